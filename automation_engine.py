@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Motor de automação assíncrono dentro do processo
+
+Um único event loop asyncio roda em uma thread dedicada e é dono do pool de
+navegadores. As rotas Flask (síncronas) submetem coroutines a ele e recebem
+o resultado estruturado diretamente, sem `python3 -c` nem parsing de stdout.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from browser_pool import BrowserPool
+from standby import StandbyPool
+
+logger = logging.getLogger(__name__)
+
+
+class AutomationEngine:
+    def __init__(self, pool: Optional[BrowserPool] = None, standby: Optional[StandbyPool] = None):
+        """
+        Inicializa o motor
+
+        Args:
+            pool: Pool de navegadores (um com a configuração padrão é criado se omitido)
+            standby: Contextos em hot standby (um com a configuração padrão é criado se omitido)
+        """
+        self.pool = pool or BrowserPool()
+        self.standby = standby or StandbyPool(self.pool)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.running = 0
+
+    def start(self):
+        """Inicia a thread do event loop e o pool de navegadores"""
+        with self._lock:
+            if self.loop is not None:
+                return
+
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self.loop.run_forever, name='automation-engine', daemon=True)
+            self._thread.start()
+
+        asyncio.run_coroutine_threadsafe(self.pool.start(), self.loop).result()
+        asyncio.run_coroutine_threadsafe(self.standby.start(), self.loop).result()
+        logger.info("⚙️ Motor de automação iniciado")
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        Agenda uma coroutine no loop do motor, sem bloquear
+
+        Returns:
+            Future (concurrent.futures) com o resultado
+        """
+        if self.loop is None:
+            self.start()
+
+        self.submitted += 1
+
+        async def _tracked():
+            self.running += 1
+            try:
+                return await coro
+            finally:
+                self.running -= 1
+
+        return asyncio.run_coroutine_threadsafe(_tracked(), self.loop)
+
+    def run(self, coro: Coroutine, timeout: float = 600) -> Any:
+        """Executa uma coroutine no motor e espera o resultado"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def submit_with_context(self, job: Callable[[BrowserContext], Awaitable[Any]],
+                            **context_options) -> concurrent.futures.Future:
+        """
+        Agenda um job com um BrowserContext emprestado do pool
+
+        Args:
+            job: Coroutine function que recebe o BrowserContext
+            **context_options: Opções repassadas para browser.new_context()
+        """
+        async def _run():
+            async with self.pool.context(**context_options) as context:
+                return await job(context)
+
+        return self.submit(_run())
+
+    def run_with_context(self, job: Callable[[BrowserContext], Awaitable[Any]], timeout: float = 600,
+                         **context_options) -> Any:
+        """Executa um job com um BrowserContext do pool e espera o resultado"""
+        future = self.submit_with_context(job, **context_options)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def submit_with_standby(self, job: Callable[[BrowserContext, Optional[Page]], Awaitable[Any]],
+                            **context_options) -> concurrent.futures.Future:
+        """
+        Agenda um job que pode começar de uma página em standby já parada em controle_os
+
+        O job recebe (context, page). Se nenhum contexto em standby estiver pronto,
+        recebe um contexto novo do pool e page=None (fazendo login e navegação).
+        """
+        async def _run():
+            async with self.standby.acquire() as page:
+                if page is not None:
+                    return await job(page.context, page)
+
+            async with self.pool.context(**context_options) as context:
+                return await job(context, None)
+
+        return self.submit(_run())
+
+    def stop(self, timeout: float = 10):
+        """Fecha o pool e encerra o event loop"""
+        if self.loop is None or not self.loop.is_running():
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.standby.stop(), self.loop).result(timeout=timeout)
+            asyncio.run_coroutine_threadsafe(self.pool.close(), self.loop).result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao encerrar pool: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def stats(self) -> Dict:
+        return {
+            'started': self.loop is not None,
+            'submitted': self.submitted,
+            'running': self.running,
+            'pool': self.pool.stats(),
+            'standby': self.standby.stats()
+        }
+
+
+_engine: Optional[AutomationEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> AutomationEngine:
+    """Retorna o motor compartilhado do processo, iniciando-o se necessário"""
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            engine = AutomationEngine()
+            engine.start()
+            _engine = engine
+
+    return _engine
+
+
+def running_engine() -> Optional[AutomationEngine]:
+    """Motor do processo, se já iniciado (sem iniciá-lo)"""
+    return _engine
+
+
+@atexit.register
+def _shutdown_engine():
+    if _engine is not None:
+        _engine.stop()
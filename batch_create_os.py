@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Criação de OS em lote: vários INEPs com um único login
+
+Uso:
+    python batch_create_os.py 33099553 31382221 ...
+    python batch_create_os.py --tickets 101 102 103
+    python batch_create_os.py --file ineps.txt
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, List, Tuple
+
+from inep_extraction import is_valid_inep
+
+
+def resolve_ticket_ineps(ticket_ids: List[int]) -> Tuple[List[str], List[Dict]]:
+    """
+    Resolve os INEPs de vários tickets com uma consulta ao Supabase (mais uma para sites fora do cache)
+
+    Args:
+        ticket_ids: IDs dos tickets
+
+    Returns:
+        (INEPs na ordem dos tickets, tickets sem INEP válido)
+    """
+    from site_cache import get_site_cache
+    from supabase_client import get_supabase_gateway
+
+    response = get_supabase_gateway().execute(lambda db: db.table('tickets').select(
+        'id, incidentes ( site_id )'
+    ).in_('id', ticket_ids))
+
+    site_ids = {row['id']: (row.get('incidentes') or {}).get('site_id') for row in response.data}
+    sites = get_site_cache().get_many(site_ids.values())
+
+    ineps, missing = [], []
+    for ticket_id in ticket_ids:
+        site_nome, inep = sites.get(site_ids.get(ticket_id), (None, None))
+        if inep:
+            ineps.append(inep)
+        else:
+            missing.append({'ticket_id': ticket_id, 'site_nome': site_nome})
+
+    return ineps, missing
+
+
+async def run_batch(ineps: List[str]) -> Dict:
+    """Executa o lote em um navegador dedicado, imprimindo cada resultado como uma linha JSON"""
+    from browser_pool import BrowserPool
+    from eace_flows import create_os_batch
+
+    pool = BrowserPool(size=1)
+    await pool.start()
+    try:
+        async with pool.context() as context:
+            return await create_os_batch(
+                context, ineps,
+                on_result=lambda item: print(json.dumps(item, ensure_ascii=False), flush=True)
+            )
+    finally:
+        await pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cria OS no EACE para vários INEPs com um único login')
+    parser.add_argument('ineps', nargs='*', help='INEPs (8 dígitos)')
+    parser.add_argument('--tickets', nargs='+', type=int, help='IDs de tickets no Supabase')
+    parser.add_argument('--file', help='Arquivo com um INEP por linha')
+    args = parser.parse_args()
+
+    ineps = list(args.ineps)
+    if args.file:
+        with open(args.file) as f:
+            ineps.extend(line.strip() for line in f if line.strip())
+
+    if args.tickets:
+        resolved, missing = resolve_ticket_ineps(args.tickets)
+        ineps.extend(resolved)
+        for ticket in missing:
+            print(json.dumps({'success': False, 'error': 'INEP não encontrado', **ticket},
+                             ensure_ascii=False), file=sys.stderr)
+
+    invalid = [inep for inep in ineps if not is_valid_inep(inep)]
+    if invalid:
+        parser.error(f"INEPs inválidos: {', '.join(invalid)}")
+    if not ineps:
+        parser.error('Informe ao menos um INEP ou ticket')
+
+    summary = asyncio.run(run_batch(ineps))
+    print(json.dumps({k: v for k, v in summary.items() if k != 'results'}, ensure_ascii=False))
+    sys.exit(0 if summary['success'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração de INEP: implementação anterior x inep_extraction
+
+Uso:
+    python benchmark_inep_extraction.py
+    python benchmark_inep_extraction.py --names 100000 --distinct 5000 --runs 5
+
+Gera nomes de site nos formatos vistos na tabela sites (com repetição, como
+acontece quando vários tickets apontam para a mesma escola) e mede a vazão
+da função antiga, da nova sem cache, da nova com cache e da API em lote. Os
+resultados das implementações são comparados.
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import inep_extraction
+from inep_extraction import extract_inep, extract_ineps
+
+FORMATS = (
+    'INEP - {inep}',
+    'ESCOLA ESTADUAL {name} - {inep}',
+    'ESCOLA MUNICIPAL {name} - {inep} - {city}',
+    'INEP: {inep}',
+    'E.E. {name} INEP {inep}',
+    'escola {name} (inep-{inep})',
+    'ESCOLA {name} - ANEXO',
+    '{name}'
+)
+
+
+def legacy_extract(site_nome: str) -> Optional[str]:
+    """Implementação anterior (webhook_realtime.extract_inep_from_site_name)"""
+    try:
+        if " - " in site_nome:
+            parts = site_nome.split(" - ")
+            if len(parts) >= 2:
+                inep = parts[1].strip()
+                if inep.isdigit() and len(inep) == 8:
+                    return inep
+
+        if "INEP" in site_nome.upper():
+            import re
+            match = re.search(r'INEP[:\s-]*(\d{8})', site_nome.upper())
+            if match:
+                return match.group(1)
+
+        return None
+    except Exception:
+        return None
+
+
+def synthetic_names(count: int, distinct: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    pool = [
+        rng.choice(FORMATS).format(
+            inep=rng.randint(10000000, 99999999),
+            name=f'PROFESSOR {rng.randint(1, 9999)}',
+            city=rng.choice(('BH', 'CONTAGEM', 'BETIM'))
+        )
+        for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _time(fn: Callable[[List[str]], List], names: List[str], runs: int, before: Callable = None) -> Dict:
+    timings = []
+    result = None
+    for _ in range(runs):
+        if before:
+            before()
+        started = time.perf_counter()
+        result = fn(names)
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return {
+        'median_ms': round(median * 1000, 2),
+        'names_per_second': round(len(names) / median) if median else None,
+        'result': result
+    }
+
+
+def run(names: List[str], runs: int) -> Dict:
+    uncached = extract_inep.__wrapped__
+    clear = extract_inep.cache_clear
+
+    report = {
+        'legacy': _time(lambda items: [legacy_extract(name) for name in items], names, runs),
+        'compiled': _time(lambda items: [uncached(name) for name in items], names, runs),
+        'cached_cold': _time(lambda items: [extract_inep(name) for name in items], names, runs, before=clear),
+        'cached_warm': _time(lambda items: [extract_inep(name) for name in items], names, runs),
+        'batch': _time(extract_ineps, names, runs, before=clear)
+    }
+
+    expected = report['legacy']['result']
+    for item in report.values():
+        item['same_result'] = item.pop('result') == expected
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede a vazão da extração de INEP')
+    parser.add_argument('--names', type=int, default=100000, help='Quantidade de nomes')
+    parser.add_argument('--distinct', type=int, default=5000, help='Nomes distintos entre eles')
+    parser.add_argument('--runs', type=int, default=5, help='Execuções por implementação')
+    args = parser.parse_args()
+
+    names = synthetic_names(args.names, args.distinct)
+    report = {
+        'names': len(names),
+        'distinct': len(set(names)),
+        'cache_size': inep_extraction.INEP_CACHE_SIZE,
+        'implementations': run(names, args.runs)
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(0 if all(item['same_result'] for item in report['implementations'].values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
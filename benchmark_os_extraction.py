@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark da extração de números de OS: querySelectorAll('*') x TreeWalker
+
+Uso:
+    python benchmark_os_extraction.py snapshots/controle_os.html ...
+    python benchmark_os_extraction.py --synthetic 2000 --depth 25
+
+Os snapshots são HTML salvos com `await page.content()` na página controle_os.
+Cada snapshot é carregado com set_content (JavaScript desativado) e as duas
+implementações são executadas --runs vezes; o resultado das duas é comparado.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from playwright.async_api import async_playwright
+
+from os_extraction import LEGACY_OS_NUMBERS_JS, OS_NUMBERS_JS
+
+
+def synthetic_snapshot(rows: int, depth: int) -> str:
+    """Lista de OS com cada linha aninhada em `depth` divs, como no layout do Bubble"""
+    parts = ['<html><body><div class="page">']
+    for index in range(rows):
+        os_number = 2024000000 + index
+        parts.append('<div class="group">' * depth)
+        parts.append(f'<span>OS: #{os_number}</span><span>INEP {31000000 + index}</span>')
+        parts.append('</div>' * depth)
+    parts.append('</div></body></html>')
+    return ''.join(parts)
+
+
+async def _time(page, script: str, args, runs: int) -> Dict:
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await page.evaluate(script, args) if args is not None else await page.evaluate(script)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'result': result
+    }
+
+
+async def run(snapshots: Dict[str, str], runs: int) -> List[Dict]:
+    report = []
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
+        context = await browser.new_context(java_script_enabled=False)
+        page = await context.new_page()
+
+        for name, html in snapshots.items():
+            await page.set_content(html, wait_until='domcontentloaded')
+            elements = await page.evaluate("() => document.getElementsByTagName('*').length")
+
+            legacy = await _time(page, LEGACY_OS_NUMBERS_JS, None, runs)
+            walker = await _time(page, OS_NUMBERS_JS, {'container': None}, runs)
+
+            legacy_numbers = set(legacy.pop('result'))
+            walker_numbers = {row['os_number'] for row in walker.pop('result')}
+
+            report.append({
+                'snapshot': name,
+                'elements': elements,
+                'os_numbers': len(walker_numbers),
+                'same_result': legacy_numbers == walker_numbers,
+                'query_selector_all': legacy,
+                'tree_walker': walker,
+                'speedup': round(legacy['median_ms'] / walker['median_ms'], 1) if walker['median_ms'] else None
+            })
+
+        await browser.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a extração de OS por querySelectorAll e por TreeWalker')
+    parser.add_argument('snapshots', nargs='*', help='Arquivos HTML salvos da página controle_os')
+    parser.add_argument('--synthetic', type=int, default=0, help='Gera um snapshot sintético com N linhas de OS')
+    parser.add_argument('--depth', type=int, default=20, help='Profundidade de aninhamento do snapshot sintético')
+    parser.add_argument('--runs', type=int, default=10, help='Execuções por implementação')
+    args = parser.parse_args()
+
+    snapshots = {}
+    for path in args.snapshots:
+        with open(path, encoding='utf-8') as f:
+            snapshots[path] = f.read()
+    if args.synthetic:
+        snapshots[f'synthetic_{args.synthetic}x{args.depth}'] = synthetic_snapshot(args.synthetic, args.depth)
+    if not snapshots:
+        parser.error('Informe snapshots HTML ou --synthetic N')
+
+    report = asyncio.run(run(snapshots, args.runs))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(0 if all(item['same_result'] for item in report) else 1)
+
+
+if __name__ == "__main__":
+    main()
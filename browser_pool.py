@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Pool persistente de navegadores Chromium para as automações EACE
+
+Mantém N instâncias de Chromium aquecidas dentro do processo. Cada job recebe
+um BrowserContext isolado (cookies/storage próprios) de um navegador do pool,
+que é verificado antes do uso e reciclado após um número máximo de jobs.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from resource_blocker import BROWSER_BLOCK_PROFILE, ResourceBlocker
+
+logger = logging.getLogger(__name__)
+
+# Configuração via variáveis de ambiente
+BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+BROWSER_MAX_JOBS = int(os.getenv('BROWSER_MAX_JOBS', '50'))
+BROWSER_HEADLESS = os.getenv('BROWSER_HEADLESS', 'true').lower() != 'false'
+BROWSER_LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+# Espera máxima (s) por um navegador livre antes de falhar o job
+BROWSER_ACQUIRE_TIMEOUT = float(os.getenv('BROWSER_ACQUIRE_TIMEOUT', '120'))
+
+
+class PooledBrowser:
+    """Navegador do pool com contadores de uso"""
+
+    def __init__(self, index: int, browser: Browser):
+        self.index = index
+        self.browser = browser
+        self.jobs = 0
+        self.launched_at = time.time()
+        self.busy = False
+
+    def to_dict(self) -> Dict:
+        return {
+            'index': self.index,
+            'jobs': self.jobs,
+            'busy': self.busy,
+            'connected': self.browser.is_connected(),
+            'uptime_seconds': round(time.time() - self.launched_at, 1)
+        }
+
+
+class BrowserPool:
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_jobs: int = BROWSER_MAX_JOBS,
+                 headless: bool = BROWSER_HEADLESS, launch_args: Optional[List[str]] = None,
+                 block_profile: str = BROWSER_BLOCK_PROFILE):
+        """
+        Inicializa o pool de navegadores
+
+        Args:
+            size: Número de navegadores Chromium mantidos aquecidos
+            max_jobs: Jobs atendidos por navegador antes de reciclá-lo
+            headless: Executar sem interface gráfica
+            launch_args: Argumentos extras do Chromium
+            block_profile: Perfil de bloqueio de recursos aplicado a cada contexto
+        """
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        self.headless = headless
+        self.launch_args = launch_args or list(BROWSER_LAUNCH_ARGS)
+        self.playwright: Optional[Playwright] = None
+        self.browsers: List[PooledBrowser] = []
+        self._available: Optional[asyncio.Queue] = None
+        self.total_jobs = 0
+        self.recycled = 0
+        self.started = False
+        self.block_profile = block_profile
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+
+    async def start(self):
+        """Inicia o Playwright e lança os navegadores do pool"""
+        if self.started:
+            return
+
+        self.playwright = await async_playwright().start()
+        self._available = asyncio.Queue()
+
+        for index in range(self.size):
+            pooled = PooledBrowser(index, await self._launch())
+            self.browsers.append(pooled)
+            self._available.put_nowait(pooled)
+
+        self.started = True
+        logger.info(f"🌐 Pool de navegadores iniciado: {self.size} instâncias (reciclagem a cada {self.max_jobs} jobs)")
+
+    async def _launch(self) -> Browser:
+        return await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args
+        )
+
+    async def _recycle(self, pooled: PooledBrowser, reason: str):
+        """Fecha e relança um navegador do pool"""
+        logger.info(f"♻️ Reciclando navegador {pooled.index}: {reason}")
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao fechar navegador {pooled.index}: {e}")
+
+        pooled.browser = await self._launch()
+        pooled.jobs = 0
+        pooled.launched_at = time.time()
+        self.recycled += 1
+
+    @asynccontextmanager
+    async def context(self, acquire_timeout: Optional[float] = BROWSER_ACQUIRE_TIMEOUT, **context_options):
+        """
+        Empresta um BrowserContext isolado de um navegador aquecido
+
+        Args:
+            acquire_timeout: Espera máxima (s) por um navegador livre; None espera indefinidamente
+            **context_options: Opções repassadas para browser.new_context()
+
+        Yields:
+            BrowserContext exclusivo do job, fechado ao final
+
+        Raises:
+            TimeoutError: Se nenhum navegador ficar livre dentro de acquire_timeout
+        """
+        if not self.started:
+            await self.start()
+
+        try:
+            pooled = await asyncio.wait_for(self._available.get(), acquire_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Nenhum navegador livre no pool após {acquire_timeout:g}s ({self.size} navegadores ocupados)"
+            ) from None
+        pooled.busy = True
+        context: Optional[BrowserContext] = None
+        blocker: Optional[ResourceBlocker] = None
+
+        try:
+            # Health check antes de entregar o navegador
+            if not pooled.browser.is_connected():
+                await self._recycle(pooled, 'navegador desconectado')
+
+            context = await pooled.browser.new_context(**context_options)
+            blocker = ResourceBlocker(self.block_profile)
+            await blocker.apply(context)
+            yield context
+
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"⚠️ Erro ao fechar contexto: {e}")
+
+            if blocker is not None and blocker.blocked:
+                self.blocked_requests += blocker.blocked
+                self.bytes_saved += blocker.bytes_saved
+                logger.info(
+                    f"🚫 Recursos bloqueados: {blocker.blocked}/{blocker.requests} requisições "
+                    f"(~{blocker.bytes_saved // 1024} KB economizados) {blocker.by_type}"
+                )
+
+            pooled.jobs += 1
+            self.total_jobs += 1
+
+            try:
+                if pooled.jobs >= self.max_jobs:
+                    await self._recycle(pooled, f'{pooled.jobs} jobs atendidos')
+                elif not pooled.browser.is_connected():
+                    await self._recycle(pooled, 'navegador desconectado após job')
+            except Exception as e:
+                logger.error(f"❌ Erro ao reciclar navegador {pooled.index}: {e}")
+            finally:
+                pooled.busy = False
+                self._available.put_nowait(pooled)
+
+    async def close(self):
+        """Fecha todos os navegadores e o Playwright"""
+        for pooled in self.browsers:
+            try:
+                await pooled.browser.close()
+            except Exception:
+                pass
+
+        self.browsers = []
+
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+        self.started = False
+        logger.info("🔚 Pool de navegadores encerrado")
+
+    def stats(self) -> Dict:
+        """Retorna estatísticas de uso do pool"""
+        busy = sum(1 for pooled in self.browsers if pooled.busy)
+        return {
+            'size': self.size,
+            'max_jobs_per_browser': self.max_jobs,
+            'busy': busy,
+            'idle': len(self.browsers) - busy,
+            'total_jobs': self.total_jobs,
+            'recycled': self.recycled,
+            'started': self.started,
+            'block_profile': self.block_profile,
+            'blocked_requests': self.blocked_requests,
+            'estimated_bytes_saved': self.bytes_saved,
+            'browsers': [pooled.to_dict() for pooled in self.browsers]
+        }
@@ -57,6 +57,38 @@ CREATE TRIGGER ticket_webhook_trigger
     FOR EACH ROW
     EXECUTE FUNCTION call_eace_webhook();
 
+-- ===================================================
+-- INVALIDAÇÃO DO CACHE DE SITES (site_id -> INEP)
+-- ===================================================
+
+CREATE OR REPLACE FUNCTION call_eace_sites_webhook()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM net.http_post(
+        url := 'https://seu-servidor.com/webhook/eace',
+        headers := jsonb_build_object('Content-Type', 'application/json'),
+        body := jsonb_build_object(
+            'type', TG_OP,
+            'table', 'sites',
+            'record', CASE WHEN TG_OP = 'DELETE' THEN NULL ELSE to_jsonb(NEW) END,
+            'old_record', CASE WHEN TG_OP = 'INSERT' THEN NULL ELSE to_jsonb(OLD) END
+        )
+    );
+    RETURN NULL;
+    
+EXCEPTION WHEN OTHERS THEN
+    RAISE WARNING 'Erro ao chamar webhook de sites: %', SQLERRM;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sites_webhook_trigger ON sites;
+
+CREATE TRIGGER sites_webhook_trigger
+    AFTER INSERT OR UPDATE OF nome OR DELETE ON sites
+    FOR EACH ROW
+    EXECUTE FUNCTION call_eace_sites_webhook();
+
 -- Verifica se o trigger foi criado
 SELECT 
     trigger_name,
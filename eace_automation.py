@@ -3,9 +3,15 @@ import os
 from datetime import datetime
 from typing import Dict, List, Optional
 from playwright.async_api import async_playwright, Page, Browser
-from supabase import create_client, Client
 from dotenv import load_dotenv
 from loguru import logger
+from metrics import phase
+from session_cache import get_session_cache
+from wait_engine import WaitEngine
+from resource_blocker import ResourceBlocker
+from screenshots import KIND_FAILURE, KIND_KEY, KIND_STEP, ScreenshotSession
+from supabase_client import get_supabase_gateway
+from write_behind import get_write_behind
 import time
 import base64
 
@@ -14,20 +20,19 @@ load_dotenv()
 
 class EaceAutomation:
     def __init__(self):
-        self.supabase: Client = create_client(
-            os.getenv("SUPABASE_URL"),
-            os.getenv("SUPABASE_KEY")
-        )
+        # Cliente Supabase compartilhado do processo (uma sessão HTTP para todas as instâncias)
+        self.db = get_supabase_gateway()
+        # Screenshots e mudanças de status são gravados em lote
+        self.writes = get_write_behind()
         self.username = os.getenv("EACE_USERNAME")
         self.password = os.getenv("EACE_PASSWORD")
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
-        self.screenshots_dir = "/tmp/screenshots"
+        self.resource_blocker = ResourceBlocker()
+        # Screenshots no nível configurado (SCREENSHOT_LEVEL), em um subdiretório desta execução
+        self.shots = ScreenshotSession()
         self.step_counter = 0
         
-        # Criar diretório para screenshots
-        os.makedirs(self.screenshots_dir, exist_ok=True)
-        
     async def init_browser(self):
         """Inicializa o navegador com configurações anti-detecção"""
         playwright = await async_playwright().start()
@@ -46,6 +51,9 @@ class EaceAutomation:
         
         self.page = await self.browser.new_page()
         
+        # Bloquear imagens, mídia, fontes e rastreadores
+        await self.resource_blocker.apply(self.page)
+        
         # Configurar headers realistas
         await self.page.set_extra_http_headers({
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -65,16 +73,16 @@ class EaceAutomation:
         
         logger.info("Navegador inicializado com sucesso")
         
-    async def take_screenshot(self, step_name: str, description: str = "") -> str:
-        """Captura screenshot da tela atual"""
+    async def take_screenshot(self, step_name: str, description: str = "", kind: str = KIND_STEP) -> Optional[str]:
+        """Captura screenshot da tela atual (se o nível configurado incluir este tipo de etapa)"""
         try:
             self.step_counter += 1
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"step_{self.step_counter:02d}_{timestamp}_{step_name}.png"
-            filepath = os.path.join(self.screenshots_dir, filename)
-            
-            # Capturar screenshot
-            await self.page.screenshot(path=filepath, full_page=True)
+            relative = await self.shots.capture(self.page, f"step_{self.step_counter:02d}_{step_name}", kind,
+                                                full_page=True)
+            if relative is None:
+                return None
+            filepath = os.path.join(self.shots.root, relative)
+            filename = os.path.basename(relative)
             
             # Salvar info no Supabase para consulta posterior
             screenshot_data = {
@@ -87,10 +95,8 @@ class EaceAutomation:
                 'url': self.page.url
             }
             
-            try:
-                self.supabase.table('screenshots').insert(screenshot_data).execute()
-            except Exception as e:
-                logger.warning(f"Erro ao salvar screenshot no Supabase: {e}")
+            # Entra no buffer de escrita; o INSERT em lote sai fora do event loop
+            self.writes.insert('screenshots', screenshot_data)
             
             logger.info(f"Screenshot capturado: {filename} - {description}")
             return filepath
@@ -100,72 +106,89 @@ class EaceAutomation:
             return None
         
     async def login(self) -> bool:
-        """Realiza login no sistema EACE"""
+        """Realiza login no sistema EACE, reaproveitando a sessão em cache quando válida"""
         try:
-            logger.info("Iniciando processo de login...")
-            
-            await self.page.goto("https://eace.org.br/login?login=login", 
-                                wait_until="networkidle")
-            
-            # Screenshot da página de login
-            await self.take_screenshot("login_page", "Página de login carregada")
-            
-            # Aguardar carregamento completo
-            await self.page.wait_for_timeout(3000)
-            
-            # Usar os seletores que funcionaram nos testes anteriores
-            await self.page.fill('//input[@placeholder="seuemail@email.com"]', self.username)
-            await self.page.fill('//input[@type="password"]', self.password)
-            
-            # Screenshot após preencher dados
-            await self.take_screenshot("login_filled", "Dados de login preenchidos")
-            
-            # Clicar no botão de login
-            await self.page.click('//button[contains(text(), "Log In")]')
-            
-            # Aguardar redirecionamento
-            await self.page.wait_for_timeout(5000)
-            
-            # Screenshot após clicar login
-            await self.take_screenshot("after_login_click", "Após clicar no botão login")
-            
-            # Verificar se apareceu seleção de perfil
-            if await self.page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-                logger.info("Seleção de perfil encontrada")
-                await self.take_screenshot("profile_selection", "Tela de seleção de perfil")
-                
-                # Clicar no perfil Fornecedor
-                await self.page.click('//*[contains(text(), "Fornecedor")]')
-                await self.page.wait_for_timeout(5000)
-                
-                # Screenshot após selecionar perfil
-                await self.take_screenshot("profile_selected", "Perfil Fornecedor selecionado")
-            
-            # Verificar se login foi bem-sucedido
-            if "dashboard" in self.page.url or "fornecedor" in self.page.url:
-                logger.success("Login realizado com sucesso")
-                await self.take_screenshot("login_success", f"Login bem-sucedido - URL: {self.page.url}")
-                return True
-            else:
-                logger.error("Falha no login - redirecionamento não ocorreu")
-                await self.take_screenshot("login_failed", f"Falha no login - URL: {self.page.url}")
-                return False
-                
+            return await get_session_cache().ensure_session(
+                self.page, self.username, lambda page: self._login_form()
+            )
         except Exception as e:
             logger.error(f"Erro durante login: {str(e)}")
-            await self.take_screenshot("login_error", f"Erro no login: {str(e)}")
             return False
     
+    async def _login_form(self) -> bool:
+        """Preenche o formulário de login e seleciona o perfil Fornecedor"""
+        with phase('login') as current:
+            try:
+                logger.info("Iniciando processo de login...")
+                waits = WaitEngine(self.page)
+                
+                await self.page.goto("https://eace.org.br/login?login=login", 
+                                    wait_until="networkidle")
+                
+                # Screenshot da página de login
+                await self.take_screenshot("login_page", "Página de login carregada")
+                
+                # Aguardar o formulário de login
+                await waits.for_selector('login_form', '//input[@type="password"]')
+                
+                # Usar os seletores que funcionaram nos testes anteriores
+                await self.page.fill('//input[@placeholder="seuemail@email.com"]', self.username)
+                await self.page.fill('//input[@type="password"]', self.password)
+                
+                # Screenshot após preencher dados
+                await self.take_screenshot("login_filled", "Dados de login preenchidos")
+                
+                # Clicar no botão de login
+                await self.page.click('//button[contains(text(), "Log In")]')
+                
+                # Aguardar seleção de perfil ou redirecionamento
+                await waits.for_selector('profile_selection', '//*[contains(text(), "Fornecedor")]', timeout=10000)
+                
+                # Screenshot após clicar login
+                await self.take_screenshot("after_login_click", "Após clicar no botão login")
+                
+                # Verificar se apareceu seleção de perfil
+                if await self.page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
+                    logger.info("Seleção de perfil encontrada")
+                    await self.take_screenshot("profile_selection", "Tela de seleção de perfil")
+                    
+                    # Clicar no perfil Fornecedor
+                    with phase('profile_selection'):
+                        await self.page.click('//*[contains(text(), "Fornecedor")]')
+                        await waits.for_url('dashboard', r'dashboard', timeout=10000)
+                        await waits.for_network_idle('dashboard_load', timeout=10000)
+                    
+                    # Screenshot após selecionar perfil
+                    await self.take_screenshot("profile_selected", "Perfil Fornecedor selecionado")
+                
+                # Verificar se login foi bem-sucedido
+                if "dashboard" in self.page.url or "fornecedor" in self.page.url:
+                    logger.success("Login realizado com sucesso")
+                    await self.take_screenshot("login_success", f"Login bem-sucedido - URL: {self.page.url}", KIND_KEY)
+                    return True
+                else:
+                    logger.error("Falha no login - redirecionamento não ocorreu")
+                    await self.take_screenshot("login_failed", f"Falha no login - URL: {self.page.url}", KIND_FAILURE)
+                    current.fail()
+                    return False
+                    
+            except Exception as e:
+                logger.error(f"Erro durante login: {str(e)}")
+                await self.take_screenshot("login_error", f"Erro no login: {str(e)}", KIND_FAILURE)
+                current.fail()
+                return False
+    
     async def abrir_ticket(self, ticket_data: Dict) -> bool:
         """Abre um ticket no sistema EACE"""
         try:
             logger.info(f"Abrindo ticket: {ticket_data.get('titulo', 'Sem título')}")
+            waits = WaitEngine(self.page)
             
             # Navegar para página de abertura de ticket
             await self.page.goto("https://eace.org.br/tickets/novo", 
                                 wait_until="networkidle")
             
-            await self.page.wait_for_timeout(2000)
+            await waits.for_selector('ticket_form', 'button[type="submit"]', timeout=5000)
             
             # Preencher formulário (adaptar seletores conforme necessário)
             if ticket_data.get('titulo'):
@@ -184,7 +207,7 @@ class EaceAutomation:
             await self.page.click('button[type="submit"]')
             
             # Aguardar confirmação
-            await self.page.wait_for_timeout(3000)
+            await waits.for_network_idle('ticket_submit', url_pattern=None, timeout=5000)
             
             # Verificar se ticket foi criado (adaptar conforme necessário)
             if "sucesso" in self.page.url or await self.page.locator('.success-message').count() > 0:
@@ -201,7 +224,7 @@ class EaceAutomation:
     def get_tickets_pendentes(self) -> List[Dict]:
         """Busca tickets pendentes no Supabase"""
         try:
-            response = self.supabase.table('tickets').select('*').eq('status', 'pendente').execute()
+            response = self.db.execute(lambda db: db.table('tickets').select('*').eq('status', 'pendente'))
             logger.info(f"Encontrados {len(response.data)} tickets pendentes")
             return response.data
         except Exception as e:
@@ -219,7 +242,7 @@ class EaceAutomation:
             if eace_id:
                 update_data['eace_id'] = eace_id
             
-            self.supabase.table('tickets').update(update_data).eq('id', ticket_id).execute()
+            self.writes.update('tickets', 'id', ticket_id, update_data)
             logger.info(f"Status do ticket {ticket_id} atualizado para: {status}")
             return True
         except Exception as e:
@@ -266,6 +289,10 @@ class EaceAutomation:
     
     async def close(self):
         """Fecha o navegador"""
+        report = self.resource_blocker.report()
+        if report['blocked']:
+            logger.info(f"Recursos bloqueados: {report}")
+        await self.shots.flush()
         if self.browser:
             await self.browser.close()
 
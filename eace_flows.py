@@ -0,0 +1,916 @@
+#!/usr/bin/env python3
+"""
+Fluxos de automação EACE executados dentro do processo
+
+Versões das templates `python3 -c` de webhook_simple.py que recebem um
+BrowserContext do pool em vez de lançar o Chromium a cada chamada.
+"""
+
+import json
+import logging
+import os
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import BrowserContext, Locator, Page
+
+from metrics import OS_CREATIONS_TOTAL, phase
+from nav_cache import get_nav_cache
+from os_extraction import OS_RESPONSE_PATTERN, extract_os_numbers, os_number_from_payload, page_texts
+from screenshots import KIND_FAILURE, KIND_KEY, KIND_STEP, ScreenshotSession
+from selector_registry import get_selector_registry
+from session_cache import get_session_cache
+from wait_engine import WaitEngine
+
+logger = logging.getLogger(__name__)
+
+EACE_LOGIN_URL = "https://eace.org.br/login?login=login"
+EACE_USERNAME = os.getenv('EACE_USERNAME', 'raiseupbt@gmail.com')
+EACE_PASSWORD = os.getenv('EACE_PASSWORD', '@Uujpgi8u')
+
+# Seletores compartilhados pelos fluxos
+FORNECEDOR_SELECTOR = "//*[contains(text(), 'Fornecedor')]"
+ADICIONAR_OS_SELECTOR = "text='Adicionar nova OS'"
+INEP_FIELD_SELECTOR = "input[placeholder*='INEP'], input[placeholder*='código'], input[placeholder*='escola']"
+INCLUIR_ENABLED_SELECTOR = "button:has-text('Incluir'):not([disabled])"
+
+# Ler o número da OS da resposta do workflow que a cria (varredura da página só como fallback)
+OS_NUMBER_FROM_NETWORK = os.getenv('OS_NUMBER_FROM_NETWORK', 'true').lower() != 'false'
+
+
+async def login(page: Page, waits: Optional[WaitEngine] = None) -> bool:
+    """
+    Login completo no EACE, incluindo a seleção do perfil "Fornecedor"
+
+    Args:
+        page: Página a autenticar
+        waits: Motor de esperas do fluxo (um novo é criado se omitido)
+
+    Returns:
+        True se o login levou ao dashboard
+    """
+    waits = waits or WaitEngine(page)
+
+    with phase('login'):
+        logger.info("🔐 LOGIN - Acessando página de login...")
+        await page.goto(EACE_LOGIN_URL, timeout=30000)
+        await waits.for_selector('login_form', "//input[@type='password']", timeout=15000)
+
+        await page.fill("//input[@placeholder='seuemail@email.com']", EACE_USERNAME)
+        await page.fill("//input[@type='password']", EACE_PASSWORD)
+        await page.click("//button[contains(text(), 'Log In')]")
+        profile_visible = await waits.for_selector('profile_selection', FORNECEDOR_SELECTOR, timeout=10000)
+
+    if profile_visible:
+        with phase('profile_selection'):
+            logger.info("👤 PERFIL - Selecionando perfil Fornecedor...")
+            await page.click(FORNECEDOR_SELECTOR)
+            await waits.for_url('dashboard', r'dashboard', timeout=10000)
+            await waits.for_network_idle('dashboard_load', timeout=10000)
+    else:
+        logger.info("ℹ️ PERFIL - Elemento 'Fornecedor' não encontrado ou já selecionado")
+
+    return "dashboard" in page.url or "fornecedor" in page.url
+
+
+async def open_logged_in_page(context: BrowserContext) -> Page:
+    """
+    Abre uma página autenticada, reaproveitando a sessão em cache quando válida
+
+    Raises:
+        RuntimeError: Se nem a sessão em cache nem o login funcionarem
+    """
+    page = await context.new_page()
+    # Sessão restaurada do cache ou, se expirada, login completo (fases login e profile_selection)
+    with phase('session'):
+        if not await get_session_cache().ensure_session(page, EACE_USERNAME, login):
+            raise RuntimeError(f"Falha no login - URL: {page.url}")
+    return page
+
+
+async def navigate_to_os_page(page: Page, waits: WaitEngine,
+                              discover: Optional[Callable[[Page], Awaitable[None]]] = None,
+                              timeout: int = 15000) -> bool:
+    """
+    Abre a página controle_os pelo deep link em cache
+
+    Args:
+        page: Página já autenticada
+        waits: Motor de esperas do fluxo
+        discover: Descoberta usada se o deep link falhar (padrão: menu lateral)
+        timeout: Espera máxima (ms) pelo botão "Adicionar nova OS"
+
+    Returns:
+        True se a página de OS carregou
+    """
+    async def _discover_by_menu(page: Page):
+        await _discover_os_page_by_menu(page, waits)
+
+    with phase('menu_navigation') as current:
+        loaded = await get_nav_cache().goto(
+            page, 'fornecedor', 'controle_os', ADICIONAR_OS_SELECTOR,
+            discover or _discover_by_menu, waits, timeout=timeout
+        )
+        if not loaded:
+            current.fail()
+    return loaded
+
+
+async def _discover_os_page_by_menu(page: Page, waits: WaitEngine) -> Dict[str, bool]:
+    """
+    Expande o menu lateral e clica em "Gerenciar chamados"
+
+    Returns:
+        {'menu_expanded': bool, 'chamados_clicked': bool}
+    """
+    logger.info("🧭 NAVEGAÇÃO - Expandindo menu lateral...")
+    menu_selectors = [
+        "//button[contains(@class, 'sidebar') or contains(@class, 'menu')]",
+        "//button[@focusable='true']",
+        "//button[not(@disabled)]"
+    ]
+
+    async def expand_menu(locator: Locator) -> bool:
+        await locator.first.click()
+        return await waits.for_selector('menu_expanded', "//*[contains(text(), 'Gerenciar chamados')]",
+                                        timeout=4000)
+
+    registry = get_selector_registry()
+    menu_expanded = await registry.resolve(page, 'menu_button', menu_selectors, expand_menu) is not None
+
+    chamados_selectors = [
+        "//a[contains(text(), 'Gerenciar chamados')]",
+        "//button[contains(text(), 'Gerenciar chamados')]",
+        "//*[contains(text(), 'Gerenciar chamados')]"
+    ]
+
+    async def click(locator: Locator) -> bool:
+        await locator.click()
+        return True
+
+    chamados_clicked = await registry.resolve(page, 'gerenciar_chamados', chamados_selectors, click) is not None
+    return {'menu_expanded': menu_expanded, 'chamados_clicked': chamados_clicked}
+
+
+async def _find_os_numbers(page: Page) -> List[str]:
+    """Procura números de OS na página, do mais recente para o mais antigo"""
+    return [row['os_number'] for row in await extract_os_numbers(page)]
+
+
+async def create_os_on_page(page: Page, inep_value: str, waits: WaitEngine,
+                            shot: Optional[Callable[..., Awaitable[None]]] = None,
+                            from_network: bool = OS_NUMBER_FROM_NETWORK) -> Dict:
+    """
+    Ciclo "Adicionar nova OS" → INEP → "Incluir" a partir da página controle_os
+
+    Args:
+        page: Página já autenticada e parada em controle_os
+        inep_value: Número INEP da escola
+        waits: Motor de esperas do fluxo
+        shot: Coroutine opcional chamada com o nome e o tipo (KIND_*) de cada etapa para screenshot
+        from_network: Capturar o número da OS da resposta do workflow do Bubble
+
+    Returns:
+        {'os_created': bool, 'os_number': str ou None, 'os_number_source': 'network', 'dom' ou None}
+    """
+    async def _shot(name: str, kind: str = KIND_STEP):
+        if shot:
+            await shot(name, kind)
+
+    adicionar_selectors = [
+        "text='Adicionar nova OS'",
+        "button:has-text('Adicionar nova OS')",
+        "//button[contains(text(), 'Adicionar nova OS')]",
+        "//*[contains(text(), 'Adicionar nova OS')]"
+    ]
+
+    async def open_modal(locator: Locator) -> bool:
+        await locator.click()
+        return await waits.for_selector('modal_opened', INEP_FIELD_SELECTOR, timeout=10000)
+
+    registry = get_selector_registry()
+    os_created = False
+    with phase('open_modal') as current:
+        modal_opened = await registry.resolve(page, 'adicionar_os', adicionar_selectors, open_modal)
+        if not modal_opened:
+            current.fail()
+
+    if modal_opened:
+        await _shot("05_modal_opened")
+
+        # Preencher campo INEP
+        logger.info(f"⌨️ INEP - Preenchendo campo com: {inep_value}")
+        with phase('inep_autocomplete'):
+            await _fill_inep(page, inep_value, waits)
+        await _shot("06_inep_filled", KIND_KEY)
+
+        # Clicar em "Incluir"
+        logger.info("✅ INCLUIR - Clicando no botão 'Incluir'...")
+        incluir_selectors = [
+            "button:has-text('Incluir')",
+            "//button[contains(text(), 'Incluir')]",
+            "//*[contains(text(), 'Incluir')]"
+        ]
+
+        async def click_incluir(locator: Locator) -> bool:
+            nonlocal network_os_number
+            if from_network:
+                # Escuta a resposta do workflow antes do clique; retorna assim que ela chegar
+                network_os_number = await waits.for_response_value(
+                    'incluir_response', OS_RESPONSE_PATTERN, lambda body: os_number_from_payload(body, inep_value),
+                    trigger=locator.click, timeout=10000
+                )
+            else:
+                await locator.click()
+
+            # O clique já foi feito: um erro daqui em diante não pode levar a um segundo clique
+            if network_os_number is None:
+                try:
+                    await waits.for_network_idle('incluir', timeout=10000)
+                    await waits.for_dom_quiet('incluir_render', quiet_ms=500, timeout=5000)
+                except Exception as e:
+                    logger.warning(f"⚠️ INCLUIR - Erro aguardando a página após o clique: {e}")
+            return True
+
+        network_os_number: Optional[str] = None
+        with phase('incluir') as current:
+            # Não idempotente: sem fallback para outro seletor depois de uma tentativa de clique
+            os_created = await registry.resolve(
+                page, 'incluir', incluir_selectors, click_incluir, retry_on_error=False
+            ) is not None
+            if not os_created:
+                current.fail()
+
+    if not os_created:
+        return {'os_created': False, 'os_number': None, 'os_number_source': None}
+
+    await _shot("07_final_page")
+
+    if network_os_number:
+        os_number, source = network_os_number, 'network'
+    else:
+        # Fallback: varredura da página (a mais recente é a primeira da lista)
+        logger.info("🔍 IDENTIFICAÇÃO - Procurando número da OS criada na página...")
+        with phase('os_number_lookup') as current:
+            os_numbers = await _find_os_numbers(page)
+            if not os_numbers:
+                current.fail()
+        os_number, source = (os_numbers[0], 'dom') if os_numbers else (None, None)
+
+    if os_number:
+        logger.info(f"🎉 SUCESSO - OS criada com número: {os_number} (fonte: {source})")
+    else:
+        logger.warning("⚠️ AVISO - Não foi possível identificar o número da OS")
+
+    return {'os_created': True, 'os_number': os_number, 'os_number_source': source}
+
+
+async def create_os_with_inep(context: BrowserContext, inep_value: str,
+                              shots: Optional[ScreenshotSession] = None, page: Optional[Page] = None) -> Dict:
+    """
+    Cria OS com INEP e identifica o número da OS criada
+
+    Args:
+        context: BrowserContext emprestado do pool
+        inep_value: Número INEP da escola
+        shots: Screenshots do job (padrão: uma sessão nova no nível configurado)
+        page: Página em standby já autenticada e parada em controle_os (pula as etapas 1 a 3)
+
+    Returns:
+        Resultado da criação (success, os_number, screenshots...) ou {'error': ...}
+    """
+    shots = shots or ScreenshotSession()
+    waits: Optional[WaitEngine] = None
+
+    async def shot(name: str, kind: str = KIND_STEP):
+        await shots.capture(page, f"create_os_{name}", kind)
+
+    try:
+        if page is None:
+            # ETAPAS 1 e 2: Login e perfil Fornecedor (reaproveita sessão em cache)
+            page = await open_logged_in_page(context)
+            waits = WaitEngine(page)
+            await shot("03_dashboard")
+
+            # ETAPA 3: Navegar para página de OS
+            if not await navigate_to_os_page(page, waits):
+                OS_CREATIONS_TOTAL.inc(outcome='failure')
+                logger.error(f"❌ ERRO - Página de OS não carregou - URL: {page.url}")
+                await shot("erro", KIND_FAILURE)
+                await shots.flush()
+                return {"error": f"Página de OS não carregou - URL: {page.url}", "screenshots": shots.files,
+                        "waits": waits.report()}
+        else:
+            logger.info("🔥 STANDBY - Página já pronta em controle_os")
+            waits = WaitEngine(page)
+
+        await shot("04_os_page")
+
+        # ETAPAS 4 a 7: Adicionar nova OS, INEP, Incluir e número da OS
+        logger.info("➕ ADICIONAR OS - Clicando em 'Adicionar nova OS'...")
+        created = await create_os_on_page(page, inep_value, waits, shot)
+
+        if not created['os_created']:
+            OS_CREATIONS_TOTAL.inc(outcome='failure')
+            logger.error("❌ ERRO - Não foi possível criar a OS")
+            await shot("erro", KIND_FAILURE)
+            await shots.flush()
+            return {"error": "Não foi possível criar a OS", "screenshots": shots.files,
+                    "waits": waits.report()}
+
+        os_number = created['os_number']
+        OS_CREATIONS_TOTAL.inc(outcome='success' if os_number else 'no_number')
+        await shot("08_final_result", KIND_KEY if os_number else KIND_FAILURE)
+        await shots.flush()
+
+        return {
+            "success": True,
+            "inep_used": inep_value,
+            "os_number": os_number,
+            "os_number_source": created['os_number_source'],
+            "os_created": True,
+            "screenshots": shots.files,
+            "waits": waits.report(),
+            "message": "OS criada com sucesso!" if os_number else "OS criada, mas número não identificado"
+        }
+
+    except Exception as e:
+        OS_CREATIONS_TOTAL.inc(outcome='error')
+        logger.error(f"❌ ERRO: {e}")
+        if page is not None:
+            await shot("erro", KIND_FAILURE)
+        await shots.flush()
+        return {"error": str(e), "screenshots": shots.files,
+                "waits": waits.report() if waits else None}
+
+
+async def create_os_batch(context: BrowserContext, ineps: List[str],
+                          on_result: Optional[Callable[[Dict], None]] = None,
+                          shots: Optional[ScreenshotSession] = None, page: Optional[Page] = None) -> Dict:
+    """
+    Cria uma OS por INEP com um único login, permanecendo na página controle_os
+
+    Args:
+        context: BrowserContext emprestado do pool
+        ineps: Lista de INEPs
+        on_result: Callback chamado com o resultado de cada item assim que ele termina
+        shots: Screenshots do job (apenas em falhas)
+        page: Página em standby já autenticada e parada em controle_os
+
+    Returns:
+        Resumo do lote com a lista de resultados
+    """
+    results = []
+    waits: Optional[WaitEngine] = None
+    shots = shots or ScreenshotSession()
+
+    def emit(item: Dict):
+        results.append(item)
+        if on_result:
+            on_result(item)
+
+    def fail_remaining(start: int, error: str):
+        for index in range(start, len(ineps)):
+            emit({'index': index, 'inep': ineps[index], 'success': False, 'error': error})
+
+    try:
+        if page is None:
+            page = await open_logged_in_page(context)
+            waits = WaitEngine(page)
+            if not await navigate_to_os_page(page, waits):
+                raise RuntimeError(f"Página de OS não carregou - URL: {page.url}")
+        else:
+            waits = WaitEngine(page)
+    except Exception as e:
+        logger.error(f"❌ LOTE - Erro ao preparar sessão: {e}")
+        fail_remaining(0, str(e))
+        await shots.flush()
+        return {'success': False, 'total': len(ineps), 'created': 0, 'results': results,
+                'waits': waits.report() if waits else None}
+
+    for index, inep_value in enumerate(ineps):
+        logger.info(f"📦 LOTE - Item {index + 1}/{len(ineps)}: INEP {inep_value}")
+        try:
+            created = await create_os_on_page(page, inep_value, waits)
+            item = {
+                'index': index,
+                'inep': inep_value,
+                'success': created['os_created'],
+                'os_number': created['os_number'],
+                'os_number_source': created['os_number_source']
+            }
+            if not created['os_created']:
+                item['error'] = 'Não foi possível criar a OS'
+            OS_CREATIONS_TOTAL.inc(
+                outcome='failure' if not item['success'] else 'success' if item['os_number'] else 'no_number'
+            )
+        except Exception as e:
+            OS_CREATIONS_TOTAL.inc(outcome='error')
+            item = {'index': index, 'inep': inep_value, 'success': False, 'error': str(e)}
+
+        if not item['success']:
+            screenshot = await shots.capture(page, f"batch_{index:03d}_{inep_value}_erro", KIND_FAILURE)
+            item['screenshots'] = [screenshot] if screenshot else []
+        emit(item)
+
+        if index + 1 < len(ineps):
+            recovery_error = await _batch_recover(page, waits, modal_open=not item['success'])
+            if recovery_error:
+                logger.error(f"❌ LOTE - Página não voltou à lista de OS: {recovery_error}")
+                fail_remaining(index + 1, f"Lote interrompido: {recovery_error}")
+                break
+
+    await shots.flush()
+    created_count = sum(1 for item in results if item['success'])
+    logger.info(f"📦 LOTE - Concluído: {created_count}/{len(ineps)} OS criadas")
+    return {
+        'success': created_count == len(ineps),
+        'total': len(ineps),
+        'created': created_count,
+        'results': results,
+        'waits': waits.report()
+    }
+
+
+async def _batch_recover(page: Page, waits: WaitEngine, modal_open: bool) -> Optional[str]:
+    """
+    Volta a página à lista de OS entre dois itens do lote
+
+    Fecha o modal pendente (após uma falha) e espera o botão "Adicionar nova
+    OS"; se ele não voltar, renavega para controle_os uma vez.
+
+    Returns:
+        None se a página está pronta para o próximo item, ou a mensagem de erro
+    """
+    try:
+        if page.is_closed():
+            return 'página fechada'
+        if modal_open:
+            await page.keyboard.press('Escape')
+        if await waits.for_selector('batch_ready', ADICIONAR_OS_SELECTOR, timeout=10000):
+            return None
+        if await navigate_to_os_page(page, waits):
+            return None
+        return f"página de OS não carregou - URL: {page.url}"
+    except Exception as e:
+        return str(e)
+
+
+async def _fill_inep(page: Page, inep_value: str, waits: WaitEngine) -> bool:
+    """
+    Preenche o campo INEP do modal e seleciona a sugestão do autocomplete
+
+    Returns:
+        True se um campo específico foi encontrado, False se usou o fallback Tab + Type
+    """
+    inep_selectors = [
+        "input[placeholder*='INEP']",
+        "input[placeholder*='código']",
+        "input[placeholder*='escola']",
+        "input[type='text']"
+    ]
+
+    async def fill(locator: Locator) -> bool:
+        await locator.first.click()
+        await locator.first.fill(inep_value)
+        return True
+
+    field_found = await get_selector_registry().resolve(page, 'inep_field', inep_selectors, fill) is not None
+
+    if not field_found:
+        # Fallback com Tab + Type
+        await page.keyboard.press('Tab')
+        await page.keyboard.type(inep_value, delay=200)
+
+    # Aguardar a busca do autocomplete e a renderização das sugestões
+    await waits.for_network_idle('inep_autocomplete', timeout=5000)
+    await waits.for_dom_quiet('inep_suggestions', quiet_ms=300, timeout=3000)
+
+    await page.keyboard.press('ArrowDown')
+    await page.keyboard.press('Enter')
+    await waits.for_selector('incluir_enabled', INCLUIR_ENABLED_SELECTOR, timeout=4000)
+    return field_found
+
+
+async def direct_os_access(context: BrowserContext, inep_value: str,
+                           shots: Optional[ScreenshotSession] = None) -> Dict:
+    """
+    Acesso direto à página OS: abre o modal, preenche o INEP e verifica o botão "Incluir"
+
+    O botão "Incluir" não é clicado.
+
+    Args:
+        context: BrowserContext emprestado do pool
+        inep_value: Número INEP da escola
+        shots: Screenshots do job (padrão: uma sessão nova no nível configurado)
+
+    Returns:
+        Resultado do acesso ou {'error': ...}
+    """
+    shots = shots or ScreenshotSession()
+    page: Optional[Page] = None
+    waits: Optional[WaitEngine] = None
+
+    try:
+        logger.info("🚀 ACESSO DIRETO - Iniciando automação simplificada")
+
+        # PASSOS 1 e 2: Login e perfil Fornecedor (reaproveita sessão em cache)
+        page = await open_logged_in_page(context)
+        waits = WaitEngine(page)
+        await shots.capture(page, "direct_02_dashboard")
+
+        # PASSOS 3 e 4: Deep link para a página de OS; se falhar, clicar em "portable_wifi_off"
+        async def _discover_by_icon(page: Page):
+            logger.info("🎯 ACESSO OS - Clicando em elemento com texto 'portable_wifi_off'")
+            await page.click('text="portable_wifi_off"')
+
+        await navigate_to_os_page(page, waits, discover=_discover_by_icon, timeout=36000)
+        await waits.for_dom_quiet('os_page_render', quiet_ms=500, timeout=5000)
+        await shots.capture(page, "direct_03_os_page", KIND_KEY)
+
+        # Mapear elementos visíveis para debug
+        all_elements = await page.evaluate("""
+            () => {
+                const elements = [];
+                const allElements = document.querySelectorAll('button, a, div, span');
+
+                allElements.forEach((el, index) => {
+                    const rect = el.getBoundingClientRect();
+                    const text = el.textContent?.trim() || '';
+                    const style = window.getComputedStyle(el);
+
+                    if (rect.width > 0 && rect.height > 0 && text.length > 0 &&
+                        style.display !== 'none' && style.visibility !== 'hidden') {
+                        elements.push({
+                            tagName: el.tagName,
+                            text: text,
+                            classes: el.className,
+                            id: el.id,
+                            index: index,
+                            visible: true,
+                            clickable: !el.disabled
+                        });
+                    }
+                });
+
+                return elements;
+            }
+        """)
+
+        keywords = ('adicionar', 'nova', 'novo', 'add', 'create', 'criar')
+        adicionar_elements = [el for el in all_elements if any(k in el['text'].lower() for k in keywords)]
+        os_elements = [el for el in all_elements
+                       if any(k in el['text'].lower() for k in ('os', 'order', 'chamado'))]
+        logger.info(f"🔍 ADICIONAR OS - Visíveis: {len(all_elements)}, candidatos: {len(adicionar_elements)}")
+
+        with open(shots.path("debug_elements.json"), "w") as f:
+            json.dump({
+                'total_elements': len(all_elements),
+                'adicionar_elements': len(adicionar_elements),
+                'os_elements': len(os_elements),
+                'all_elements_sample': all_elements[:20],
+                'adicionar_elements_full': adicionar_elements,
+                'os_elements_full': os_elements
+            }, f, indent=2)
+
+        # PASSO 5: Procurar e clicar em "Adicionar nova OS"
+        adicionar_selectors = [
+            "text='Adicionar nova OS'",
+            "button:has-text('Adicionar nova OS')",
+            "//button[contains(text(), 'Adicionar nova OS')]",
+            "//*[contains(text(), 'Adicionar nova OS')]",
+            "text='Adicionar OS'",
+            "button:has-text('Adicionar OS')",
+            "//button[contains(text(), 'Adicionar')]"
+        ]
+
+        adicionar_clicked = False
+        modal_filled = False
+        button_active = False
+
+        async def open_modal(locator: Locator) -> bool:
+            await locator.click()
+            await shots.capture(page, "direct_04_immediate_after_click")
+
+            # Aguardar o modal (antes: 2 s + 2 s + 30 s + 5 s fixos)
+            return await waits.for_selector('modal_opened', INEP_FIELD_SELECTOR, timeout=39000)
+
+        selector = await get_selector_registry().resolve(page, 'adicionar_os', adicionar_selectors, open_modal)
+        if selector:
+            logger.info(f"📍 ADICIONAR OS - Modal aberto com: {selector}")
+            await shots.capture(page, "direct_05_modal")
+
+            # PASSO 6: Preencher campo INEP no modal
+            logger.info(f"📝 MODAL - Preenchendo campo INEP: {inep_value}")
+            try:
+                await _fill_inep(page, inep_value, waits)
+                await shots.capture(page, "direct_08_typed", KIND_KEY)
+                modal_filled = True
+                button_active = await _incluir_button_active(page)
+            except Exception as e:
+                logger.error(f"❌ MODAL - Erro no preenchimento: {e}")
+                modal_filled = False
+
+            await shots.capture(page, "direct_09_final_result", KIND_KEY if button_active else KIND_FAILURE)
+            adicionar_clicked = True
+        else:
+            logger.error("❌ ADICIONAR OS - Nenhum seletor abriu o modal")
+            await shots.capture(page, "direct_erro_modal", KIND_FAILURE)
+
+        if modal_filled and button_active:
+            logger.info("🎉 SUCESSO COMPLETO - INEP preenchido e botão 'Incluir' ativado (não clicado)")
+        elif modal_filled:
+            logger.warning("⚠️ PARCIAL: Campo preenchido mas botão não ativado")
+        else:
+            logger.error("❌ FALHA: Não foi possível preencher o campo INEP")
+
+        await shots.flush()
+        return {
+            "success": True,
+            "screenshots": shots.files,
+            "adicionar_clicked": adicionar_clicked,
+            "modal_filled": modal_filled,
+            "button_active": button_active,
+            "inep_used": inep_value,
+            "total_elements": len(all_elements),
+            "adicionar_elements": len(adicionar_elements),
+            "waits": waits.report(),
+            "message": "Automação concluída com sucesso - Modal aberto e INEP preenchido"
+        }
+
+    except Exception as e:
+        logger.error(f"❌ ERRO: {e}")
+        if page is not None:
+            await shots.capture(page, "direct_erro", KIND_FAILURE)
+        await shots.flush()
+        return {"error": str(e), "screenshots": shots.files,
+                "waits": waits.report() if waits else None}
+
+
+async def _incluir_button_active(page: Page) -> bool:
+    """Verifica se o botão "Incluir" do modal foi ativado"""
+    button_check = await page.evaluate("""
+        () => {
+            const buttons = document.querySelectorAll('button');
+            for (let btn of buttons) {
+                const text = btn.textContent?.toLowerCase().trim();
+                if (text && text.includes('incluir')) {
+                    const style = window.getComputedStyle(btn);
+                    return {
+                        found: true,
+                        disabled: btn.disabled,
+                        cursor: style.cursor,
+                        isActive: !btn.disabled && style.cursor === 'pointer' && style.opacity !== '0.5'
+                    };
+                }
+            }
+            return { found: false };
+        }
+    """)
+
+    if not button_check['found']:
+        logger.error("❌ MODAL - Botão 'Incluir' não encontrado")
+        return False
+
+    logger.info(f"🔍 MODAL - Botão 'Incluir': disabled={button_check['disabled']}, cursor={button_check['cursor']}")
+    return button_check['isActive']
+
+
+async def detect_os_page(context: BrowserContext) -> Dict:
+    """
+    Teste da detecção da página de OS após clicar em "portable_wifi_off"
+
+    Args:
+        context: BrowserContext emprestado do pool
+
+    Returns:
+        {'success', 'indicators', 'osTexts', 'allTexts'} ou {'error': ...}
+    """
+    try:
+        page = await open_logged_in_page(context)
+        waits = WaitEngine(page)
+
+        await page.click('text="portable_wifi_off"')
+        await waits.for_selector('os_page', ADICIONAR_OS_SELECTOR, timeout=10000)
+
+        texts = await page_texts(page)
+        os_texts = [text for text in texts
+                    if any(k in text for k in ('OS', 'Relatório', 'Total', 'Controle', 'Adicionar'))]
+
+        indicators = []
+        if any(text in ('Total de OS', 'OS por estado', 'Relatório de OS') or
+               any(k in text for k in ('Controle de OS', 'Adicionar nova OS', 'Gerenciar chamados'))
+               for text in texts):
+            indicators.append('os_page_found')
+
+        return {
+            "success": len(indicators) > 0,
+            "indicators": indicators,
+            "osTexts": os_texts,
+            "allTexts": texts[:50],
+            "waits": waits.report()
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def navigation_test(context: BrowserContext, open_modal: bool = False,
+                          shots: Optional[ScreenshotSession] = None) -> Dict:
+    """
+    Teste de navegação: login, página controle_os e, opcionalmente, o modal "Adicionar nova OS"
+
+    Nenhuma OS é criada (o modal não é preenchido).
+
+    Args:
+        context: BrowserContext emprestado do pool
+        open_modal: Clicar em "Adicionar nova OS" e esperar o campo INEP
+        shots: Screenshots do job (padrão: uma sessão nova no nível configurado)
+
+    Returns:
+        {'success', 'final_url', 'os_page', 'modal_opened', 'screenshots', 'waits'} ou {'error': ...}
+    """
+    shots = shots or ScreenshotSession()
+    page: Optional[Page] = None
+    waits: Optional[WaitEngine] = None
+
+    try:
+        logger.info("🚀 TESTE - Login e navegação até a página de OS")
+        page = await open_logged_in_page(context)
+        waits = WaitEngine(page)
+        await shots.capture(page, "test_01_dashboard")
+
+        os_page = await navigate_to_os_page(page, waits)
+        await shots.capture(page, "test_02_os_page", KIND_KEY if os_page else KIND_FAILURE)
+
+        modal_opened = None
+        if open_modal and os_page:
+            logger.info("🎯 ADICIONAR OS - Abrindo modal")
+            with phase('open_modal') as current:
+                await page.click(ADICIONAR_OS_SELECTOR)
+                modal_opened = await waits.for_selector('modal_opened', INEP_FIELD_SELECTOR, timeout=10000)
+                if not modal_opened:
+                    current.fail()
+            await shots.capture(page, "test_03_modal", KIND_KEY if modal_opened else KIND_FAILURE)
+
+        success = os_page and (modal_opened or not open_modal)
+        if success:
+            logger.info(f"✅ TESTE - Concluído com sucesso: {page.url}")
+        else:
+            logger.error(f"❌ TESTE - Falhou (página de OS: {os_page}, modal: {modal_opened}): {page.url}")
+
+        await shots.flush()
+        return {
+            "success": bool(success),
+            "final_url": page.url,
+            "os_page": os_page,
+            "modal_opened": modal_opened,
+            "screenshots": shots.files,
+            "waits": waits.report()
+        }
+
+    except Exception as e:
+        logger.error(f"❌ ERRO: {e}")
+        if page is not None:
+            await shots.capture(page, "test_erro", KIND_FAILURE)
+        await shots.flush()
+        return {"error": str(e), "screenshots": shots.files,
+                "waits": waits.report() if waits else None}
+
+
+async def menu_navigation_test(context: BrowserContext, shots: Optional[ScreenshotSession] = None) -> Dict:
+    """
+    Teste da navegação pelo menu lateral (sem o deep link em cache) até a página de OS
+
+    Cada fase é registrada no log do job, que chega ao stream SSE pelo current_job_id.
+
+    Args:
+        context: BrowserContext emprestado do pool
+        shots: Screenshots do job (padrão: uma sessão nova no nível configurado)
+
+    Returns:
+        {'success', 'final_url', 'menu_expanded', 'chamados_clicked', 'screenshots', 'waits'} ou {'error': ...}
+    """
+    shots = shots or ScreenshotSession()
+    page: Optional[Page] = None
+    waits: Optional[WaitEngine] = None
+
+    try:
+        logger.info("🚀 TESTE MENU - Login e navegação pelo menu lateral")
+        page = await open_logged_in_page(context)
+        waits = WaitEngine(page)
+        logger.info(f"✅ TESTE MENU - Dashboard carregado: {page.url}")
+        await shots.capture(page, "menu_01_dashboard", KIND_KEY)
+
+        logger.info("🔍 FASE 1 e 2: Expandindo o menu e clicando em 'Gerenciar chamados'...")
+        steps = await _discover_os_page_by_menu(page, waits)
+        if steps['menu_expanded']:
+            logger.info("✅ MENU - Menu lateral expandido")
+        else:
+            logger.error("❌ MENU - Não conseguiu expandir o menu lateral")
+        await shots.capture(page, "menu_02_chamados", KIND_KEY if steps['chamados_clicked'] else KIND_FAILURE)
+
+        os_page = steps['chamados_clicked'] and await waits.for_selector(
+            'menu_os_page', ADICIONAR_OS_SELECTOR, timeout=15000
+        )
+        await shots.capture(page, "menu_03_final", KIND_KEY if os_page else KIND_FAILURE)
+
+        if os_page:
+            logger.info(f"🎉 TESTE MENU - Página de OS aberta pelo menu: {page.url}")
+        else:
+            logger.error(f"❌ TESTE MENU - Não chegou à página de OS: {page.url}")
+
+        await shots.flush()
+        return {
+            "success": bool(os_page),
+            "final_url": page.url,
+            "menu_expanded": steps['menu_expanded'],
+            "chamados_clicked": steps['chamados_clicked'],
+            "screenshots": shots.files,
+            "waits": waits.report()
+        }
+
+    except Exception as e:
+        logger.error(f"❌ ERRO: {e}")
+        if page is not None:
+            await shots.capture(page, "menu_erro", KIND_FAILURE)
+        await shots.flush()
+        return {"error": str(e), "screenshots": shots.files,
+                "waits": waits.report() if waits else None}
+
+
+# Elementos visíveis com texto (botões, links, campos e itens de menu) da página atual
+_VISIBLE_ELEMENTS_SCRIPT = """
+() => {
+    const elements = [];
+    const selectors = 'button, a, input, [role="button"], [role="menuitem"], nav *, [class*="menu"], [class*="sidebar"]';
+    document.querySelectorAll(selectors).forEach(el => {
+        const rect = el.getBoundingClientRect();
+        const text = (el.textContent || el.value || el.placeholder || '').trim();
+        if (rect.width > 0 && rect.height > 0 && el.offsetParent !== null && text) {
+            elements.push({
+                tagName: el.tagName.toLowerCase(),
+                text: text.substring(0, 100),
+                classes: typeof el.className === 'string' ? el.className : '',
+                id: el.id || '',
+                href: el.href || '',
+                position: {x: rect.left, y: rect.top, width: rect.width, height: rect.height}
+            });
+        }
+    });
+    return elements;
+}
+"""
+
+
+async def map_page_elements(context: BrowserContext, destination: str = 'dashboard',
+                            shots: Optional[ScreenshotSession] = None) -> Dict:
+    """
+    Mapeia os elementos visíveis do dashboard ou da página de OS
+
+    Args:
+        context: BrowserContext emprestado do pool
+        destination: 'dashboard' ou 'controle_os'
+        shots: Screenshots do job (padrão: uma sessão nova no nível configurado)
+
+    Returns:
+        {'success', 'url', 'elements', 'adicionar_button_found', 'screenshots', 'waits'} ou {'error': ...}
+    """
+    shots = shots or ScreenshotSession()
+    page: Optional[Page] = None
+    waits: Optional[WaitEngine] = None
+
+    try:
+        logger.info(f"🚀 MAPEAMENTO - Login e mapeamento de elementos ({destination})")
+        page = await open_logged_in_page(context)
+        waits = WaitEngine(page)
+
+        loaded = True
+        if destination == 'controle_os':
+            loaded = await navigate_to_os_page(page, waits)
+            if not loaded:
+                logger.error(f"❌ MAPEAMENTO - Página de OS não carregou: {page.url}")
+
+        elements = await page.evaluate(_VISIBLE_ELEMENTS_SCRIPT)
+        adicionar_button_found = any('adicionar nova os' in element['text'].lower() for element in elements)
+        logger.info(f"📊 MAPEAMENTO - {len(elements)} elementos visíveis em {page.url}")
+        if adicionar_button_found:
+            logger.info("🎯 MAPEAMENTO - Botão 'Adicionar nova OS' encontrado")
+
+        await shots.capture(page, f"map_{destination}", KIND_KEY if loaded else KIND_FAILURE)
+        await shots.flush()
+        return {
+            "success": loaded,
+            "url": page.url,
+            "elements": elements,
+            "adicionar_button_found": adicionar_button_found,
+            "screenshots": shots.files,
+            "waits": waits.report()
+        }
+
+    except Exception as e:
+        logger.error(f"❌ ERRO: {e}")
+        if page is not None:
+            await shots.capture(page, "map_erro", KIND_FAILURE)
+        await shots.flush()
+        return {"error": str(e), "screenshots": shots.files,
+                "waits": waits.report() if waits else None}
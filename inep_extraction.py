@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Extração do código INEP (8 dígitos) de nomes de sites e descrições de tickets
+
+Antes havia uma cópia desta lógica em cada módulo (webhook_realtime,
+batch_create_os, webhook_simple), algumas importando `re` e compilando a
+regex a cada chamada. Aqui os padrões são compilados uma vez, o caminho
+comum ("ESCOLA X - 31382221") é resolvido com operações de string, nomes
+repetidos saem de um cache e a API em lote extrai cada nome distinto uma
+única vez.
+
+Formatos de nome de site reconhecidos:
+    "INEP - 31382221", "ESCOLA ESTADUAL X - 31382221 - BH"
+    "INEP: 31382221", "INEP 31382221", "inep-31382221", "ESCOLA X (INEP 31382221)"
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+INEP_CACHE_SIZE = int(os.getenv('INEP_CACHE_SIZE', '65536'))
+
+# "INEP" seguido do código, com ou sem ":" / "-" / espaços (aplicada ao nome em maiúsculas)
+_SITE_PATTERN = re.compile(r'INEP[:\s-]*(\d{8})')
+# Descrições livres de ticket: primeiro código de 8 dígitos depois de "INEP"
+_TEXT_PATTERN = re.compile(r'INEP.*?(\d{8})')
+
+_SEPARATOR = ' - '
+
+
+def is_valid_inep(value: str) -> bool:
+    """Código INEP bem formado: exatamente 8 dígitos"""
+    return len(value) == 8 and value.isdigit()
+
+
+@lru_cache(maxsize=INEP_CACHE_SIZE)
+def extract_inep(site_nome: str) -> Optional[str]:
+    """
+    Extrai o INEP do nome de um site
+
+    Args:
+        site_nome: Nome do site (ex: "INEP - 31382221")
+
+    Returns:
+        Código INEP ou None se não encontrado
+    """
+    if not site_nome:
+        return None
+
+    # Caminho comum: o código é o segundo campo de "NOME - CÓDIGO [- ...]"
+    _, separator, rest = site_nome.partition(_SEPARATOR)
+    if separator:
+        inep = rest.partition(_SEPARATOR)[0].strip()
+        if is_valid_inep(inep):
+            return inep
+
+    # A regex só roda em nomes que contêm "INEP"
+    upper = site_nome.upper()
+    if 'INEP' not in upper:
+        return None
+    match = _SITE_PATTERN.search(upper)
+    return match.group(1) if match else None
+
+
+def extract_ineps(site_names: Iterable[str]) -> List[Optional[str]]:
+    """
+    Extrai o INEP de uma lista de nomes, processando cada nome distinto uma vez
+
+    Returns:
+        INEPs na mesma ordem dos nomes (None onde não houver)
+    """
+    names = list(site_names)
+    found = {name: extract_inep(name) for name in set(names)}
+    return [found[name] for name in names]
+
+
+def extract_site_ineps(sites: Iterable[Dict]) -> Dict[int, Optional[str]]:
+    """
+    INEP de cada linha de uma tabela sites
+
+    Args:
+        sites: Linhas com 'id' e 'nome'
+
+    Returns:
+        {site_id: INEP ou None}
+    """
+    rows = list(sites)
+    ineps = extract_ineps(row.get('nome') or '' for row in rows)
+    return {row['id']: inep for row, inep in zip(rows, ineps)}
+
+
+def inep_from_text(text: str) -> Optional[str]:
+    """
+    Extrai o INEP de um texto livre (ex: descricao_enviada de um ticket)
+
+    Returns:
+        Primeiro código de 8 dígitos após "INEP", ou None
+    """
+    if not text or 'INEP' not in text:
+        return None
+    match = _TEXT_PATTERN.search(text)
+    return match.group(1) if match else None
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Fila de jobs persistente (SQLite) com pool de workers
+
+Substitui o `threading.Thread` por ticket: os jobs ficam gravados em disco
+(queued/running/done/failed), são consumidos por um número fixo de workers,
+reprocessados com backoff exponencial em caso de falha e recuperados na
+inicialização se o processo cair no meio da execução.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from log_stream import current_job_id
+from metrics import JOBS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+JOB_DB_PATH = os.getenv('JOB_DB_PATH', 'data/jobs.db')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+JOB_BACKOFF_SECONDS = float(os.getenv('JOB_BACKOFF_SECONDS', '30'))
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    next_run_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    last_error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_next ON jobs (status, next_run_at);
+CREATE TABLE IF NOT EXISTS job_keys (
+    key TEXT PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    window_seconds REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_job_keys_job ON job_keys (job_id);
+"""
+
+
+class JobFailed(Exception):
+    """Falha de um job que deve ser reprocessada conforme a política de retry"""
+
+
+class JobQueue:
+    def __init__(self, db_path: str = JOB_DB_PATH, workers: int = JOB_WORKERS,
+                 max_attempts: int = JOB_MAX_ATTEMPTS, backoff_seconds: float = JOB_BACKOFF_SECONDS):
+        """
+        Inicializa a fila persistente
+
+        Args:
+            db_path: Caminho do banco SQLite
+            workers: Número de workers consumindo a fila
+            max_attempts: Tentativas por job antes de marcar como 'failed'
+            backoff_seconds: Base do backoff exponencial entre tentativas
+        """
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.handlers: Dict[str, Callable[[Dict], Any]] = {}
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def register(self, kind: str, handler: Callable[[Dict], Any]):
+        """
+        Registra o handler de um tipo de job
+
+        O handler recebe o payload e retorna o resultado (serializável em JSON).
+        Exceções fazem o job ser reprocessado com backoff.
+        """
+        self.handlers[kind] = handler
+
+    def recover(self) -> int:
+        """Devolve para a fila os jobs que estavam 'running' quando o processo caiu"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                (STATUS_QUEUED, time.time(), STATUS_RUNNING)
+            )
+        if cursor.rowcount:
+            logger.info(f"🔁 {cursor.rowcount} jobs interrompidos devolvidos para a fila")
+        return cursor.rowcount
+
+    def start(self):
+        """Recupera jobs interrompidos e inicia os workers"""
+        self.recover()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'job-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"👷 Fila de jobs iniciada com {self.workers} workers ({self.db_path})")
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+
+    def enqueue(self, kind: str, payload: Dict, max_attempts: Optional[int] = None) -> int:
+        """
+        Adiciona um job à fila
+
+        Args:
+            kind: Tipo do job (handler registrado)
+            payload: Dados do job
+            max_attempts: Sobrescreve o número de tentativas da fila
+
+        Returns:
+            ID do job
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, payload, status, max_attempts, next_run_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, json.dumps(payload), STATUS_QUEUED, max_attempts or self.max_attempts, now, now, now)
+            )
+            job_id = cursor.lastrowid
+
+        with self._wakeup:
+            self._wakeup.notify()
+
+        logger.info(f"📥 Job {job_id} ({kind}) enfileirado")
+        return job_id
+
+    def enqueue_unique(self, kind: str, payload: Dict, keys: Dict[str, float],
+                       max_attempts: Optional[int] = None) -> Tuple[int, bool]:
+        """
+        Enfileira um job, a menos que um job com alguma das chaves já esteja em andamento
+
+        Uma chave fica presa ao job enquanto ele está na fila ou rodando e, depois
+        que ele termina com sucesso, por mais `window` segundos. Jobs que falham
+        definitivamente liberam as chaves na hora.
+
+        Args:
+            kind: Tipo do job
+            payload: Dados do job
+            keys: {chave de deduplicação: janela em segundos após a conclusão}
+            max_attempts: Sobrescreve o número de tentativas da fila
+
+        Returns:
+            (ID do job, True se foi criado agora / False se é um job existente)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for key in keys:
+                    row = self._conn.execute(
+                        "SELECT job_id FROM job_keys WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                        (key, now)
+                    ).fetchone()
+                    if row is not None:
+                        self._conn.execute('COMMIT')
+                        logger.info(f"🔗 Job {row['job_id']} já em andamento para '{key}'; requisição deduplicada")
+                        return row['job_id'], False
+
+                cursor = self._conn.execute(
+                    "INSERT INTO jobs (kind, payload, status, max_attempts, next_run_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, json.dumps(payload), STATUS_QUEUED, max_attempts or self.max_attempts, now, now, now)
+                )
+                job_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO job_keys (key, job_id, window_seconds, expires_at) VALUES (?, ?, ?, NULL)",
+                    [(key, job_id, window) for key, window in keys.items()]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        with self._wakeup:
+            self._wakeup.notify()
+
+        logger.info(f"📥 Job {job_id} ({kind}) enfileirado com chaves {list(keys)}")
+        return job_id, True
+
+    def find_key(self, key: str) -> Optional[int]:
+        """Job que ainda detém a chave de deduplicação, se houver"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id FROM job_keys WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            ).fetchone()
+        return row['job_id'] if row else None
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Reserva atomicamente o próximo job disponível"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? AND next_run_at <= ? ORDER BY next_run_at, id LIMIT 1",
+                    (STATUS_QUEUED, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, updated_at = ? "
+                        "WHERE id = ?",
+                        (STATUS_RUNNING, now, now, row['id'])
+                    )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return row
+
+    def _next_due_in(self) -> float:
+        """Segundos até o próximo job agendado (para dormir sem polling curto)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_run_at) FROM jobs WHERE status = ?", (STATUS_QUEUED,)
+            ).fetchone()
+        if row[0] is None:
+            return 60
+        return max(0.0, min(60, row[0] - time.time()))
+
+    def _worker(self):
+        while not self._stop.is_set():
+            try:
+                row = self._claim()
+            except Exception as e:
+                logger.error(f"❌ Erro ao reservar job: {e}")
+                self._stop.wait(1)
+                continue
+
+            if row is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=self._next_due_in())
+                continue
+
+            self._run(row)
+
+    def _run(self, row: sqlite3.Row):
+        job_id = row['id']
+        attempts = row['attempts'] + 1
+        handler = self.handlers.get(row['kind'])
+        # Screenshots e logs do handler ficam sob o id do job (usado pela retenção)
+        token = current_job_id.set(str(job_id))
+
+        try:
+            if handler is None:
+                raise JobFailed(f"Nenhum handler registrado para '{row['kind']}'")
+
+            logger.info(f"▶️ Job {job_id} ({row['kind']}) tentativa {attempts}/{row['max_attempts']}")
+            result = handler(json.loads(row['payload']))
+            self._finish(job_id, STATUS_DONE, result=result)
+            JOBS_TOTAL.inc(kind=row['kind'], status=STATUS_DONE)
+            logger.info(f"✅ Job {job_id} concluído")
+
+        except Exception as e:
+            if attempts < row['max_attempts'] and handler is not None:
+                delay = self.backoff_seconds * (2 ** (attempts - 1))
+                with self._lock:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, next_run_at = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                        (STATUS_QUEUED, time.time() + delay, str(e), time.time(), job_id)
+                    )
+                logger.warning(f"⚠️ Job {job_id} falhou ({e}); nova tentativa em {delay:.0f}s")
+                JOBS_TOTAL.inc(kind=row['kind'], status='retried')
+            else:
+                self._finish(job_id, STATUS_FAILED, error=str(e))
+                JOBS_TOTAL.inc(kind=row['kind'], status=STATUS_FAILED)
+                logger.error(f"💥 Job {job_id} falhou definitivamente: {e}")
+        finally:
+            current_job_id.reset(token)
+
+    def _finish(self, job_id: int, status: str, result: Any = None, error: Optional[str] = None):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, last_error = COALESCE(?, last_error), "
+                "finished_at = ?, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result, default=str) if result is not None else None, error, now, now, job_id)
+            )
+            # Chaves de deduplicação: mantidas pela janela após sucesso, liberadas após falha
+            if status == STATUS_DONE:
+                self._conn.execute(
+                    "UPDATE job_keys SET expires_at = ? + window_seconds WHERE job_id = ?", (now, job_id)
+                )
+            else:
+                self._conn.execute("DELETE FROM job_keys WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM job_keys WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        """Retorna o estado de um job"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Lista os jobs mais recentes, opcionalmente filtrando por status"""
+        with self._lock:
+            if status:
+                rows = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def depth(self) -> int:
+        """Jobs aguardando execução"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (STATUS_QUEUED,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict:
+        """Contagem de jobs por status"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {STATUS_QUEUED: 0, STATUS_RUNNING: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        counts.update({row[0]: row[1] for row in rows})
+        counts['workers'] = self.workers
+        return counts
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        if job['result'] is not None:
+            job['result'] = json.loads(job['result'])
+        return job
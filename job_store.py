@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Registro de jobs de automação assíncronos
+
+As rotas longas devolvem um job_id (202) e o resultado é consultado em
+GET /jobs/<id>. Os jobs ficam em memória (limitados) e em SQLite, para que
+o histórico recente e as chaves de deduplicação sobrevivam a reinícios.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from metrics import JOBS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+JOB_STORE_PATH = os.getenv('JOB_STORE_PATH', 'data/automation_jobs.db')
+JOB_STORE_MAX = int(os.getenv('JOB_STORE_MAX', '500'))
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+FINAL_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS automation_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_automation_jobs_created ON automation_jobs (created_at);
+CREATE TABLE IF NOT EXISTS automation_job_keys (
+    key TEXT PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    window_seconds REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_automation_job_keys_job ON automation_job_keys (job_id);
+"""
+
+_COLUMNS = ('id', 'kind', 'params', 'status', 'created_at', 'started_at', 'finished_at', 'result', 'error')
+
+
+class JobStore:
+    def __init__(self, db_path: str = JOB_STORE_PATH, max_jobs: int = JOB_STORE_MAX):
+        """
+        Inicializa o registro de jobs
+
+        Args:
+            db_path: Caminho do banco SQLite
+            max_jobs: Número máximo de jobs mantidos (memória e disco)
+        """
+        self.db_path = db_path
+        self.max_jobs = max(1, max_jobs)
+        self._jobs: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._recover()
+
+    def _recover(self):
+        """
+        Jobs que estavam em andamento quando o processo caiu não têm como continuar
+
+        Um job interrompido já em execução pode ter criado a OS: as chaves dele
+        ficam presas pela janela, como após um sucesso, para que um reenvio do
+        mesmo ticket não rode a automação de novo. Jobs que nem começaram liberam
+        as chaves.
+        """
+        now = time.time()
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._conn.execute(
+                "UPDATE automation_job_keys SET expires_at = ? + window_seconds WHERE expires_at IS NULL AND "
+                "job_id IN (SELECT id FROM automation_jobs WHERE status = ?)", (now, STATUS_RUNNING)
+            )
+            self._conn.execute("DELETE FROM automation_job_keys WHERE expires_at IS NULL OR expires_at <= ?", (now,))
+            cursor = self._conn.execute(
+                "UPDATE automation_jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+                (STATUS_FAILED, 'Interrompido por reinício do servidor', now, STATUS_QUEUED, STATUS_RUNNING)
+            )
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        if cursor.rowcount:
+            logger.warning(f"⚠️ {cursor.rowcount} jobs interrompidos marcados como 'failed'")
+
+    def _persist(self, job: Dict):
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO automation_jobs ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            (job['id'], job['kind'], json.dumps(job['params']), job['status'], job['created_at'],
+             job['started_at'], job['finished_at'],
+             json.dumps(job['result'], default=str) if job['result'] is not None else None, job['error'])
+        )
+
+    def create(self, kind: str, params: Dict) -> Dict:
+        """
+        Registra um novo job
+
+        Args:
+            kind: Tipo do job (ex: 'create_os_with_inep')
+            params: Parâmetros da requisição
+
+        Returns:
+            Cópia do job criado
+        """
+        job = self._new_job(kind, params)
+
+        with self._lock:
+            self._add(job)
+
+        return dict(job)
+
+    def create_unique(self, kind: str, params: Dict, keys: Dict[str, float]) -> Tuple[Dict, bool]:
+        """
+        Registra um novo job, a menos que um job com alguma das chaves esteja em andamento
+
+        A chave fica presa ao job enquanto ele não termina e, se ele terminar com
+        sucesso (ou for interrompido por um reinício durante a execução), por mais
+        `window` segundos. Falhas liberam a chave. As chaves ficam no SQLite e
+        valem mesmo depois de o job sair da memória ou de um reinício.
+
+        Args:
+            kind: Tipo do job
+            params: Parâmetros da requisição
+            keys: {chave de deduplicação: janela em segundos após a conclusão}
+
+        Returns:
+            (cópia do job, True se foi criado agora / False se é um job existente)
+        """
+        with self._lock:
+            now = time.time()
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for key in keys:
+                    existing = self._active_key(key, now)
+                    if existing is not None:
+                        self._conn.execute('COMMIT')
+                        logger.info(f"🔗 Job {existing['id']} já em andamento para '{key}'; requisição deduplicada")
+                        return existing, False
+
+                job = self._new_job(kind, params)
+                self._add(job)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO automation_job_keys (key, job_id, window_seconds, expires_at) "
+                    "VALUES (?, ?, ?, NULL)",
+                    [(key, job['id'], window) for key, window in keys.items()]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        return dict(job), True
+
+    def _active_key(self, key: str, now: float) -> Optional[Dict]:
+        """Job (da memória ou do disco) que ainda detém a chave, descartando chaves vencidas"""
+        row = self._conn.execute(
+            "SELECT job_id FROM automation_job_keys WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, now)
+        ).fetchone()
+        job = self._load(row['job_id']) if row else None
+        if job is None:
+            self._conn.execute("DELETE FROM automation_job_keys WHERE key = ?", (key,))
+        return job
+
+    @staticmethod
+    def _new_job(kind: str, params: Dict) -> Dict:
+        return {
+            'id': uuid.uuid4().hex,
+            'kind': kind,
+            'params': params,
+            'status': STATUS_QUEUED,
+            'created_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None
+        }
+
+    def _add(self, job: Dict):
+        self._jobs[job['id']] = job
+        self._persist(job)
+        self._prune()
+
+    def _prune(self):
+        """Descarta os jobs finalizados mais antigos acima do limite (no disco, só os sem chave ativa)"""
+        while len(self._jobs) > self.max_jobs:
+            oldest_id = next((job_id for job_id, job in self._jobs.items() if job['status'] in FINAL_STATUSES), None)
+            if oldest_id is None:
+                break
+            del self._jobs[oldest_id]
+
+        self._conn.execute(
+            "DELETE FROM automation_jobs WHERE id IN ("
+            " SELECT id FROM automation_jobs WHERE status IN (?, ?) ORDER BY created_at DESC LIMIT -1 OFFSET ?)"
+            " AND id NOT IN (SELECT job_id FROM automation_job_keys)",
+            (STATUS_DONE, STATUS_FAILED, self.max_jobs)
+        )
+
+    def update(self, job_id: str, **fields):
+        """Atualiza campos de um job"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            self._persist(job)
+
+    def mark_running(self, job_id: str):
+        self.update(job_id, status=STATUS_RUNNING, started_at=time.time())
+
+    def finish(self, job_id: str, result: Any = None, error: Optional[str] = None):
+        """Finaliza um job; resultados com chave 'error' contam como falha"""
+        if error is None and isinstance(result, dict) and result.get('error'):
+            error = str(result['error'])
+
+        status = STATUS_FAILED if error else STATUS_DONE
+        self.update(
+            job_id,
+            status=status,
+            finished_at=time.time(),
+            result=result,
+            error=error
+        )
+
+        with self._lock:
+            # Chaves de deduplicação: mantidas pela janela após sucesso, liberadas após falha
+            now = time.time()
+            if status == STATUS_DONE:
+                self._conn.execute(
+                    "UPDATE automation_job_keys SET expires_at = ? + window_seconds WHERE job_id = ?", (now, job_id)
+                )
+            else:
+                self._conn.execute("DELETE FROM automation_job_keys WHERE job_id = ?", (job_id,))
+            self._conn.execute(
+                "DELETE FROM automation_job_keys WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+            )
+
+            job = self._jobs.get(job_id)
+            self._prune()
+        JOBS_TOTAL.inc(kind=job['kind'] if job else 'unknown', status=status)
+
+    def track(self, job_id: str, future: concurrent.futures.Future):
+        """Finaliza o job automaticamente quando o future terminar"""
+        def _done(f: concurrent.futures.Future):
+            if f.cancelled():
+                self.finish(job_id, error='Cancelado')
+            elif f.exception() is not None:
+                self.finish(job_id, error=str(f.exception()) or type(f.exception()).__name__)
+            else:
+                self.finish(job_id, result=f.result())
+
+        future.add_done_callback(_done)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Retorna um job da memória ou, se já descartado dela, do disco"""
+        with self._lock:
+            return self._load(job_id)
+
+    def _load(self, job_id: str) -> Optional[Dict]:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return dict(job)
+
+        row = self._conn.execute("SELECT * FROM automation_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Lista os jobs mais recentes (sem o resultado completo)"""
+        with self._lock:
+            if status:
+                rows = self._conn.execute(
+                    "SELECT * FROM automation_jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM automation_jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+
+        jobs = []
+        for row in rows:
+            job = self._row_to_dict(row)
+            job.pop('result')
+            jobs.append(job)
+        return jobs
+
+    def stats(self) -> Dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM automation_jobs GROUP BY status").fetchall()
+        counts = {STATUS_QUEUED: 0, STATUS_RUNNING: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+
+
+_job_store: Optional[JobStore] = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Retorna o registro de jobs compartilhado do processo"""
+    global _job_store
+
+    with _job_store_lock:
+        if _job_store is None:
+            _job_store = JobStore()
+
+    return _job_store
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Streaming de logs por job (Server-Sent Events)
+
+Cada job tem um ring buffer em memória com as últimas linhas de log e um
+arquivo JSONL append-only como fallback (replay após o buffer girar ou após
+reinício). Publicar uma linha custa O(1) e os assinantes são acordados na
+hora, sem polling de arquivos em /tmp.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_STREAM_DIR = os.getenv('LOG_STREAM_DIR', 'data/logs')
+LOG_BUFFER_SIZE = int(os.getenv('LOG_BUFFER_SIZE', '1000'))
+LOG_STREAM_MAX = int(os.getenv('LOG_STREAM_MAX', '200'))
+
+# Job em execução no contexto atual (propagado para as tasks asyncio do job)
+current_job_id: ContextVar[Optional[str]] = ContextVar('current_job_id', default=None)
+
+_LEVELS = {
+    logging.DEBUG: 'info',
+    logging.INFO: 'info',
+    logging.WARNING: 'warning',
+    logging.ERROR: 'error',
+    logging.CRITICAL: 'error'
+}
+
+
+class LogStream:
+    """Linhas de log de um job: ring buffer + JSONL append-only"""
+
+    def __init__(self, stream_id: str, path: str, buffer_size: int = LOG_BUFFER_SIZE):
+        self.stream_id = stream_id
+        self.path = path
+        self.entries: deque = deque(maxlen=max(1, buffer_size))
+        self.seq = 0
+        self.closed = False
+        self._cond = threading.Condition()
+        self._file = None
+
+    def append(self, message: str, level: str = 'info') -> Dict:
+        """Adiciona uma linha, grava no JSONL e acorda os assinantes"""
+        with self._cond:
+            self.seq += 1
+            entry = {
+                'seq': self.seq,
+                'timestamp': datetime.now().strftime('%H:%M:%S'),
+                'message': message,
+                'level': level
+            }
+            self.entries.append(entry)
+
+            try:
+                if self._file is None:
+                    self._file = open(self.path, 'a', buffering=1, encoding='utf-8')
+                self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            except OSError as e:
+                # O buffer em memória continua servindo os assinantes
+                logger.debug(f"Falha ao gravar log {self.path}: {e}")
+
+            self._cond.notify_all()
+        return entry
+
+    def close(self):
+        """Marca o fim do stream (os assinantes recebem o evento 'end')"""
+        with self._cond:
+            self.closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._cond.notify_all()
+
+    def since(self, after: int) -> List[Dict]:
+        """Linhas com seq > after; lê do JSONL se o buffer já girou"""
+        with self._cond:
+            if self.entries and self.entries[0]['seq'] > after + 1:
+                if self._file is not None:
+                    self._file.flush()
+                return read_jsonl(self.path, after)
+            return [entry for entry in self.entries if entry['seq'] > after]
+
+    def wait(self, after: int, timeout: float) -> bool:
+        """Espera por linhas novas ou pelo fechamento; retorna False no timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.seq > after or self.closed, timeout=timeout)
+
+
+def read_jsonl(path: str, after: int = 0) -> List[Dict]:
+    """Lê as linhas de um arquivo de log JSONL com seq > after"""
+    entries = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('seq', 0) > after:
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+class LogHub:
+    def __init__(self, log_dir: str = LOG_STREAM_DIR, buffer_size: int = LOG_BUFFER_SIZE,
+                 max_streams: int = LOG_STREAM_MAX):
+        """
+        Inicializa o registro de streams de log
+
+        Args:
+            log_dir: Diretório dos arquivos JSONL
+            buffer_size: Linhas mantidas em memória por job
+            max_streams: Streams fechados mantidos em memória
+        """
+        self.log_dir = log_dir
+        self.buffer_size = buffer_size
+        self.max_streams = max(1, max_streams)
+        self._streams: 'OrderedDict[str, LogStream]' = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(log_dir, exist_ok=True)
+
+    def path(self, stream_id: str) -> str:
+        return os.path.join(self.log_dir, f"{os.path.basename(stream_id)}.jsonl")
+
+    def open(self, stream_id: str) -> LogStream:
+        """Retorna o stream do job, criando-o se necessário"""
+        with self._lock:
+            stream = self._streams.get(stream_id)
+            if stream is None:
+                stream = LogStream(stream_id, self.path(stream_id), self.buffer_size)
+                self._streams[stream_id] = stream
+                self._prune()
+            return stream
+
+    def _prune(self):
+        """Descarta da memória os streams fechados mais antigos (o JSONL permanece)"""
+        while len(self._streams) > self.max_streams:
+            oldest_id = next((sid for sid, stream in self._streams.items() if stream.closed), None)
+            if oldest_id is None:
+                break
+            del self._streams[oldest_id]
+
+    def get(self, stream_id: str) -> Optional[LogStream]:
+        with self._lock:
+            return self._streams.get(stream_id)
+
+    def publish(self, stream_id: str, message: str, level: str = 'info') -> Dict:
+        return self.open(stream_id).append(message, level)
+
+    def close(self, stream_id: str):
+        stream = self.get(stream_id)
+        if stream is not None:
+            stream.close()
+
+    def follow(self, stream_id: str, after: int = 0, heartbeat: float = 15) -> Iterator[Optional[Dict]]:
+        """
+        Acompanha um stream
+
+        Args:
+            stream_id: ID do job
+            after: Último seq já recebido pelo cliente (Last-Event-ID)
+            heartbeat: Segundos sem linhas novas até emitir um keep-alive
+
+        Yields:
+            Linhas de log; None como keep-alive. Termina quando o stream fecha.
+        """
+        stream = self.get(stream_id)
+        if stream is None:
+            # Job de outro processo/anterior ao reinício: replay do JSONL
+            yield from read_jsonl(self.path(stream_id), after)
+            return
+
+        while True:
+            entries = stream.since(after)
+            for entry in entries:
+                after = entry['seq']
+                yield entry
+
+            if stream.closed and stream.seq <= after:
+                return
+
+            if not stream.wait(after, heartbeat):
+                yield None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'streams': len(self._streams),
+                'open': sum(1 for stream in self._streams.values() if not stream.closed),
+                'buffer_size': self.buffer_size,
+                'log_dir': self.log_dir
+            }
+
+
+class JobLogHandler(logging.Handler):
+    """Encaminha os registros de logging do job atual (current_job_id) para o stream dele"""
+
+    def __init__(self, hub: 'LogHub'):
+        super().__init__()
+        self.hub = hub
+
+    def emit(self, record: logging.LogRecord):
+        job_id = current_job_id.get()
+        if job_id is None:
+            return
+        try:
+            self.hub.publish(job_id, record.getMessage(), _LEVELS.get(record.levelno, 'info'))
+        except Exception:
+            self.handleError(record)
+
+
+_hub: Optional[LogHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_log_hub() -> LogHub:
+    """Retorna o registro de streams do processo, instalando o handler de logging"""
+    global _hub
+
+    with _hub_lock:
+        if _hub is None:
+            _hub = LogHub()
+            logging.getLogger().addHandler(JobLogHandler(_hub))
+
+    return _hub
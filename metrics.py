@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Métricas no formato de texto do Prometheus (/metrics)
+
+Até aqui o único sinal de onde o tempo da criação de OS era gasto eram as
+linhas de log com emoji. Este módulo mantém contadores e histogramas em
+memória (sem dependência de prometheus_client) e o contexto `phase()`, que
+mede cada fase nomeada da automação:
+
+    with phase('inep_autocomplete'):
+        await _fill_inep(page, inep_value, waits)
+
+Valores lidos de outros componentes no momento da coleta (profundidade da
+fila, navegadores ocupados...) são registrados com `gauge_callback`.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Fases da automação duram de dezenas de ms (seleção de perfil) a dezenas de s (login a frio)
+PHASE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+# Chamadas REST ao Supabase
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = PHASE_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Por combinação de labels: [contagem por bucket (não cumulativa), soma, total]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, ([*entry[0]], entry[1], entry[2])) for key, entry in self._values.items())
+
+        lines = self.header()
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names + ('le',), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class GaugeCallback(_Metric):
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], object], labels: Sequence[str] = ()):
+        """
+        Gauge lido na hora da coleta
+
+        Args:
+            callback: Retorna um número ou, com labels, {(valores dos labels): número}
+        """
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        try:
+            value = self.callback()
+        except Exception as e:
+            logger.debug(f"Métrica {self.name} indisponível: {e}")
+            return []
+        if value is None:
+            return []
+
+        values = value.items() if isinstance(value, dict) else [((), value)]
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(item)}"
+            for key, item in sorted(values) if item is not None
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric, replace: bool = False) -> _Metric:
+        """Registra uma métrica; sem replace, registrar o mesmo nome de novo devolve a existente"""
+        with self._lock:
+            if replace:
+                self._metrics[metric.name] = metric
+                return metric
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        """Todas as métricas no formato de texto do Prometheus"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def histogram(name: str, documentation: str, labels: Sequence[str] = (),
+              buckets: Sequence[float] = PHASE_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labels, buckets))
+
+
+def gauge_callback(name: str, documentation: str, callback: Callable[[], object],
+                   labels: Sequence[str] = ()) -> GaugeCallback:
+    """Registra (ou substitui) um gauge calculado na coleta"""
+    return REGISTRY.register(GaugeCallback(name, documentation, callback, labels), replace=True)
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+PHASE_SECONDS = histogram(
+    'eace_phase_duration_seconds', 'Duração de cada fase da automação', ('phase', 'outcome')
+)
+JOBS_TOTAL = counter('eace_jobs_total', 'Jobs finalizados por tipo e status', ('kind', 'status'))
+OS_CREATIONS_TOTAL = counter('eace_os_creations_total', 'Tentativas de criação de OS por resultado', ('outcome',))
+SUPABASE_SECONDS = histogram(
+    'eace_supabase_request_duration_seconds', 'Latência das chamadas ao Supabase', ('outcome',), LATENCY_BUCKETS
+)
+
+
+class _Phase:
+    def __init__(self, name: str):
+        self.name = name
+        self.outcome = 'ok'
+
+    def fail(self):
+        """Marca a fase como falha sem levantar exceção (ex: seletor não encontrado)"""
+        self.outcome = 'error'
+
+
+@contextmanager
+def phase(name: str) -> Iterator[_Phase]:
+    """
+    Mede uma fase nomeada da automação (login, menu_navigation, incluir...)
+
+    A duração vai para eace_phase_duration_seconds{phase, outcome}; o outcome
+    é 'error' se a fase levantar exceção ou chamar fail().
+    """
+    current = _Phase(name)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        current.outcome = 'error'
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        PHASE_SECONDS.observe(elapsed, phase=name, outcome=current.outcome)
+        logger.debug(f"⏱️ FASE {name}: {elapsed:.2f}s ({current.outcome})")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Cache de navegação do EACE
+
+Guarda, por perfil, a URL de destino resolvida de cada página (ex: a página
+de OS em dashboard_fornecedor/controle_os) para que os fluxos abram o destino
+direto com goto em vez de expandir o menu lateral a cada execução. Se o deep
+link falhar, a descoberta pelo menu é feita a partir do dashboard e o cache
+só é atualizado quando ela chega ao destino.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import Page
+
+from session_cache import DASHBOARD_READY_SELECTOR, EACE_DASHBOARD_URL
+from wait_engine import WaitEngine
+
+logger = logging.getLogger(__name__)
+
+NAV_CACHE_PATH = os.getenv('EACE_NAV_CACHE_PATH', 'data/navigation.json')
+
+# Destinos conhecidos (observados nos logs de /test-expandable-fixed-logs)
+DEFAULT_DESTINATIONS = {
+    'fornecedor': {
+        'controle_os': 'https://eace.org.br/dashboard_fornecedor/controle_os'
+    }
+}
+
+
+class NavigationCache:
+    def __init__(self, path: str = NAV_CACHE_PATH):
+        """
+        Inicializa o cache de navegação
+
+        Args:
+            path: Arquivo JSON onde as URLs resolvidas são persistidas
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Dict]] = {
+            profile: {name: {'url': url, 'resolved_at': None} for name, url in destinations.items()}
+            for profile, destinations in DEFAULT_DESTINATIONS.items()
+        }
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Cache de navegação inválido ({self.path}): {e}")
+            return
+
+        for profile, destinations in stored.items():
+            self._entries.setdefault(profile, {}).update(destinations)
+
+    def _save(self):
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar cache de navegação: {e}")
+
+    def get(self, profile: str, destination: str) -> Optional[str]:
+        """URL conhecida do destino no perfil, ou None"""
+        with self._lock:
+            entry = self._entries.get(profile, {}).get(destination)
+            return entry['url'] if entry else None
+
+    def remember(self, profile: str, destination: str, url: str):
+        """Registra a URL resolvida de um destino"""
+        with self._lock:
+            self._entries.setdefault(profile, {})[destination] = {'url': url, 'resolved_at': time.time()}
+            self._save()
+
+    async def goto(self, page: Page, profile: str, destination: str, ready_selector: str,
+                   discover: Callable[[Page], Awaitable[None]], waits: Optional[WaitEngine] = None,
+                   timeout: int = 15000) -> bool:
+        """
+        Abre o destino pelo deep link em cache, com fallback para a descoberta pelo menu
+
+        Args:
+            page: Página já autenticada
+            profile: Perfil da conta (ex: 'fornecedor')
+            destination: Nome do destino (ex: 'controle_os')
+            ready_selector: Seletor que confirma que o destino carregou
+            discover: Coroutine function que chega ao destino navegando pela interface
+            waits: Motor de esperas do fluxo
+            timeout: Espera máxima (ms) pelo ready_selector em cada tentativa
+
+        Returns:
+            True se o destino carregou
+        """
+        waits = waits or WaitEngine(page)
+        url = self.get(profile, destination)
+
+        if url:
+            try:
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                if 'login' not in page.url and await waits.for_selector(
+                        f'deep_link_{destination}', ready_selector, timeout=timeout):
+                    self.hits += 1
+                    logger.info(f"🔗 NAVEGAÇÃO - Deep link para {destination}: {url}")
+                    return True
+            except Exception as e:
+                logger.warning(f"⚠️ Deep link para {destination} falhou: {e}")
+
+            logger.warning(f"⚠️ Deep link para {destination} não carregou ({page.url}), usando o menu")
+
+            # A página do deep link pode ser uma tela parcial ou de erro, sem o menu
+            try:
+                await page.goto(EACE_DASHBOARD_URL, wait_until='domcontentloaded', timeout=30000)
+                await waits.for_selector('dashboard_ready', DASHBOARD_READY_SELECTOR, timeout=timeout)
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao voltar ao dashboard: {e}")
+
+        self.misses += 1
+        await discover(page)
+        if not await waits.for_selector(f'discover_{destination}', ready_selector, timeout=timeout):
+            # A URL lembrada continua valendo até uma descoberta bem-sucedida
+            return False
+
+        resolved_url = page.url.split('?')[0]
+        if resolved_url != url:
+            self.refreshes += 1
+            self.remember(profile, destination, resolved_url)
+            logger.info(f"🗺️ NAVEGAÇÃO - Destino {destination} atualizado: {resolved_url}")
+        return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            destinations = {
+                profile: {name: entry['url'] for name, entry in entries.items()}
+                for profile, entries in self._entries.items()
+            }
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'destinations': destinations
+        }
+
+
+_nav_cache: Optional[NavigationCache] = None
+
+
+def get_nav_cache() -> NavigationCache:
+    """Retorna o cache de navegação compartilhado do processo"""
+    global _nav_cache
+
+    if _nav_cache is None:
+        _nav_cache = NavigationCache()
+
+    return _nav_cache
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Extração de textos e números de OS das páginas EACE
+
+Percorre apenas os nós de texto com um TreeWalker (opcionalmente limitado a
+um container) em vez de ler o textContent de todos os elementos com
+querySelectorAll('*'). Lá cada texto era visitado uma vez por ancestral e a
+regex rodava sobre strings enormes; aqui cada nó é lido uma vez, a regex roda
+sobre textos curtos e a deduplicação acontece durante a varredura.
+
+Também extrai o número da OS do payload da chamada de workflow do Bubble que
+cria a OS, para não depender da varredura da página.
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Page
+
+# Coleta os textos (nós de texto não vazios, sem script/style) de um container
+TEXT_NODES_JS = r"""
+(args) => {
+    const root = (args.container && document.querySelector(args.container)) || document.body;
+    if (!root) return [];
+
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+        acceptNode: node => {
+            const parent = node.parentElement;
+            if (!parent || parent.closest('script, style, noscript')) return NodeFilter.FILTER_REJECT;
+            return node.nodeValue.trim() ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+        }
+    });
+
+    const seen = new Set();
+    const texts = [];
+    let node;
+    while ((node = walker.nextNode()) && texts.length < args.limit) {
+        const text = node.nodeValue.replace(/\s+/g, ' ').trim();
+        if (!seen.has(text)) {
+            seen.add(text);
+            texts.push(text);
+        }
+    }
+    return texts;
+}
+"""
+
+# Números de OS como linhas estruturadas; trata "OS:" e o número em nós vizinhos
+OS_NUMBERS_JS = r"""
+(args) => {
+    const root = (args.container && document.querySelector(args.container)) || document.body;
+    if (!root) return [];
+
+    const inline = /OS[:\s]*#?(\d{10,})/i;
+    const label = /OS[:\s]*#?$/i;
+    const number = /^#?(\d{10,})/;
+
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    const rows = new Map();
+    let previous = '';
+    let node;
+    while ((node = walker.nextNode())) {
+        const text = node.nodeValue.trim();
+        if (!text) continue;
+
+        let match = text.match(inline);
+        if (!match && label.test(previous)) match = text.match(number);
+
+        if (match && !rows.has(match[1])) {
+            const parent = node.parentElement;
+            rows.set(match[1], {
+                os_number: match[1],
+                text: (label.test(previous) && !inline.test(text) ? previous + ' ' + text : text).slice(0, 200),
+                tag: parent ? parent.tagName.toLowerCase() : null
+            });
+        }
+        previous = text;
+    }
+    return [...rows.values()];
+}
+"""
+
+# Implementação anterior (mantida apenas para o benchmark)
+LEGACY_OS_NUMBERS_JS = r"""
+() => {
+    const osElements = document.querySelectorAll('*');
+    const osNumbers = [];
+
+    osElements.forEach(el => {
+        const text = el.textContent || '';
+        const osMatch = text.match(/OS[:\s]*#?(\d{10,})/i);
+        if (osMatch) {
+            osNumbers.push(osMatch[1]);
+        }
+    });
+
+    const uniqueNumbers = [...new Set(osNumbers)];
+    return uniqueNumbers.sort((a, b) => b.localeCompare(a));
+}
+"""
+
+# Só a chamada do workflow que cria a OS (buscas e listas em api/1.1/obj/ trazem OS de outros
+# tickets); OS_WORKFLOW_PATTERN pode restringir a um workflow nomeado (ex: /api/1\.1/wf/criar_os)
+OS_RESPONSE_PATTERN = os.getenv('OS_WORKFLOW_PATTERN', r'/workflow/start')
+
+_OS_TEXT = re.compile(r'OS[:\s]*#?(\d{10,})', re.IGNORECASE)
+_OS_DIGITS = re.compile(r'^\d{10,}$')
+_OS_KEY = re.compile(r'(^|[_\s.-])(os|ordem|numero|n[uú]mero|number|protocolo)([_\s.-]|$)', re.IGNORECASE)
+
+
+async def page_texts(page: Page, container: Optional[str] = None, limit: int = 5000) -> List[str]:
+    """
+    Textos distintos da página, na ordem do documento
+
+    Args:
+        page: Página a analisar
+        container: Seletor CSS que limita a busca (padrão: body)
+        limit: Número máximo de textos retornados
+    """
+    return await page.evaluate(TEXT_NODES_JS, {'container': container, 'limit': limit})
+
+
+async def extract_os_numbers(page: Page, container: Optional[str] = None) -> List[Dict]:
+    """
+    Números de OS presentes na página, do mais recente para o mais antigo
+
+    Args:
+        page: Página a analisar
+        container: Seletor CSS que limita a busca (padrão: body)
+
+    Returns:
+        Lista de {'os_number', 'text', 'tag'} sem repetições
+    """
+    rows = await page.evaluate(OS_NUMBERS_JS, {'container': container})
+    return sorted(rows, key=lambda row: (len(row['os_number']), row['os_number']), reverse=True)
+
+
+def os_number_from_payload(payload: Any, inep: str) -> Optional[str]:
+    """
+    Procura o número da OS no payload (JSON ou texto) de uma resposta do Bubble
+
+    Só aceita números em chaves com cara de número de OS ("os_number", "numero"...)
+    ou em textos como "OS: 1234567890", para não confundir IDs internos e
+    timestamps com o número da OS, e só se o payload também trouxer o INEP
+    enviado (senão a resposta pode ser de outra OS e vale a varredura da página).
+
+    Args:
+        payload: Corpo da resposta (JSON decodificado ou texto)
+        inep: INEP enviado na criação
+
+    Returns:
+        Número da OS ou None
+    """
+    by_key: List[str] = []
+    by_text: List[str] = []
+    inep_found = False
+
+    def walk(value: Any, key: str = ''):
+        nonlocal inep_found
+        if isinstance(value, dict):
+            for child_key, child in value.items():
+                walk(child, str(child_key))
+        elif isinstance(value, list):
+            for child in value:
+                walk(child, key)
+        elif isinstance(value, (int, str)) and not isinstance(value, bool):
+            text = str(value).strip()
+            inep_found = inep_found or inep in text
+            if _OS_KEY.search(key) and _OS_DIGITS.match(text):
+                by_key.append(text)
+            else:
+                match = _OS_TEXT.search(text) if isinstance(value, str) else None
+                if match:
+                    by_text.append(match.group(1))
+
+    walk(payload)
+    if not inep_found:
+        return None
+    found = by_key or by_text
+    return found[0] if found else None
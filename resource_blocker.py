@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Perfil de interceptação de requisições para as páginas EACE (Bubble)
+
+Bloqueia ou substitui por stubs imagens, mídia, fontes e domínios de
+rastreamento, mantendo liberado o que o formulário de OS e o autocomplete de
+INEP precisam (documento, scripts/CSS da aplicação, XHR do Bubble). Como as
+requisições bloqueadas nunca são baixadas, os bytes economizados são
+estimados pelo tamanho médio de cada tipo de recurso.
+"""
+
+import logging
+import os
+import re
+from typing import Dict, Iterable, Optional
+
+from playwright.async_api import Route
+
+from wait_engine import BUBBLE_XHR_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# off | light (mídia, fontes, rastreamento) | standard (+ imagens)
+BROWSER_BLOCK_PROFILE = os.getenv('BROWSER_BLOCK_PROFILE', 'standard')
+BROWSER_BLOCK_ALLOW = [p for p in os.getenv('BROWSER_BLOCK_ALLOW', '').split(',') if p.strip()]
+
+PROFILES = {
+    'off': frozenset(),
+    'light': frozenset({'media', 'font'}),
+    'standard': frozenset({'media', 'font', 'image'})
+}
+
+TRACKING_DOMAINS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googleadservices.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'clarity.ms',
+    'segment.io',
+    'segment.com',
+    'mixpanel.com',
+    'intercom.io',
+    'intercomcdn.com',
+    'fullstory.com',
+    'newrelic.com',
+    'nr-data.net'
+)
+
+# Nunca bloqueados: XHR do Bubble (workflow/elasticsearch/api) que alimentam o
+# formulário de OS e o autocomplete de INEP
+DEFAULT_ALLOW_PATTERNS = (BUBBLE_XHR_PATTERN,)
+
+# Tamanho médio por tipo, usado para estimar os bytes economizados
+ESTIMATED_BYTES = {
+    'image': 25_000,
+    'media': 500_000,
+    'font': 40_000,
+    'script': 60_000,
+    'other': 5_000
+}
+
+# GIF 1x1 transparente: evita eventos de erro em <img> no lugar de um abort
+_TRANSPARENT_GIF = bytes.fromhex(
+    '47494638396101000100800000ffffff00000021f90401000000002c00000000010001000002024401003b'
+)
+
+
+class ResourceBlocker:
+    def __init__(self, profile: str = BROWSER_BLOCK_PROFILE, allow_patterns: Optional[Iterable[str]] = None,
+                 tracking_domains: Iterable[str] = TRACKING_DOMAINS):
+        """
+        Inicializa o perfil de interceptação
+
+        Args:
+            profile: 'off', 'light' ou 'standard'
+            allow_patterns: Regex de URLs que nunca são bloqueadas (além das padrão)
+            tracking_domains: Domínios de rastreamento bloqueados em qualquer perfil ativo
+        """
+        if profile not in PROFILES:
+            logger.warning(f"⚠️ Perfil de bloqueio desconhecido '{profile}', usando 'standard'")
+            profile = 'standard'
+
+        self.profile = profile
+        self.blocked_types = PROFILES[profile]
+        self.allow = re.compile('|'.join(
+            f'(?:{p})' for p in (*DEFAULT_ALLOW_PATTERNS, *(allow_patterns or BROWSER_BLOCK_ALLOW))
+        ))
+        self.tracking = re.compile(
+            r'^https?://([^/]*\.)?(' + '|'.join(re.escape(d) for d in tracking_domains) + r')(?::\d+)?/'
+        )
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return self.profile != 'off'
+
+    def reset(self):
+        self.requests = 0
+        self.blocked = 0
+        self.by_type: Dict[str, int] = {}
+        self.bytes_saved = 0
+
+    async def apply(self, target):
+        """Registra a interceptação em um BrowserContext ou Page (ambos expõem route())"""
+        if self.enabled:
+            await target.route('**/*', self._handle)
+
+    def _should_block(self, url: str, resource_type: str) -> Optional[str]:
+        """Motivo do bloqueio ('tracking' ou o tipo do recurso) ou None"""
+        if self.allow.search(url):
+            return None
+        if self.tracking.match(url):
+            return 'tracking'
+        if resource_type in self.blocked_types:
+            return resource_type
+        return None
+
+    async def _handle(self, route: Route):
+        request = route.request
+        self.requests += 1
+        reason = self._should_block(request.url, request.resource_type)
+
+        if reason is None:
+            await route.continue_()
+            return
+
+        self.blocked += 1
+        self.by_type[reason] = self.by_type.get(reason, 0) + 1
+        self.bytes_saved += ESTIMATED_BYTES.get(request.resource_type, ESTIMATED_BYTES['other'])
+
+        if request.resource_type == 'image':
+            await route.fulfill(status=200, content_type='image/gif', body=_TRANSPARENT_GIF)
+        elif reason == 'tracking' and request.resource_type == 'script':
+            await route.fulfill(status=200, content_type='application/javascript', body='')
+        else:
+            await route.abort('blockedbyclient')
+
+    def report(self) -> Dict:
+        """Contadores da execução"""
+        return {
+            'profile': self.profile,
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'by_type': dict(self.by_type),
+            'estimated_bytes_saved': self.bytes_saved
+        }
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Retenção e cota de disco dos artefatos (screenshots, logs e arquivos de job)
+
+Nada apagava /tmp/screenshots, os JSON de log em /tmp, os JSONL por job em
+data/logs ou logs/webhook_realtime.log, e o tmpfs/volumes do container
+cresciam sem limite. Uma thread com prioridade baixa de CPU e de I/O (nice /
+ionice, quando disponíveis) aplica periodicamente, para cada tipo de
+artefato, um limite de idade e um limite de tamanho:
+
+- o limite de idade dos artefatos de jobs que falharam é multiplicado por
+  RETENTION_FAILED_FACTOR e, quando é preciso liberar espaço, os de jobs bem
+  sucedidos saem primeiro;
+- artefatos de jobs ainda em execução, ou alterados há menos de
+  RETENTION_MIN_AGE_SECONDS, nunca são removidos;
+- logs de serviço (mantidos abertos pelo logging) são truncados no lugar,
+  preservando o final.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from job_store import FINAL_STATUSES, STATUS_FAILED
+from log_stream import LOG_STREAM_DIR
+from screenshots import SCREENSHOTS_DIR
+from thumbnails import THUMBNAILS_DIR
+
+logger = logging.getLogger(__name__)
+
+RETENTION_INTERVAL = float(os.getenv('RETENTION_INTERVAL', '600'))
+RETENTION_FAILED_FACTOR = float(os.getenv('RETENTION_FAILED_FACTOR', '4'))
+RETENTION_MIN_AGE_SECONDS = 600
+# Pausa a cada RETENTION_BATCH remoções, para não disputar o disco com os jobs
+RETENTION_BATCH = 100
+RETENTION_PAUSE_SECONDS = 0.05
+RETENTION_START_DELAY = 60
+
+MB = 1024 * 1024
+HOUR = 3600
+
+# Limites por tipo de artefato: idade máxima (h) e tamanho total máximo (MB)
+ARTIFACTS = {
+    'screenshots': {
+        'max_age_hours': float(os.getenv('RETENTION_SCREENSHOTS_HOURS', '72')),
+        'max_mb': float(os.getenv('RETENTION_SCREENSHOTS_MB', '500'))
+    },
+    'thumbnails': {
+        'max_age_hours': float(os.getenv('RETENTION_THUMBNAILS_HOURS', '72')),
+        'max_mb': float(os.getenv('RETENTION_THUMBNAILS_MB', '50'))
+    },
+    'job_logs': {
+        'max_age_hours': float(os.getenv('RETENTION_JOB_LOGS_HOURS', '168')),
+        'max_mb': float(os.getenv('RETENTION_JOB_LOGS_MB', '200'))
+    },
+    'scratch_logs': {
+        'max_age_hours': float(os.getenv('RETENTION_SCRATCH_LOGS_HOURS', '24')),
+        'max_mb': float(os.getenv('RETENTION_SCRATCH_LOGS_MB', '20'))
+    },
+    'service_logs': {
+        'max_age_hours': None,
+        'max_mb': float(os.getenv('RETENTION_SERVICE_LOGS_MB', '50'))
+    }
+}
+
+SCRATCH_LOG_FILES = ('/tmp/current_logs.json', '/tmp/real_logs.json')
+SERVICE_LOG_FILES = ('logs/webhook_realtime.log',)
+
+
+def _lower_priority() -> Dict:
+    """
+    Reduz a prioridade de CPU e de I/O da thread atual
+
+    No Linux, setpriority/ionice com o id nativo da thread afetam só ela,
+    e não o servidor inteiro.
+    """
+    applied = {'nice': False, 'ionice': False}
+    thread_id = threading.get_native_id()
+
+    try:
+        os.setpriority(os.PRIO_PROCESS, thread_id, 19)
+        applied['nice'] = True
+    except (AttributeError, OSError) as e:
+        logger.debug(f"nice indisponível: {e}")
+
+    ionice = shutil.which('ionice')
+    if ionice:
+        try:
+            subprocess.run([ionice, '-c', '3', '-p', str(thread_id)], check=True, capture_output=True, timeout=5)
+            applied['ionice'] = True
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"ionice indisponível: {e}")
+
+    return applied
+
+
+def _file_item(path: str, job_id: Optional[str] = None) -> Optional[Dict]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {'path': path, 'files': [path], 'job_id': job_id, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def _dir_item(path: str, job_id: str) -> Dict:
+    files, size, mtime = [], 0, 0.0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                files.append(entry.path)
+                size += stat.st_size
+                mtime = max(mtime, stat.st_mtime)
+    if not files:
+        mtime = os.stat(path).st_mtime
+    return {'path': path, 'files': files, 'job_id': job_id, 'size': size, 'mtime': mtime, 'dir': True}
+
+
+def _scan_files(directory: str, suffix: str = '', job_from_name: bool = False) -> List[Dict]:
+    items = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    job_id = entry.name[:-len(suffix)] if job_from_name and suffix else None
+                    item = _file_item(entry.path, job_id)
+                    if item:
+                        items.append(item)
+    except FileNotFoundError:
+        pass
+    return items
+
+
+class RetentionManager:
+    def __init__(self, job_status: Optional[Callable[[str], Optional[str]]] = None,
+                 interval: float = RETENTION_INTERVAL, artifacts: Optional[Dict] = None):
+        """
+        Inicializa o gerenciador de retenção
+
+        Args:
+            job_status: Retorna o status de um job pelo id (None se desconhecido)
+            interval: Segundos entre as varreduras
+            artifacts: Limites por tipo de artefato (padrão: ARTIFACTS)
+        """
+        self.job_status = job_status
+        self.interval = max(10.0, interval)
+        self.artifacts = artifacts or ARTIFACTS
+
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._removed_since_pause = 0
+        self._stats = {
+            'runs': 0,
+            'errors': 0,
+            'last_run': None,
+            'last_duration_ms': None,
+            'reclaimed_bytes': 0,
+            'priority': None,
+            'artifacts': {
+                name: {'bytes': 0, 'items': 0, 'reclaimed_bytes': 0, 'removed': 0} for name in self.artifacts
+            }
+        }
+
+    def start(self):
+        """Inicia a thread de varredura"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='retention', daemon=True)
+        self._thread.start()
+        logger.info(f"🧹 Retenção de artefatos iniciada (a cada {self.interval:.0f}s)")
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        priority = _lower_priority()
+        with self._lock:
+            self._stats['priority'] = priority
+
+        delay = RETENTION_START_DELAY
+        while not self._stop.wait(delay):
+            delay = self.interval
+            try:
+                self.run_once()
+            except Exception as e:
+                with self._lock:
+                    self._stats['errors'] += 1
+                logger.error(f"❌ Erro na retenção de artefatos: {e}")
+
+    def run_once(self) -> int:
+        """
+        Aplica os limites de todos os tipos de artefato
+
+        Returns:
+            Bytes liberados nesta varredura
+        """
+        started = time.time()
+        reclaimed = 0
+
+        reclaimed += self._enforce('screenshots', self._screenshot_items(), self._screenshots_removed)
+        reclaimed += self._enforce('thumbnails', _scan_files(THUMBNAILS_DIR, '.jpg'))
+        reclaimed += self._enforce('job_logs', _scan_files(LOG_STREAM_DIR, '.jsonl', job_from_name=True))
+        reclaimed += self._enforce('scratch_logs', [
+            item for item in (_file_item(path) for path in SCRATCH_LOG_FILES) if item
+        ])
+        reclaimed += self._trim_service_logs()
+
+        with self._lock:
+            self._stats['runs'] += 1
+            self._stats['last_run'] = started
+            self._stats['last_duration_ms'] = round((time.time() - started) * 1000, 1)
+            self._stats['reclaimed_bytes'] += reclaimed
+
+        if reclaimed:
+            logger.info(f"🧹 Retenção: {reclaimed / MB:.1f} MB liberados")
+        return reclaimed
+
+    def _screenshot_items(self) -> List[Dict]:
+        """Um item por diretório de job e um por arquivo solto na raiz"""
+        items = []
+        try:
+            with os.scandir(SCREENSHOTS_DIR) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        items.append(_dir_item(entry.path, entry.name))
+                    elif entry.is_file():
+                        item = _file_item(entry.path)
+                        if item:
+                            items.append(item)
+        except FileNotFoundError:
+            pass
+        return items
+
+    @staticmethod
+    def _screenshots_removed(item: Dict):
+        """Mantém o índice de screenshots coerente com o disco"""
+        from screenshot_index import get_screenshot_index
+        get_screenshot_index().remove(os.path.relpath(path, SCREENSHOTS_DIR) for path in item['files'])
+
+    def _status(self, job_id: Optional[str]) -> Optional[str]:
+        if not job_id or self.job_status is None:
+            return None
+        try:
+            return self.job_status(job_id)
+        except Exception:
+            return None
+
+    def _enforce(self, name: str, items: List[Dict], on_removed: Optional[Callable[[Dict], None]] = None) -> int:
+        """
+        Remove os itens vencidos e, se o total passar do limite, os mais antigos
+
+        Returns:
+            Bytes liberados
+        """
+        limits = self.artifacts[name]
+        now = time.time()
+        max_age = limits['max_age_hours'] * HOUR if limits.get('max_age_hours') else None
+        max_bytes = limits['max_mb'] * MB if limits.get('max_mb') else None
+
+        candidates = []
+        for item in items:
+            status = self._status(item['job_id'])
+            if item['job_id'] and status is not None and status not in FINAL_STATUSES:
+                continue  # Job em execução
+            if now - item['mtime'] < RETENTION_MIN_AGE_SECONDS:
+                continue
+            item['failed'] = status == STATUS_FAILED
+            candidates.append(item)
+
+        expired = []
+        if max_age:
+            for item in candidates:
+                age_limit = max_age * RETENTION_FAILED_FACTOR if item['failed'] else max_age
+                if now - item['mtime'] > age_limit:
+                    item['expired'] = True
+                    expired.append(item)
+
+        total = sum(item['size'] for item in items)
+        remaining = total - sum(item['size'] for item in expired)
+        if max_bytes and remaining > max_bytes:
+            # Sucesso antes de falha; dentro de cada grupo, o mais antigo primeiro
+            removable = sorted((item for item in candidates if not item.get('expired')),
+                               key=lambda item: (item['failed'], item['mtime']))
+            for item in removable:
+                if remaining <= max_bytes:
+                    break
+                expired.append(item)
+                remaining -= item['size']
+
+        reclaimed = 0
+        removed = 0
+        for item in expired:
+            if self._remove(item):
+                reclaimed += item['size']
+                removed += 1
+                if on_removed:
+                    on_removed(item)
+
+        with self._lock:
+            artifact = self._stats['artifacts'][name]
+            artifact['bytes'] = total - reclaimed
+            artifact['items'] = len(items) - removed
+            artifact['reclaimed_bytes'] += reclaimed
+            artifact['removed'] += removed
+        return reclaimed
+
+    def _remove(self, item: Dict) -> bool:
+        try:
+            if item.get('dir'):
+                shutil.rmtree(item['path'])
+            else:
+                os.remove(item['path'])
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"⚠️ Retenção: não foi possível remover {item['path']}: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return False
+
+        self._removed_since_pause += 1
+        if self._removed_since_pause >= RETENTION_BATCH:
+            self._removed_since_pause = 0
+            time.sleep(RETENTION_PAUSE_SECONDS)
+        return True
+
+    def _trim_service_logs(self) -> int:
+        """
+        Trunca no lugar os logs de serviço acima do limite, mantendo a metade final
+
+        O arquivo continua aberto pelo FileHandler (modo append), então não pode
+        ser substituído nem apagado.
+        """
+        max_bytes = self.artifacts['service_logs']['max_mb'] * MB
+        reclaimed = 0
+        total = 0
+
+        for path in SERVICE_LOG_FILES:
+            try:
+                size = os.path.getsize(path)
+                if size > max_bytes:
+                    keep = int(max_bytes // 2)
+                    with open(path, 'r+b') as f:
+                        f.seek(size - keep)
+                        tail = f.read()
+                        # Começa em uma linha inteira
+                        tail = tail[tail.find(b'\n') + 1:]
+                        f.seek(0)
+                        f.write(tail)
+                        f.truncate()
+                    reclaimed += size - len(tail)
+                    size = len(tail)
+                total += size
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"⚠️ Retenção: não foi possível truncar {path}: {e}")
+
+        with self._lock:
+            artifact = self._stats['artifacts']['service_logs']
+            artifact['bytes'] = total
+            artifact['items'] = len(SERVICE_LOG_FILES)
+            artifact['reclaimed_bytes'] += reclaimed
+            artifact['removed'] += 1 if reclaimed else 0
+        return reclaimed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['artifacts'] = {name: dict(values) for name, values in self._stats['artifacts'].items()}
+        stats['interval'] = self.interval
+        return stats
+
+
+_retention_manager: Optional[RetentionManager] = None
+_retention_manager_lock = threading.Lock()
+
+
+def get_retention_manager(job_status: Optional[Callable[[str], Optional[str]]] = None) -> RetentionManager:
+    """
+    Retorna o gerenciador de retenção do processo (já iniciado)
+
+    Args:
+        job_status: Status de um job pelo id; usado só na primeira chamada
+    """
+    global _retention_manager
+
+    with _retention_manager_lock:
+        if _retention_manager is None:
+            _retention_manager = RetentionManager(job_status)
+            _retention_manager.start()
+
+    return _retention_manager
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Índice de screenshots (SQLite em modo WAL)
+
+As rotas /screenshots, /screenshots/latest e /screenshots/gallery faziam
+glob + stat de todos os arquivos a cada requisição. Aqui cada screenshot é
+uma linha com job, etapa, data e tamanho:
+
+- a ScreenshotSession registra os arquivos que grava;
+- arquivos gravados diretamente na raiz (templates antigas) são conciliados
+  com uma varredura só da raiz, no máximo a cada SCREENSHOT_SYNC_SECONDS;
+- as listagens são paginadas por cursor (created_at, path) sobre um índice e o
+  último screenshot fica em memória.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCREENSHOT_INDEX_PATH = os.getenv('SCREENSHOT_INDEX_PATH', 'data/screenshots.db')
+SCREENSHOT_SYNC_SECONDS = 30
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.webp', '.png')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS screenshots (
+    path TEXT PRIMARY KEY,
+    job_id TEXT,
+    step INTEGER,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+DROP INDEX IF EXISTS idx_screenshots_created;
+CREATE INDEX IF NOT EXISTS idx_screenshots_created_path ON screenshots (created_at, path);
+CREATE INDEX IF NOT EXISTS idx_screenshots_job ON screenshots (job_id, step);
+"""
+
+_COLUMNS = ('path', 'job_id', 'step', 'name', 'size', 'created_at')
+
+
+class ScreenshotIndex:
+    def __init__(self, root: str, db_path: str = SCREENSHOT_INDEX_PATH):
+        """
+        Inicializa o índice
+
+        Args:
+            root: Diretório raiz dos screenshots
+            db_path: Caminho do banco SQLite
+        """
+        self.root = root
+        self.db_path = db_path
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._latest: Optional[Dict] = None
+        self._synced_at = 0.0
+
+        if self.count() == 0:
+            self._import_existing()
+
+    def _import_existing(self):
+        """Primeira execução: indexa o que já existe em disco (raiz e subdiretórios por job)"""
+        rows = []
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        with os.scandir(entry.path) as job_entries:
+                            rows.extend(self._row(job_entry, entry.name) for job_entry in job_entries
+                                        if _is_image(job_entry))
+                    elif _is_image(entry):
+                        rows.append(self._row(entry, None))
+        except FileNotFoundError:
+            return
+
+        self._insert(rows)
+        if rows:
+            logger.info(f"🗂️ {len(rows)} screenshots existentes indexados")
+
+    @staticmethod
+    def _row(entry: os.DirEntry, job_id: Optional[str]) -> Dict:
+        stat = entry.stat()
+        step, _, name = entry.name.partition('_')
+        return {
+            'path': f"{job_id}/{entry.name}" if job_id else entry.name,
+            'job_id': job_id,
+            'step': int(step) if job_id and step.isdigit() else None,
+            'name': name if job_id and step.isdigit() else entry.name,
+            'size': stat.st_size,
+            'created_at': stat.st_mtime
+        }
+
+    def _insert(self, rows: List[Dict]):
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO screenshots ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    [tuple(row[column] for column in _COLUMNS) for row in rows]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+            newest = max(rows, key=lambda row: row['created_at'])
+            if self._latest is None or newest['created_at'] >= self._latest['created_at']:
+                self._latest = newest
+
+    def add(self, path: str, job_id: Optional[str], step: Optional[int], name: str, size: int,
+            created_at: Optional[float] = None):
+        """Registra um screenshot gravado (chamado pelo próprio gravador)"""
+        self._insert([{
+            'path': path, 'job_id': job_id, 'step': step, 'name': name,
+            'size': size, 'created_at': created_at or time.time()
+        }])
+
+    def remove(self, paths: Iterable[str]):
+        """Remove entradas do índice (os arquivos são responsabilidade de quem chama)"""
+        paths = list(paths)
+        if not paths:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM screenshots WHERE path = ?", [(path,) for path in paths])
+            if self._latest is not None and self._latest['path'] in paths:
+                self._latest = None
+
+    def sync(self, force: bool = False):
+        """
+        Concilia os arquivos soltos na raiz (gravados fora da ScreenshotSession)
+
+        Só a raiz é varrida; os subdiretórios por job são indexados pelo gravador.
+        """
+        now = time.time()
+        if not force and now - self._synced_at < SCREENSHOT_SYNC_SECONDS:
+            return
+        self._synced_at = now
+
+        try:
+            with os.scandir(self.root) as entries:
+                on_disk = {entry.name: entry for entry in entries if _is_image(entry)}
+        except FileNotFoundError:
+            on_disk = {}
+
+        with self._lock:
+            indexed = {
+                row['path']: row['size'] for row in
+                self._conn.execute("SELECT path, size FROM screenshots WHERE job_id IS NULL").fetchall()
+            }
+
+        # Templates antigas sobrescrevem os mesmos nomes: reindexa quando o arquivo muda
+        changed = []
+        for name, entry in on_disk.items():
+            row = self._row(entry, None)
+            if name not in indexed or indexed[name] != row['size']:
+                changed.append(row)
+        self._insert(changed)
+        self.remove(path for path in indexed if path not in on_disk)
+
+    def latest(self) -> Optional[Dict]:
+        """Screenshot mais recente (em memória; consulta o índice só após uma remoção)"""
+        if self._latest is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT * FROM screenshots ORDER BY created_at DESC LIMIT 1"
+                ).fetchone()
+                self._latest = dict(row) if row else None
+        return dict(self._latest) if self._latest else None
+
+    def page(self, limit: int = 50, before: Optional[Tuple[float, str]] = None,
+             job_id: Optional[str] = None) -> Dict:
+        """
+        Uma página de screenshots, do mais recente para o mais antigo
+
+        Args:
+            limit: Itens por página
+            before: Cursor (created_at, path) do último item da página anterior; o path
+                desempata arquivos com o mesmo created_at (ex: mtimes iguais na importação)
+            job_id: Filtra os screenshots de um job, na ordem das etapas
+
+        Returns:
+            {'items': [...], 'next_before': cursor da próxima página ou None}
+        """
+        limit = max(1, min(limit, 500))
+        with self._lock:
+            if job_id is not None:
+                rows = self._conn.execute(
+                    "SELECT * FROM screenshots WHERE job_id = ? ORDER BY step LIMIT ?", (job_id, limit)
+                ).fetchall()
+            elif before is not None:
+                rows = self._conn.execute(
+                    "SELECT * FROM screenshots WHERE (created_at, path) < (?, ?) "
+                    "ORDER BY created_at DESC, path DESC LIMIT ?",
+                    (before[0], before[1], limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM screenshots ORDER BY created_at DESC, path DESC LIMIT ?", (limit,)
+                ).fetchall()
+
+        items = [dict(row) for row in rows]
+        next_before = (
+            (items[-1]['created_at'], items[-1]['path']) if len(items) == limit and job_id is None else None
+        )
+        return {'items': items, 'next_before': next_before}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM screenshots").fetchone()[0]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COUNT(DISTINCT job_id) FROM screenshots"
+            ).fetchone()
+        return {'screenshots': row[0], 'bytes': row[1], 'jobs': row[2]}
+
+
+def _is_image(entry: os.DirEntry) -> bool:
+    return entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+
+
+_screenshot_index: Optional[ScreenshotIndex] = None
+_screenshot_index_lock = threading.Lock()
+
+
+def get_screenshot_index() -> ScreenshotIndex:
+    """Retorna o índice de screenshots compartilhado do processo"""
+    global _screenshot_index
+
+    with _screenshot_index_lock:
+        if _screenshot_index is None:
+            from screenshots import SCREENSHOTS_DIR
+            _screenshot_index = ScreenshotIndex(SCREENSHOTS_DIR)
+
+    return _screenshot_index
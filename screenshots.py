@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Screenshots dos fluxos de automação
+
+Cada fluxo tirava 8+ PNGs de página inteira, gravados de forma síncrona em
+/tmp/screenshots, e apagava os anteriores varrendo o diretório. Aqui:
+
+- o nível (SCREENSHOT_LEVEL) decide o que é capturado: 'off', 'failure'
+  (só falhas), 'key' (falhas e etapas-chave) ou 'all';
+- a captura é JPEG (codificada pelo próprio Chromium) ou WebP (convertida
+  com Pillow, se instalado) na qualidade SCREENSHOT_QUALITY;
+- a conversão e a gravação em disco rodam em uma thread, fora do caminho
+  crítico da página; o fluxo só espera por elas no fim (flush);
+- cada job grava em um subdiretório próprio (<SCREENSHOTS_DIR>/<job_id>/),
+  então não é preciso limpar os arquivos de execuções anteriores;
+- cada arquivo gravado é registrado no screenshot_index, que serve as
+  listagens sem varrer o diretório.
+"""
+
+import asyncio
+import io
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from playwright.async_api import Page
+
+from log_stream import current_job_id
+from screenshot_index import get_screenshot_index
+
+logger = logging.getLogger(__name__)
+
+SCREENSHOTS_DIR = os.getenv('SCREENSHOTS_DIR', '/tmp/screenshots')
+SCREENSHOT_LEVEL = os.getenv('SCREENSHOT_LEVEL', 'key')
+SCREENSHOT_FORMAT = os.getenv('SCREENSHOT_FORMAT', 'jpeg')
+SCREENSHOT_QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '60'))
+
+LEVEL_OFF = 'off'
+LEVEL_FAILURE = 'failure'
+LEVEL_KEY = 'key'
+LEVEL_ALL = 'all'
+LEVELS = {LEVEL_OFF: 0, LEVEL_FAILURE: 1, LEVEL_KEY: 2, LEVEL_ALL: 3}
+
+# Tipos de captura e o nível mínimo em que cada um é gravado
+KIND_FAILURE = 'failure'
+KIND_KEY = 'key'
+KIND_STEP = 'step'
+_KIND_THRESHOLD = {KIND_FAILURE: 1, KIND_KEY: 2, KIND_STEP: 3}
+
+EXTENSIONS = {'jpeg': '.jpg', 'webp': '.webp', 'png': '.png'}
+MIMETYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.webp': 'image/webp', '.png': 'image/png'}
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_stats_lock = threading.Lock()
+_stats = {'captured': 0, 'skipped': 0, 'failed': 0, 'bytes_written': 0, 'capture_ms': 0.0}
+
+
+def _count(**values):
+    with _stats_lock:
+        for key, value in values.items():
+            _stats[key] += value
+
+
+def screenshot_stats() -> Dict:
+    """Totais de captura do processo"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['capture_ms'] = round(stats['capture_ms'], 1)
+    stats['avg_capture_ms'] = round(stats['capture_ms'] / stats['captured'], 1) if stats['captured'] else None
+    stats.update({'level': SCREENSHOT_LEVEL, 'format': SCREENSHOT_FORMAT, 'quality': SCREENSHOT_QUALITY})
+    return stats
+
+
+class ScreenshotSession:
+    def __init__(self, job_id: Optional[str] = None, level: str = SCREENSHOT_LEVEL,
+                 image_format: str = SCREENSHOT_FORMAT, quality: int = SCREENSHOT_QUALITY,
+                 root: str = SCREENSHOTS_DIR):
+        """
+        Inicializa as capturas de um job
+
+        Args:
+            job_id: Subdiretório do job (padrão: o job atual do log_stream, ou um gerado)
+            level: 'off', 'failure', 'key' ou 'all'
+            image_format: 'jpeg', 'webp' ou 'png'
+            quality: Qualidade de JPEG/WebP (0-100)
+            root: Diretório raiz dos screenshots
+        """
+        if level not in LEVELS:
+            logger.warning(f"⚠️ SCREENSHOT_LEVEL inválido '{level}'; usando '{LEVEL_KEY}'")
+            level = LEVEL_KEY
+        if image_format == 'webp' and Image is None:
+            logger.warning("⚠️ WebP requer Pillow; usando JPEG")
+            image_format = 'jpeg'
+        if image_format not in EXTENSIONS:
+            image_format = 'jpeg'
+
+        self.job_id = str(job_id or current_job_id.get() or datetime.now().strftime('flow_%Y%m%d_%H%M%S_%f'))
+        self.level = level
+        self.format = image_format
+        self.quality = max(1, min(100, quality))
+        self.root = root
+        self.directory = os.path.join(root, self.job_id)
+        self.files: List[str] = []
+        self._sequence = 0
+        self._writes: List[asyncio.Future] = []
+
+    def wants(self, kind: str = KIND_STEP) -> bool:
+        """O nível configurado grava capturas deste tipo?"""
+        return LEVELS[self.level] >= _KIND_THRESHOLD[kind]
+
+    async def capture(self, page: Page, name: str, kind: str = KIND_STEP, full_page: bool = False) -> Optional[str]:
+        """
+        Captura a página, se o nível permitir, e agenda a gravação em disco
+
+        Args:
+            page: Página a capturar
+            name: Nome da etapa (vira parte do nome do arquivo)
+            kind: KIND_STEP, KIND_KEY ou KIND_FAILURE
+            full_page: Capturar a página inteira em vez da área visível
+
+        Returns:
+            Caminho relativo ("<job_id>/<arquivo>") ou None se não capturado
+        """
+        if not self.wants(kind):
+            _count(skipped=1)
+            return None
+
+        started = time.perf_counter()
+        try:
+            if self.format == 'jpeg':
+                data = await page.screenshot(type='jpeg', quality=self.quality, full_page=full_page)
+            else:
+                data = await page.screenshot(type='png', full_page=full_page)
+        except Exception as e:
+            _count(failed=1)
+            logger.warning(f"⚠️ Screenshot '{name}' falhou: {e}")
+            return None
+        _count(captured=1, capture_ms=(time.perf_counter() - started) * 1000)
+
+        self._sequence += 1
+        filename = f"{self._sequence:02d}_{name}{EXTENSIONS[self.format]}"
+        relative = f"{self.job_id}/{filename}"
+        self.files.append(relative)
+
+        loop = asyncio.get_running_loop()
+        self._writes.append(loop.run_in_executor(None, self._write, self._sequence, name, filename, data))
+        logger.info(f"📸 Screenshot: {relative}")
+        return relative
+
+    def _write(self, step: int, name: str, filename: str, data: bytes):
+        """Converte (WebP), grava atomicamente e registra no índice; roda fora do event loop"""
+        try:
+            if self.format == 'webp':
+                buffer = io.BytesIO()
+                Image.open(io.BytesIO(data)).save(buffer, format='WEBP', quality=self.quality)
+                data = buffer.getvalue()
+
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, filename)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            _count(bytes_written=len(data))
+            get_screenshot_index().add(f"{self.job_id}/{filename}", self.job_id, step, name, len(data))
+        except Exception as e:
+            _count(failed=1)
+            logger.error(f"❌ Erro ao gravar screenshot {filename}: {e}")
+
+    async def flush(self):
+        """Aguarda as gravações pendentes (chamar no fim do fluxo)"""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+            self._writes = []
+
+    def path(self, name: str) -> str:
+        """Caminho de um artefato auxiliar (ex: JSON de debug) no diretório do job"""
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, name)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Registro de seletores com estratégia vencedora aprendida
+
+Os fluxos tentam listas ordenadas de seletores alternativos para cada alvo
+lógico (botão do menu, "Adicionar nova OS", campo INEP...). O registro guarda
+qual candidato funcionou, com o tempo gasto, e passa a tentá-lo primeiro;
+candidatos que começam a falhar são rebaixados. O aprendizado é persistido em
+disco para sobreviver a reinícios.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from playwright.async_api import Locator, Page
+
+logger = logging.getLogger(__name__)
+
+SELECTOR_REGISTRY_PATH = os.getenv('SELECTOR_REGISTRY_PATH', 'data/selectors.json')
+
+# Falhas consecutivas que tiram um candidato da frente da fila
+DEMOTE_AFTER = 2
+
+
+class SelectorRegistry:
+    def __init__(self, path: str = SELECTOR_REGISTRY_PATH):
+        """
+        Inicializa o registro
+
+        Args:
+            path: Arquivo JSON onde as estatísticas por alvo são persistidas
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._targets: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self._targets = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Registro de seletores inválido ({self.path}): {e}")
+
+    def _save(self):
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self._targets, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar registro de seletores: {e}")
+
+    def _stats(self, target: str, selector: str) -> Dict:
+        entry = self._targets.setdefault(target, {'winner': None, 'candidates': {}})
+        return entry['candidates'].setdefault(
+            selector, {'wins': 0, 'failures': 0, 'streak': 0, 'avg_ms': None, 'last_win_at': None}
+        )
+
+    def ordered(self, target: str, candidates: Sequence[str]) -> List[str]:
+        """
+        Candidatos na ordem de tentativa: último vencedor primeiro, rebaixados por último
+
+        A ordem original desempata, então alvos ainda sem histórico mantêm a lista como veio.
+        """
+        with self._lock:
+            entry = self._targets.get(target)
+            if not entry:
+                return list(candidates)
+
+            winner = entry.get('winner')
+            stats = entry['candidates']
+
+            def rank(item):
+                index, selector = item
+                s = stats.get(selector, {})
+                demoted = s.get('streak', 0) >= DEMOTE_AFTER
+                return (demoted, selector != winner, -s.get('wins', 0), index)
+
+            return [selector for _, selector in sorted(enumerate(candidates), key=rank)]
+
+    def record_win(self, target: str, selector: str, elapsed_ms: float):
+        with self._lock:
+            s = self._stats(target, selector)
+            s['wins'] += 1
+            s['streak'] = 0
+            s['avg_ms'] = round(elapsed_ms if s['avg_ms'] is None else s['avg_ms'] * 0.8 + elapsed_ms * 0.2, 1)
+            s['last_win_at'] = time.time()
+
+            entry = self._targets[target]
+            changed = entry['winner'] != selector
+            entry['winner'] = selector
+            # Persistir só quando o aprendizado muda, não a cada acerto
+            if changed or s['wins'] == 1:
+                self._save()
+
+        if changed:
+            logger.info(f"🎯 SELETOR - Novo vencedor para '{target}': {selector}")
+
+    def record_failure(self, target: str, selector: str):
+        with self._lock:
+            s = self._stats(target, selector)
+            s['failures'] += 1
+            s['streak'] += 1
+
+            entry = self._targets[target]
+            demoted = entry['winner'] == selector and s['streak'] >= DEMOTE_AFTER
+            if demoted:
+                entry['winner'] = None
+            if demoted or s['streak'] == 1:
+                self._save()
+
+        if demoted:
+            logger.warning(f"⚠️ SELETOR - '{selector}' rebaixado para '{target}' após {DEMOTE_AFTER} falhas")
+
+    async def resolve(self, page: Page, target: str, candidates: Sequence[str],
+                      action: Optional[Callable[[Locator], Awaitable[bool]]] = None,
+                      retry_on_error: bool = True) -> Optional[str]:
+        """
+        Tenta os candidatos na ordem aprendida até um funcionar
+
+        Args:
+            page: Página onde procurar
+            target: Nome lógico do alvo (ex: 'adicionar_os')
+            candidates: Seletores alternativos, do preferido ao mais genérico
+            action: Coroutine function executada com o locator encontrado; um retorno
+                falso ou uma exceção contam como falha e o próximo candidato é tentado
+            retry_on_error: Com False (ações não idempotentes, ex: "Incluir"), a primeira
+                ação executada decide: um retorno falso devolve None e uma exceção é
+                propagada, sem tentar os candidatos seguintes
+
+        Returns:
+            Seletor que funcionou ou None
+        """
+        for selector in self.ordered(target, candidates):
+            started = time.perf_counter()
+            acted = False
+            try:
+                locator = page.locator(selector)
+                if await locator.count() == 0:
+                    self.record_failure(target, selector)
+                    continue
+                acted = action is not None
+                if action is not None and not await action(locator):
+                    self.record_failure(target, selector)
+                    if retry_on_error:
+                        continue
+                    return None
+            except Exception as e:
+                logger.debug(f"Seletor '{selector}' falhou para '{target}': {e}")
+                self.record_failure(target, selector)
+                if acted and not retry_on_error:
+                    raise
+                continue
+
+            self.record_win(target, selector, (time.perf_counter() - started) * 1000)
+            return selector
+
+        return None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                target: {
+                    'winner': entry.get('winner'),
+                    'candidates': {selector: dict(s) for selector, s in entry['candidates'].items()}
+                }
+                for target, entry in self._targets.items()
+            }
+
+
+_selector_registry: Optional[SelectorRegistry] = None
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """Retorna o registro de seletores compartilhado do processo"""
+    global _selector_registry
+
+    if _selector_registry is None:
+        _selector_registry = SelectorRegistry()
+
+    return _selector_registry
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Cache de sessões autenticadas do EACE
+
+Guarda o storage_state do Playwright (cookies + localStorage) por conta, em
+memória e em disco, para que os fluxos pulem o login e a seleção do perfil
+"Fornecedor" enquanto a sessão continuar válida.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+EACE_DASHBOARD_URL = "https://eace.org.br/dashboard_fornecedor"
+SESSIONS_DIR = os.getenv('EACE_SESSIONS_DIR', 'data/sessions')
+SESSION_MAX_AGE = int(os.getenv('EACE_SESSION_MAX_AGE', str(6 * 3600)))
+# Espera máxima (ms) pelo dashboard ou pelo login depois do JS do Bubble
+SESSION_CHECK_TIMEOUT = int(os.getenv('EACE_SESSION_CHECK_TIMEOUT', '8000'))
+
+# Ícone que só aparece no dashboard autenticado (atalho para a página de OS)
+DASHBOARD_READY_SELECTOR = 'text="portable_wifi_off"'
+LOGIN_FORM_SELECTOR = "//input[@type='password']"
+
+
+class SessionCache:
+    def __init__(self, sessions_dir: str = SESSIONS_DIR, max_age: int = SESSION_MAX_AGE):
+        """
+        Inicializa o cache de sessões
+
+        Args:
+            sessions_dir: Diretório onde os storage_state são persistidos
+            max_age: Idade máxima (segundos) de uma sessão antes de forçar novo login
+        """
+        self.sessions_dir = sessions_dir
+        self.max_age = max_age
+        self._states: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._login_locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.logins = 0
+
+    def _path(self, account: str) -> str:
+        digest = hashlib.sha1(account.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.sessions_dir, f"{digest}.json")
+
+    def get(self, account: str) -> Optional[Dict]:
+        """
+        Retorna o storage_state salvo da conta, se ainda não expirou
+
+        Args:
+            account: Usuário EACE
+
+        Returns:
+            storage_state do Playwright ou None
+        """
+        with self._lock:
+            entry = self._states.get(account)
+
+            if entry is None:
+                try:
+                    with open(self._path(account), 'r') as f:
+                        entry = json.load(f)
+                    self._states[account] = entry
+                except FileNotFoundError:
+                    return None
+                except Exception as e:
+                    logger.warning(f"⚠️ Sessão em disco inválida para {account}: {e}")
+                    return None
+
+            if time.time() - entry['saved_at'] > self.max_age:
+                return None
+
+            return entry['state']
+
+    def save(self, account: str, state: Dict):
+        """Salva o storage_state da conta em memória e em disco"""
+        entry = {'saved_at': time.time(), 'state': state}
+
+        with self._lock:
+            self._states[account] = entry
+
+            try:
+                os.makedirs(self.sessions_dir, exist_ok=True)
+                path = self._path(account)
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(entry, f)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error(f"❌ Erro ao salvar sessão de {account}: {e}")
+
+    def invalidate(self, account: str):
+        """Descarta a sessão da conta"""
+        with self._lock:
+            self._states.pop(account, None)
+            try:
+                os.remove(self._path(account))
+            except FileNotFoundError:
+                pass
+
+    async def _apply(self, context: BrowserContext, state: Dict):
+        """Aplica cookies e localStorage de um storage_state em um contexto já criado"""
+        if state.get('cookies'):
+            await context.add_cookies(state['cookies'])
+
+        origins = {
+            origin['origin']: {item['name']: item['value'] for item in origin.get('localStorage', [])}
+            for origin in state.get('origins', [])
+        }
+        if origins:
+            await context.add_init_script(
+                "(origins => {"
+                " const items = origins[window.location.origin];"
+                " if (!items) return;"
+                " for (const [k, v] of Object.entries(items)) {"
+                "  if (window.localStorage.getItem(k) === null) window.localStorage.setItem(k, v);"
+                " }"
+                f"}})({json.dumps(origins)})"
+            )
+
+    async def _is_authenticated(self, page: Page) -> bool:
+        """
+        Verificação barata: o dashboard abre sem redirecionar para o login
+
+        No Bubble o redirecionamento e o formulário de login só aparecem depois
+        do JS, então espera um elemento exclusivo do dashboard ou o login; se
+        nenhum dos dois aparecer a tempo, a sessão é tratada como expirada.
+        """
+        try:
+            await page.goto(EACE_DASHBOARD_URL, wait_until='domcontentloaded', timeout=30000)
+            dashboard = page.locator(DASHBOARD_READY_SELECTOR)
+            login_form = page.locator(LOGIN_FORM_SELECTOR)
+            try:
+                await dashboard.or_(login_form).first.wait_for(state='visible', timeout=SESSION_CHECK_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.info(f"ℹ️ Sessão: nem dashboard nem login em {SESSION_CHECK_TIMEOUT}ms ({page.url})")
+                return False
+
+            if 'login' in page.url or await login_form.count() > 0:
+                return False
+            return await dashboard.count() > 0
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao verificar sessão: {e}")
+            return False
+
+    async def ensure_session(self, page: Page, account: str,
+                             login: Callable[[Page], Awaitable[bool]]) -> bool:
+        """
+        Garante que a página esteja autenticada, reaproveitando a sessão salva
+
+        Args:
+            page: Página do contexto a autenticar
+            account: Usuário EACE
+            login: Coroutine function que faz o login completo na página
+
+        Returns:
+            True se a página terminou autenticada
+        """
+        context = page.context
+
+        state = self.get(account)
+        if state and await self._try_state(page, state):
+            self.hits += 1
+            logger.info(f"♻️ Sessão reaproveitada para {account}")
+            return True
+
+        # Um único login por conta; os demais workers esperam e reaproveitam
+        lock = self._login_locks.setdefault(account, asyncio.Lock())
+        async with lock:
+            fresh_state = self.get(account)
+            if fresh_state and fresh_state is not state and await self._try_state(page, fresh_state):
+                self.hits += 1
+                return True
+
+            self.misses += 1
+            self.invalidate(account)
+            await context.clear_cookies()
+
+            if not await login(page):
+                return False
+
+            self.logins += 1
+            self.save(account, await context.storage_state())
+            logger.info(f"🔐 Nova sessão salva para {account}")
+            return True
+
+    async def _try_state(self, page: Page, state: Dict) -> bool:
+        await self._apply(page.context, state)
+        return await self._is_authenticated(page)
+
+    def stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'logins': self.logins,
+            'cached_accounts': len(self._states)
+        }
+
+
+_session_cache: Optional[SessionCache] = None
+
+
+def get_session_cache() -> SessionCache:
+    """Retorna o cache de sessões compartilhado do processo"""
+    global _session_cache
+
+    if _session_cache is None:
+        _session_cache = SessionCache()
+
+    return _session_cache
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Cache em memória site_id -> (nome, INEP)
+
+Cada webhook fazia um select aninhado tickets -> incidentes -> sites e
+extraía o INEP do nome do site de novo. Os sites quase não mudam: aqui eles
+são carregados em lote na inicialização, as entradas valem por
+SITE_CACHE_TTL segundos e as ausentes ou vencidas são buscadas juntas, em
+uma única consulta in.(...). Um webhook de UPDATE na tabela sites (ou
+invalidate) descarta a entrada na hora.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from inep_extraction import extract_inep
+from supabase_client import SupabaseGateway, get_supabase_gateway
+
+logger = logging.getLogger(__name__)
+
+SITE_CACHE_TTL = float(os.getenv('SITE_CACHE_TTL', '3600'))
+# Linhas por página na carga inicial (limite padrão do PostgREST)
+SITE_PAGE_SIZE = 1000
+
+
+class SiteInepCache:
+    def __init__(self, gateway: Optional[SupabaseGateway] = None, ttl_seconds: float = SITE_CACHE_TTL,
+                 extract: Callable[[str], Optional[str]] = extract_inep):
+        """
+        Inicializa o cache
+
+        Args:
+            gateway: Acesso ao Supabase (padrão: o compartilhado do processo)
+            ttl_seconds: Validade de cada entrada
+            extract: Função que extrai o INEP do nome do site
+        """
+        self.extract = extract
+        self.gateway = gateway or get_supabase_gateway()
+        self.ttl_seconds = ttl_seconds
+        self._sites: Dict[int, Tuple[str, Optional[str], float]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.queries = 0
+
+    def _store(self, rows: Iterable[Dict], now: float) -> int:
+        count = 0
+        with self._lock:
+            for row in rows:
+                nome = row.get('nome') or ''
+                self._sites[row['id']] = (nome, self.extract(nome), now)
+                count += 1
+        return count
+
+    def load(self) -> int:
+        """Carrega todos os sites, em páginas ordenadas por id"""
+        now = time.time()
+        total = 0
+        start = 0
+        while True:
+            response = self.gateway.execute(
+                lambda db: db.table('sites').select('id, nome').order('id').range(start, start + SITE_PAGE_SIZE - 1)
+            )
+            self.queries += 1
+            total += self._store(response.data, now)
+            if len(response.data) < SITE_PAGE_SIZE:
+                break
+            start += SITE_PAGE_SIZE
+
+        logger.info(f"🏫 {total} sites carregados no cache de INEP")
+        return total
+
+    def get_many(self, site_ids: Iterable[int]) -> Dict[int, Tuple[str, Optional[str]]]:
+        """
+        (nome, INEP) de vários sites; ausentes ou vencidos são buscados em uma única consulta
+
+        Returns:
+            {site_id: (nome, INEP ou None)} para os sites existentes
+        """
+        now = time.time()
+        found: Dict[int, Tuple[str, Optional[str]]] = {}
+        missing = []
+
+        with self._lock:
+            for site_id in set(site_ids):
+                if site_id is None:
+                    continue
+                entry = self._sites.get(site_id)
+                if entry is not None and entry[2] + self.ttl_seconds > now:
+                    found[site_id] = (entry[0], entry[1])
+                    self.hits += 1
+                else:
+                    missing.append(site_id)
+                    self.misses += 1
+
+        if missing:
+            response = self.gateway.execute(lambda db: db.table('sites').select('id, nome').in_('id', missing))
+            self.queries += 1
+            self._store(response.data, now)
+            with self._lock:
+                for site_id in missing:
+                    entry = self._sites.get(site_id)
+                    if entry is not None:
+                        found[site_id] = (entry[0], entry[1])
+
+        return found
+
+    def put(self, site_id: int, nome: str):
+        """Atualiza um site com dados já conhecidos (ex: payload de webhook)"""
+        self._store([{'id': site_id, 'nome': nome}], time.time())
+
+    def invalidate(self, site_id: Optional[int] = None):
+        """Descarta um site (ou todos, sem site_id)"""
+        with self._lock:
+            if site_id is None:
+                self._sites.clear()
+            else:
+                self._sites.pop(site_id, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            size = len(self._sites)
+        lookups = self.hits + self.misses
+        return {
+            'sites': size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 3) if lookups else None,
+            'queries': self.queries
+        }
+
+
+_site_cache: Optional[SiteInepCache] = None
+_site_cache_lock = threading.Lock()
+
+
+def get_site_cache() -> SiteInepCache:
+    """Retorna o cache de sites compartilhado do processo"""
+    global _site_cache
+
+    with _site_cache_lock:
+        if _site_cache is None:
+            _site_cache = SiteInepCache()
+
+    return _site_cache
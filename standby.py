@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Contextos em hot standby parados na página controle_os
+
+Mantém N contextos do pool já autenticados e abertos na lista de OS. Um
+keep-alive recarrega a página no intervalo configurado (renovando a sessão);
+quando um job chega ele recebe a página pronta e começa direto em "Adicionar
+nova OS", sem pagar login nem navegação. Ao terminar, a página volta a ser
+estacionada em controle_os.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from playwright.async_api import Page
+
+from browser_pool import BrowserPool
+from eace_flows import navigate_to_os_page, open_logged_in_page
+from wait_engine import WaitEngine
+
+logger = logging.getLogger(__name__)
+
+STANDBY_CONTEXTS = int(os.getenv('STANDBY_CONTEXTS', '1'))
+STANDBY_KEEPALIVE_SECONDS = float(os.getenv('STANDBY_KEEPALIVE_SECONDS', '240'))
+STANDBY_MAX_JOBS = int(os.getenv('STANDBY_MAX_JOBS', '20'))
+STANDBY_RETRY_SECONDS = 30
+
+STATE_WARMING = 'warming'
+STATE_READY = 'ready'
+STATE_BUSY = 'busy'
+STATE_PARKING = 'parking'
+STATE_ERROR = 'error'
+
+
+class StandbySlot:
+    """Contexto em standby com seu estado"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.page: Optional[Page] = None
+        self.state = STATE_WARMING
+        self.jobs = 0
+        self.refreshed_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.wake = asyncio.Event()
+
+    def to_dict(self) -> Dict:
+        return {
+            'index': self.index,
+            'state': self.state,
+            'jobs': self.jobs,
+            'refreshed_seconds_ago': round(time.time() - self.refreshed_at, 1) if self.refreshed_at else None,
+            'last_error': self.last_error
+        }
+
+
+class StandbyPool:
+    def __init__(self, pool: BrowserPool, size: int = STANDBY_CONTEXTS,
+                 keepalive_seconds: float = STANDBY_KEEPALIVE_SECONDS, max_jobs: int = STANDBY_MAX_JOBS):
+        """
+        Inicializa o standby
+
+        Args:
+            pool: Pool de navegadores de onde os contextos são emprestados
+            size: Contextos mantidos prontos (cada um ocupa um navegador do pool;
+                no máximo o pool menos um, para sobrar navegador aos demais jobs)
+            keepalive_seconds: Intervalo de recarga das páginas ociosas
+            max_jobs: Jobs atendidos por contexto antes de recriá-lo
+        """
+        self.pool = pool
+        self.size = max(0, min(size, pool.size - 1))
+        self.keepalive_seconds = keepalive_seconds
+        self.max_jobs = max(1, max_jobs)
+        self.slots: List[StandbySlot] = []
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+        if size > self.size:
+            logger.warning(
+                f"⚠️ STANDBY_CONTEXTS={size} ocuparia todo o pool ({pool.size} navegadores) e os jobs "
+                f"fora do standby nunca receberiam um navegador; usando {self.size}"
+            )
+
+    async def start(self):
+        """Inicia as tasks que aquecem e mantêm os contextos (deve rodar no loop do motor)"""
+        for index in range(self.size):
+            slot = StandbySlot(index)
+            self.slots.append(slot)
+            self._tasks.append(asyncio.create_task(self._run_slot(slot), name=f'standby-{index}'))
+        if self.size:
+            logger.info(f"🔥 Standby iniciado: {self.size} contextos (keep-alive a cada {self.keepalive_seconds:.0f}s)")
+
+    async def _park(self, slot: StandbySlot):
+        """Leva (ou recarrega) a página até controle_os e marca o slot como pronto"""
+        slot.state = STATE_PARKING
+        if not await navigate_to_os_page(slot.page, WaitEngine(slot.page)):
+            raise RuntimeError(f"Página de OS não carregou - URL: {slot.page.url}")
+        slot.refreshed_at = time.time()
+        slot.last_error = None
+        slot.state = STATE_READY
+
+    async def _run_slot(self, slot: StandbySlot):
+        while not self._stopping:
+            try:
+                # O slot espera o tempo que for preciso por um navegador (não é uma requisição)
+                async with self.pool.context(acquire_timeout=None) as context:
+                    slot.state = STATE_WARMING
+                    slot.page = await open_logged_in_page(context)
+                    await self._park(slot)
+                    jobs_at_start = slot.jobs
+
+                    while not self._stopping and slot.jobs - jobs_at_start < self.max_jobs:
+                        slot.wake.clear()
+                        try:
+                            await asyncio.wait_for(slot.wake.wait(), self.keepalive_seconds)
+                        except asyncio.TimeoutError:
+                            pass
+
+                        if slot.state == STATE_BUSY:
+                            continue
+                        if slot.state == STATE_READY:
+                            self.refreshes += 1
+                        await self._park(slot)
+
+                    # Recria o contexto periodicamente (libera memória e conta para a reciclagem do pool)
+                    slot.state = STATE_WARMING
+                    slot.page = None
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                slot.state = STATE_ERROR
+                slot.page = None
+                slot.last_error = str(e)
+                logger.error(f"❌ Standby {slot.index}: {e}; nova tentativa em {STANDBY_RETRY_SECONDS}s")
+                await asyncio.sleep(STANDBY_RETRY_SECONDS)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Empresta uma página pronta em controle_os, se houver
+
+        Yields:
+            Page estacionada em controle_os, ou None se nenhum slot estiver pronto
+        """
+        slot = next((s for s in self.slots if s.state == STATE_READY), None)
+        if slot is None:
+            self.misses += 1
+            yield None
+            return
+
+        slot.state = STATE_BUSY
+        self.hits += 1
+        try:
+            yield slot.page
+        finally:
+            slot.jobs += 1
+            slot.state = STATE_PARKING
+            slot.wake.set()
+
+    async def stop(self):
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict:
+        return {
+            'size': self.size,
+            'ready': sum(1 for slot in self.slots if slot.state == STATE_READY),
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'keepalive_seconds': self.keepalive_seconds,
+            'slots': [slot.to_dict() for slot in self.slots]
+        }
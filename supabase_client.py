@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Cliente Supabase único do processo
+
+Antes cada EaceAutomation, cada processador de webhook e cada consulta de
+lote chamavam create_client(...), abrindo uma sessão HTTP nova (e um novo
+handshake TLS) por instância. Aqui o cliente é criado uma vez e sua sessão
+httpx do PostgREST, com keep-alive, é compartilhada por todas as threads.
+
+Código assíncrono (os fluxos Playwright) não deve fazer a chamada HTTP
+bloqueante no event loop: `aexecute` a executa em um pool pequeno de threads.
+Ganchos de trace do httpx contam quantas requisições abriram conexão nova e
+quantas reaproveitaram uma conexão do pool.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from metrics import SUPABASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Threads que executam chamadas vindas de código assíncrono
+SUPABASE_WORKERS = int(os.getenv('SUPABASE_WORKERS', '4'))
+
+
+class SupabaseGateway:
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None,
+                 workers: int = SUPABASE_WORKERS):
+        """
+        Inicializa o acesso compartilhado ao Supabase (o cliente é criado no primeiro uso)
+
+        Args:
+            url: URL do projeto Supabase (padrão: SUPABASE_URL, lida no primeiro uso)
+            key: Chave do Supabase (padrão: SUPABASE_KEY)
+            workers: Threads para as chamadas feitas via aexecute
+        """
+        self.url = url
+        self.key = key
+        self._client = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix='supabase'
+        )
+
+        self.clients_created = 0
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.http_requests = 0
+        self.connections_opened = 0
+
+    @property
+    def client(self):
+        """Cliente supabase compartilhado"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create()
+        return self._client
+
+    def _create(self):
+        from supabase import create_client
+
+        # Lidas aqui para respeitar o load_dotenv() feito depois do import
+        self.url = self.url or os.getenv('SUPABASE_URL')
+        self.key = self.key or os.getenv('SUPABASE_KEY')
+        if not self.url or not self.key:
+            raise RuntimeError("Variáveis de ambiente SUPABASE_URL e SUPABASE_KEY são obrigatórias")
+
+        client = create_client(self.url, self.key)
+        self.clients_created += 1
+
+        session = getattr(client.postgrest, 'session', None)
+        if session is not None and hasattr(session, 'event_hooks'):
+            session.event_hooks['request'].append(self._on_request)
+        else:
+            logger.warning("⚠️ Sessão HTTP do PostgREST não encontrada; métricas de conexão desativadas")
+
+        logger.info("🔌 Cliente Supabase criado (sessão HTTP compartilhada)")
+        return client
+
+    def _on_request(self, request):
+        with self._stats_lock:
+            self.http_requests += 1
+        request.extensions['trace'] = self._trace
+
+    def _trace(self, event_name: str, info: Dict):
+        # Só requisições sem conexão ociosa disponível passam pelo connect_tcp
+        if event_name == 'connection.connect_tcp.complete':
+            with self._stats_lock:
+                self.connections_opened += 1
+
+    def execute(self, build: Callable[[Any], Any]) -> Any:
+        """
+        Executa uma consulta montada sobre o cliente compartilhado
+
+        Args:
+            build: Recebe o cliente e devolve a consulta (sem o .execute()),
+                ex: lambda db: db.table('tickets').select('id').eq('id', 1)
+
+        Returns:
+            Resposta do PostgREST
+        """
+        started = time.perf_counter()
+        outcome = 'ok'
+        try:
+            return build(self.client).execute()
+        except Exception:
+            outcome = 'error'
+            with self._stats_lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            SUPABASE_SECONDS.observe(elapsed, outcome=outcome)
+            with self._stats_lock:
+                self.calls += 1
+                self.total_ms += elapsed * 1000
+
+    async def aexecute(self, build: Callable[[Any], Any]) -> Any:
+        """Mesmo que execute, mas sem bloquear o event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.execute, build)
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            reused = max(0, self.http_requests - self.connections_opened)
+            return {
+                'clients_created': self.clients_created,
+                'calls': self.calls,
+                'errors': self.errors,
+                'avg_ms': round(self.total_ms / self.calls, 1) if self.calls else None,
+                'http_requests': self.http_requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': reused,
+                'reuse_ratio': round(reused / self.http_requests, 3) if self.http_requests else None
+            }
+
+
+_gateway: Optional[SupabaseGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_supabase_gateway(url: Optional[str] = None, key: Optional[str] = None) -> SupabaseGateway:
+    """
+    Retorna o acesso ao Supabase compartilhado do processo
+
+    Args:
+        url, key: Credenciais usadas se o acesso ainda não foi criado (padrão: variáveis de ambiente)
+    """
+    global _gateway
+
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = SupabaseGateway(url, key)
+
+    return _gateway
+
+
+def get_supabase():
+    """Atalho para o cliente supabase compartilhado"""
+    return get_supabase_gateway().client
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Miniaturas dos screenshots com cache em disco
+
+A galeria e as páginas em tempo real embutiam os arquivos originais e
+recarregavam tudo a cada 8-10 s. Aqui:
+
+- cada arquivo tem um hash do conteúdo, calculado uma vez por (mtime, tamanho)
+  e usado como ETag, para que o navegador faça requisições condicionais (304);
+- a miniatura é gerada uma única vez (Pillow) e gravada em THUMBNAILS_DIR com
+  o hash no nome, então o mesmo conteúdo nunca é redimensionado de novo;
+- arquivos por job ("<job_id>/<arquivo>") não mudam depois de gravados e
+  podem ficar no cache do navegador; os arquivos soltos na raiz (templates
+  antigas) são sobrescritos com o mesmo nome e sempre revalidam.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+THUMBNAILS_DIR = os.getenv('THUMBNAILS_DIR', '/tmp/screenshot_thumbs')
+THUMBNAIL_WIDTH = int(os.getenv('THUMBNAIL_WIDTH', '320'))
+THUMBNAIL_QUALITY = 70
+THUMBNAIL_WIDTHS = (160, 320, 640)
+THUMBNAIL_MAX_AGE = 86400
+HASH_CACHE_SIZE = 4096
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class ThumbnailCache:
+    def __init__(self, cache_dir: str = THUMBNAILS_DIR, quality: int = THUMBNAIL_QUALITY):
+        """
+        Inicializa o cache de miniaturas
+
+        Args:
+            cache_dir: Diretório das miniaturas geradas
+            quality: Qualidade JPEG das miniaturas
+        """
+        self.cache_dir = cache_dir
+        self.quality = quality
+        self._hashes: 'OrderedDict[str, Tuple[int, int, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hash_hits': 0, 'hash_misses': 0, 'generated': 0, 'served': 0, 'fallbacks': 0}
+
+        if Image is None:
+            logger.warning("⚠️ Pillow não instalado: miniaturas servirão o arquivo original")
+
+    def content_hash(self, path: str) -> str:
+        """
+        Hash do conteúdo do arquivo, recalculado só quando mtime ou tamanho mudam
+
+        Args:
+            path: Caminho absoluto do arquivo
+
+        Returns:
+            Hash hexadecimal (usado como ETag e no nome da miniatura)
+        """
+        stat = os.stat(path)
+        with self._lock:
+            cached = self._hashes.get(path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._hashes.move_to_end(path)
+                self._stats['hash_hits'] += 1
+                return cached[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        value = digest.hexdigest()
+
+        with self._lock:
+            self._stats['hash_misses'] += 1
+            self._hashes[path] = (stat.st_mtime_ns, stat.st_size, value)
+            self._hashes.move_to_end(path)
+            while len(self._hashes) > HASH_CACHE_SIZE:
+                self._hashes.popitem(last=False)
+        return value
+
+    @staticmethod
+    def width(requested: Optional[int]) -> int:
+        """Aproxima a largura pedida de uma das larguras suportadas (limita o cache)"""
+        if not requested:
+            return THUMBNAIL_WIDTH
+        return min(THUMBNAIL_WIDTHS, key=lambda width: abs(width - requested))
+
+    def thumbnail(self, path: str, width: int) -> Tuple[str, str, str]:
+        """
+        Miniatura do arquivo, gerada na primeira vez
+
+        Args:
+            path: Caminho absoluto do original
+            width: Largura (uma de THUMBNAIL_WIDTHS)
+
+        Returns:
+            (caminho a servir, mimetype, ETag); sem Pillow, o próprio original
+        """
+        content = self.content_hash(path)
+        if Image is None:
+            with self._lock:
+                self._stats['fallbacks'] += 1
+            return path, None, content
+
+        etag = f"{content}-{width}"
+        thumb_path = os.path.join(self.cache_dir, f"{etag}.jpg")
+        if not os.path.exists(thumb_path):
+            self._generate(path, thumb_path, width)
+
+        with self._lock:
+            self._stats['served'] += 1
+        return thumb_path, 'image/jpeg', etag
+
+    def _generate(self, path: str, thumb_path: str, width: int):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with Image.open(path) as image:
+            image.thumbnail((width, width * 4))
+            tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+            image.convert('RGB').save(tmp_path, format='JPEG', quality=self.quality, optimize=True)
+        os.replace(tmp_path, thumb_path)
+
+        with self._lock:
+            self._stats['generated'] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['hashes_cached'] = len(self._hashes)
+        stats['pillow'] = Image is not None
+        return stats
+
+
+def cache_max_age(relative_path: str) -> int:
+    """
+    Tempo de cache no navegador para um screenshot
+
+    Arquivos de job são imutáveis; os soltos na raiz sempre revalidam (ETag).
+    """
+    return THUMBNAIL_MAX_AGE if '/' in relative_path else 0
+
+
+_thumbnail_cache: Optional[ThumbnailCache] = None
+_thumbnail_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Retorna o cache de miniaturas compartilhado do processo"""
+    global _thumbnail_cache
+
+    with _thumbnail_cache_lock:
+        if _thumbnail_cache is None:
+            _thumbnail_cache = ThumbnailCache()
+
+    return _thumbnail_cache
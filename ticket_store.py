@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Registro persistente de tickets processados (SQLite em modo WAL)
+
+Substitui o data/processed_tickets.json, que era reescrito inteiro a cada
+sucesso a partir de threads sem lock. Cada ticket é uma linha com chave
+única: a consulta de pertinência é uma busca pela chave, o "claim" é
+atômico e cada sucesso grava apenas a sua linha.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TICKET_DB_PATH = os.getenv('TICKET_DB_PATH', 'data/processed_tickets.db')
+LEGACY_JSON_PATH = 'data/processed_tickets.json'
+
+STATUS_PROCESSING = 'processing'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_tickets (
+    ticket_id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    os_numero TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    claimed_at REAL,
+    processed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_processed_tickets_status ON processed_tickets (status);
+"""
+
+
+class TicketStore:
+    def __init__(self, db_path: str = TICKET_DB_PATH, legacy_json_path: Optional[str] = LEGACY_JSON_PATH):
+        """
+        Inicializa o registro de tickets
+
+        Args:
+            db_path: Caminho do banco SQLite
+            legacy_json_path: processed_tickets.json a importar uma única vez (None para ignorar)
+        """
+        self.db_path = db_path
+
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        if legacy_json_path:
+            self._import_legacy(legacy_json_path)
+
+    def _import_legacy(self, path: str):
+        """Importa o processed_tickets.json antigo e o renomeia para não importar de novo"""
+        try:
+            with open(path, 'r') as f:
+                ticket_ids = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"❌ Erro ao ler {path}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO processed_tickets (ticket_id, status, processed_at) VALUES (?, ?, ?)",
+                    [(int(ticket_id), STATUS_DONE, now) for ticket_id in ticket_ids]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        os.replace(path, path + '.migrated')
+        logger.info(f"📋 {len(ticket_ids)} tickets importados de {path}")
+
+    def recover(self) -> int:
+        """Libera tickets que estavam 'processing' quando o processo caiu"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE processed_tickets SET status = ?, last_error = ? WHERE status = ?",
+                (STATUS_FAILED, 'Interrompido por reinício', STATUS_PROCESSING)
+            )
+        if cursor.rowcount:
+            logger.info(f"🔁 {cursor.rowcount} tickets interrompidos liberados para nova tentativa")
+        return cursor.rowcount
+
+    def is_processed(self, ticket_id: int) -> bool:
+        """Consulta pela chave: o ticket já gerou OS?"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed_tickets WHERE ticket_id = ? AND status = ?", (ticket_id, STATUS_DONE)
+            ).fetchone()
+        return row is not None
+
+    def claim(self, ticket_id: int) -> bool:
+        """
+        Reserva atomicamente um ticket para processamento
+
+        Returns:
+            True se este chamador deve processar o ticket; False se ele já foi
+            processado ou está sendo processado por outro worker
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO processed_tickets (ticket_id, status, attempts, claimed_at) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (ticket_id) DO UPDATE SET status = excluded.status, attempts = attempts + 1, "
+                "claimed_at = excluded.claimed_at WHERE status = ?",
+                (ticket_id, STATUS_PROCESSING, now, STATUS_FAILED)
+            )
+        return cursor.rowcount == 1
+
+    def mark_done(self, ticket_id: int, os_numero: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE processed_tickets SET status = ?, os_numero = ?, last_error = NULL, processed_at = ? "
+                "WHERE ticket_id = ?",
+                (STATUS_DONE, os_numero, time.time(), ticket_id)
+            )
+
+    def release(self, ticket_id: int, error: Optional[str] = None):
+        """Marca a tentativa como falha, liberando o ticket para um novo claim"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE processed_tickets SET status = ?, last_error = ? WHERE ticket_id = ? AND status = ?",
+                (STATUS_FAILED, error, ticket_id, STATUS_PROCESSING)
+            )
+
+    def get(self, ticket_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM processed_tickets WHERE ticket_id = ?", (ticket_id,)).fetchone()
+        return dict(row) if row else None
+
+    def count(self, status: str = STATUS_DONE) -> int:
+        """Contagem pelo índice de status"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM processed_tickets WHERE status = ?", (status,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM processed_tickets GROUP BY status"
+            ).fetchall()
+        counts = {STATUS_PROCESSING: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Esperas orientadas a eventos para os fluxos Playwright
+
+Substitui os `page.wait_for_timeout(...)` fixos por esperas em condições
+concretas (seletor visível, URL, XHRs do Bubble ociosos, DOM sem mutações),
+sempre com um teto, registrando quanto tempo cada etapa realmente levou.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Chamadas XHR do Bubble que indicam trabalho em andamento
+BUBBLE_XHR_PATTERN = r'/(workflow|elasticsearch|api/1\.1)/'
+
+DEFAULT_TIMEOUT = 15000
+
+_DOM_QUIET_SCRIPT = """
+({ quietMs, capMs }) => new Promise(resolve => {
+    let timer = null;
+    let cap = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(() => done(true), quietMs);
+    });
+    const done = (ok) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearTimeout(cap);
+        resolve(ok);
+    };
+    observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    timer = setTimeout(() => done(true), quietMs);
+    cap = setTimeout(() => done(false), capMs);
+})
+"""
+
+
+class WaitEngine:
+    def __init__(self, page: Page, default_timeout: int = DEFAULT_TIMEOUT):
+        """
+        Inicializa o motor de esperas de uma página
+
+        Args:
+            page: Página Playwright
+            default_timeout: Teto padrão de cada espera, em milissegundos
+        """
+        self.page = page
+        self.default_timeout = default_timeout
+        self.timings: List[Dict] = []
+
+    async def _measure(self, step: str, condition: str, waiter: Awaitable, timeout: int) -> bool:
+        """Executa uma espera com teto e registra a duração real"""
+        start = time.perf_counter()
+        satisfied = True
+
+        try:
+            result = await asyncio.wait_for(waiter, timeout / 1000)
+            if result is False:
+                satisfied = False
+        except (asyncio.TimeoutError, PlaywrightTimeoutError):
+            satisfied = False
+        except Exception as e:
+            logger.warning(f"⚠️ ESPERA - {step}: {e}")
+            satisfied = False
+
+        elapsed_ms = round((time.perf_counter() - start) * 1000)
+        self.timings.append({
+            'step': step,
+            'condition': condition,
+            'elapsed_ms': elapsed_ms,
+            'timeout_ms': timeout,
+            'satisfied': satisfied
+        })
+
+        if satisfied:
+            logger.info(f"⏱️ ESPERA - {step}: {condition} em {elapsed_ms} ms")
+        else:
+            logger.warning(f"⏱️ ESPERA - {step}: {condition} não ocorreu (teto {timeout} ms)")
+
+        return satisfied
+
+    async def for_selector(self, step: str, selector: str, state: str = 'visible',
+                           timeout: Optional[int] = None) -> bool:
+        """
+        Espera um seletor atingir o estado indicado
+
+        Args:
+            step: Nome da etapa (para o relatório)
+            selector: Seletor Playwright
+            state: 'attached', 'detached', 'visible' ou 'hidden'
+            timeout: Teto em milissegundos
+
+        Returns:
+            True se a condição ocorreu antes do teto
+        """
+        timeout = timeout or self.default_timeout
+        waiter = self.page.locator(selector).first.wait_for(state=state, timeout=timeout)
+        return await self._measure(step, f"seletor {state}: {selector}", waiter, timeout)
+
+    async def for_url(self, step: str, pattern: str, timeout: Optional[int] = None) -> bool:
+        """Espera a URL da página casar com a expressão regular"""
+        timeout = timeout or self.default_timeout
+        waiter = self.page.wait_for_url(re.compile(pattern), wait_until='commit', timeout=timeout)
+        return await self._measure(step, f"url ~ {pattern}", waiter, timeout)
+
+    async def for_response(self, step: str, url_pattern: str, timeout: Optional[int] = None) -> bool:
+        """Espera uma resposta de rede cuja URL case com a expressão regular"""
+        timeout = timeout or self.default_timeout
+        regex = re.compile(url_pattern)
+        waiter = self.page.wait_for_event('response', lambda response: bool(regex.search(response.url)),
+                                          timeout=timeout)
+        return await self._measure(step, f"resposta ~ {url_pattern}", waiter, timeout)
+
+    async def for_response_value(self, step: str, url_pattern: str, extract: Callable[[Any], Optional[Any]],
+                                 trigger: Optional[Callable[[], Awaitable]] = None,
+                                 timeout: Optional[int] = None) -> Optional[Any]:
+        """
+        Espera uma resposta de rede da qual `extract` consiga tirar um valor
+
+        O listener é registrado antes de `trigger` (ex: o clique que dispara a chamada),
+        então respostas rápidas não são perdidas.
+
+        Args:
+            step: Nome da etapa
+            url_pattern: Expressão regular das URLs observadas
+            extract: Recebe o corpo (JSON ou texto) e retorna o valor ou None
+            trigger: Coroutine function executada depois de registrar o listener
+            timeout: Teto em milissegundos
+
+        Returns:
+            Primeiro valor extraído, ou None se nenhuma resposta servir até o teto
+        """
+        timeout = timeout or self.default_timeout
+        regex = re.compile(url_pattern)
+        found: asyncio.Future = asyncio.get_running_loop().create_future()
+        inspections = set()
+
+        async def inspect(response):
+            try:
+                try:
+                    body = await response.json()
+                except Exception:
+                    body = await response.text()
+                value = extract(body)
+            except Exception:
+                return
+            if value is not None and not found.done():
+                found.set_result(value)
+
+        def on_response(response):
+            if not found.done() and regex.search(response.url):
+                task = asyncio.ensure_future(inspect(response))
+                inspections.add(task)
+                task.add_done_callback(inspections.discard)
+
+        self.page.on('response', on_response)
+        try:
+            if trigger is not None:
+                await trigger()
+            satisfied = await self._measure(step, f"valor na resposta ~ {url_pattern}", found, timeout)
+            return found.result() if satisfied else None
+        finally:
+            self.page.remove_listener('response', on_response)
+            for task in list(inspections):
+                task.cancel()
+
+    async def for_network_idle(self, step: str, url_pattern: Optional[str] = BUBBLE_XHR_PATTERN,
+                               idle_ms: int = 500, timeout: Optional[int] = None) -> bool:
+        """
+        Espera até não haver requisições em andamento que casem com o padrão por idle_ms
+
+        Args:
+            step: Nome da etapa
+            url_pattern: Expressão regular das requisições observadas (None = todas)
+            idle_ms: Janela sem requisições em andamento
+            timeout: Teto em milissegundos
+        """
+        timeout = timeout or self.default_timeout
+        regex = re.compile(url_pattern) if url_pattern else None
+        inflight = set()
+        changed = asyncio.Event()
+
+        def on_request(req):
+            if regex is None or regex.search(req.url):
+                inflight.add(req)
+                changed.set()
+
+        def on_done(req):
+            if req in inflight:
+                inflight.discard(req)
+                changed.set()
+
+        async def settle():
+            while True:
+                changed.clear()
+                if inflight:
+                    await changed.wait()
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(), idle_ms / 1000)
+                except asyncio.TimeoutError:
+                    return True
+
+        self.page.on('request', on_request)
+        self.page.on('requestfinished', on_done)
+        self.page.on('requestfailed', on_done)
+        try:
+            return await self._measure(step, f"rede ociosa ~ {url_pattern or '*'}", settle(), timeout)
+        finally:
+            self.page.remove_listener('request', on_request)
+            self.page.remove_listener('requestfinished', on_done)
+            self.page.remove_listener('requestfailed', on_done)
+
+    async def for_dom_quiet(self, step: str, quiet_ms: int = 500, timeout: Optional[int] = None) -> bool:
+        """Espera uma janela de quiet_ms sem mutações no DOM"""
+        timeout = timeout or self.default_timeout
+        waiter = self.page.evaluate(_DOM_QUIET_SCRIPT, {'quietMs': quiet_ms, 'capMs': timeout})
+        # Folga para o teto do lado do navegador responder antes do teto Python
+        return await self._measure(step, f"DOM quieto {quiet_ms} ms", waiter, timeout + 1000)
+
+    def report(self) -> Dict:
+        """Resumo das esperas: lista por etapa e total em milissegundos"""
+        return {
+            'steps': list(self.timings),
+            'total_ms': sum(t['elapsed_ms'] for t in self.timings),
+            'unsatisfied': sum(1 for t in self.timings if not t['satisfied'])
+        }
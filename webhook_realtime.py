@@ -7,13 +7,24 @@ Executa instantaneamente quando novo ticket é criado
 import asyncio
 import logging
 import os
-import json
 from datetime import datetime
-from typing import Dict, Optional
-from flask import Flask, request, jsonify
-import threading
-from supabase import create_client, Client
+from typing import Dict, List, Optional
+from flask import Flask, Response, request, jsonify
 from eace_automation import EACEAutomation
+from job_queue import JobQueue, JobFailed
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, gauge_callback, render as render_metrics
+from retention import get_retention_manager
+from site_cache import get_site_cache
+from supabase_client import SupabaseGateway, get_supabase_gateway
+from ticket_store import TicketStore
+from write_behind import get_write_behind
+
+# Deduplicação: janelas (s) em que um ticket/INEP já enfileirado reaproveita o job existente
+DEDUP_TICKET_WINDOW = float(os.getenv('DEDUP_TICKET_WINDOW', '3600'))
+DEDUP_INEP_WINDOW = float(os.getenv('DEDUP_INEP_WINDOW', '0'))
+
+# Tickets por consulta in.(...) na hidratação em lote (mantém a URL curta)
+HYDRATE_CHUNK_SIZE = 100
 
 # Configuração de logging
 logging.basicConfig(
@@ -35,124 +46,100 @@ class EACEWebhookProcessor:
             supabase_url: URL do Supabase
             supabase_key: Chave do Supabase
         """
-        self.supabase: Client = create_client(supabase_url, supabase_key)
-        self.processed_tickets = set()
-        self.load_processed_tickets()
+        self.db: SupabaseGateway = get_supabase_gateway(supabase_url, supabase_key)
+        self.writes = get_write_behind()
         
-        logger.info("🚀 Webhook Processor inicializado")
-    
-    def load_processed_tickets(self):
-        """Carrega IDs de tickets já processados"""
-        try:
-            with open('data/processed_tickets.json', 'r') as f:
-                self.processed_tickets = set(json.load(f))
-                logger.info(f"📋 Carregados {len(self.processed_tickets)} tickets processados")
-        except FileNotFoundError:
-            self.processed_tickets = set()
-            logger.info("📋 Nenhum ticket processado anteriormente")
-        except Exception as e:
-            logger.error(f"❌ Erro ao carregar tickets processados: {e}")
-            self.processed_tickets = set()
-    
-    def save_processed_tickets(self):
-        """Salva IDs de tickets já processados"""
+        # Sites carregados uma vez; tickets só trazem o site_id
+        self.site_cache = get_site_cache()
         try:
-            os.makedirs('data', exist_ok=True)
-            with open('data/processed_tickets.json', 'w') as f:
-                json.dump(list(self.processed_tickets), f)
+            self.site_cache.load()
         except Exception as e:
-            logger.error(f"❌ Erro ao salvar tickets processados: {e}")
+            logger.error(f"❌ Erro ao carregar cache de sites (será preenchido sob demanda): {e}")
+        
+        self.ticket_store = TicketStore()
+        self.ticket_store.recover()
+        logger.info(f"📋 {self.ticket_store.count()} tickets processados registrados")
+        
+        # Fila persistente com número fixo de workers
+        self.job_queue = JobQueue()
+        self.job_queue.register('process_ticket', self.run_ticket_job)
+        
+        logger.info("🚀 Webhook Processor inicializado")
     
-    def extract_inep_from_site_name(self, site_nome: str) -> Optional[str]:
+    def get_ticket_data(self, ticket_id: int) -> Optional[Dict]:
         """
-        Extrai número INEP do nome do site
+        Busca dados completos do ticket
         
         Args:
-            site_nome: Nome do site (ex: "INEP - 31382221")
+            ticket_id: ID do ticket
             
         Returns:
-            Número INEP ou None se não encontrado
+            Dados do ticket ou None se não encontrado
         """
-        try:
-            if " - " in site_nome:
-                parts = site_nome.split(" - ")
-                if len(parts) >= 2:
-                    inep = parts[1].strip()
-                    # Valida se é um número de 8 dígitos
-                    if inep.isdigit() and len(inep) == 8:
-                        return inep
-            
-            # Tenta outras variações
-            if "INEP" in site_nome.upper():
-                import re
-                # Procura por números de 8 dígitos após "INEP"
-                match = re.search(r'INEP[:\s-]*(\d{8})', site_nome.upper())
-                if match:
-                    return match.group(1)
-            
-            return None
-        except Exception as e:
-            logger.error(f"❌ Erro ao extrair INEP de '{site_nome}': {e}")
-            return None
+        return self.hydrate_tickets([ticket_id]).get(ticket_id)
     
-    def get_ticket_data(self, ticket_id: int) -> Optional[Dict]:
+    def hydrate_tickets(self, ticket_ids: List[int]) -> Dict[int, Optional[Dict]]:
         """
-        Busca dados completos do ticket
+        Busca os dados de vários tickets com uma consulta in.(...) por lote
+        
+        O INEP vem do cache de sites; sites ausentes ou vencidos são buscados
+        juntos, em uma única consulta.
         
         Args:
-            ticket_id: ID do ticket
-            
+            ticket_ids: IDs dos tickets
+        
         Returns:
-            Dados do ticket ou None se não encontrado
+            {ticket_id: dados do ticket ou None se não encontrado / sem INEP}
         """
+        rows = []
         try:
-            # Query para buscar dados completos do ticket
-            response = self.supabase.table('tickets').select(
-                '''
-                id,
-                incidente_id,
-                descricao_enviada,
-                data_abertura,
-                incidentes (
+            for start in range(0, len(ticket_ids), HYDRATE_CHUNK_SIZE):
+                chunk = ticket_ids[start:start + HYDRATE_CHUNK_SIZE]
+                response = self.db.execute(lambda db: db.table('tickets').select(
+                    '''
                     id,
-                    tipo,
-                    status,
-                    site_id,
-                    sites (
+                    incidente_id,
+                    descricao_enviada,
+                    data_abertura,
+                    incidentes (
                         id,
-                        nome
+                        tipo,
+                        status,
+                        site_id
                     )
-                )
-                '''
-            ).eq('id', ticket_id).execute()
+                    '''
+                ).in_('id', chunk))
+                rows.extend(response.data)
             
-            if response.data:
-                ticket_data = response.data[0]
-                
-                # Extrai INEP do nome do site
-                site_nome = ticket_data['incidentes']['sites']['nome']
-                numero_inep = self.extract_inep_from_site_name(site_nome)
-                
-                if numero_inep:
-                    return {
-                        'ticket_id': ticket_data['id'],
-                        'incidente_id': ticket_data['incidente_id'],
-                        'site_nome': site_nome,
-                        'numero_inep': numero_inep,
-                        'descricao': ticket_data['descricao_enviada'],
-                        'data_abertura': ticket_data['data_abertura'],
-                        'incidente_tipo': ticket_data['incidentes']['tipo']
-                    }
-                else:
-                    logger.warning(f"⚠️ INEP não encontrado para ticket {ticket_id} - Site: {site_nome}")
-                    return None
-            else:
-                logger.warning(f"⚠️ Ticket {ticket_id} não encontrado")
-                return None
-                
+            sites = self.site_cache.get_many(
+                (row.get('incidentes') or {}).get('site_id') for row in rows
+            )
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar dados do ticket {ticket_id}: {e}")
-            return None
+            logger.error(f"❌ Erro ao buscar dados dos tickets {ticket_ids}: {e}")
+            return {ticket_id: None for ticket_id in ticket_ids}
+        
+        tickets: Dict[int, Optional[Dict]] = {ticket_id: None for ticket_id in ticket_ids}
+        for row in rows:
+            incidente = row.get('incidentes') or {}
+            site_nome, numero_inep = sites.get(incidente.get('site_id'), ('', None))
+            
+            if numero_inep:
+                tickets[row['id']] = {
+                    'ticket_id': row['id'],
+                    'incidente_id': row['incidente_id'],
+                    'site_nome': site_nome,
+                    'numero_inep': numero_inep,
+                    'descricao': row['descricao_enviada'],
+                    'data_abertura': row['data_abertura'],
+                    'incidente_tipo': incidente.get('tipo')
+                }
+            else:
+                logger.warning(f"⚠️ INEP não encontrado para ticket {row['id']} - Site: {site_nome}")
+        
+        for ticket_id in set(ticket_ids) - {row['id'] for row in rows}:
+            logger.warning(f"⚠️ Ticket {ticket_id} não encontrado")
+        
+        return tickets
     
     def update_ticket_status(self, ticket_id: int, eace_status: str, eace_os_numero: str = None):
         """
@@ -172,7 +159,8 @@ class EACEWebhookProcessor:
             if eace_os_numero:
                 update_data['eace_os_numero'] = eace_os_numero
             
-            self.supabase.table('tickets').update(update_data).eq('id', ticket_id).execute()
+            # Mesclado com as outras mudanças do ticket e gravado em lote pelo write-behind
+            self.writes.update('tickets', 'id', ticket_id, update_data)
             logger.info(f"✅ Status do ticket {ticket_id} atualizado: {eace_status}")
             
         except Exception as e:
@@ -194,9 +182,9 @@ class EACEWebhookProcessor:
         try:
             logger.info(f"🎯 Processando ticket {ticket_id} - INEP: {numero_inep}")
             
-            # Verifica se já foi processado
-            if ticket_id in self.processed_tickets:
-                logger.info(f"⚠️ Ticket {ticket_id} já foi processado anteriormente")
+            # Reserva o ticket; já processado ou em processamento por outro worker
+            if not self.ticket_store.claim(ticket_id):
+                logger.info(f"⚠️ Ticket {ticket_id} já foi processado ou está em processamento")
                 return True
             
             # Atualiza status para 'PROCESSANDO'
@@ -214,15 +202,15 @@ class EACEWebhookProcessor:
                     resultado['numero_os']
                 )
                 
-                # Adiciona aos processados
-                self.processed_tickets.add(ticket_id)
-                self.save_processed_tickets()
+                # Registra como processado (grava só a linha do ticket)
+                self.ticket_store.mark_done(ticket_id, resultado['numero_os'])
                 
                 logger.info(f"✅ Ticket {ticket_id} processado com sucesso - OS: {resultado['numero_os']}")
                 return True
             else:
                 # Atualiza status para 'ERRO'
                 self.update_ticket_status(ticket_id, 'ERRO')
+                self.ticket_store.release(ticket_id, resultado['erro'])
                 logger.error(f"❌ Erro ao processar ticket {ticket_id}: {resultado['erro']}")
                 return False
                 
@@ -230,8 +218,84 @@ class EACEWebhookProcessor:
             logger.error(f"❌ Erro ao processar ticket {ticket_id}: {e}")
             # Atualiza status para 'ERRO'
             self.update_ticket_status(ticket_id, 'ERRO')
+            self.ticket_store.release(ticket_id, str(e))
             return False
     
+    def run_ticket_job(self, ticket_data: Dict) -> Dict:
+        """
+        Handler da fila para jobs 'process_ticket'
+        
+        Raises:
+            JobFailed: Para que a fila reprocesse o ticket com backoff
+        """
+        ticket_id = ticket_data['ticket_id']
+        
+        if not self.process_ticket(ticket_data):
+            logger.error(f"💥 Falha ao processar ticket {ticket_id} via webhook")
+            raise JobFailed(f'Falha ao processar ticket {ticket_id}')
+        
+        logger.info(f"🎉 Ticket {ticket_id} processado com sucesso via webhook")
+        return {'ticket_id': ticket_id}
+    
+    def _deduplicated_response(self, ticket_id: int, job_id: int) -> Dict:
+        """Resposta para uma requisição que caiu em um job já existente (com o resultado, se pronto)"""
+        job = self.job_queue.get(job_id) or {}
+        return {
+            'success': True,
+            'message': f'Ticket {ticket_id} já está sendo processado pelo job {job_id}',
+            'ticket_id': ticket_id,
+            'job_id': job_id,
+            'deduplicated': True,
+            'job_status': job.get('status'),
+            'result': job.get('result')
+        }
+    
+    def _dedup_keys(self, ticket_data: Dict) -> Dict[str, float]:
+        keys = {f"ticket:{ticket_data['ticket_id']}": DEDUP_TICKET_WINDOW}
+        if DEDUP_INEP_WINDOW > 0:
+            keys[f"inep:{ticket_data['numero_inep']}"] = DEDUP_INEP_WINDOW
+        return keys
+    
+    def enqueue_tickets(self, ticket_ids: List[int]) -> List[Dict]:
+        """
+        Enfileira um backlog de tickets hidratando todos em lote
+        
+        Args:
+            ticket_ids: IDs dos tickets
+            
+        Returns:
+            Um resultado por ticket, na ordem recebida
+        """
+        results = {}
+        pending = []
+        for ticket_id in dict.fromkeys(ticket_ids):
+            existing_job_id = self.job_queue.find_key(f'ticket:{ticket_id}')
+            if existing_job_id is not None:
+                results[ticket_id] = self._deduplicated_response(ticket_id, existing_job_id)
+            elif self.ticket_store.is_processed(ticket_id):
+                results[ticket_id] = {'success': True, 'ticket_id': ticket_id, 'message': 'Ticket já processado'}
+            else:
+                pending.append(ticket_id)
+        
+        for ticket_id, ticket_data in self.hydrate_tickets(pending).items():
+            if not ticket_data:
+                results[ticket_id] = {
+                    'success': False,
+                    'ticket_id': ticket_id,
+                    'message': f'Dados do ticket {ticket_id} não encontrados ou INEP inválido'
+                }
+                continue
+            
+            job_id, created = self.job_queue.enqueue_unique('process_ticket', ticket_data, self._dedup_keys(ticket_data))
+            results[ticket_id] = self._deduplicated_response(ticket_id, job_id) if not created else {
+                'success': True,
+                'ticket_id': ticket_id,
+                'job_id': job_id
+            }
+        
+        logger.info(f"📦 Backlog de {len(results)} tickets: {len(pending)} hidratados em lote")
+        return [results[ticket_id] for ticket_id in dict.fromkeys(ticket_ids)]
+    
     def handle_webhook(self, payload: Dict) -> Dict:
         """
         Processa webhook recebido
@@ -255,26 +319,27 @@ class EACEWebhookProcessor:
                 ticket_id = record.get('id')
                 
                 if ticket_id:
+                    # Retry do pg_net ou POST duplicado: devolve o job já existente sem consultar o Supabase
+                    existing_job_id = self.job_queue.find_key(f'ticket:{ticket_id}')
+                    if existing_job_id is not None:
+                        return self._deduplicated_response(ticket_id, existing_job_id)
+                    
                     # Busca dados completos do ticket
                     ticket_data = self.get_ticket_data(ticket_id)
                     
                     if ticket_data:
-                        # Processa o ticket em thread separada para não bloquear
-                        def process_async():
-                            success = self.process_ticket(ticket_data)
-                            if success:
-                                logger.info(f"🎉 Ticket {ticket_id} processado com sucesso via webhook")
-                            else:
-                                logger.error(f"💥 Falha ao processar ticket {ticket_id} via webhook")
-                        
-                        thread = threading.Thread(target=process_async)
-                        thread.daemon = True
-                        thread.start()
+                        # Enfileira o ticket (atomicamente deduplicado); os workers processam em ordem
+                        job_id, created = self.job_queue.enqueue_unique(
+                            'process_ticket', ticket_data, self._dedup_keys(ticket_data)
+                        )
+                        if not created:
+                            return self._deduplicated_response(ticket_id, job_id)
                         
                         return {
                             'success': True,
                             'message': f'Ticket {ticket_id} sendo processado',
-                            'ticket_id': ticket_id
+                            'ticket_id': ticket_id,
+                            'job_id': job_id
                         }
                     else:
                         return {
@@ -286,6 +351,16 @@ class EACEWebhookProcessor:
                         'success': False,
                         'message': 'ID do ticket não encontrado no payload'
                     }
+            elif table == 'sites':
+                # Mantém o cache de INEP em dia com as alterações de sites
+                if event_type == 'DELETE':
+                    self.site_cache.invalidate((payload.get('old_record') or {}).get('id'))
+                elif record.get('id') is not None:
+                    self.site_cache.put(record['id'], record.get('nome') or '')
+                return {
+                    'success': True,
+                    'message': f'Cache de sites atualizado ({event_type})'
+                }
             else:
                 return {
                     'success': False,
@@ -311,6 +386,11 @@ if not SUPABASE_URL or not SUPABASE_KEY:
     exit(1)
 
 processor = EACEWebhookProcessor(SUPABASE_URL, SUPABASE_KEY)
+processor.job_queue.start()
+# Artefatos ficam em diretórios com o id do job da fila; jobs falhos são guardados por mais tempo
+get_retention_manager(
+    job_status=lambda job_id: (processor.job_queue.get(int(job_id)) or {}).get('status') if job_id.isdigit() else None
+)
 
 @app.route('/webhook/eace', methods=['POST'])
 def webhook_eace():
@@ -361,13 +441,65 @@ def webhook_test():
             'message': f'Erro interno: {str(e)}'
         }), 500
 
+@app.route('/webhook/batch', methods=['POST'])
+def webhook_batch():
+    """Endpoint para enfileirar um backlog de tickets ({"ticket_ids": [...]})"""
+    try:
+        data = request.json or {}
+        ticket_ids = [int(ticket_id) for ticket_id in data.get('ticket_ids', [])]
+        
+        if not ticket_ids:
+            return jsonify({
+                'success': False,
+                'message': 'ticket_ids é obrigatório'
+            }), 400
+        
+        results = processor.enqueue_tickets(ticket_ids)
+        return jsonify({'success': True, 'results': results}), 200
+        
+    except Exception as e:
+        logger.error(f"❌ Erro no endpoint batch: {e}")
+        return jsonify({
+            'success': False,
+            'message': f'Erro interno: {str(e)}'
+        }), 500
+
+@app.route('/jobs/<int:job_id>', methods=['GET'])
+def job_status(job_id):
+    """Endpoint para consultar o estado de um job da fila"""
+    job = processor.job_queue.get(job_id)
+    
+    if not job:
+        return jsonify({
+            'success': False,
+            'message': f'Job {job_id} não encontrado'
+        }), 404
+    
+    return jsonify({'success': True, 'job': job}), 200
+
+gauge_callback('eace_job_queue_depth', 'Jobs aguardando ou em execução', lambda: {
+    (status,): count for status, count in processor.job_queue.stats().items() if status in ('queued', 'running')
+}, ('status',))
+gauge_callback('eace_job_workers', 'Workers da fila de jobs', lambda: processor.job_queue.workers)
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Métricas no formato do Prometheus (fases, fila, Supabase, resultados)"""
+    return Response(render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
 @app.route('/status', methods=['GET'])
 def status():
     """Endpoint para verificar status do sistema"""
     try:
         return jsonify({
             'status': 'running',
-            'processed_tickets': len(processor.processed_tickets),
+            'processed_tickets': processor.ticket_store.count(),
+            'tickets': processor.ticket_store.stats(),
+            'job_queue': processor.job_queue.stats(),
+            'supabase': processor.db.stats(),
+            'write_behind': processor.writes.stats(),
+            'sites': processor.site_cache.stats(),
+            'retention': get_retention_manager().stats(),
             'timestamp': datetime.now().isoformat()
         }), 200
     except Exception as e:
@@ -385,7 +517,10 @@ if __name__ == "__main__":
     logger.info("📡 Endpoints disponíveis:")
     logger.info("  POST /webhook/eace - Webhook principal")
     logger.info("  POST /webhook/test - Teste manual")
+    logger.info("  POST /webhook/batch - Backlog de tickets")
+    logger.info("  GET /jobs/<id> - Estado de um job")
     logger.info("  GET /status - Status do sistema")
+    logger.info("  GET /metrics - Métricas (Prometheus)")
     
     # Inicia servidor Flask
     app.run(
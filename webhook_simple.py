@@ -3,7 +3,8 @@
 Versão simplificada do webhook para teste
 """
 
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, request, jsonify, send_file, send_from_directory, Response, stream_with_context
+from werkzeug.utils import safe_join
 import os
 import logging
 from datetime import datetime
@@ -13,6 +14,27 @@ import threading
 import subprocess
 import time
 import json
+import asyncio
+import concurrent.futures
+import queue
+from html import escape
+from urllib.parse import urlencode
+
+import eace_flows
+from batch_create_os import resolve_ticket_ineps
+from inep_extraction import inep_from_text, is_valid_inep
+from automation_engine import get_engine, running_engine
+from job_store import FINAL_STATUSES, get_job_store
+from log_stream import current_job_id, get_log_hub
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, gauge_callback, render as render_metrics
+from retention import get_retention_manager
+from nav_cache import get_nav_cache
+from screenshot_index import get_screenshot_index
+from screenshots import MIMETYPES, SCREENSHOTS_DIR, screenshot_stats
+from thumbnails import cache_max_age, get_thumbnail_cache
+from selector_registry import get_selector_registry
+from supabase_client import get_supabase_gateway
+from write_behind import get_write_behind
 
 # Configurar logging
 logging.basicConfig(
@@ -23,6 +45,74 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Deduplicação: janelas (s) em que um ticket/INEP já agendado reaproveita o job existente
+DEDUP_TICKET_WINDOW = float(os.getenv('DEDUP_TICKET_WINDOW', '3600'))
+DEDUP_INEP_WINDOW = float(os.getenv('DEDUP_INEP_WINDOW', '0'))
+
+def schedule_automation_job(record, job, timeout=600, standby=False):
+    """
+    Agenda no motor o fluxo de um job já registrado no JobStore
+    
+    Os logs emitidos pelo fluxo vão para o stream SSE do job e o resultado
+    (ou a exceção) finaliza o registro.
+    """
+    store = get_job_store()
+    hub = get_log_hub()
+    hub.open(record['id'])
+    
+    async def run_job(*args):
+        current_job_id.set(record['id'])
+        store.mark_running(record['id'])
+        try:
+            return await asyncio.wait_for(job(*args), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'Timeout na execução ({timeout}s)')
+    
+    engine = get_engine()
+    future = engine.submit_with_standby(run_job) if standby else engine.submit_with_context(run_job)
+    store.track(record['id'], future)
+    future.add_done_callback(lambda f: hub.close(record['id']))
+    logger.info(f"Job {record['id']} ({record['kind']}) agendado")
+    return future
+
+def submit_automation_job(kind, params, job, timeout=600, standby=False, dedup_keys=None):
+    """
+    Agenda um fluxo no motor de automação e registra o job para consulta em /jobs/<id>
+    
+    Com standby=True o fluxo recebe (context, page) e começa de uma página em
+    hot standby já parada em controle_os quando houver uma pronta.
+    
+    Com dedup_keys ({chave: janela em segundos}) requisições repetidas enquanto
+    um job com a mesma chave está em andamento (ou dentro da janela após o
+    sucesso) recebem esse job, com o resultado se já houver, em vez de um novo.
+    """
+    store = get_job_store()
+    if dedup_keys:
+        record, created = store.create_unique(kind, params, dedup_keys)
+        if not created:
+            return jsonify({
+                'success': True,
+                'deduplicated': True,
+                'job_id': record['id'],
+                'status': record['status'],
+                'result': record['result'],
+                'error': record['error'],
+                'status_url': f"/jobs/{record['id']}",
+                'events_url': f"/jobs/{record['id']}/events"
+            }), 200 if record['status'] in FINAL_STATUSES else 202
+    else:
+        record = store.create(kind, params)
+    
+    schedule_automation_job(record, job, timeout=timeout, standby=standby)
+    
+    return jsonify({
+        'success': True,
+        'job_id': record['id'],
+        'status': record['status'],
+        'status_url': f"/jobs/{record['id']}",
+        'events_url': f"/jobs/{record['id']}/events"
+    }), 202
+
 @app.route('/status', methods=['GET'])
 def status():
     """Health check endpoint"""
@@ -48,33 +138,45 @@ def webhook_test():
 
 @app.route('/webhook/eace', methods=['POST'])
 def webhook_eace():
-    """Simulação do webhook EACE"""
+    """Webhook EACE: extrai o INEP do ticket e cria a OS a partir do standby"""
     data = request.json or {}
     logger.info(f"Webhook EACE recebido: {data}")
     
-    # Simular processamento
-    record = data.get('record', {})
+    # Só INSERT em tickets cria OS; o trigger de sites posta na mesma URL
+    if data.get('table') != 'tickets' or data.get('type') != 'INSERT':
+        return jsonify({
+            'status': 'ignored',
+            'message': f"Evento ignorado: {data.get('type')} em {data.get('table')}",
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    record = data.get('record') or {}
     descricao = record.get('descricao_enviada', '')
     
-    # Extrair INEP (simulação)
-    inep = "31382221"
-    if 'INEP' in descricao:
-        try:
-            import re
-            match = re.search(r'INEP.*?(\d{8})', descricao)
-            if match:
-                inep = match.group(1)
-        except:
-            pass
+    inep = inep_from_text(descricao)
     
-    return jsonify({
-        'status': 'success',
-        'message': 'Webhook EACE processado (simulação)',
-        'extracted_inep': inep,
-        'description': descricao,
-        'timestamp': datetime.now().isoformat(),
-        'note': 'Versão simplificada - sem automação real'
-    })
+    if not inep:
+        return jsonify({
+            'status': 'ignored',
+            'message': 'INEP não encontrado na descrição',
+            'description': descricao,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    # Reenvios do mesmo ticket (e do mesmo INEP, se configurado) caem no job já existente
+    dedup_keys = {f"inep:{inep}": DEDUP_INEP_WINDOW} if DEDUP_INEP_WINDOW > 0 else {}
+    if record.get('id') is not None:
+        dedup_keys[f"ticket:{record['id']}"] = DEDUP_TICKET_WINDOW
+    
+    # Começa direto em "Adicionar nova OS" quando há um contexto em standby pronto
+    return submit_automation_job(
+        'create_os_with_inep',
+        {'inep': inep, 'ticket_id': record.get('id'), 'source': 'webhook_eace'},
+        lambda context, page: eace_flows.create_os_with_inep(context, inep, page=page),
+        timeout=600,
+        standby=True,
+        dedup_keys=dedup_keys
+    )
 
 @app.route('/', methods=['GET'])
 def home():
@@ -107,15 +209,11 @@ def home():
                 'screenshots_gallery': '/screenshots/gallery',
                 'run_test': '/run-test',
                 'inspect_page': '/inspect-page',
-                'test_menu_navigation': '/test-menu-navigation',
-                'test_bubble_structure': '/test-bubble-structure',
-                'test_direct_click': '/test-direct-click',
-                'test_smart_menu': '/test-smart-menu',
                 'test_expandable_menu': '/test-expandable-menu',
-                'test_os_page_mapping': '/test-os-page-mapping',
-                'map_adicionar_os_button': '/map-adicionar-os-button',
                 'map_os_button_fixed': '/map-os-button-fixed',
-                'debug_step_by_step': '/debug-step-by-step'
+                'create_os_batch': '/execute-create-os-batch',
+                'jobs': '/jobs',
+                'pool_status': '/pool/status'
             },
             'note': 'Acesse /endpoints.html para interface visual ou /debug para diagnóstico'
         })
@@ -162,50 +260,61 @@ def api_info():
             'screenshots_gallery': '/screenshots/gallery',
             'run_test': '/run-test',
             'inspect_page': '/inspect-page',
-            'test_menu_navigation': '/test-menu-navigation',
-            'test_bubble_structure': '/test-bubble-structure',
-            'test_direct_click': '/test-direct-click',
-            'test_smart_menu': '/test-smart-menu',
             'test_expandable_menu': '/test-expandable-menu',
-            'test_os_page_mapping': '/test-os-page-mapping',
-            'map_adicionar_os_button': '/map-adicionar-os-button',
             'map_os_button_fixed': '/map-os-button-fixed',
-            'debug_step_by_step': '/debug-step-by-step'
+            'create_os_batch': '/execute-create-os-batch',
+            'jobs': '/jobs',
+            'pool_status': '/pool/status'
         },
         'note': 'Versão simplificada para teste'
     })
 
+SCREENSHOTS_PAGE_SIZE = 50
+
+def _screenshot_page():
+    """Página do índice de screenshots a partir de ?limit=, ?before= e ?job="""
+    index = get_screenshot_index()
+    index.sync()
+    return index.page(
+        limit=request.args.get('limit', SCREENSHOTS_PAGE_SIZE, type=int),
+        before=_parse_cursor(request.args.get('before')),
+        job_id=request.args.get('job')
+    )
+
+def _parse_cursor(value):
+    """Cursor "<created_at>:<path>" do parâmetro ?before= (None se ausente ou inválido)"""
+    created_at, separator, path = (value or '').partition(':')
+    try:
+        return (float(created_at), path) if separator else None
+    except ValueError:
+        return None
+
+def _page_url(path, cursor):
+    """URL da próxima página mantendo os demais parâmetros"""
+    args = request.args.to_dict()
+    args['before'] = f"{cursor[0]!r}:{cursor[1]}"
+    return path + '?' + urlencode(args)
+
 @app.route('/screenshots', methods=['GET'])
 def list_screenshots():
-    """Lista todos os screenshots disponíveis"""
+    """Lista os screenshots do índice, paginados (mais recentes primeiro)"""
     try:
-        screenshots_dir = "/tmp/screenshots"
-        if not os.path.exists(screenshots_dir):
-            return jsonify({
-                'status': 'error',
-                'message': 'Diretório de screenshots não encontrado',
-                'screenshots': []
-            })
-        
-        # Listar arquivos PNG
-        files = glob.glob(os.path.join(screenshots_dir, "*.png"))
-        screenshots = []
-        
-        for file_path in sorted(files, key=os.path.getctime, reverse=True):
-            filename = os.path.basename(file_path)
-            file_stats = os.stat(file_path)
-            
-            screenshots.append({
-                'filename': filename,
-                'size': file_stats.st_size,
-                'created': datetime.fromtimestamp(file_stats.st_ctime).isoformat(),
-                'download_url': f'/screenshot/{filename}'
-            })
+        page = _screenshot_page()
+        screenshots = [{
+            'filename': item['path'],
+            'job_id': item['job_id'],
+            'step': item['step'],
+            'size': item['size'],
+            'created': datetime.fromtimestamp(item['created_at']).isoformat(),
+            'download_url': f"/screenshot/{item['path']}",
+            'thumbnail_url': f"/thumbnail/{item['path']}"
+        } for item in page['items']]
         
         return jsonify({
             'status': 'success',
-            'total_screenshots': len(screenshots),
-            'screenshots': screenshots
+            'total_screenshots': get_screenshot_index().count(),
+            'screenshots': screenshots,
+            'next_page': _page_url('/screenshots', page['next_before']) if page['next_before'] else None
         })
         
     except Exception as e:
@@ -215,20 +324,22 @@ def list_screenshots():
             'message': str(e)
         }), 500
 
-@app.route('/screenshot/<filename>', methods=['GET'])
+@app.route('/screenshot/<path:filename>', methods=['GET'])
 def get_screenshot(filename):
-    """Retorna um screenshot específico"""
+    """Retorna um screenshot específico (nome ou "<job_id>/<arquivo>")"""
     try:
-        screenshots_dir = "/tmp/screenshots"
-        file_path = os.path.join(screenshots_dir, filename)
+        file_path = safe_join(SCREENSHOTS_DIR, filename)
         
-        if not os.path.exists(file_path):
+        if not file_path or not os.path.isfile(file_path):
             return jsonify({
                 'status': 'error',
                 'message': 'Screenshot não encontrado'
             }), 404
         
-        return send_file(file_path, mimetype='image/png')
+        mimetype = MIMETYPES.get(os.path.splitext(file_path)[1].lower(), 'application/octet-stream')
+        return send_file(file_path, mimetype=mimetype,
+                         etag=get_thumbnail_cache().content_hash(file_path),
+                         max_age=cache_max_age(filename))
         
     except Exception as e:
         logger.error(f"Erro ao servir screenshot: {e}")
@@ -237,27 +348,50 @@ def get_screenshot(filename):
             'message': str(e)
         }), 500
 
-@app.route('/screenshots/latest', methods=['GET'])
-def get_latest_screenshot():
-    """Retorna o screenshot mais recente"""
+@app.route('/thumbnail/<path:filename>', methods=['GET'])
+def get_screenshot_thumbnail(filename):
+    """Retorna a miniatura de um screenshot (?w= largura aproximada)"""
     try:
-        screenshots_dir = "/tmp/screenshots"
-        if not os.path.exists(screenshots_dir):
-            return jsonify({
-                'status': 'error',
-                'message': 'Diretório de screenshots não encontrado'
-            }), 404
+        file_path = safe_join(SCREENSHOTS_DIR, filename)
         
-        # Encontrar o arquivo mais recente
-        files = glob.glob(os.path.join(screenshots_dir, "*.png"))
-        if not files:
+        if not file_path or not os.path.isfile(file_path):
             return jsonify({
                 'status': 'error',
-                'message': 'Nenhum screenshot encontrado'
+                'message': 'Screenshot não encontrado'
             }), 404
         
-        latest_file = max(files, key=os.path.getctime)
-        return send_file(latest_file, mimetype='image/png')
+        thumbnails = get_thumbnail_cache()
+        thumb_path, mimetype, etag = thumbnails.thumbnail(file_path, thumbnails.width(request.args.get('w', type=int)))
+        mimetype = mimetype or MIMETYPES.get(os.path.splitext(file_path)[1].lower(), 'application/octet-stream')
+        return send_file(thumb_path, mimetype=mimetype, etag=etag, max_age=cache_max_age(filename))
+        
+    except Exception as e:
+        logger.error(f"Erro ao gerar miniatura: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/screenshots/latest', methods=['GET'])
+def get_latest_screenshot():
+    """Retorna o screenshot mais recente"""
+    try:
+        index = get_screenshot_index()
+        index.sync()
+        
+        latest = index.latest()
+        while latest is not None:
+            file_path = os.path.join(SCREENSHOTS_DIR, latest['path'])
+            if os.path.isfile(file_path):
+                return send_file(file_path, mimetype=MIMETYPES.get(os.path.splitext(file_path)[1].lower()))
+            # Arquivo removido fora do índice
+            index.remove([latest['path']])
+            latest = index.latest()
+        
+        return jsonify({
+            'status': 'error',
+            'message': 'Nenhum screenshot encontrado'
+        }), 404
         
     except Exception as e:
         logger.error(f"Erro ao obter último screenshot: {e}")
@@ -268,56 +402,52 @@ def get_latest_screenshot():
 
 @app.route('/screenshots/gallery', methods=['GET'])
 def screenshots_gallery():
-    """Retorna uma galeria HTML dos screenshots"""
+    """Retorna uma galeria HTML paginada dos screenshots"""
     try:
-        screenshots_dir = "/tmp/screenshots"
-        if not os.path.exists(screenshots_dir):
+        page = _screenshot_page()
+        if not page['items']:
             return "<h1>Nenhum screenshot encontrado</h1>"
         
-        files = glob.glob(os.path.join(screenshots_dir, "*.png"))
-        if not files:
-            return "<h1>Nenhum screenshot encontrado</h1>"
-        
-        files.sort(key=os.path.getctime, reverse=True)
-        
-        html = """
+        parts = ["""
         <html>
         <head>
             <title>Screenshots EACE Automation</title>
             <style>
                 body { font-family: Arial, sans-serif; margin: 20px; }
-                .screenshot { margin: 20px 0; border: 1px solid #ccc; padding: 10px; }
-                .screenshot img { max-width: 800px; height: auto; }
+                .screenshot { display: inline-block; vertical-align: top; width: 340px; margin: 10px; border: 1px solid #ccc; padding: 10px; }
+                .screenshot img { max-width: 100%; height: auto; }
                 .info { background: #f5f5f5; padding: 10px; margin: 10px 0; }
             </style>
         </head>
         <body>
             <h1>Screenshots da Automação EACE</h1>
             <p>Última atualização: """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """</p>
-        """
+        """]
         
-        for file_path in files:
-            filename = os.path.basename(file_path)
-            file_stats = os.stat(file_path)
-            created_time = datetime.fromtimestamp(file_stats.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
+        for item in page['items']:
+            filename = escape(item['path'])
+            created_time = datetime.fromtimestamp(item['created_at']).strftime("%Y-%m-%d %H:%M:%S")
             
-            html += """
+            parts.append("""
             <div class="screenshot">
                 <div class="info">
                     <strong>Arquivo:</strong> """ + filename + """<br>
                     <strong>Criado:</strong> """ + created_time + """<br>
-                    <strong>Tamanho:</strong> """ + str(file_stats.st_size) + """ bytes
+                    <strong>Tamanho:</strong> """ + str(item['size']) + """ bytes
                 </div>
-                <img src="/screenshot/""" + filename + """" alt=\"""" + filename + """\">
+                <a href="/screenshot/""" + filename + """" target="_blank"><img src="/thumbnail/""" + filename + """" alt=\"""" + filename + """\" loading="lazy"></a>
             </div>
-            """
+            """)
+        
+        if page['next_before']:
+            parts.append('<p><a href="' + escape(_page_url('/screenshots/gallery', page['next_before'])) + '">Próxima página »</a></p>')
         
-        html += """
+        parts.append("""
         </body>
         </html>
-        """
+        """)
         
-        return html
+        return ''.join(parts)
         
     except Exception as e:
         logger.error(f"Erro ao gerar galeria: {e}")
@@ -325,254 +455,14 @@ def screenshots_gallery():
 
 @app.route('/run-test', methods=['POST', 'GET'])
 def run_automation_test():
-    """Executa o teste de automação"""
-    try:
-        import subprocess
-        import threading
-        
-        def run_test():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Iniciar Xvfb se necessário
-                try:
-                    subprocess.run(['Xvfb', ':99', '-screen', '0', '1024x768x24'], 
-                                 env=env, timeout=5, capture_output=True)
-                except:
-                    pass  # Pode já estar rodando
-                
-                # Código Python inline para teste básico
-                test_code = '''
-import asyncio
-import os
-from datetime import datetime
-from playwright.async_api import async_playwright
-
-async def test_login():
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
+    """Executa o teste de automação (login e navegação até a página de OS)"""
     try:
-        # Ir para página de login
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        # Screenshot inicial
-        await page.screenshot(path=f"{screenshots_dir}/01_login_page.png")
-        
-        # Preencher credenciais
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.screenshot(path=f"{screenshots_dir}/02_credentials_filled.png")
-        
-        # Fazer login
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        await page.screenshot(path=f"{screenshots_dir}/03_after_login.png")
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-            await page.screenshot(path=f"{screenshots_dir}/04_profile_selected.png")
-        
-        # Screenshot final do dashboard
-        await page.screenshot(path=f"{screenshots_dir}/05_dashboard.png")
-        
-        # Aguardar um pouco para garantir que a página carregou
-        await page.wait_for_timeout(3000)
-        
-        # Procurar pelo menu hamburguer ou menu lateral
-        print("🔍 Procurando menu lateral...")
-        
-        # Tentar diferentes seletores para o menu
-        menu_selectors = [
-            "button[aria-label*='menu']",
-            "button[class*='menu']",
-            "button[class*='hamburger']",
-            ".menu-toggle",
-            ".hamburger",
-            "[data-testid*='menu']",
-            "svg[class*='menu']",
-            "div[class*='menu-button']",
-            "//button[contains(@class, 'menu')]",
-            "//div[contains(@class, 'menu')]//button",
-            "//button[@aria-label='menu']"
-        ]
-        
-        menu_found = False
-        for selector in menu_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"✅ Menu encontrado com seletor: {selector}")
-                    if selector.startswith("//"):
-                        await page.locator(selector).first.click()
-                    else:
-                        await page.locator(selector).first.click()
-                    menu_found = True
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/06_menu_opened.png")
-                    break
-            except Exception as e:
-                continue
-        
-        # Se não encontrou o menu, tentar procurar por texto "OS" ou "Menu"
-        if not menu_found:
-            print("🔍 Procurando por links de OS ou Menu...")
-            os_selectors = [
-                "//a[contains(text(), 'OS')]",
-                "//button[contains(text(), 'OS')]",
-                "//div[contains(text(), 'OS')]",
-                "//a[contains(text(), 'Menu')]",
-                "//button[contains(text(), 'Menu')]",
-                "//div[contains(text(), 'Menu')]",
-                "//a[contains(@href, 'os')]",
-                "//a[contains(@href, 'ordem')]",
-                "//a[contains(@href, 'servico')]",
-                "[href*='os']",
-                "[href*='ordem']",
-                "[href*='servico']"
-            ]
-            
-            for selector in os_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = await page.locator(selector).count()
-                    else:
-                        elements = await page.locator(selector).count()
-                    
-                    if elements > 0:
-                        print(f"✅ Link OS encontrado com seletor: {selector}")
-                        if selector.startswith("//"):
-                            await page.locator(selector).first.click()
-                        else:
-                            await page.locator(selector).first.click()
-                        await page.wait_for_timeout(5000)
-                        await page.screenshot(path=f"{screenshots_dir}/07_os_page.png")
-                        menu_found = True
-                        break
-                except Exception as e:
-                    continue
-        
-        # Se ainda não encontrou, vamos explorar a estrutura da página
-        if not menu_found:
-            print("🔍 Explorando estrutura da página...")
-            await page.screenshot(path=f"{screenshots_dir}/06_page_structure.png")
-            
-            # Tentar encontrar todos os elementos clicáveis
-            try:
-                # Procurar por elementos com ícones ou que podem ser menu
-                clickable_elements = await page.evaluate("""
-                    () => {
-                        const elements = [];
-                        const selectors = ['button', 'a', '[role="button"]', 'div[onclick]', '.menu', '.nav'];
-                        
-                        selectors.forEach(selector => {
-                            document.querySelectorAll(selector).forEach(el => {
-                                const text = el.textContent?.trim() || '';
-                                const classes = el.className || '';
-                                const href = el.href || '';
-                                
-                                if (text.toLowerCase().includes('menu') || 
-                                    text.toLowerCase().includes('os') ||
-                                    classes.toLowerCase().includes('menu') ||
-                                    classes.toLowerCase().includes('hamburger') ||
-                                    href.toLowerCase().includes('os')) {
-                                    elements.push({
-                                        text: text,
-                                        classes: classes,
-                                        href: href,
-                                        tagName: el.tagName
-                                    });
-                                }
-                            });
-                        });
-                        
-                        return elements;
-                    }
-                """)
-                
-                print(f"📋 Elementos encontrados: {clickable_elements}")
-                
-                # Tentar clicar no primeiro elemento que pareça ser um menu
-                if clickable_elements:
-                    first_element = clickable_elements[0]
-                    print(f"🔗 Tentando clicar no primeiro elemento: {first_element}")
-                    
-                    # Tentar diferentes maneiras de clicar
-                    try:
-                        await page.click(f"text='{first_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/07_clicked_element.png")
-                    except:
-                        pass
-                        
-            except Exception as e:
-                print(f"❌ Erro ao explorar página: {e}")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/08_final_exploration.png")
-        
-        print(f"✅ Exploration completed - URL: {page.url}")
-        print(f"📸 Screenshots salvos em: {screenshots_dir}")
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/error.png")
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    asyncio.run(test_login())
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste: {e}")
-        
-        # Executar em thread separada para não bloquear
-        thread = threading.Thread(target=run_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste de automação iniciado',
-            'note': 'Aguarde alguns minutos e verifique os screenshots',
-            'endpoints': {
-                'gallery': '/screenshots/gallery',
-                'screenshots': '/screenshots',
-                'latest': '/screenshots/latest'
-            }
-        })
+        return submit_automation_job(
+            'run_test',
+            {},
+            eace_flows.navigation_test,
+            timeout=300
+        )
         
     except Exception as e:
         logger.error(f"Erro ao iniciar teste: {e}")
@@ -583,181 +473,14 @@ if __name__ == "__main__":
 
 @app.route('/inspect-page', methods=['POST', 'GET'])
 def inspect_page():
-    """Inspeciona a página atual do dashboard para encontrar elementos de menu"""
-    try:
-        import subprocess
-        import threading
-        
-        def run_inspection():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Código Python para inspeção detalhada
-                inspection_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-
-async def inspect_dashboard():
-    screenshots_dir = "/tmp/screenshots"
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
+    """Inspeciona o dashboard e mapeia os elementos de menu visíveis"""
     try:
-        # Fazer login primeiro
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Agora inspecionar a página
-        print("🔍 Inspecionando dashboard...")
-        
-        # Obter informações da página
-        page_info = await page.evaluate("""
-            () => {
-                const info = {
-                    url: window.location.href,
-                    title: document.title,
-                    body_classes: document.body.className,
-                    all_buttons: [],
-                    all_links: [],
-                    menu_elements: [],
-                    navigation_elements: []
-                };
-                
-                // Todos os botões
-                document.querySelectorAll('button').forEach((btn, index) => {
-                    info.all_buttons.push({
-                        index: index,
-                        text: btn.textContent?.trim() || '',
-                        classes: btn.className || '',
-                        id: btn.id || '',
-                        visible: btn.offsetParent !== null
-                    });
-                });
-                
-                // Todos os links
-                document.querySelectorAll('a').forEach((link, index) => {
-                    info.all_links.push({
-                        index: index,
-                        text: link.textContent?.trim() || '',
-                        href: link.href || '',
-                        classes: link.className || '',
-                        id: link.id || ''
-                    });
-                });
-                
-                // Elementos que podem ser menu
-                const menuSelectors = [
-                    'nav', '[role="navigation"]', '.menu', '.nav', 
-                    '[class*="menu"]', '[class*="nav"]', '[class*="sidebar"]',
-                    'button[aria-label*="menu"]', 'button[class*="menu"]'
-                ];
-                
-                menuSelectors.forEach(selector => {
-                    document.querySelectorAll(selector).forEach(el => {
-                        info.menu_elements.push({
-                            selector: selector,
-                            text: el.textContent?.trim() || '',
-                            classes: el.className || '',
-                            id: el.id || '',
-                            tagName: el.tagName
-                        });
-                    });
-                });
-                
-                // Elementos de navegação específicos
-                const navTexts = ['dashboard', 'menu', 'os', 'ordem', 'serviço'];
-                navTexts.forEach(text => {
-                    const elements = document.querySelectorAll(`*`);
-                    elements.forEach(el => {
-                        const content = el.textContent?.toLowerCase() || '';
-                        if (content.includes(text) && content.length < 50) {
-                            info.navigation_elements.push({
-                                search_term: text,
-                                text: el.textContent?.trim() || '',
-                                tagName: el.tagName,
-                                classes: el.className || '',
-                                id: el.id || ''
-                            });
-                        }
-                    });
-                });
-                
-                return info;
-            }
-        """)
-        
-        # Salvar informações em arquivo
-        with open(f"{screenshots_dir}/page_inspection.json", "w") as f:
-            json.dump(page_info, f, indent=2)
-        
-        # Screenshot da página atual
-        await page.screenshot(path=f"{screenshots_dir}/inspection_screenshot.png")
-        
-        print("✅ Inspeção concluída")
-        print(f"📊 Encontrados: {len(page_info['all_buttons'])} botões, {len(page_info['all_links'])} links")
-        print(f"🔍 Elementos de menu: {len(page_info['menu_elements'])}")
-        print(f"🧭 Elementos de navegação: {len(page_info['navigation_elements'])}")
-        
-        return page_info
-        
-    except Exception as e:
-        print(f"❌ Erro na inspeção: {e}")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(inspect_dashboard())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', inspection_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Inspeção executada - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar inspeção: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_inspection)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Inspeção da página iniciada',
-            'note': 'Aguarde alguns minutos e verifique o arquivo page_inspection.json nos screenshots',
-            'info': 'Este endpoint analisa todos os elementos da página para encontrar menus e navegação'
-        })
+        return submit_automation_job(
+            'inspect_page',
+            {},
+            lambda context: eace_flows.map_page_elements(context, destination='dashboard'),
+            timeout=300
+        )
         
     except Exception as e:
         logger.error(f"Erro ao iniciar inspeção: {e}")
@@ -766,4770 +489,453 @@ if __name__ == "__main__":
             'message': f'Erro ao iniciar inspeção: {e}'
         }), 500
 
-@app.route('/test-menu-navigation', methods=['POST', 'GET'])
-def test_menu_navigation():
-    """Testa navegação específica para o segundo item do menu lateral"""
-    try:
-        import subprocess
-        import threading
-        
-        def run_menu_test():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Código Python para teste específico do menu
-                menu_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-
-async def test_menu_navigation():
-    screenshots_dir = "/tmp/screenshots"
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
+@app.route('/test-expandable-menu', methods=['GET', 'POST'])
+def test_expandable_menu():
+    """Teste da navegação pelo menu expansível: expandir o menu e clicar em Gerenciar chamados"""
     try:
-        # Fazer login primeiro
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Screenshot do dashboard
-        await page.screenshot(path=f"{screenshots_dir}/menu_01_dashboard.png")
-        print("✅ Login realizado, agora procurando menu lateral...")
-        
-        # Estratégia 1: Procurar especificamente pelo segundo ícone do menu lateral
-        print("🔍 Estratégia 1: Procurando segundo ícone do menu lateral...")
-        sidebar_found = False
-        
-        # Seletores específicos baseados na imagem do sistema
-        sidebar_selectors = [
-            "aside a:nth-child(2)",
-            "nav a:nth-child(2)", 
-            ".sidebar a:nth-child(2)",
-            "div[class*='sidebar'] a:nth-child(2)",
-            "div[class*='menu'] a:nth-child(2)",
-            "ul li:nth-child(2) a",
-            "ul li:nth-child(2)",
-            "nav ul li:nth-child(2)",
-            "aside ul li:nth-child(2)"
-        ]
-        
-        for selector in sidebar_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    print(f"📍 Sidebar encontrada: {selector}")
-                    
-                    # Capturar screenshot da sidebar
-                    await page.screenshot(path=f"{screenshots_dir}/menu_02_sidebar_found.png")
-                    
-                    # Procurar pelo segundo item dentro da sidebar
-                    sidebar_items = await page.locator(f"{selector} a, {selector} button, {selector} div[onclick], {selector} li").count()
-                    print(f"📋 Itens encontrados na sidebar: {sidebar_items}")
-                    
-                    if sidebar_items >= 2:
-                        print("🎯 Tentando clicar no segundo item...")
-                        try:
-                            # Tentar clicar no segundo item (índice 1)
-                            await page.locator(f"{selector} a, {selector} button, {selector} div[onclick], {selector} li").nth(1).click()
-                            await page.wait_for_timeout(3000)
-                            await page.screenshot(path=f"{screenshots_dir}/menu_03_second_item_clicked.png")
-                            sidebar_found = True
-                            break
-                        except Exception as e:
-                            print(f"❌ Erro ao clicar no segundo item: {e}")
-                            continue
-                    
-            except Exception as e:
-                continue
-        
-        # Estratégia 2: Se não encontrou, procurar por texto específico "OS" ou "operação"
-        if not sidebar_found:
-            print("🔍 Estratégia 2: Procurando por texto 'OS' ou 'operação'...")
-            
-            # Procurar por elementos que contenham texto relacionado a OS
-            menu_patterns = [
-                "//a[contains(text(), 'OS')]",
-                "//a[contains(text(), 'operação')]",
-                "//a[contains(text(), 'Controle')]",
-                "//button[contains(text(), 'OS')]",
-                "//div[contains(text(), 'OS')]",
-                "//li[contains(text(), 'OS')]",
-                "//*[@title='OS']",
-                "//*[@aria-label='OS']",
-                "//a[contains(@href, 'os')]",
-                "//a[contains(@href, 'operacao')]"
-            ]
-            
-            for pattern in menu_patterns:
-                try:
-                    elements = await page.locator(pattern).count()
-                    if elements > 0:
-                        print(f"📍 Menu pattern encontrado: {pattern}")
-                        await page.locator(pattern).click()
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/menu_03_pattern_clicked.png")
-                        sidebar_found = True
-                        break
-                except Exception as e:
-                    continue
-        
-        # Estratégia 3: Procurar no menu lateral esquerdo (posição específica)
-        if not sidebar_found:
-            print("🔍 Estratégia 3: Análise de posição no menu lateral...")
-            
-            # Obter elementos especificamente do menu lateral esquerdo
-            elements_info = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const clickable = ['a', 'button', 'div[onclick]', 'li', '[role="button"]'];
-                    
-                    clickable.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            const classes = el.className || '';
-                            
-                            // Filtrar elementos do menu lateral esquerdo (baseado na imagem)
-                            if (rect.left < 100 && rect.width > 15 && rect.height > 15 && rect.top > 50) {
-                                elements.push({
-                                    selector: selector,
-                                    index: index,
-                                    text: text,
-                                    left: rect.left,
-                                    top: rect.top,
-                                    width: rect.width,
-                                    height: rect.height,
-                                    classes: classes,
-                                    href: el.href || ''
-                                });
-                            }
-                        });
-                    });
-                    
-                    // Ordenar por posição vertical (top) - o segundo item será o índice 1
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Elementos no lado esquerdo: {len(elements_info)}")
-            
-            # Tentar clicar no segundo elemento (se existir)
-            if len(elements_info) >= 2:
-                second_element = elements_info[1]
-                print(f"🎯 Tentando clicar no segundo elemento: {second_element}")
-                
-                try:
-                    # Várias tentativas de clicar no segundo elemento
-                    click_attempts = [
-                        f"{second_element['selector']}:nth-child({second_element['index'] + 1})",
-                        f"{second_element['selector']}:nth-of-type(2)",
-                        f"({second_element['selector']})[2]"
-                    ]
-                    
-                    for attempt in click_attempts:
-                        try:
-                            await page.click(attempt)
-                            await page.wait_for_timeout(3000)
-                            await page.screenshot(path=f"{screenshots_dir}/menu_03_position_clicked.png")
-                            
-                            # Verificar se navegou para página de OS
-                            current_url = page.url
-                            if 'os' in current_url.lower() or 'operacao' in current_url.lower():
-                                print(f"✅ Sucesso! Navegou para: {current_url}")
-                                sidebar_found = True
-                                break
-                        except:
-                            continue
-                    
-                    if not sidebar_found:
-                        print("❌ Não conseguiu clicar no segundo elemento")
-                        
-                except Exception as e:
-                    print(f"❌ Erro ao clicar por posição: {e}")
-            
-            # Tentar também o primeiro, terceiro e quarto elementos
-            if not sidebar_found and len(elements_info) >= 4:
-                print("🔍 Tentando outros elementos do menu...")
-                for i in [0, 2, 3]:  # primeiro, terceiro, quarto
-                    try:
-                        element = elements_info[i]
-                        print(f"🎯 Tentando elemento {i+1}: {element['text']}")
-                        
-                        await page.click(f"{element['selector']}:nth-child({element['index'] + 1})")
-                        await page.wait_for_timeout(3000)
-                        
-                        current_url = page.url
-                        if 'os' in current_url.lower() or 'operacao' in current_url.lower():
-                            print(f"✅ Sucesso com elemento {i+1}!")
-                            sidebar_found = True
-                            break
-                    except:
-                        continue
-        
-        # Estratégia 4: Procurar especificamente por ícones ou imagens
-        if not sidebar_found:
-            print("🔍 Estratégia 4: Procurando por ícones...")
-            
-            # Procurar por SVGs, ícones, ou elementos que podem ser menu
-            icon_selectors = [
-                "svg:nth-child(2)",
-                "i:nth-child(2)",
-                ".icon:nth-child(2)",
-                "[class*='icon']:nth-child(2)",
-                "//svg[2]",
-                "//i[2]",
-                "//*[contains(@class, 'icon')][2]"
-            ]
-            
-            for selector in icon_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = await page.locator(selector).count()
-                    else:
-                        elements = await page.locator(selector).count()
-                    
-                    if elements > 0:
-                        print(f"📍 Ícone encontrado: {selector}")
-                        if selector.startswith("//"):
-                            await page.locator(selector).click()
-                        else:
-                            await page.locator(selector).click()
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/menu_03_icon_clicked.png")
-                        sidebar_found = True
-                        break
-                except Exception as e:
-                    continue
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/menu_04_final_result.png")
-        
-        # Verificar se conseguiu navegar
-        final_url = page.url
-        print(f"📍 URL final: {final_url}")
-        
-        if sidebar_found:
-            print("✅ Navegação bem-sucedida!")
-        else:
-            print("❌ Não conseguiu encontrar o segundo item do menu")
-        
-        return {
-            "success": sidebar_found,
-            "final_url": final_url,
-            "elements_found": len(elements_info) if 'elements_info' in locals() else 0
-        }
+        return submit_automation_job(
+            'test_expandable_menu',
+            {},
+            eace_flows.menu_navigation_test,
+            timeout=300
+        )
         
     except Exception as e:
-        print(f"❌ Erro no teste: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/menu_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_menu_navigation())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', menu_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste de menu executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste de menu: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_menu_test)
-        thread.daemon = True
-        thread.start()
-        
+        logger.error(f"Erro ao iniciar teste do menu: {e}")
         return jsonify({
-            'status': 'success',
-            'message': 'Teste de navegação do menu iniciado',
-            'note': 'Aguarde alguns minutos. O teste tentará 4 estratégias diferentes para encontrar o segundo item do menu',
-            'strategies': [
-                '1. Procurar por sidebar/menu lateral',
-                '2. Usar padrões XPath para segundo item',
-                '3. Análise de posição dos elementos',
-                '4. Procurar por ícones especificamente'
-            ]
-        })
+            'status': 'error',
+            'message': f'Erro ao iniciar teste do menu: {e}'
+        }), 500
+
+@app.route('/test-simple', methods=['GET'])
+def test_simple():
+    """Endpoint simples para teste"""
+    return jsonify({
+        'message': 'Endpoint funcionando!',
+        'timestamp': datetime.now().isoformat(),
+        'status': 'OK'
+    })
+
+@app.route('/map-os-button-fixed', methods=['GET', 'POST'])
+def map_os_button_fixed():
+    """Mapeia os elementos da página de OS, incluindo o botão Adicionar nova OS"""
+    try:
+        return submit_automation_job(
+            'map_os_button',
+            {},
+            lambda context: eace_flows.map_page_elements(context, destination='controle_os'),
+            timeout=300
+        )
         
     except Exception as e:
-        logger.error(f"Erro ao iniciar teste de menu: {e}")
+        logger.error(f"Erro ao iniciar mapeamento: {e}")
         return jsonify({
             'status': 'error',
-            'message': f'Erro ao iniciar teste de menu: {e}'
+            'message': f'Erro ao iniciar mapeamento: {e}'
         }), 500
 
-@app.route('/test-bubble-structure', methods=['POST', 'GET'])
-def test_bubble_structure():
-    """Testa navegação específica para estrutura do Bubble.io"""
+@app.route('/analyze-dashboard-elements', methods=['GET', 'POST'])
+def analyze_dashboard_elements():
+    """Analisa os elementos do dashboard para encontrar o botão do menu"""
     try:
-        import subprocess
-        import threading
+        return submit_automation_job(
+            'analyze_dashboard',
+            {},
+            lambda context: eace_flows.map_page_elements(context, destination='dashboard'),
+            timeout=300
+        )
         
-        def run_bubble_test():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Código Python para teste específico do Bubble.io
-                bubble_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
+    except Exception as e:
+        logger.error(f"Erro ao iniciar análise: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro ao iniciar análise: {e}'
+        }), 500
 
-async def test_bubble_navigation():
-    screenshots_dir = "/tmp/screenshots"
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
+@app.route('/realtime-analysis', methods=['GET', 'POST'])
+def realtime_analysis():
+    """Endpoint com visualização em tempo real - logs e imagens"""
     try:
-        # Fazer login primeiro
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Screenshot do dashboard
-        await page.screenshot(path=f"{screenshots_dir}/bubble_01_dashboard.png")
-        print("✅ Login realizado, procurando estrutura do Bubble.io...")
-        
-        # Estratégia 1: Procurar por "Gerenciar chamados" (baseado no inspect element)
-        print("🔍 Estratégia 1: Procurando por 'Gerenciar chamados'...")
-        
-        gerenciar_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'Gerenciar')]",
-            "//button[contains(text(), 'chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "button[aria-label*='Gerenciar']",
-            "button[title*='Gerenciar']"
-        ]
-        
-        button_found = False
-        for selector in gerenciar_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"✅ Encontrado 'Gerenciar chamados': {selector}")
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/bubble_02_gerenciar_clicked.png")
-                    button_found = True
-                    break
-            except Exception as e:
-                print(f"❌ Erro com {selector}: {e}")
-                continue
-        
-        # Estratégia 2: Procurar por estrutura específica do Bubble.io
-        if not button_found:
-            print("🔍 Estratégia 2: Procurando estrutura específica do Bubble.io...")
-            
-            # Baseado na imagem: generic > button > SvgRoot
-            bubble_selectors = [
-                "div[class*='generic'] button",
-                "div[data-element-type] button",
-                "div[id*='generic'] button",
-                "button[focusable='true']",
-                "button[focusable]",
-                "button:has(svg)",
-                "button svg",
-                "div[class*='bubble'] button"
-            ]
-            
-            for selector in bubble_selectors:
-                try:
-                    elements = await page.locator(selector).count()
-                    if elements > 0:
-                        print(f"📍 Encontrado elementos Bubble: {elements} com {selector}")
-                        
-                        # Tentar clicar no segundo elemento (índice 1)
-                        if elements >= 2:
-                            await page.locator(selector).nth(1).click()
-                            await page.wait_for_timeout(3000)
-                            await page.screenshot(path=f"{screenshots_dir}/bubble_02_structure_clicked.png")
-                            
-                            # Verificar se navegou
-                            current_url = page.url
-                            if 'os' in current_url.lower() or 'chamados' in current_url.lower():
-                                print(f"✅ Sucesso com estrutura! URL: {current_url}")
-                                button_found = True
-                                break
-                        
-                except Exception as e:
-                    continue
-        
-        # Estratégia 3: Procurar por posição no menu lateral (focusable=true)
-        if not button_found:
-            print("🔍 Estratégia 3: Procurando por elementos focusable no menu lateral...")
-            
-            # Obter elementos focusable do lado esquerdo
-            focusable_info = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const focusableElements = document.querySelectorAll('button[focusable="true"], button[focusable], [focusable="true"]');
-                    
-                    focusableElements.forEach((el, index) => {
-                        const rect = el.getBoundingClientRect();
-                        const text = el.textContent?.trim() || '';
-                        
-                        // Filtrar elementos do menu lateral esquerdo
-                        if (rect.left < 150 && rect.width > 10 && rect.height > 10 && rect.top > 50) {
-                            elements.push({
-                                index: index,
-                                text: text,
-                                left: rect.left,
-                                top: rect.top,
-                                width: rect.width,
-                                height: rect.height,
-                                classes: el.className,
-                                id: el.id,
-                                focusable: el.getAttribute('focusable'),
-                                tagName: el.tagName
-                            });
-                        }
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Elementos focusable encontrados: {len(focusable_info)}")
-            
-            # Tentar clicar no segundo elemento focusable
-            if len(focusable_info) >= 2:
-                second_focusable = focusable_info[1]
-                print(f"🎯 Tentando segundo elemento focusable: {second_focusable}")
-                
-                try:
-                    # Clicar por posição
-                    await page.click(f"button[focusable]:nth-child({second_focusable['index'] + 1})")
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/bubble_02_focusable_clicked.png")
-                    
-                    current_url = page.url
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower():
-                        print(f"✅ Sucesso com focusable! URL: {current_url}")
-                        button_found = True
-                        
-                except Exception as e:
-                    print(f"❌ Erro ao clicar focusable: {e}")
-        
-        # Estratégia 4: Força bruta - tentar todos os botões do menu lateral
-        if not button_found:
-            print("🔍 Estratégia 4: Força bruta - todos os botões do menu lateral...")
-            
-            all_buttons = await page.evaluate("""
-                () => {
-                    const buttons = [];
-                    document.querySelectorAll('button').forEach((btn, index) => {
-                        const rect = btn.getBoundingClientRect();
-                        if (rect.left < 150 && rect.width > 10 && rect.height > 10 && rect.top > 50) {
-                            buttons.push({
-                                index: index,
-                                text: btn.textContent?.trim() || '',
-                                left: rect.left,
-                                top: rect.top
-                            });
-                        }
-                    });
-                    return buttons.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Todos os botões do menu: {len(all_buttons)}")
-            
-            # Tentar clicar em cada botão até encontrar o correto
-            for i, button in enumerate(all_buttons):
-                try:
-                    print(f"🎯 Tentando botão {i+1}: {button['text']}")
-                    await page.click(f"button:nth-child({button['index'] + 1})")
-                    await page.wait_for_timeout(2000)
-                    
-                    current_url = page.url
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        print(f"✅ SUCESSO! Botão {i+1} levou para: {current_url}")
-                        await page.screenshot(path=f"{screenshots_dir}/bubble_02_success.png")
-                        button_found = True
-                        break
-                        
-                except Exception as e:
-                    continue
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/bubble_03_final.png")
-        
-        final_url = page.url
-        print(f"📍 URL final: {final_url}")
-        
-        if button_found:
-            print("✅ NAVEGAÇÃO BEM-SUCEDIDA!")
-        else:
-            print("❌ Não conseguiu encontrar o botão correto")
-        
-        return {
-            "success": button_found,
-            "final_url": final_url,
-            "focusable_elements": len(focusable_info) if 'focusable_info' in locals() else 0,
-            "total_buttons": len(all_buttons) if 'all_buttons' in locals() else 0
-        }
-        
-    except Exception as e:
-        print(f"❌ Erro no teste: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/bubble_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_bubble_navigation())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', bubble_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste Bubble executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste Bubble: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_bubble_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste específico para Bubble.io iniciado',
-            'note': 'Teste baseado na estrutura do inspect element: button "Gerenciar chamados" focusable=true',
-            'strategies': [
-                '1. Procurar por texto "Gerenciar chamados"',
-                '2. Procurar por estrutura específica do Bubble.io',
-                '3. Procurar por elementos focusable no menu lateral',
-                '4. Força bruta - testar todos os botões do menu'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar teste Bubble: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar teste Bubble: {e}'
-        }), 500
-
-@app.route('/test-direct-click', methods=['POST', 'GET'])
-def test_direct_click():
-    """Teste direto - força bruta em todos os botões do menu lateral"""
-    try:
-        import subprocess
-        import threading
-        
-        def run_direct_test():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Código Python para teste direto
-                direct_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-
-async def test_direct_navigation():
-    screenshots_dir = "/tmp/screenshots"
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
-    try:
-        # Fazer login
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Screenshot inicial
-        await page.screenshot(path=f"{screenshots_dir}/direct_01_dashboard.png")
-        print("✅ Login realizado!")
-        
-        # Obter TODOS os botões da página
-        print("🔍 Mapeando TODOS os botões da página...")
-        all_buttons = await page.evaluate("""
-            () => {
-                const buttons = [];
-                document.querySelectorAll('button').forEach((btn, index) => {
-                    const rect = btn.getBoundingClientRect();
-                    const text = btn.textContent?.trim() || '';
-                    const visible = rect.width > 0 && rect.height > 0 && btn.offsetParent !== null;
-                    
-                    if (visible) {
-                        buttons.push({
-                            index: index,
-                            text: text,
-                            left: rect.left,
-                            top: rect.top,
-                            width: rect.width,
-                            height: rect.height,
-                            classes: btn.className,
-                            id: btn.id,
-                            focusable: btn.getAttribute('focusable'),
-                            innerHTML: btn.innerHTML.substring(0, 100)
-                        });
-                    }
-                });
-                return buttons;
-            }
-        """)
-        
-        print(f"📋 Total de botões encontrados: {len(all_buttons)}")
-        
-        # Salvar informações dos botões
-        with open(f"{screenshots_dir}/buttons_info.json", "w") as f:
-            json.dump(all_buttons, f, indent=2)
-        
-        # Tentar clicar em cada botão
-        success_found = False
-        initial_url = page.url
-        
-        for i, button in enumerate(all_buttons):
-            try:
-                print(f"🎯 Testando botão {i+1}/{len(all_buttons)}: '{button['text']}'")
-                
-                # Voltar para dashboard se mudou de página
-                if page.url != initial_url:
-                    await page.goto(initial_url)
-                    await page.wait_for_timeout(2000)
-                
-                # Clicar no botão
-                await page.click(f"button:nth-child({button['index'] + 1})")
-                await page.wait_for_timeout(3000)
-                
-                # Verificar se mudou de página
-                current_url = page.url
-                if current_url != initial_url:
-                    print(f"📍 Botão {i+1} mudou URL para: {current_url}")
-                    await page.screenshot(path=f"{screenshots_dir}/direct_02_button_{i+1}_clicked.png")
-                    
-                    # Verificar se é a página que queremos
-                    if any(keyword in current_url.lower() for keyword in ['os', 'chamados', 'operacao', 'controle']):
-                        print(f"✅ SUCESSO! Botão {i+1} levou para página de OS!")
-                        print(f"   Texto: '{button['text']}'")
-                        print(f"   URL: {current_url}")
-                        await page.screenshot(path=f"{screenshots_dir}/direct_03_SUCCESS.png")
-                        success_found = True
-                        break
-                    else:
-                        print(f"   ❌ Não é a página de OS")
-                
-                # Limite de tentativas para não travar
-                if i >= 20:  # Testar apenas os primeiros 20 botões
-                    print("⚠️ Limite de 20 botões atingido")
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Erro no botão {i+1}: {e}")
-                continue
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/direct_04_final.png")
-        
-        print(f"📍 URL final: {page.url}")
-        if success_found:
-            print("✅ ENCONTROU A PÁGINA DE OS!")
-        else:
-            print("❌ Não encontrou a página de OS")
-        
-        return {
-            "success": success_found,
-            "final_url": page.url,
-            "total_buttons_tested": min(len(all_buttons), 20),
-            "all_buttons_count": len(all_buttons)
-        }
-        
-    except Exception as e:
-        print(f"❌ Erro geral: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/direct_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_direct_navigation())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', direct_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste direto executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste direto: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_direct_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste direto iniciado - força bruta em todos os botões',
-            'note': 'Este teste clica em cada botão da página até encontrar o que leva para OS',
-            'info': 'Gerará screenshots de cada botão clicado e salvará informações em buttons_info.json'
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar teste direto: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar teste direto: {e}'
-        }), 500
-
-@app.route('/test-smart-menu', methods=['POST', 'GET'])
-def test_smart_menu():
-    """Teste inteligente - foca apenas no menu lateral esquerdo e evita links externos"""
-    try:
-        import subprocess
-        import threading
-        
-        def run_smart_test():
-            try:
-                # Criar diretório de screenshots se não existir
-                screenshots_dir = "/tmp/screenshots"
-                os.makedirs(screenshots_dir, exist_ok=True)
-                
-                # Definir variáveis de ambiente
-                env = os.environ.copy()
-                env['EACE_USERNAME'] = 'raiseupbt@gmail.com'
-                env['EACE_PASSWORD'] = '@Uujpgi8u'
-                env['DISPLAY'] = ':99'
-                
-                # Código Python para teste inteligente
-                smart_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-
-async def test_smart_navigation():
-    screenshots_dir = "/tmp/screenshots"
-    
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(headless=True)
-    page = await browser.new_page()
-    
-    try:
-        # Fazer login
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Screenshot inicial
-        await page.screenshot(path=f"{screenshots_dir}/smart_01_dashboard.png")
-        print("✅ Login realizado!")
-        
-        # Obter apenas botões do menu lateral esquerdo (evitando links externos)
-        print("🔍 Mapeando botões do menu lateral...")
-        menu_buttons = await page.evaluate("""
-            () => {
-                const buttons = [];
-                const domain = window.location.hostname;
-                
-                document.querySelectorAll('button').forEach((btn, index) => {
-                    const rect = btn.getBoundingClientRect();
-                    const text = btn.textContent?.trim() || '';
-                    const visible = rect.width > 0 && rect.height > 0 && btn.offsetParent !== null;
-                    
-                    // Filtrar apenas botões do menu lateral esquerdo
-                    if (visible && rect.left < 200 && rect.top > 50) {
-                        // Evitar botões que parecem ser links externos
-                        const isExternal = text.toLowerCase().includes('intranet') || 
-                                         text.toLowerCase().includes('portal') ||
-                                         text.toLowerCase().includes('site') ||
-                                         text.toLowerCase().includes('www') ||
-                                         text.toLowerCase().includes('http');
-                        
-                        if (!isExternal) {
-                            buttons.push({
-                                index: index,
-                                text: text,
-                                left: rect.left,
-                                top: rect.top,
-                                width: rect.width,
-                                height: rect.height,
-                                classes: btn.className,
-                                id: btn.id,
-                                focusable: btn.getAttribute('focusable'),
-                                innerHTML: btn.innerHTML.substring(0, 100)
-                            });
-                        }
-                    }
-                });
-                
-                // Ordenar por posição vertical (menu de cima para baixo)
-                return buttons.sort((a, b) => a.top - b.top);
-            }
-        """)
-        
-        print(f"📋 Botões do menu lateral encontrados: {len(menu_buttons)}")
-        
-        # Salvar informações dos botões
-        with open(f"{screenshots_dir}/menu_buttons_info.json", "w") as f:
-            json.dump(menu_buttons, f, indent=2)
-        
-        # Tentar clicar em cada botão do menu
-        success_found = False
-        initial_url = page.url
-        
-        for i, button in enumerate(menu_buttons):
-            try:
-                print(f"🎯 Testando botão {i+1}/{len(menu_buttons)}: '{button['text']}'")
-                
-                # Garantir que estamos na página inicial
-                if page.url != initial_url:
-                    print(f"   🔄 Voltando para dashboard...")
-                    await page.goto(initial_url)
-                    await page.wait_for_timeout(3000)
-                
-                # Screenshot antes do clique
-                await page.screenshot(path=f"{screenshots_dir}/smart_02_before_button_{i+1}.png")
-                
-                # Clicar no botão usando diferentes métodos
-                click_success = False
-                
-                # Método 1: Clicar por seletor
-                try:
-                    await page.click(f"button:nth-child({button['index'] + 1})")
-                    click_success = True
-                except:
-                    pass
-                
-                # Método 2: Clicar por posição (se o primeiro falhar)
-                if not click_success:
-                    try:
-                        await page.click(f"button", position={"x": button['width']//2, "y": button['height']//2})
-                        click_success = True
-                    except:
-                        pass
-                
-                # Método 3: Clicar por texto (se os outros falharem)
-                if not click_success and button['text']:
-                    try:
-                        await page.click(f"text='{button['text']}'")
-                        click_success = True
-                    except:
-                        pass
-                
-                if not click_success:
-                    print(f"   ❌ Não conseguiu clicar no botão {i+1}")
-                    continue
-                
-                # Aguardar possível mudança de página
-                await page.wait_for_timeout(4000)
-                
-                # Verificar se mudou de página
-                current_url = page.url
-                if current_url != initial_url:
-                    print(f"   📍 Botão {i+1} mudou URL para: {current_url}")
-                    await page.screenshot(path=f"{screenshots_dir}/smart_03_button_{i+1}_result.png")
-                    
-                    # Verificar se ainda está no domínio eace.org.br
-                    if 'eace.org.br' in current_url:
-                        # Verificar se é a página que queremos
-                        if any(keyword in current_url.lower() for keyword in ['os', 'chamados', 'operacao', 'controle']):
-                            print(f"   ✅ SUCESSO! Botão {i+1} levou para página de OS!")
-                            print(f"   Texto: '{button['text']}'")
-                            print(f"   URL: {current_url}")
-                            await page.screenshot(path=f"{screenshots_dir}/smart_04_SUCCESS.png")
-                            success_found = True
-                            break
-                        else:
-                            print(f"   ℹ️  Mudou de página mas não é OS")
-                    else:
-                        print(f"   ⚠️  Saiu do domínio eace.org.br")
-                else:
-                    print(f"   ➡️  Não mudou de página")
-                    
-            except Exception as e:
-                print(f"   ❌ Erro no botão {i+1}: {e}")
-                continue
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/smart_05_final.png")
-        
-        print(f"📍 URL final: {page.url}")
-        if success_found:
-            print("✅ ENCONTROU A PÁGINA DE OS!")
-        else:
-            print("❌ Não encontrou a página de OS nos botões do menu lateral")
-        
-        return {
-            "success": success_found,
-            "final_url": page.url,
-            "menu_buttons_tested": len(menu_buttons),
-            "initial_url": initial_url
-        }
-        
-    except Exception as e:
-        print(f"❌ Erro geral: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/smart_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_smart_navigation())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', smart_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste inteligente executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste inteligente: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_smart_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste inteligente iniciado - foco no menu lateral e evita links externos',
-            'note': 'Filtra apenas botões do menu lateral esquerdo e evita "intranet", "portal", etc.',
-            'features': [
-                'Foca apenas no menu lateral esquerdo (left < 200px)',
-                'Evita botões com texto "intranet", "portal", "site", etc.',
-                'Sempre volta para dashboard se mudar de página',
-                'Verifica se continua no domínio eace.org.br',
-                'Múltiplos métodos de clique como fallback'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar teste inteligente: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar teste inteligente: {e}'
-        }), 500
-
-@app.route('/test-expandable-menu', methods=['GET', 'POST'])
-def test_expandable_menu():
-    """Teste para navegação de menu expansível - foco em dois passos: expandir + clicar"""
-    try:
-        def run_expandable_test():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código para teste de menu expansível
-                expandable_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-
-async def test_expandable_menu():
-    """Teste de menu expansível com dois passos: expandir menu + clicar item"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Iniciando teste de menu expansível...")
-        
-        # Fazer login
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/expandable_01_dashboard.png")
-        
-        # FASE 1: Expandir o menu (hambúrguer)
-        print("🔍 FASE 1: Procurando e expandindo o menu...")
-        
-        menu_expanded = False
-        
-        # Seletores para botão de menu hambúrguer
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",  # Primeiro botão da página
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_toggle_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"📍 Tentando expandir menu com: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/expandable_02_menu_expanded.png")
-                    
-                    # Verificar se menu foi expandido (procurar por mais elementos visíveis)
-                    visible_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    print(f"🔍 Elementos visíveis após clique: {visible_elements}")
-                    
-                    # Assumir que menu foi expandido se há mais elementos visíveis
-                    if visible_elements > 10:  # Threshold arbitrário
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao expandir menu com {selector}: {e}")
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não conseguiu expandir o menu")
-            await page.screenshot(path=f"{screenshots_dir}/expandable_02_menu_not_expanded.png")
-        
-        # FASE 2: Procurar e clicar no item do menu relacionado a OS
-        print("🔍 FASE 2: Procurando item 'Gerenciar chamados' ou similar...")
-        
-        os_found = False
-        
-        # Primeiro, procurar especificamente por "Gerenciar chamados" (baseado na imagem)
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for selector in specific_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    print(f"📍 Encontrado 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/expandable_03_chamados_clicked.png")
-                    
-                    # Verificar se navegou para página de OS/chamados
-                    current_url = page.url
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        print(f"✅ SUCESSO! Navegou para: {current_url}")
-                        os_found = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar em {selector}: {e}")
-                continue
-        
-        # Se não encontrou "Gerenciar chamados", procurar por outros termos
-        if not os_found:
-            print("🔍 Procurando por termos alternativos...")
-            
-            alternative_selectors = [
-                "//*[contains(text(), 'OS')]",
-                "//*[contains(text(), 'Operação')]",
-                "//*[contains(text(), 'Controle')]",
-                "//*[contains(text(), 'Tickets')]",
-                "//*[contains(text(), 'Atendimento')]",
-                "//button[contains(@class, 'generic')]",
-                "//a[contains(@href, 'os')]",
-                "//a[contains(@href, 'chamados')]",
-                "//a[contains(@href, 'controle')]"
-            ]
-            
-            for selector in alternative_selectors:
-                try:
-                    elements = await page.locator(selector).count()
-                    if elements > 0:
-                        print(f"📍 Tentando alternativa: {selector}")
-                        await page.locator(selector).click()
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/expandable_04_alternative_clicked.png")
-                        
-                        current_url = page.url
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ SUCESSO com alternativa! URL: {current_url}")
-                            os_found = True
-                            break
-                            
-                except Exception as e:
-                    print(f"❌ Erro com alternativa {selector}: {e}")
-                    continue
-        
-        # FASE 3: Análise estrutural do menu expandido
-        if not os_found:
-            print("🔍 FASE 3: Analisando estrutura do menu expandido...")
-            
-            # Mapear todos os elementos do menu expandido
-            menu_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            // Focar no menu lateral esquerdo
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                                elements.push({
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                });
-                            }
-                        });
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Elementos encontrados no menu: {len(menu_elements)}")
-            
-            # Procurar pelo segundo elemento (baseado no feedback do usuário)
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]  # Segundo elemento (índice 1)
-                print(f"🎯 Tentando segundo elemento: {target_element}")
-                
-                try:
-                    # Tentar clicar no elemento por texto
-                    if target_element['text']:
-                        await page.click(f"text='{target_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/expandable_05_second_element.png")
-                        
-                        current_url = page.url
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ SUCESSO com segundo elemento! URL: {current_url}")
-                            os_found = True
-                            
-                except Exception as e:
-                    print(f"❌ Erro ao clicar no segundo elemento: {e}")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/expandable_06_final.png")
-        
-        final_url = page.url
-        print(f"📍 URL final: {final_url}")
-        
-        if os_found:
-            print("✅ Teste de menu expansível CONCLUÍDO COM SUCESSO!")
-        else:
-            print("❌ Não conseguiu navegar para página de OS/chamados")
-        
-        return {
-            "success": os_found,
-            "final_url": final_url,
-            "menu_expanded": menu_expanded,
-            "elements_found": len(menu_elements) if 'menu_elements' in locals() else 0
-        }
-        
-    except Exception as e:
-        print(f"❌ Erro no teste expansível: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/expandable_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_expandable_menu())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', expandable_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste expansível executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste expansível: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_expandable_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste de menu expansível iniciado - abordagem em duas fases',
-            'note': 'Fase 1: Expandir menu hambúrguer + Fase 2: Clicar em "Gerenciar chamados"',
-            'phases': [
-                'Fase 1: Identifica e clica no botão do menu hambúrguer',
-                'Fase 2: Procura por "Gerenciar chamados" no menu expandido',
-                'Fase 3: Se não encontrar, analisa estrutura e tenta segundo elemento',
-                'Foco específico no menu lateral esquerdo (left < 200px)',
-                'Baseado na imagem do inspect element fornecida'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar teste expansível: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar teste expansível: {e}'
-        }), 500
-
-@app.route('/test-os-page-mapping', methods=['GET', 'POST'])
-def test_os_page_mapping():
-    """Mapeia a página 'Controle de OS' e procura pelo botão 'Adicionar nova OS'"""
-    try:
-        def run_os_mapping_test():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código para mapear página de OS
-                os_mapping_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def map_os_page():
-    """Mapeia a página de Controle de OS e procura pelo botão Adicionar nova OS"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Iniciando mapeamento da página de Controle de OS...")
-        
-        # ETAPA 1: Fazer login e navegar até página de OS
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_map_01_dashboard.png")
-        
-        # ETAPA 2: Navegar para página de Controle de OS (usando método que já funciona)
-        print("🔍 Navegando para página de Controle de OS...")
-        
-        # Expandir menu hambúrguer
-        menu_expanded = False
-        menu_selectors = [
-            "button[focusable='true']",
-            "//button[@focusable='true']",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"📍 Expandindo menu com: {selector}")
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    await page.wait_for_timeout(2000)
-                    menu_expanded = True
-                    break
-            except Exception as e:
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não conseguiu expandir o menu")
-            return {"error": "Menu não expandido"}
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_map_02_menu_expanded.png")
-        
-        # Procurar por "Gerenciar chamados"
-        chamados_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]"
-        ]
-        
-        os_page_reached = False
-        for selector in chamados_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    print(f"✅ Clicando em 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(5000)
-                    os_page_reached = True
-                    break
-            except Exception as e:
-                continue
-        
-        if not os_page_reached:
-            print("❌ Não conseguiu chegar na página de OS")
-            return {"error": "Página de OS não alcançada"}
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_map_03_os_page_reached.png")
-        
-        # ETAPA 3: Mapear a página de Controle de OS
-        print("🔍 Mapeando página de Controle de OS...")
-        
-        current_url = page.url
-        print(f"📍 URL atual: {current_url}")
-        
-        # Analisar todos os elementos da página
-        page_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const selectors = ['button', 'a', 'input', 'div', 'span', 'h1', 'h2', 'h3', 'p'];
-                
-                selectors.forEach(selector => {
-                    document.querySelectorAll(selector).forEach((el, index) => {
-                        const rect = el.getBoundingClientRect();
-                        const text = el.textContent?.trim() || '';
-                        const visible = rect.width > 0 && rect.height > 0 && el.offsetParent !== null;
-                        
-                        if (visible && text.length > 0) {
-                            elements.push({
-                                tagName: el.tagName.toLowerCase(),
-                                text: text,
-                                classes: el.className || '',
-                                id: el.id || '',
-                                type: el.type || '',
-                                href: el.href || '',
-                                onclick: el.onclick ? 'true' : 'false',
-                                left: rect.left,
-                                top: rect.top,
-                                width: rect.width,
-                                height: rect.height,
-                                focusable: el.getAttribute('focusable') || '',
-                                ariaLabel: el.getAttribute('aria-label') || '',
-                                title: el.getAttribute('title') || ''
-                            });
-                        }
-                    });
-                });
-                
-                return elements;
-            }
-        """)
-        
-        print(f"📋 Total de elementos encontrados: {len(page_elements)}")
-        
-        # ETAPA 4: Procurar especificamente pelo botão "Adicionar nova OS"
-        print("🔍 Procurando pelo botão 'Adicionar nova OS'...")
-        
-        adicionar_os_buttons = []
-        for element in page_elements:
-            text_lower = element['text'].lower()
-            if ('adicionar' in text_lower and 'os' in text_lower) or \
-               ('nova' in text_lower and 'os' in text_lower) or \
-               ('criar' in text_lower and 'os' in text_lower) or \
-               ('novo' in text_lower and 'os' in text_lower):
-                adicionar_os_buttons.append(element)
-        
-        print(f"🎯 Botões relacionados a 'Adicionar OS' encontrados: {len(adicionar_os_buttons)}")
-        
-        # Salvar análise completa
-        analysis_data = {
-            'url': current_url,
-            'timestamp': datetime.now().isoformat(),
-            'total_elements': len(page_elements),
-            'adicionar_os_buttons': adicionar_os_buttons,
-            'all_buttons': [el for el in page_elements if el['tagName'] == 'button'],
-            'all_links': [el for el in page_elements if el['tagName'] == 'a'],
-            'form_elements': [el for el in page_elements if el['tagName'] in ['input', 'textarea', 'select']]
-        }
-        
-        with open(f"{screenshots_dir}/os_page_analysis.json", "w") as f:
-            json.dump(analysis_data, f, indent=2)
-        
-        # ETAPA 5: Tentar clicar no botão "Adicionar nova OS" se encontrado
-        button_clicked = False
-        if adicionar_os_buttons:
-            target_button = adicionar_os_buttons[0]  # Primeiro botão encontrado
-            print(f"🎯 Tentando clicar no botão: {target_button['text']}")
-            
-            try:
-                # Tentar diferentes métodos para clicar
-                click_methods = [
-                    f"text='{target_button['text']}'",
-                    f"button:has-text('{target_button['text'][:20]}')",
-                    f"//button[contains(text(), '{target_button['text'][:20]}')]"
-                ]
-                
-                for method in click_methods:
-                    try:
-                        if method.startswith("//"):
-                            await page.locator(method).click()
-                        else:
-                            await page.click(method)
-                        await page.wait_for_timeout(3000)
-                        button_clicked = True
-                        print(f"✅ Clique realizado com método: {method}")
-                        break
-                    except Exception as e:
-                        continue
-                
-                if button_clicked:
-                    await page.screenshot(path=f"{screenshots_dir}/os_map_04_button_clicked.png")
-                    
-                    # Verificar se navegou para formulário
-                    new_url = page.url
-                    if new_url != current_url:
-                        print(f"✅ Navegou para nova página: {new_url}")
-                        
-                        # Mapear formulário rapidamente
-                        await page.wait_for_timeout(3000)
-                        form_elements = await page.evaluate("""
-                            () => {
-                                const inputs = [];
-                                document.querySelectorAll('input, textarea, select').forEach(el => {
-                                    const rect = el.getBoundingClientRect();
-                                    if (rect.width > 0 && rect.height > 0) {
-                                        inputs.push({
-                                            tagName: el.tagName.toLowerCase(),
-                                            type: el.type || '',
-                                            name: el.name || '',
-                                            id: el.id || '',
-                                            placeholder: el.placeholder || '',
-                                            required: el.required || false,
-                                            classes: el.className || ''
-                                        });
-                                    }
-                                });
-                                return inputs;
-                            }
-                        """)
-                        
-                        await page.screenshot(path=f"{screenshots_dir}/os_map_05_form_page.png")
-                        
-                        analysis_data['form_reached'] = True
-                        analysis_data['form_url'] = new_url
-                        analysis_data['form_elements_detailed'] = form_elements
-                        
-                        with open(f"{screenshots_dir}/os_page_analysis.json", "w") as f:
-                            json.dump(analysis_data, f, indent=2)
-                        
-                        print(f"✅ Formulário mapeado com {len(form_elements)} campos")
-                    else:
-                        print("ℹ️ Permaneceu na mesma página após clique")
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar no botão: {e}")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/os_map_06_final.png")
-        
-        # Resultado final
-        result = {
-            'success': True,
-            'current_url': page.url,
-            'os_buttons_found': len(adicionar_os_buttons),
-            'button_clicked': button_clicked,
-            'form_reached': analysis_data.get('form_reached', False),
-            'total_elements_analyzed': len(page_elements)
-        }
-        
-        if adicionar_os_buttons:
-            result['target_button'] = adicionar_os_buttons[0]
-        
-        print(f"✅ Mapeamento concluído: {result}")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Erro no mapeamento: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/os_map_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(map_os_page())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', os_mapping_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Mapeamento de OS executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar mapeamento de OS: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_os_mapping_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Mapeamento da página de OS iniciado',
-            'note': 'Mapeia a página "Controle de OS" e procura pelo botão "Adicionar nova OS"',
-            'objectives': [
-                '1. Navegar para página de Controle de OS',
-                '2. Mapear todos os elementos da página',
-                '3. Encontrar botão "Adicionar nova OS"', 
-                '4. Tentar clicar no botão',
-                '5. Mapear formulário se alcançado',
-                '6. Salvar análise completa em JSON'
-            ],
-            'outputs': [
-                'Screenshots do processo completo',
-                'Arquivo os_page_analysis.json com análise detalhada',
-                'Mapeamento de elementos do formulário (se encontrado)'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar mapeamento de OS: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar mapeamento de OS: {e}'
-        }), 500
-
-@app.route('/test-simple', methods=['GET'])
-def test_simple():
-    """Endpoint simples para teste"""
-    return jsonify({
-        'message': 'Endpoint funcionando!',
-        'timestamp': datetime.now().isoformat(),
-        'status': 'OK'
-    })
-
-@app.route('/debug-os-mapping', methods=['GET', 'POST'])
-def debug_os_mapping():
-    """Debug do mapeamento de OS com logs detalhados"""
-    try:
-        def run_debug_test():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código simplificado para debug
-                debug_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def debug_os_mapping():
-    """Debug do mapeamento de OS com logs detalhados"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Log detalhado
-    log_file = f"{screenshots_dir}/debug_log.txt"
-    
-    def log_message(message):
-        print(message)
-        with open(log_file, "a") as f:
-            f.write(f"{datetime.now()}: {message}\\n")
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        log_message("🚀 Iniciando debug do mapeamento...")
-        
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        log_message("✅ Browser iniciado")
-        
-        # ETAPA 1: Login
-        log_message("🔐 Iniciando login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        log_message("✅ Página de login carregada")
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        log_message("✅ Credenciais preenchidas")
-        
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        log_message("✅ Login realizado")
-        
-        # Screenshot 1
-        await page.screenshot(path=f"{screenshots_dir}/debug_01_login.png")
-        log_message("📸 Screenshot 1 - Login")
-        
-        # ETAPA 2: Seleção de perfil
-        log_message("👤 Verificando seleção de perfil...")
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-            log_message("✅ Perfil Fornecedor selecionado")
-        else:
-            log_message("ℹ️ Perfil já selecionado ou não necessário")
-        
-        # Screenshot 2
-        await page.screenshot(path=f"{screenshots_dir}/debug_02_perfil.png")
-        log_message("📸 Screenshot 2 - Perfil")
-        
-        # ETAPA 3: Expandir menu
-        log_message("🔍 Tentando expandir menu...")
-        menu_expanded = False
-        
-        menu_selectors = [
-            "button[focusable='true']",
-            "//button[@focusable='true']",
-            "//button[1]"
-        ]
-        
-        for i, selector in enumerate(menu_selectors):
-            try:
-                log_message(f"🔍 Tentando seletor {i+1}: {selector}")
-                
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                log_message(f"📊 Elementos encontrados: {elements}")
-                
-                if elements > 0:
-                    log_message(f"✅ Clicando com seletor: {selector}")
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    await page.wait_for_timeout(2000)
-                    menu_expanded = True
-                    log_message("✅ Menu expandido com sucesso")
-                    break
-                else:
-                    log_message(f"❌ Nenhum elemento encontrado com: {selector}")
-                    
-            except Exception as e:
-                log_message(f"❌ Erro com seletor {selector}: {e}")
-                continue
-        
-        # Screenshot 3
-        await page.screenshot(path=f"{screenshots_dir}/debug_03_menu.png")
-        log_message("📸 Screenshot 3 - Menu")
-        
-        if not menu_expanded:
-            log_message("❌ ERRO: Menu não foi expandido")
-            return {"error": "Menu não expandido", "step": "menu_expansion"}
-        
-        # ETAPA 4: Procurar "Gerenciar chamados"
-        log_message("🔍 Procurando 'Gerenciar chamados'...")
-        
-        chamados_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        os_page_reached = False
-        for i, selector in enumerate(chamados_selectors):
-            try:
-                log_message(f"🔍 Tentando seletor chamados {i+1}: {selector}")
-                elements = await page.locator(selector).count()
-                log_message(f"📊 Elementos 'chamados' encontrados: {elements}")
-                
-                if elements > 0:
-                    log_message(f"✅ Clicando em 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(5000)
-                    os_page_reached = True
-                    log_message("✅ Página de OS alcançada")
-                    break
-                else:
-                    log_message(f"❌ Nenhum elemento 'chamados' encontrado com: {selector}")
-                    
-            except Exception as e:
-                log_message(f"❌ Erro com seletor chamados {selector}: {e}")
-                continue
-        
-        # Screenshot 4
-        await page.screenshot(path=f"{screenshots_dir}/debug_04_os_page.png")
-        log_message("📸 Screenshot 4 - Página OS")
-        
-        if not os_page_reached:
-            log_message("❌ ERRO: Página de OS não foi alcançada")
-            return {"error": "Página de OS não alcançada", "step": "os_navigation"}
-        
-        # ETAPA 5: Analisar página atual
-        log_message("🔍 Analisando página atual...")
-        current_url = page.url
-        log_message(f"📍 URL atual: {current_url}")
-        
-        # Buscar botões relacionados a OS
-        buttons_info = await page.evaluate("""
-            () => {
-                const buttons = [];
-                document.querySelectorAll('button, a').forEach((el, index) => {
-                    const rect = el.getBoundingClientRect();
-                    const text = el.textContent?.trim() || '';
-                    const visible = rect.width > 0 && rect.height > 0;
-                    
-                    if (visible && text.length > 0) {
-                        buttons.push({
-                            index: index,
-                            text: text,
-                            tagName: el.tagName.toLowerCase(),
-                            classes: el.className || '',
-                            id: el.id || ''
-                        });
-                    }
-                });
-                return buttons;
-            }
-        """)
-        
-        log_message(f"📊 Total de botões encontrados: {len(buttons_info)}")
-        
-        # Procurar botão "Adicionar nova OS"
-        os_buttons = []
-        for button in buttons_info:
-            text_lower = button['text'].lower()
-            if ('adicionar' in text_lower and 'os' in text_lower) or \
-               ('nova' in text_lower and 'os' in text_lower) or \
-               ('novo' in text_lower and 'os' in text_lower):
-                os_buttons.append(button)
-                log_message(f"🎯 Botão OS encontrado: {button['text']}")
-        
-        log_message(f"📊 Botões de OS encontrados: {len(os_buttons)}")
-        
-        # Screenshot 5
-        await page.screenshot(path=f"{screenshots_dir}/debug_05_analysis.png")
-        log_message("📸 Screenshot 5 - Análise")
-        
-        # Salvar dados completos
-        debug_data = {
-            'timestamp': datetime.now().isoformat(),
-            'current_url': current_url,
-            'menu_expanded': menu_expanded,
-            'os_page_reached': os_page_reached,
-            'total_buttons': len(buttons_info),
-            'os_buttons_found': len(os_buttons),
-            'os_buttons': os_buttons,
-            'all_buttons': buttons_info[:10]  # Primeiros 10 para não sobrecarregar
-        }
-        
-        with open(f"{screenshots_dir}/debug_analysis.json", "w") as f:
-            json.dump(debug_data, f, indent=2)
-        
-        log_message("✅ Debug concluído com sucesso")
-        
-        return {
-            'success': True,
-            'current_url': current_url,
-            'os_buttons_found': len(os_buttons),
-            'total_buttons': len(buttons_info),
-            'menu_expanded': menu_expanded,
-            'os_page_reached': os_page_reached
-        }
-        
-    except Exception as e:
-        log_message(f"❌ ERRO GERAL: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/debug_error.png")
-        return {"error": str(e), "step": "general_error"}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-        log_message("🔚 Browser fechado")
-
-if __name__ == "__main__":
-    result = asyncio.run(debug_os_mapping())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', debug_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Debug executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar debug: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_debug_test)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Debug do mapeamento de OS iniciado',
-            'note': 'Versão com logs detalhados para identificar onde está falhando',
-            'outputs': [
-                'debug_log.txt - Log detalhado de cada etapa',
-                'debug_analysis.json - Análise completa dos elementos',
-                'Screenshots numerados de cada etapa',
-                'Identificação do ponto de falha'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar debug: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar debug: {e}'
-        }), 500
-
-@app.route('/map-adicionar-os-button', methods=['GET', 'POST'])
-def map_adicionar_os_button():
-    """Mapeia o botão 'Adicionar nova OS' usando navegação funcional do test-expandable-menu"""
-    try:
-        def run_os_button_mapping():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código baseado no test-expandable-menu que funciona
-                os_button_mapping_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def map_adicionar_os_button():
-    """Mapeia o botão 'Adicionar nova OS' na página de Controle de OS"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Mapeando botão 'Adicionar nova OS' - baseado no test-expandable-menu")
-        
-        # ETAPA 1: Login (idêntico ao test-expandable-menu)
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_btn_01_dashboard.png")
-        
-        # ETAPA 2: Expandir menu (usando método que funciona)
-        print("🔍 Expandindo menu hambúrguer...")
-        
-        menu_expanded = False
-        menu_selectors = [
-            "button[focusable='true']",
-            "//button[@focusable='true']",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"📍 Expandindo menu com: {selector}")
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    await page.wait_for_timeout(2000)
-                    menu_expanded = True
-                    break
-            except Exception as e:
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não conseguiu expandir o menu")
-            return {"error": "Menu não expandido"}
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_btn_02_menu_expanded.png")
-        
-        # ETAPA 3: Procurar e clicar em "Gerenciar chamados"
-        print("🔍 Procurando 'Gerenciar chamados'...")
-        
-        chamados_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]"
-        ]
-        
-        os_page_reached = False
-        for selector in chamados_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    print(f"✅ Clicando em 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(5000)
-                    os_page_reached = True
-                    break
-            except Exception as e:
-                continue
-        
-        if not os_page_reached:
-            print("❌ Não conseguiu chegar na página de OS")
-            return {"error": "Página de OS não alcançada"}
-        
-        # ETAPA 4: Análise estrutural do menu (método que funciona)
-        print("🔍 Analisando estrutura do menu expandido...")
-        
-        menu_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                
-                selectors.forEach(selector => {
-                    document.querySelectorAll(selector).forEach((el, index) => {
-                        const rect = el.getBoundingClientRect();
-                        const text = el.textContent?.trim() || '';
-                        
-                        // Focar no menu lateral esquerdo
-                        if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                            elements.push({
-                                tagName: el.tagName.toLowerCase(),
-                                text: text,
-                                classes: el.className,
-                                href: el.href || '',
-                                left: rect.left,
-                                top: rect.top,
-                                index: index
-                            });
-                        }
-                    });
-                });
-                
-                return elements.sort((a, b) => a.top - b.top);
-            }
-        """)
-        
-        print(f"📋 Elementos encontrados no menu: {len(menu_elements)}")
-        
-        # Clicar no segundo elemento (método que funciona)
-        if len(menu_elements) >= 2:
-            target_element = menu_elements[1]  # Segundo elemento (índice 1)
-            print(f"🎯 Clicando no segundo elemento: {target_element}")
-            
-            try:
-                if target_element['text']:
-                    await page.click(f"text='{target_element['text']}'")
-                    await page.wait_for_timeout(3000)
-                    
-                    current_url = page.url
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        print(f"✅ Sucesso! Chegou na página de OS: {current_url}")
-                        os_page_reached = True
-                    else:
-                        print(f"❌ URL não parece ser de OS: {current_url}")
-                        return {"error": "URL não reconhecida como página de OS"}
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar no segundo elemento: {e}")
-                return {"error": f"Erro ao clicar: {e}"}
-        
-        await page.screenshot(path=f"{screenshots_dir}/os_btn_03_os_page.png")
-        
-        # ETAPA 5: MAPEAR PÁGINA DE CONTROLE DE OS
-        print("🔍 Mapeando página de Controle de OS...")
-        
-        current_url = page.url
-        print(f"📍 URL da página de OS: {current_url}")
-        
-        # Mapear todos os elementos da página
-        page_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const selectors = ['button', 'a', 'div', 'span', 'input'];
-                
-                selectors.forEach(selector => {
-                    document.querySelectorAll(selector).forEach((el, index) => {
-                        const rect = el.getBoundingClientRect();
-                        const text = el.textContent?.trim() || '';
-                        const visible = rect.width > 0 && rect.height > 0 && el.offsetParent !== null;
-                        
-                        if (visible && text.length > 0) {
-                            elements.push({
-                                tagName: el.tagName.toLowerCase(),
-                                text: text,
-                                classes: el.className || '',
-                                id: el.id || '',
-                                type: el.type || '',
-                                href: el.href || '',
-                                left: rect.left,
-                                top: rect.top,
-                                width: rect.width,
-                                height: rect.height,
-                                focusable: el.getAttribute('focusable') || '',
-                                onclick: el.onclick ? 'true' : 'false'
-                            });
-                        }
-                    });
-                });
-                
-                return elements;
-            }
-        """)
-        
-        print(f"📊 Total de elementos na página: {len(page_elements)}")
-        
-        # ETAPA 6: PROCURAR ESPECIFICAMENTE PELO BOTÃO "ADICIONAR NOVA OS"
-        print("🎯 Procurando botão 'Adicionar nova OS'...")
-        
-        adicionar_os_buttons = []
-        for element in page_elements:
-            text_lower = element['text'].lower()
-            if ('adicionar' in text_lower and ('os' in text_lower or 'nova' in text_lower)) or \
-               ('nova' in text_lower and 'os' in text_lower) or \
-               ('criar' in text_lower and 'os' in text_lower) or \
-               ('novo' in text_lower and 'os' in text_lower) or \
-               ('adicionar nova' in text_lower):
-                adicionar_os_buttons.append(element)
-                print(f"🎯 Botão encontrado: '{element['text']}' - {element['tagName']}")
-        
-        print(f"📊 Botões 'Adicionar OS' encontrados: {len(adicionar_os_buttons)}")
-        
-        # ETAPA 7: TENTAR CLICAR NO BOTÃO SE ENCONTRADO
-        button_clicked = False
-        form_reached = False
-        
-        if adicionar_os_buttons:
-            target_button = adicionar_os_buttons[0]
-            print(f"🎯 Tentando clicar no botão: '{target_button['text']}'")
-            
-            try:
-                # Diferentes métodos para clicar
-                click_methods = [
-                    f"text='{target_button['text']}'",
-                    f"button:has-text('{target_button['text']}')",
-                    f"//button[contains(text(), '{target_button['text'][:15]}')]",
-                    f"//*[contains(text(), '{target_button['text'][:15]}')]"
-                ]
-                
-                for method in click_methods:
-                    try:
-                        print(f"🔍 Tentando método: {method}")
-                        if method.startswith("//"):
-                            await page.locator(method).click()
-                        else:
-                            await page.click(method)
-                        await page.wait_for_timeout(3000)
-                        button_clicked = True
-                        print(f"✅ Clique realizado com: {method}")
-                        break
-                    except Exception as e:
-                        print(f"❌ Falha com método {method}: {e}")
-                        continue
-                
-                if button_clicked:
-                    await page.screenshot(path=f"{screenshots_dir}/os_btn_04_button_clicked.png")
-                    
-                    # Verificar se chegou no formulário
-                    new_url = page.url
-                    if new_url != current_url:
-                        print(f"✅ Navegou para nova página: {new_url}")
-                        form_reached = True
-                        
-                        # Aguardar carregamento do formulário
-                        await page.wait_for_timeout(3000)
-                        
-                        # Mapear campos do formulário
-                        form_fields = await page.evaluate("""
-                            () => {
-                                const fields = [];
-                                document.querySelectorAll('input, textarea, select').forEach(el => {
-                                    const rect = el.getBoundingClientRect();
-                                    if (rect.width > 0 && rect.height > 0) {
-                                        fields.push({
-                                            tagName: el.tagName.toLowerCase(),
-                                            type: el.type || '',
-                                            name: el.name || '',
-                                            id: el.id || '',
-                                            placeholder: el.placeholder || '',
-                                            required: el.required || false,
-                                            classes: el.className || '',
-                                            value: el.value || ''
-                                        });
-                                    }
-                                });
-                                return fields;
-                            }
-                        """)
-                        
-                        await page.screenshot(path=f"{screenshots_dir}/os_btn_05_form_page.png")
-                        print(f"✅ Formulário mapeado com {len(form_fields)} campos")
-                        
-                        # Salvar dados do formulário
-                        form_data = {
-                            'form_url': new_url,
-                            'form_fields': form_fields,
-                            'field_count': len(form_fields)
-                        }
-                        
-                        with open(f"{screenshots_dir}/form_mapping.json", "w") as f:
-                            json.dump(form_data, f, indent=2)
-                    else:
-                        print("ℹ️ Permaneceu na mesma página após clique")
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar no botão: {e}")
-        else:
-            print("❌ Nenhum botão 'Adicionar OS' encontrado")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/os_btn_06_final.png")
-        
-        # Salvar análise completa
-        analysis_data = {
-            'timestamp': datetime.now().isoformat(),
-            'current_url': current_url,
-            'total_elements': len(page_elements),
-            'adicionar_os_buttons': adicionar_os_buttons,
-            'button_clicked': button_clicked,
-            'form_reached': form_reached,
-            'all_buttons': [el for el in page_elements if el['tagName'] == 'button'][:10],
-            'success': button_clicked and form_reached
-        }
-        
-        with open(f"{screenshots_dir}/os_button_analysis.json", "w") as f:
-            json.dump(analysis_data, f, indent=2)
-        
-        result = {
-            'success': button_clicked,
-            'form_reached': form_reached,
-            'current_url': page.url,
-            'os_buttons_found': len(adicionar_os_buttons),
-            'total_elements': len(page_elements),
-            'target_button': adicionar_os_buttons[0] if adicionar_os_buttons else None
-        }
-        
-        print(f"✅ Mapeamento concluído: {result}")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Erro geral: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/os_btn_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(map_adicionar_os_button())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', os_button_mapping_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Mapeamento botão OS executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar mapeamento botão OS: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_os_button_mapping)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Mapeamento do botão "Adicionar nova OS" iniciado',
-            'note': 'Baseado no test-expandable-menu que funciona 100%',
-            'objectives': [
-                '1. Usar navegação funcional do test-expandable-menu',
-                '2. Chegar na página de Controle de OS',
-                '3. Mapear todos os elementos da página',
-                '4. Encontrar botão "Adicionar nova OS"',
-                '5. Tentar clicar no botão',
-                '6. Mapear formulário de criação se encontrado'
-            ],
-            'outputs': [
-                'os_btn_01_dashboard.png até os_btn_06_final.png',
-                'os_button_analysis.json - Análise completa',
-                'form_mapping.json - Mapeamento do formulário (se encontrado)'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar mapeamento botão OS: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar mapeamento botão OS: {e}'
-        }), 500
-
-@app.route('/map-os-button-fixed', methods=['GET', 'POST'])
-def map_os_button_fixed():
-    """Versão corrigida - copia EXATAMENTE o test-expandable-menu e adiciona mapeamento do botão"""
-    try:
-        def run_fixed_mapping():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código IDÊNTICO ao test-expandable-menu + mapeamento do botão
-                fixed_mapping_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def map_os_button_fixed():
-    """Versão corrigida - copia EXATAMENTE o test-expandable-menu funcionando"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Versão corrigida - baseada EXATAMENTE no test-expandable-menu")
-        
-        # CÓDIGO IDÊNTICO AO TEST-EXPANDABLE-MENU QUE FUNCIONA
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/fixed_01_dashboard.png")
-        
-        # FASE 1: Expandir o menu (hambúrguer) - CÓDIGO IDÊNTICO
-        print("🔍 FASE 1: Procurando e expandindo o menu...")
-        
-        menu_expanded = False
-        
-        # Seletores para botão de menu hambúrguer - IDÊNTICOS AO ORIGINAL
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",  # Primeiro botão da página
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_toggle_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"📍 Tentando expandir menu com: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/fixed_02_menu_expanded.png")
-                    
-                    # Verificar se menu foi expandido (procurar por mais elementos visíveis)
-                    visible_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    print(f"🔍 Elementos visíveis após clique: {visible_elements}")
-                    
-                    # Assumir que menu foi expandido se há mais elementos visíveis
-                    if visible_elements > 10:  # Threshold arbitrário
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao expandir menu com {selector}: {e}")
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não conseguiu expandir o menu")
-            await page.screenshot(path=f"{screenshots_dir}/fixed_02_menu_not_expanded.png")
-            return {"error": "Menu não expandido"}
-        
-        # FASE 2: Procurar e clicar no item do menu relacionado a OS - CÓDIGO IDÊNTICO
-        print("🔍 FASE 2: Procurando item 'Gerenciar chamados' ou similar...")
-        
-        os_found = False
-        
-        # Primeiro, procurar especificamente por "Gerenciar chamados" - IDÊNTICO
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for selector in specific_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    print(f"📍 Encontrado 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/fixed_03_chamados_clicked.png")
-                    
-                    # Verificar se navegou para página de OS/chamados
-                    current_url = page.url
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        print(f"✅ SUCESSO! Navegou para: {current_url}")
-                        os_found = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar em {selector}: {e}")
-                continue
-        
-        # Se não encontrou "Gerenciar chamados", procurar por outros termos - IDÊNTICO
-        if not os_found:
-            print("🔍 Procurando por termos alternativos...")
-            
-            alternative_selectors = [
-                "//*[contains(text(), 'OS')]",
-                "//*[contains(text(), 'Operação')]",
-                "//*[contains(text(), 'Controle')]",
-                "//*[contains(text(), 'Tickets')]",
-                "//*[contains(text(), 'Atendimento')]",
-                "//button[contains(@class, 'generic')]",
-                "//a[contains(@href, 'os')]",
-                "//a[contains(@href, 'chamados')]",
-                "//a[contains(@href, 'controle')]"
-            ]
-            
-            for selector in alternative_selectors:
-                try:
-                    elements = await page.locator(selector).count()
-                    if elements > 0:
-                        print(f"📍 Tentando alternativa: {selector}")
-                        await page.locator(selector).click()
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/fixed_04_alternative_clicked.png")
-                        
-                        current_url = page.url
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ SUCESSO com alternativa! URL: {current_url}")
-                            os_found = True
-                            break
-                            
-                except Exception as e:
-                    print(f"❌ Erro com alternativa {selector}: {e}")
-                    continue
-        
-        # FASE 3: Análise estrutural do menu expandido - CÓDIGO IDÊNTICO
-        if not os_found:
-            print("🔍 FASE 3: Analisando estrutura do menu expandido...")
-            
-            # Mapear todos os elementos do menu expandido
-            menu_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            // Focar no menu lateral esquerdo
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                                elements.push({
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                });
-                            }
-                        });
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Elementos encontrados no menu: {len(menu_elements)}")
-            
-            # Procurar pelo segundo elemento (baseado no feedback do usuário) - IDÊNTICO
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]  # Segundo elemento (índice 1)
-                print(f"🎯 Tentando segundo elemento: {target_element}")
-                
-                try:
-                    # Tentar clicar no elemento por texto
-                    if target_element['text']:
-                        await page.click(f"text='{target_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/fixed_05_second_element.png")
-                        
-                        current_url = page.url
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ SUCESSO com segundo elemento! URL: {current_url}")
-                            os_found = True
-                            
-                except Exception as e:
-                    print(f"❌ Erro ao clicar no segundo elemento: {e}")
-        
-        # Screenshot da página final
-        await page.screenshot(path=f"{screenshots_dir}/fixed_06_final_page.png")
-        
-        if not os_found:
-            print("❌ Não conseguiu navegar para página de OS/chamados")
-            return {"error": "Página de OS não alcançada"}
-        
-        # AGORA ADICIONAR O MAPEAMENTO DO BOTÃO "ADICIONAR NOVA OS"
-        print("🎯 ADICIONANDO: Mapeamento do botão 'Adicionar nova OS'...")
-        
-        current_url = page.url
-        print(f"📍 URL da página de OS: {current_url}")
-        
-        # Mapear todos os elementos da página
-        page_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const selectors = ['button', 'a', 'div', 'span', 'input'];
-                
-                selectors.forEach(selector => {
-                    document.querySelectorAll(selector).forEach((el, index) => {
-                        const rect = el.getBoundingClientRect();
-                        const text = el.textContent?.trim() || '';
-                        const visible = rect.width > 0 && rect.height > 0 && el.offsetParent !== null;
-                        
-                        if (visible && text.length > 0) {
-                            elements.push({
-                                tagName: el.tagName.toLowerCase(),
-                                text: text,
-                                classes: el.className || '',
-                                id: el.id || '',
-                                type: el.type || '',
-                                href: el.href || '',
-                                left: rect.left,
-                                top: rect.top,
-                                width: rect.width,
-                                height: rect.height,
-                                focusable: el.getAttribute('focusable') || '',
-                                onclick: el.onclick ? 'true' : 'false'
-                            });
-                        }
-                    });
-                });
-                
-                return elements;
-            }
-        """)
-        
-        print(f"📊 Total de elementos na página: {len(page_elements)}")
-        
-        # Procurar especificamente pelo botão "Adicionar nova OS"
-        adicionar_os_buttons = []
-        for element in page_elements:
-            text_lower = element['text'].lower()
-            if ('adicionar' in text_lower and ('os' in text_lower or 'nova' in text_lower)) or \
-               ('nova' in text_lower and 'os' in text_lower) or \
-               ('criar' in text_lower and 'os' in text_lower) or \
-               ('novo' in text_lower and 'os' in text_lower) or \
-               ('adicionar nova' in text_lower):
-                adicionar_os_buttons.append(element)
-                print(f"🎯 Botão encontrado: '{element['text']}' - {element['tagName']}")
-        
-        print(f"📊 Botões 'Adicionar OS' encontrados: {len(adicionar_os_buttons)}")
-        
-        # Salvar análise completa
-        analysis_data = {
-            'timestamp': datetime.now().isoformat(),
-            'current_url': current_url,
-            'total_elements': len(page_elements),
-            'adicionar_os_buttons': adicionar_os_buttons,
-            'all_buttons': [el for el in page_elements if el['tagName'] == 'button'][:20],
-            'success': os_found and len(adicionar_os_buttons) > 0
-        }
-        
-        with open(f"{screenshots_dir}/fixed_button_analysis.json", "w") as f:
-            json.dump(analysis_data, f, indent=2)
-        
-        result = {
-            'success': os_found,
-            'os_page_reached': os_found,
-            'current_url': current_url,
-            'os_buttons_found': len(adicionar_os_buttons),
-            'total_elements': len(page_elements),
-            'target_buttons': adicionar_os_buttons
-        }
-        
-        print(f"✅ Mapeamento corrigido concluído: {result}")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Erro geral: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/fixed_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(map_os_button_fixed())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', fixed_mapping_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Mapeamento corrigido executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar mapeamento corrigido: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_fixed_mapping)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Mapeamento corrigido do botão "Adicionar nova OS" iniciado',
-            'note': 'Copia EXATAMENTE o código do test-expandable-menu que funciona',
-            'changes': [
-                'Código idêntico ao test-expandable-menu',
-                'Adiciona apenas o mapeamento do botão no final',
-                'Mesma lógica de 3 fases que funciona',
-                'Screenshots fixed_01 até fixed_06'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar mapeamento corrigido: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar mapeamento corrigido: {e}'
-        }), 500
-
-@app.route('/debug-step-by-step', methods=['GET', 'POST'])
-def debug_step_by_step():
-    """Debug passo a passo com logs detalhados para identificar onde trava"""
-    try:
-        def run_step_by_step_debug():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código com logs extremamente detalhados
-                debug_step_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def debug_step_by_step():
-    """Debug passo a passo com logs extremamente detalhados"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Arquivo de log
-    log_file = f"{screenshots_dir}/step_by_step_log.txt"
-    
-    def log_step(step, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_msg = f"[{timestamp}] STEP {step}: {message}"
-        print(log_msg)
-        with open(log_file, "a") as f:
-            f.write(log_msg + "\\n")
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        log_step("01", "Iniciando browser...")
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        log_step("02", "Browser iniciado com sucesso")
-        
-        # STEP 1: Ir para página de login
-        log_step("03", "Navegando para página de login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        log_step("04", "Página de login carregada")
-        
-        # Screenshot login
-        await page.screenshot(path=f"{screenshots_dir}/step_01_login_page.png")
-        log_step("05", "Screenshot da página de login salvo")
-        
-        # STEP 2: Preencher email
-        log_step("06", "Preenchendo email...")
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        log_step("07", "Email preenchido")
-        
-        # STEP 3: Preencher senha
-        log_step("08", "Preenchendo senha...")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        log_step("09", "Senha preenchida")
-        
-        # Screenshot com credenciais
-        await page.screenshot(path=f"{screenshots_dir}/step_02_credentials_filled.png")
-        log_step("10", "Screenshot com credenciais preenchidas")
-        
-        # STEP 4: Clicar no botão de login
-        log_step("11", "Clicando no botão de login...")
-        await page.click('//button[contains(text(), "Log In")]')
-        log_step("12", "Botão de login clicado")
-        
-        # Aguardar processamento
-        await page.wait_for_timeout(5000)
-        log_step("13", "Aguardou 5 segundos após login")
-        
-        # Screenshot após login
-        await page.screenshot(path=f"{screenshots_dir}/step_03_after_login.png")
-        log_step("14", "Screenshot após login salvo")
-        
-        # STEP 5: Verificar se precisa selecionar perfil
-        log_step("15", "Verificando se precisa selecionar perfil Fornecedor...")
-        fornecedor_count = await page.locator('//*[contains(text(), "Fornecedor")]').count()
-        log_step("16", f"Elementos 'Fornecedor' encontrados: {fornecedor_count}")
-        
-        if fornecedor_count > 0:
-            log_step("17", "Perfil Fornecedor encontrado, clicando...")
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            log_step("18", "Clicou no perfil Fornecedor")
-            
-            # Aguardar seleção
-            await page.wait_for_timeout(5000)
-            log_step("19", "Aguardou 5 segundos após seleção de perfil")
-            
-            # Screenshot após seleção de perfil
-            await page.screenshot(path=f"{screenshots_dir}/step_04_profile_selected.png")
-            log_step("20", "Screenshot após seleção de perfil salvo")
-        else:
-            log_step("17", "Perfil Fornecedor não encontrado ou já selecionado")
-        
-        # STEP 6: Screenshot do dashboard
-        await page.screenshot(path=f"{screenshots_dir}/step_05_dashboard.png")
-        log_step("21", "Screenshot do dashboard salvo")
-        
-        # STEP 7: Verificar URL atual
-        current_url = page.url
-        log_step("22", f"URL atual: {current_url}")
-        
-        # STEP 8: Verificar título da página
-        page_title = await page.title()
-        log_step("23", f"Título da página: {page_title}")
-        
-        # STEP 9: Contar elementos visíveis
-        visible_elements = await page.evaluate("""
-            () => {
-                const elements = document.querySelectorAll('*');
-                return Array.from(elements).filter(el => {
-                    const rect = el.getBoundingClientRect();
-                    return rect.width > 0 && rect.height > 0;
-                }).length;
-            }
-        """)
-        log_step("24", f"Elementos visíveis na página: {visible_elements}")
-        
-        # STEP 10: Procurar botões focusable
-        log_step("25", "Procurando botões focusable...")
-        focusable_buttons = await page.locator("button[focusable='true']").count()
-        log_step("26", f"Botões focusable encontrados: {focusable_buttons}")
-        
-        # STEP 11: Procurar primeiro botão
-        log_step("27", "Procurando primeiro botão...")
-        first_button = await page.locator("//button[1]").count()
-        log_step("28", f"Primeiro botão encontrado: {first_button}")
-        
-        # STEP 12: Tentar expandir menu
-        log_step("29", "INICIANDO TENTATIVA DE EXPANDIR MENU...")
-        
-        menu_selectors = [
-            "button[focusable='true']",
-            "//button[@focusable='true']",
-            "//button[1]"
-        ]
-        
-        menu_expanded = False
-        
-        for i, selector in enumerate(menu_selectors):
-            log_step(f"30.{i+1}", f"Tentando seletor: {selector}")
-            
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                log_step(f"31.{i+1}", f"Elementos encontrados com {selector}: {elements}")
-                
-                if elements > 0:
-                    log_step(f"32.{i+1}", f"Clicando com seletor: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    log_step(f"33.{i+1}", f"Clique executado com {selector}")
-                    
-                    # Aguardar
-                    await page.wait_for_timeout(3000)
-                    log_step(f"34.{i+1}", "Aguardou 3 segundos após clique")
-                    
-                    # Screenshot após clique
-                    await page.screenshot(path=f"{screenshots_dir}/step_06_menu_click_{i+1}.png")
-                    log_step(f"35.{i+1}", f"Screenshot após clique {i+1} salvo")
-                    
-                    # Verificar se menu expandiu
-                    new_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    log_step(f"36.{i+1}", f"Elementos após clique: {new_elements}")
-                    
-                    if new_elements > 15:
-                        log_step(f"37.{i+1}", "Menu parece ter expandido!")
-                        menu_expanded = True
-                        break
-                    else:
-                        log_step(f"37.{i+1}", "Menu não expandiu, tentando próximo seletor")
-                        
-                else:
-                    log_step(f"32.{i+1}", f"Nenhum elemento encontrado com {selector}")
-                    
-            except Exception as e:
-                log_step(f"ERROR.{i+1}", f"Erro com {selector}: {str(e)}")
-                continue
-        
-        log_step("38", f"Resultado da expansão do menu: {menu_expanded}")
-        
-        # STEP 13: Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/step_07_final_debug.png")
-        log_step("39", "Screenshot final do debug salvo")
-        
-        # STEP 14: Salvar resultado
-        result = {
-            'menu_expanded': menu_expanded,
-            'current_url': current_url,
-            'page_title': page_title,
-            'visible_elements': visible_elements,
-            'focusable_buttons': focusable_buttons,
-            'first_button': first_button,
-            'fornecedor_count': fornecedor_count,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        with open(f"{screenshots_dir}/debug_result.json", "w") as f:
-            json.dump(result, f, indent=2)
-        
-        log_step("40", "Resultado salvo em debug_result.json")
-        log_step("41", "DEBUG CONCLUÍDO")
-        
-        return result
-        
-    except Exception as e:
-        log_step("ERROR", f"Erro geral: {str(e)}")
-        await page.screenshot(path=f"{screenshots_dir}/step_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-        log_step("42", "Browser fechado")
-
-if __name__ == "__main__":
-    result = asyncio.run(debug_step_by_step())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', debug_step_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Debug step-by-step executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar debug step-by-step: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_step_by_step_debug)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Debug step-by-step iniciado',
-            'note': 'Logs extremamente detalhados para identificar onde trava',
-            'outputs': [
-                'step_by_step_log.txt - Log detalhado de cada passo',
-                'step_01_login_page.png - Página de login',
-                'step_02_credentials_filled.png - Credenciais preenchidas',
-                'step_03_after_login.png - Após login',
-                'step_04_profile_selected.png - Perfil selecionado',
-                'step_05_dashboard.png - Dashboard',
-                'step_06_menu_click_X.png - Tentativas de clique no menu',
-                'step_07_final_debug.png - Estado final',
-                'debug_result.json - Resultado completo'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar debug step-by-step: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar debug step-by-step: {e}'
-        }), 500
-
-@app.route('/analyze-dashboard-elements', methods=['GET', 'POST'])
-def analyze_dashboard_elements():
-    """Analisa especificamente os elementos do dashboard para encontrar o botão do menu"""
-    try:
-        def run_dashboard_analysis():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código para análise completa do dashboard
-                dashboard_analysis_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def analyze_dashboard():
-    """Analisa especificamente os elementos do dashboard"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🔍 Analisando elementos do dashboard...")
-        
-        # Fazer login
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Screenshot do dashboard
-        await page.screenshot(path=f"{screenshots_dir}/dashboard_01_initial.png")
-        
-        print("✅ Login realizado, analisando dashboard...")
-        
-        # ANÁLISE COMPLETA DO DASHBOARD
-        dashboard_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const allElements = document.querySelectorAll('*');
-                
-                allElements.forEach((el, index) => {
-                    const rect = el.getBoundingClientRect();
-                    const text = el.textContent?.trim() || '';
-                    const visible = rect.width > 0 && rect.height > 0 && el.offsetParent !== null;
-                    
-                    if (visible) {
-                        elements.push({
-                            index: index,
-                            tagName: el.tagName.toLowerCase(),
-                            text: text.substring(0, 100), // Limitar texto
-                            classes: el.className || '',
-                            id: el.id || '',
-                            left: rect.left,
-                            top: rect.top,
-                            width: rect.width,
-                            height: rect.height,
-                            focusable: el.getAttribute('focusable') || '',
-                            ariaLabel: el.getAttribute('aria-label') || '',
-                            role: el.getAttribute('role') || '',
-                            onclick: el.onclick ? 'true' : 'false',
-                            type: el.type || '',
-                            href: el.href || ''
-                        });
-                    }
-                });
-                
-                return elements;
-            }
-        """)
-        
-        print(f"📊 Total de elementos encontrados: {len(dashboard_elements)}")
-        
-        # Filtrar apenas botões
-        buttons = [el for el in dashboard_elements if el['tagName'] == 'button']
-        print(f"🔘 Botões encontrados: {len(buttons)}")
-        
-        # Filtrar botões do menu lateral (posição esquerda)
-        left_buttons = [btn for btn in buttons if btn['left'] < 200]
-        print(f"⬅️ Botões do lado esquerdo: {len(left_buttons)}")
-        
-        # Filtrar botões focusable
-        focusable_buttons = [btn for btn in buttons if btn['focusable'] == 'true']
-        print(f"🎯 Botões focusable: {len(focusable_buttons)}")
-        
-        # Procurar por elementos que podem ser menu
-        menu_candidates = []
-        for el in dashboard_elements:
-            text_lower = el['text'].lower()
-            classes_lower = el['classes'].lower()
-            
-            # Critérios para ser candidato a menu
-            is_menu_candidate = (
-                el['tagName'] == 'button' and
-                el['left'] < 200 and
-                el['width'] > 20 and
-                el['height'] > 20 and
-                (
-                    'menu' in classes_lower or
-                    'hamburger' in classes_lower or
-                    'toggle' in classes_lower or
-                    el['focusable'] == 'true' or
-                    'sidebar' in classes_lower or
-                    'nav' in classes_lower or
-                    len(el['text']) < 10  # Botões de menu geralmente têm pouco texto
-                )
-            )
-            
-            if is_menu_candidate:
-                menu_candidates.append(el)
-                print(f"🎯 Candidato a menu: {el['text'][:50]} | Classes: {el['classes'][:50]}")
-        
-        print(f"📋 Candidatos a menu encontrados: {len(menu_candidates)}")
-        
-        # Ordenar candidatos por posição (mais ao topo primeiro)
-        menu_candidates.sort(key=lambda x: x['top'])
-        
-        # Testar cada candidato
-        successful_clicks = []
-        
-        for i, candidate in enumerate(menu_candidates[:5]):  # Testar apenas os 5 primeiros
-            print(f"🔍 Testando candidato {i+1}: {candidate['text'][:30]}")
-            
-            try:
-                # Tentar clicar usando diferentes métodos
-                click_methods = [
-                    f"button:nth-child({candidate['index'] + 1})",
-                    f"button[focusable='true']:nth-child({i+1})" if candidate['focusable'] == 'true' else None,
-                    f"text='{candidate['text'][:20]}'" if candidate['text'] else None
-                ]
-                
-                for method in click_methods:
-                    if method is None:
-                        continue
-                        
-                    try:
-                        print(f"   🎯 Tentando método: {method}")
-                        
-                        # Contar elementos antes do clique
-                        elements_before = await page.evaluate("""
-                            () => {
-                                return document.querySelectorAll('a, button, [role="button"]').length;
-                            }
-                        """)
-                        
-                        # Fazer o clique
-                        await page.click(method)
-                        await page.wait_for_timeout(2000)
-                        
-                        # Contar elementos após o clique
-                        elements_after = await page.evaluate("""
-                            () => {
-                                return document.querySelectorAll('a, button, [role="button"]').length;
-                            }
-                        """)
-                        
-                        # Screenshot após clique
-                        await page.screenshot(path=f"{screenshots_dir}/dashboard_02_click_{i+1}.png")
-                        
-                        # Verificar se expandiu (mais elementos apareceram)
-                        if elements_after > elements_before:
-                            print(f"   ✅ SUCESSO! Elementos: {elements_before} → {elements_after}")
-                            successful_clicks.append({
-                                'candidate': candidate,
-                                'method': method,
-                                'elements_before': elements_before,
-                                'elements_after': elements_after,
-                                'screenshot': f"dashboard_02_click_{i+1}.png"
-                            })
-                            
-                            # Procurar por "Gerenciar chamados" agora
-                            chamados_found = await page.locator("//*[contains(text(), 'Gerenciar chamados')]").count()
-                            print(f"   🔍 'Gerenciar chamados' encontrado: {chamados_found}")
-                            
-                            if chamados_found > 0:
-                                print("   🎯 Tentando clicar em 'Gerenciar chamados'...")
-                                await page.click("//*[contains(text(), 'Gerenciar chamados')]")
-                                await page.wait_for_timeout(3000)
-                                
-                                # Screenshot após clicar em Gerenciar chamados
-                                await page.screenshot(path=f"{screenshots_dir}/dashboard_03_gerenciar_clicked.png")
-                                
-                                # Verificar URL
-                                current_url = page.url
-                                print(f"   📍 URL após clique: {current_url}")
-                                
-                                # Se chegou na página de OS, parar
-                                if 'os' in current_url.lower() or 'chamados' in current_url.lower():
-                                    print("   🎉 CHEGOU NA PÁGINA DE OS!")
-                                    successful_clicks[-1]['reached_os_page'] = True
-                                    successful_clicks[-1]['os_url'] = current_url
-                                    break
-                            
-                            break
-                        else:
-                            print(f"   ❌ Menu não expandiu. Elementos: {elements_before} → {elements_after}")
-                            
-                    except Exception as e:
-                        print(f"   ❌ Erro com método {method}: {str(e)}")
-                        continue
-                
-                # Se chegou na página de OS, parar de testar outros candidatos
-                if successful_clicks and successful_clicks[-1].get('reached_os_page'):
-                    break
-                    
-            except Exception as e:
-                print(f"❌ Erro ao testar candidato {i+1}: {str(e)}")
-                continue
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/dashboard_04_final.png")
-        
-        # Salvar análise completa
-        analysis_data = {
-            'timestamp': datetime.now().isoformat(),
-            'total_elements': len(dashboard_elements),
-            'total_buttons': len(buttons),
-            'left_buttons': len(left_buttons),
-            'focusable_buttons': len(focusable_buttons),
-            'menu_candidates': menu_candidates,
-            'successful_clicks': successful_clicks,
-            'reached_os_page': any(click.get('reached_os_page') for click in successful_clicks),
-            'current_url': page.url
-        }
-        
-        with open(f"{screenshots_dir}/dashboard_analysis.json", "w") as f:
-            json.dump(analysis_data, f, indent=2)
-        
-        result = {
-            'success': True,
-            'total_elements': len(dashboard_elements),
-            'menu_candidates': len(menu_candidates),
-            'successful_clicks': len(successful_clicks),
-            'reached_os_page': any(click.get('reached_os_page') for click in successful_clicks),
-            'current_url': page.url
-        }
-        
-        print(f"✅ Análise concluída: {result}")
-        return result
-        
-    except Exception as e:
-        print(f"❌ Erro geral: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/dashboard_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(analyze_dashboard())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', dashboard_analysis_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Análise do dashboard executada - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar análise do dashboard: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_dashboard_analysis)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Análise do dashboard iniciada',
-            'note': 'Análise completa dos elementos do dashboard para encontrar o botão correto do menu',
-            'objectives': [
-                '1. Mapear todos os elementos do dashboard',
-                '2. Identificar candidatos a botão de menu',
-                '3. Testar cada candidato sistematicamente',
-                '4. Verificar se menu expande após clique',
-                '5. Procurar por "Gerenciar chamados"',
-                '6. Tentar navegar para página de OS'
-            ],
-            'outputs': [
-                'dashboard_01_initial.png - Dashboard inicial',
-                'dashboard_02_click_X.png - Resultado de cada clique',
-                'dashboard_03_gerenciar_clicked.png - Após clicar em Gerenciar',
-                'dashboard_04_final.png - Estado final',
-                'dashboard_analysis.json - Análise completa'
-            ]
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar análise do dashboard: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar análise do dashboard: {e}'
-        }), 500
-
-@app.route('/realtime-analysis', methods=['GET', 'POST'])
-def realtime_analysis():
-    """Endpoint com visualização em tempo real - logs e imagens"""
-    try:
-        # Retornar página HTML com visualização em tempo real
-        html_content = '''
-<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Análise em Tempo Real - EACE</title>
-    <style>
-        body {
-            font-family: 'Courier New', monospace;
-            margin: 0;
-            padding: 20px;
-            background: #1a1a1a;
-            color: #00ff00;
-            min-height: 100vh;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            padding: 20px;
-            background: #2a2a2a;
-            border-radius: 10px;
-            border: 2px solid #00ff00;
-        }
-        .controls {
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            margin-bottom: 30px;
-        }
-        .btn {
-            padding: 10px 20px;
-            background: #00ff00;
-            color: #1a1a1a;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-weight: bold;
-        }
-        .btn:hover {
-            background: #00cc00;
-        }
-        .btn:disabled {
-            background: #666;
-            cursor: not-allowed;
-        }
-        .content {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            height: 70vh;
-        }
-        .logs-panel {
-            background: #2a2a2a;
-            border: 2px solid #00ff00;
-            border-radius: 10px;
-            padding: 20px;
-            overflow-y: auto;
-        }
-        .images-panel {
-            background: #2a2a2a;
-            border: 2px solid #00ff00;
-            border-radius: 10px;
-            padding: 20px;
-            overflow-y: auto;
-        }
-        .log-entry {
-            margin-bottom: 10px;
-            padding: 5px;
-            border-left: 3px solid #00ff00;
-            padding-left: 10px;
-        }
-        .log-timestamp {
-            color: #ffff00;
-            font-weight: bold;
-        }
-        .log-step {
-            color: #00ffff;
-            font-weight: bold;
-        }
-        .log-message {
-            color: #00ff00;
-        }
-        .screenshot-item {
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        .screenshot-item img {
-            max-width: 100%;
-            height: auto;
-            border: 2px solid #00ff00;
-            border-radius: 5px;
-        }
-        .screenshot-item .caption {
-            margin-top: 10px;
-            color: #ffff00;
-            font-weight: bold;
-        }
-        .status-indicator {
-            display: inline-block;
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 10px;
-        }
-        .status-running { background: #ffff00; }
-        .status-success { background: #00ff00; }
-        .status-error { background: #ff0000; }
-        .status-idle { background: #666; }
-        .progress-bar {
-            width: 100%;
-            height: 20px;
-            background: #2a2a2a;
-            border: 1px solid #00ff00;
-            border-radius: 10px;
-            overflow: hidden;
-            margin: 20px 0;
-        }
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #00ff00, #00cc00);
-            width: 0%;
-            transition: width 0.3s ease;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 Análise em Tempo Real - EACE</h1>
-            <p>Visualização completa dos logs e screenshots da automação</p>
-            <div class="progress-bar">
-                <div class="progress-fill" id="progress"></div>
-            </div>
-        </div>
-        
-        <div class="controls">
-            <button class="btn" id="startBtn" onclick="startAnalysis()">
-                <span class="status-indicator status-idle"></span>
-                Iniciar Análise
-            </button>
-            <button class="btn" id="clearBtn" onclick="clearLogs()">
-                Limpar Logs
-            </button>
-            <button class="btn" id="refreshBtn" onclick="refreshImages()">
-                Atualizar Imagens
-            </button>
-        </div>
-        
-        <div class="content">
-            <div class="logs-panel">
-                <h2>📋 Logs em Tempo Real</h2>
-                <div id="logs-container"></div>
-            </div>
-            
-            <div class="images-panel">
-                <h2>📸 Screenshots</h2>
-                <div id="images-container"></div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let analysisRunning = false;
-        let logInterval;
-        let imageInterval;
-        let currentStep = 0;
-        let totalSteps = 10;
-        
-        function updateStatus(status, message) {
-            const btn = document.getElementById('startBtn');
-            const indicator = btn.querySelector('.status-indicator');
-            
-            indicator.className = `status-indicator status-${status}`;
-            btn.innerHTML = `<span class="status-indicator status-${status}"></span>${message}`;
-        }
-        
-        function updateProgress(step) {
-            const progress = document.getElementById('progress');
-            const percentage = (step / totalSteps) * 100;
-            progress.style.width = percentage + '%';
-        }
-        
-        function addLog(timestamp, step, message) {
-            const container = document.getElementById('logs-container');
-            const logEntry = document.createElement('div');
-            logEntry.className = 'log-entry';
-            logEntry.innerHTML = `
-                <span class="log-timestamp">[${timestamp}]</span>
-                <span class="log-step">STEP ${step}:</span>
-                <span class="log-message">${message}</span>
-            `;
-            container.appendChild(logEntry);
-            container.scrollTop = container.scrollHeight;
-        }
-        
-        function addImage(filename, caption) {
-            const container = document.getElementById('images-container');
-            const imageItem = document.createElement('div');
-            imageItem.className = 'screenshot-item';
-            imageItem.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" loading="lazy">
-                <div class="caption">${caption}</div>
-            `;
-            container.appendChild(imageItem);
-            container.scrollTop = container.scrollHeight;
-        }
-        
-        function clearLogs() {
-            document.getElementById('logs-container').innerHTML = '';
-            document.getElementById('images-container').innerHTML = '';
-            updateProgress(0);
-        }
-        
-        function refreshImages() {
-            fetch('/screenshots')
-                .then(response => response.json())
-                .then(data => {
-                    const container = document.getElementById('images-container');
-                    container.innerHTML = '<h2>📸 Screenshots</h2>';
-                    
-                    data.screenshots.forEach(screenshot => {
-                        addImage(screenshot.filename, screenshot.description || screenshot.filename);
-                    });
-                })
-                .catch(error => console.error('Erro ao carregar screenshots:', error));
-        }
-        
-        function startAnalysis() {
-            if (analysisRunning) return;
-            
-            analysisRunning = true;
-            updateStatus('running', 'Executando Análise...');
-            clearLogs();
-            
-            // Iniciar análise no servidor
-            fetch('/execute-working-analysis', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    realtime: true
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.status === 'success') {
-                    updateStatus('success', 'Análise Iniciada');
-                    startMonitoring();
-                } else {
-                    updateStatus('error', 'Erro ao Iniciar');
-                    analysisRunning = false;
-                }
-            })
-            .catch(error => {
-                updateStatus('error', 'Erro de Conexão');
-                analysisRunning = false;
-            });
-        }
-        
-        function startMonitoring() {
-            let step = 0;
-            const steps = [
-                'Iniciando navegador...',
-                'Navegando para página de login...',
-                'Preenchendo credenciais...',
-                'Realizando login...',
-                'Selecionando perfil Fornecedor...',
-                'Analisando dashboard...',
-                'Tentando expandir menu...',
-                'Procurando Gerenciar chamados...',
-                'Navegando para página de OS...',
-                'Análise concluída!'
-            ];
-            
-            const monitoringInterval = setInterval(() => {
-                if (step < steps.length) {
-                    const timestamp = new Date().toLocaleTimeString();
-                    addLog(timestamp, step + 1, steps[step]);
-                    updateProgress(step + 1);
-                    step++;
-                } else {
-                    clearInterval(monitoringInterval);
-                    updateStatus('success', 'Análise Concluída');
-                    analysisRunning = false;
-                    refreshImages();
-                }
-            }, 3000);
-        }
-        
-        // Atualizar imagens periodicamente
-        setInterval(refreshImages, 10000);
-        
-        // Carregar imagens iniciais
-        refreshImages();
-    </script>
-</body>
-</html>
-        '''
-        
-        return html_content
-        
-    except Exception as e:
-        logger.error(f"Erro no endpoint realtime-analysis: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro no endpoint realtime-analysis: {e}'
-        }), 500
-
-@app.route('/execute-working-analysis', methods=['POST'])
-def execute_working_analysis():
-    """Executa a análise usando o código que funciona (baseado em map-os-button-fixed)"""
-    try:
-        def run_working_analysis():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Usar o código que FUNCIONA do map-os-button-fixed
-                working_analysis_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def working_analysis():
-    """Análise usando o código que funciona - baseado no map-os-button-fixed"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("realtime_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Executando análise com código que funciona...")
-        
-        # STEP 1: Login
-        print("🔐 Fazendo login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # STEP 2: Selecionar perfil
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/realtime_01_dashboard.png")
-        print("✅ Login realizado, dashboard capturado")
-        
-        # STEP 3: Expandir menu (usando lógica que funciona)
-        print("🔍 Expandindo menu...")
-        
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        menu_expanded = False
-        
-        for selector in menu_toggle_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"📍 Tentando expandir menu com: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/realtime_02_menu_expanded.png")
-                    
-                    # Verificar se "Gerenciar chamados" apareceu
-                    chamados_count = await page.locator("//*[contains(text(), 'Gerenciar chamados')]").count()
-                    print(f"🔍 'Gerenciar chamados' encontrado: {chamados_count}")
-                    
-                    if chamados_count > 0:
-                        print("✅ Menu expandido com sucesso!")
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro com seletor {selector}: {e}")
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não foi possível expandir o menu")
-            return {"success": False, "error": "Menu não expandiu"}
-        
-        # STEP 4: Clicar em "Gerenciar chamados"
-        print("🎯 Clicando em 'Gerenciar chamados'...")
-        await page.click("//*[contains(text(), 'Gerenciar chamados')]")
-        await page.wait_for_timeout(3000)
-        
-        await page.screenshot(path=f"{screenshots_dir}/realtime_03_gerenciar_clicked.png")
-        print("✅ Clicou em 'Gerenciar chamados'")
-        
-        # STEP 5: Verificar se chegou na página de OS
-        current_url = page.url
-        print(f"📍 URL atual: {current_url}")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/realtime_04_final.png")
-        
-        # Verificar se é a página de OS
-        if "os" in current_url.lower() or "chamados" in current_url.lower():
-            print("🎉 SUCESSO! Chegou na página de OS!")
-            return {"success": True, "url": current_url}
-        else:
-            print("❌ Não chegou na página de OS")
-            return {"success": False, "error": "Não chegou na página de OS"}
-        
-    except Exception as e:
-        print(f"❌ Erro: {e}")
-        return {"success": False, "error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(working_analysis())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', working_analysis_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Análise executada - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar análise: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_working_analysis)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Análise iniciada com código que funciona'
-        })
-        
-    except Exception as e:
-        logger.error(f"Erro ao iniciar análise: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro ao iniciar análise: {e}'
-        }), 500
-
-@app.route('/visual-step-by-step', methods=['GET'])
-def visual_step_by_step():
-    """Endpoint com visualização detalhada do passo a passo incluindo análise da página de OS"""
-    try:
-        # Retornar página HTML com visualização detalhada
+        # Retornar página HTML com visualização em tempo real
         html_content = '''
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Passo a Passo Visual - EACE</title>
+    <title>Análise em Tempo Real - EACE</title>
     <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
         body {
             font-family: 'Courier New', monospace;
-            background: #0d1117;
-            color: #c9d1d9;
+            margin: 0;
+            padding: 20px;
+            background: #1a1a1a;
+            color: #00ff00;
             min-height: 100vh;
-            overflow-x: hidden;
         }
-        
         .container {
-            max-width: 1600px;
+            max-width: 1400px;
             margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            padding: 20px;
-            background: linear-gradient(135deg, #1f2937, #374151);
-            border-radius: 15px;
-            border: 2px solid #10b981;
-            box-shadow: 0 0 20px rgba(16, 185, 129, 0.3);
-        }
-        
-        .header h1 {
-            color: #10b981;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            text-shadow: 0 0 10px rgba(16, 185, 129, 0.5);
-        }
-        
-        .controls {
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            margin-bottom: 30px;
-            flex-wrap: wrap;
-        }
-        
-        .btn {
-            padding: 12px 24px;
-            background: linear-gradient(135deg, #10b981, #059669);
-            color: white;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            min-width: 140px;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(16, 185, 129, 0.4);
-        }
-        
-        .btn:disabled {
-            background: #6b7280;
-            cursor: not-allowed;
-            transform: none;
-        }
-        
-        .status-panel {
-            background: #1f2937;
-            border: 2px solid #10b981;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 30px;
         }
-        
-        .status-item {
-            display: flex;
-            align-items: center;
-            margin-bottom: 15px;
-            padding: 10px;
-            background: #374151;
-            border-radius: 8px;
-            border-left: 4px solid #10b981;
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            padding: 20px;
+            background: #2a2a2a;
+            border-radius: 10px;
+            border: 2px solid #00ff00;
         }
-        
-        .status-icon {
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            margin-right: 15px;
+        .controls {
             display: flex;
-            align-items: center;
+            gap: 20px;
             justify-content: center;
-            font-weight: bold;
-            color: white;
-        }
-        
-        .status-waiting { background: #6b7280; }
-        .status-running { background: #f59e0b; }
-        .status-success { background: #10b981; }
-        .status-error { background: #ef4444; }
-        
-        .progress-container {
-            margin: 20px 0;
+            margin-bottom: 30px;
         }
-        
-        .progress-bar {
-            width: 100%;
-            height: 25px;
-            background: #374151;
-            border-radius: 15px;
-            overflow: hidden;
-            border: 2px solid #10b981;
+        .btn {
+            padding: 10px 20px;
+            background: #00ff00;
+            color: #1a1a1a;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-weight: bold;
         }
-        
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #10b981, #059669);
-            width: 0%;
-            transition: width 0.5s ease;
-            position: relative;
+        .btn:hover {
+            background: #00cc00;
         }
-        
-        .progress-text {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            color: white;
-            font-weight: bold;
-            font-size: 14px;
+        .btn:disabled {
+            background: #666;
+            cursor: not-allowed;
         }
-        
-        .main-content {
+        .content {
             display: grid;
             grid-template-columns: 1fr 1fr;
-            gap: 30px;
+            gap: 20px;
             height: 70vh;
         }
-        
-        .panel {
-            background: #1f2937;
-            border: 2px solid #10b981;
-            border-radius: 15px;
+        .logs-panel {
+            background: #2a2a2a;
+            border: 2px solid #00ff00;
+            border-radius: 10px;
             padding: 20px;
             overflow-y: auto;
         }
-        
-        .panel h2 {
-            color: #10b981;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-            text-align: center;
+        .images-panel {
+            background: #2a2a2a;
+            border: 2px solid #00ff00;
+            border-radius: 10px;
+            padding: 20px;
+            overflow-y: auto;
         }
-        
         .log-entry {
-            margin-bottom: 15px;
-            padding: 12px;
-            background: #374151;
-            border-radius: 8px;
-            border-left: 4px solid #10b981;
-            animation: fadeIn 0.3s ease;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
+            margin-bottom: 10px;
+            padding: 5px;
+            border-left: 3px solid #00ff00;
+            padding-left: 10px;
         }
-        
         .log-timestamp {
-            color: #fbbf24;
+            color: #ffff00;
             font-weight: bold;
-            font-size: 0.9em;
         }
-        
         .log-step {
-            color: #60a5fa;
+            color: #00ffff;
             font-weight: bold;
-            margin: 0 10px;
         }
-        
         .log-message {
-            color: #c9d1d9;
-        }
-        
-        .log-success {
-            border-left-color: #10b981;
-            background: rgba(16, 185, 129, 0.1);
-        }
-        
-        .log-error {
-            border-left-color: #ef4444;
-            background: rgba(239, 68, 68, 0.1);
-        }
-        
-        .log-warning {
-            border-left-color: #f59e0b;
-            background: rgba(245, 158, 11, 0.1);
+            color: #00ff00;
         }
-        
-        .screenshot-container {
-            margin-bottom: 25px;
+        .screenshot-item {
+            margin-bottom: 20px;
             text-align: center;
         }
-        
-        .screenshot-container img {
+        .screenshot-item img {
             max-width: 100%;
             height: auto;
-            border: 3px solid #10b981;
-            border-radius: 10px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-            transition: transform 0.3s ease;
-        }
-        
-        .screenshot-container img:hover {
-            transform: scale(1.05);
+            border: 2px solid #00ff00;
+            border-radius: 5px;
         }
-        
-        .screenshot-caption {
+        .screenshot-item .caption {
             margin-top: 10px;
-            color: #fbbf24;
+            color: #ffff00;
             font-weight: bold;
-            font-size: 0.9em;
-        }
-        
-        .step-indicator {
-            display: flex;
-            justify-content: center;
-            margin: 20px 0;
-            flex-wrap: wrap;
-            gap: 10px;
         }
-        
-        .step-dot {
-            width: 40px;
-            height: 40px;
+        .status-indicator {
+            display: inline-block;
+            width: 12px;
+            height: 12px;
             border-radius: 50%;
-            background: #374151;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-            border: 2px solid #6b7280;
-        }
-        
-        .step-dot.active {
-            background: #10b981;
-            border-color: #10b981;
-            box-shadow: 0 0 15px rgba(16, 185, 129, 0.5);
-        }
-        
-        .step-dot.completed {
-            background: #059669;
-            border-color: #059669;
-        }
-        
-        .analysis-section {
-            margin-top: 30px;
-            padding: 20px;
-            background: #1f2937;
-            border: 2px solid #10b981;
-            border-radius: 15px;
-        }
-        
-        .analysis-title {
-            color: #10b981;
-            font-size: 1.3em;
-            margin-bottom: 15px;
-            text-align: center;
-        }
-        
-        .analysis-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-        }
-        
-        .analysis-item {
-            background: #374151;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #10b981;
+            margin-right: 10px;
         }
-        
-        .analysis-item h4 {
-            color: #fbbf24;
-            margin-bottom: 10px;
+        .status-running { background: #ffff00; }
+        .status-success { background: #00ff00; }
+        .status-error { background: #ff0000; }
+        .status-idle { background: #666; }
+        .progress-bar {
+            width: 100%;
+            height: 20px;
+            background: #2a2a2a;
+            border: 1px solid #00ff00;
+            border-radius: 10px;
+            overflow: hidden;
+            margin: 20px 0;
         }
-        
-        .analysis-item p {
-            color: #c9d1d9;
-            font-size: 0.9em;
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #00ff00, #00cc00);
+            width: 0%;
+            transition: width 0.3s ease;
         }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🔍 Passo a Passo Visual - EACE</h1>
-            <p>Análise detalhada da automação até a página de Controle de OS</p>
+            <h1>🤖 Análise em Tempo Real - EACE</h1>
+            <p>Visualização completa dos logs e screenshots da automação</p>
+            <div class="progress-bar">
+                <div class="progress-fill" id="progress"></div>
+            </div>
         </div>
         
         <div class="controls">
-            <button class="btn" id="startBtn" onclick="startDetailedAnalysis()">
-                🚀 Iniciar Análise Detalhada
+            <button class="btn" id="startBtn" onclick="startAnalysis()">
+                <span class="status-indicator status-idle"></span>
+                Iniciar Análise
             </button>
-            <button class="btn" onclick="clearAll()">
-                🧹 Limpar Tudo
+            <button class="btn" id="clearBtn" onclick="clearLogs()">
+                Limpar Logs
             </button>
-            <button class="btn" onclick="refreshData()">
-                🔄 Atualizar Dados
+            <button class="btn" id="refreshBtn" onclick="refreshImages()">
+                Atualizar Imagens
             </button>
         </div>
         
-        <div class="status-panel">
-            <div class="progress-container">
-                <div class="progress-bar">
-                    <div class="progress-fill" id="progressFill">
-                        <div class="progress-text" id="progressText">0%</div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="step-indicator" id="stepIndicator">
-                <div class="step-dot">1</div>
-                <div class="step-dot">2</div>
-                <div class="step-dot">3</div>
-                <div class="step-dot">4</div>
-                <div class="step-dot">5</div>
-                <div class="step-dot">6</div>
-                <div class="step-dot">7</div>
-                <div class="step-dot">8</div>
-            </div>
-        </div>
-        
-        <div class="main-content">
-            <div class="panel">
-                <h2>📋 Logs Detalhados</h2>
-                <div id="logsContainer"></div>
+        <div class="content">
+            <div class="logs-panel">
+                <h2>📋 Logs em Tempo Real</h2>
+                <div id="logs-container"></div>
             </div>
             
-            <div class="panel">
-                <h2>📸 Screenshots em Tempo Real</h2>
-                <div id="screenshotsContainer"></div>
-            </div>
-        </div>
-        
-        <div class="analysis-section">
-            <h3 class="analysis-title">🔬 Análise da Página de Controle de OS</h3>
-            <div class="analysis-grid" id="analysisGrid">
-                <!-- Análise será preenchida dinamicamente -->
+            <div class="images-panel">
+                <h2>📸 Screenshots</h2>
+                <div id="images-container"></div>
             </div>
         </div>
     </div>
 
     <script>
-        let currentStep = 0;
-        let totalSteps = 8;
         let analysisRunning = false;
+        let logInterval;
+        let imageInterval;
+        let currentStep = 0;
+        let totalSteps = 10;
         
-        const steps = [
-            { name: "Navegação para Login", desc: "Acessando página de login do EACE" },
-            { name: "Preenchimento de Credenciais", desc: "Inserindo email e senha" },
-            { name: "Autenticação", desc: "Realizando login no sistema" },
-            { name: "Seleção de Perfil", desc: "Escolhendo perfil Fornecedor" },
-            { name: "Dashboard", desc: "Analisando painel principal" },
-            { name: "Expansão do Menu", desc: "Abrindo menu lateral" },
-            { name: "Navegação para OS", desc: "Acessando Controle de OS" },
-            { name: "Análise da Página OS", desc: "Mapeando elementos da página" }
-        ];
+        function updateStatus(status, message) {
+            const btn = document.getElementById('startBtn');
+            const indicator = btn.querySelector('.status-indicator');
+            
+            indicator.className = `status-indicator status-${status}`;
+            btn.innerHTML = `<span class="status-indicator status-${status}"></span>${message}`;
+        }
         
         function updateProgress(step) {
+            const progress = document.getElementById('progress');
             const percentage = (step / totalSteps) * 100;
-            const progressFill = document.getElementById('progressFill');
-            const progressText = document.getElementById('progressText');
-            
-            progressFill.style.width = percentage + '%';
-            progressText.textContent = Math.round(percentage) + '%';
-            
-            // Atualizar indicadores de step
-            const stepDots = document.querySelectorAll('.step-dot');
-            stepDots.forEach((dot, index) => {
-                dot.className = 'step-dot';
-                if (index < step) {
-                    dot.classList.add('completed');
-                } else if (index === step) {
-                    dot.classList.add('active');
-                }
-            });
+            progress.style.width = percentage + '%';
         }
         
-        function addLog(step, message, type = 'info') {
-            const container = document.getElementById('logsContainer');
+        function addLog(timestamp, step, message) {
+            const container = document.getElementById('logs-container');
             const logEntry = document.createElement('div');
-            logEntry.className = `log-entry log-${type}`;
-            
-            const timestamp = new Date().toLocaleTimeString();
+            logEntry.className = 'log-entry';
             logEntry.innerHTML = `
                 <span class="log-timestamp">[${timestamp}]</span>
                 <span class="log-step">STEP ${step}:</span>
                 <span class="log-message">${message}</span>
             `;
-            
             container.appendChild(logEntry);
             container.scrollTop = container.scrollHeight;
         }
         
-        function addScreenshot(filename, caption) {
-            const container = document.getElementById('screenshotsContainer');
-            const screenshotDiv = document.createElement('div');
-            screenshotDiv.className = 'screenshot-container';
-            
-            screenshotDiv.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" loading="lazy">
-                <div class="screenshot-caption">${caption}</div>
+        function addImage(filename, caption) {
+            const container = document.getElementById('images-container');
+            const imageItem = document.createElement('div');
+            imageItem.className = 'screenshot-item';
+            imageItem.innerHTML = `
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" loading="lazy"></a>
+                <div class="caption">${caption}</div>
             `;
-            
-            container.appendChild(screenshotDiv);
+            container.appendChild(imageItem);
             container.scrollTop = container.scrollHeight;
         }
         
-        function addAnalysis(title, content) {
-            const analysisGrid = document.getElementById('analysisGrid');
-            const analysisItem = document.createElement('div');
-            analysisItem.className = 'analysis-item';
-            
-            analysisItem.innerHTML = `
-                <h4>${title}</h4>
-                <p>${content}</p>
-            `;
-            
-            analysisGrid.appendChild(analysisItem);
-        }
-        
-        function clearAll() {
-            document.getElementById('logsContainer').innerHTML = '';
-            document.getElementById('screenshotsContainer').innerHTML = '';
-            document.getElementById('analysisGrid').innerHTML = '';
+        function clearLogs() {
+            document.getElementById('logs-container').innerHTML = '';
+            document.getElementById('images-container').innerHTML = '';
             updateProgress(0);
-            currentStep = 0;
         }
         
-        function refreshData() {
+        function refreshImages() {
             fetch('/screenshots')
                 .then(response => response.json())
                 .then(data => {
-                    const container = document.getElementById('screenshotsContainer');
-                    container.innerHTML = '';
+                    const container = document.getElementById('images-container');
+                    container.innerHTML = '<h2>📸 Screenshots</h2>';
                     
                     data.screenshots.forEach(screenshot => {
-                        addScreenshot(screenshot.filename, screenshot.description || screenshot.filename);
+                        addImage(screenshot.filename, screenshot.description || screenshot.filename);
                     });
                 })
                 .catch(error => console.error('Erro ao carregar screenshots:', error));
         }
         
-        function startDetailedAnalysis() {
+        function startAnalysis() {
             if (analysisRunning) return;
             
             analysisRunning = true;
-            document.getElementById('startBtn').disabled = true;
-            clearAll();
+            updateStatus('running', 'Executando Análise...');
+            clearLogs();
             
             // Iniciar análise no servidor
-            fetch('/execute-detailed-analysis', {
+            fetch('/execute-working-analysis', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 },
                 body: JSON.stringify({
-                    detailed: true,
-                    analyze_os_page: true
+                    realtime: true
                 })
             })
             .then(response => response.json())
             .then(data => {
-                if (data.status === 'success') {
-                    startStepByStepMonitoring();
+                if (data.success) {
+                    updateStatus('running', 'Análise Iniciada');
+                    startMonitoring(data.job_id);
                 } else {
-                    addLog(0, 'Erro ao iniciar análise: ' + data.message, 'error');
+                    updateStatus('error', 'Erro ao Iniciar');
                     analysisRunning = false;
-                    document.getElementById('startBtn').disabled = false;
                 }
             })
             .catch(error => {
-                addLog(0, 'Erro de conexão: ' + error.message, 'error');
+                updateStatus('error', 'Erro de Conexão');
                 analysisRunning = false;
-                document.getElementById('startBtn').disabled = false;
             });
         }
         
-        function startStepByStepMonitoring() {
-            const stepInterval = setInterval(() => {
-                if (currentStep < totalSteps) {
-                    const step = steps[currentStep];
-                    addLog(currentStep + 1, step.desc, 'info');
-                    updateProgress(currentStep + 1);
-                    
-                    // Simular geração de screenshots
-                    setTimeout(() => {
-                        const screenshotName = `detailed_step_${String(currentStep + 1).padStart(2, '0')}.png`;
-                        addScreenshot(screenshotName, step.name);
-                    }, 1500);
-                    
-                    currentStep++;
-                } else {
-                    clearInterval(stepInterval);
-                    addLog(totalSteps, 'Análise concluída com sucesso!', 'success');
-                    
-                    // Adicionar análise da página de OS
-                    setTimeout(() => {
-                        addAnalysis(
-                            "🎯 Botão 'Adicionar nova OS'",
-                            "Localizado no canto superior direito da página. Elemento principal para criar novos tickets."
-                        );
-                        addAnalysis(
-                            "📊 Tabela de OS",
-                            "Lista todas as OS existentes com status, datas e informações relevantes."
-                        );
-                        addAnalysis(
-                            "🔍 Filtros de Busca",
-                            "Permite filtrar OS por status, data, tipo e outras características."
-                        );
-                        addAnalysis(
-                            "⚙️ Configurações",
-                            "Opções para personalizar visualização e gerenciar configurações da página."
-                        );
-                    }, 2000);
-                    
-                    analysisRunning = false;
-                    document.getElementById('startBtn').disabled = false;
-                    refreshData();
-                }
-            }, 3000);
-        }
-        
-        // Atualizar dados periodicamente
-        setInterval(refreshData, 15000);
-        
-        // Carregar dados iniciais
-        refreshData();
-    </script>
-</body>
-</html>
-        '''
-        
-        return html_content
-        
-    except Exception as e:
-        logger.error(f"Erro no endpoint visual-step-by-step: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Erro no endpoint visual-step-by-step: {e}'
-        }), 500
-
-@app.route('/execute-detailed-analysis', methods=['POST'])
-def execute_detailed_analysis():
-    """Executa análise detalhada incluindo mapeamento da página de OS"""
-    try:
-        def run_detailed_analysis():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código para análise detalhada com mapeamento da página de OS
-                detailed_analysis_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def detailed_analysis():
-    """Análise detalhada com mapeamento da página de Controle de OS"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("detailed_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        print("🚀 Iniciando análise detalhada...")
-        
-        # STEP 1: Navegação para Login
-        print("🔍 STEP 1: Navegando para página de login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_01.png")
-        print("✅ Página de login carregada")
-        
-        # STEP 2: Preenchimento de Credenciais
-        print("🔍 STEP 2: Preenchendo credenciais...")
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_02.png")
-        print("✅ Credenciais preenchidas")
-        
-        # STEP 3: Autenticação
-        print("🔍 STEP 3: Realizando login...")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_03.png")
-        print("✅ Login realizado")
-        
-        # STEP 4: Seleção de Perfil
-        print("🔍 STEP 4: Selecionando perfil Fornecedor...")
-        if await page.locator('//*[contains(text(), "Fornecedor")]').count() > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_04.png")
-        print("✅ Perfil selecionado")
-        
-        # STEP 5: Dashboard
-        print("🔍 STEP 5: Analisando dashboard...")
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_05.png")
-        
-        # Contar elementos do dashboard
-        dashboard_elements = await page.evaluate("""
-            () => {
-                const elements = document.querySelectorAll('button, a, input, select');
-                return elements.length;
-            }
-        """)
-        print(f"📊 Elementos no dashboard: {dashboard_elements}")
-        
-        # STEP 6: Expansão do Menu
-        print("🔍 STEP 6: Expandindo menu lateral...")
-        
-        menu_toggle_selectors = [
-            "button[focusable='true']",
-            "//button[@focusable='true']",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        menu_expanded = False
-        
-        for selector in menu_toggle_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                if elements > 0:
-                    print(f"🎯 Tentando expandir menu com: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/detailed_step_06.png")
-                    
-                    # Verificar se "Gerenciar chamados" apareceu
-                    chamados_count = await page.locator("//*[contains(text(), 'Gerenciar chamados')]").count()
-                    print(f"🔍 'Gerenciar chamados' encontrado: {chamados_count}")
-                    
-                    if chamados_count > 0:
-                        print("✅ Menu expandido com sucesso!")
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro com seletor {selector}: {e}")
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não foi possível expandir o menu")
-            return {"success": False, "error": "Menu não expandiu"}
-        
-        # STEP 7: Navegação para OS
-        print("🔍 STEP 7: Navegando para Controle de OS...")
-        await page.click("//*[contains(text(), 'Gerenciar chamados')]")
-        await page.wait_for_timeout(3000)
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_07.png")
-        print("✅ Navegação para OS concluída")
-        
-        # STEP 8: Análise da Página de OS
-        print("🔍 STEP 8: Analisando página de Controle de OS...")
-        
-        # Verificar URL
-        current_url = page.url
-        print(f"📍 URL atual: {current_url}")
-        
-        # Mapear elementos da página de OS
-        os_page_elements = await page.evaluate("""
-            () => {
-                const elements = [];
-                const allButtons = document.querySelectorAll('button');
-                const allLinks = document.querySelectorAll('a');
-                const allInputs = document.querySelectorAll('input');
-                
-                // Mapear botões
-                allButtons.forEach((btn, index) => {
-                    const rect = btn.getBoundingClientRect();
-                    const text = btn.textContent?.trim() || '';
-                    
-                    if (rect.width > 0 && rect.height > 0 && text) {
-                        elements.push({
-                            type: 'button',
-                            text: text,
-                            classes: btn.className,
-                            id: btn.id,
-                            position: {
-                                x: rect.left,
-                                y: rect.top,
-                                width: rect.width,
-                                height: rect.height
-                            }
-                        });
-                    }
-                });
-                
-                return elements;
-            }
-        """)
-        
-        print(f"🔍 Elementos mapeados na página de OS: {len(os_page_elements)}")
-        
-        # Procurar especificamente pelo botão "Adicionar nova OS"
-        adicionar_os_button = await page.locator("//*[contains(text(), 'Adicionar') and contains(text(), 'OS')]").count()
-        print(f"🎯 Botão 'Adicionar nova OS' encontrado: {adicionar_os_button}")
-        
-        # Screenshot final detalhado
-        await page.screenshot(path=f"{screenshots_dir}/detailed_step_08.png")
-        
-        # Salvar análise em arquivo
-        analysis_data = {
-            'timestamp': datetime.now().isoformat(),
-            'url': current_url,
-            'elements_count': len(os_page_elements),
-            'adicionar_os_button': adicionar_os_button,
-            'elements': os_page_elements
+        function startMonitoring(jobId) {
+            let step = 0;
+            
+            // Logs reais do job via SSE; os screenshots vêm do resultado ao final
+            const eventos = new EventSource('/jobs/' + jobId + '/events');
+            eventos.addEventListener('log', event => {
+                const entry = JSON.parse(event.data);
+                step++;
+                addLog(entry.timestamp, step, entry.message);
+                updateProgress(Math.min(step, totalSteps));
+            });
+            eventos.addEventListener('end', () => {
+                eventos.close();
+                fetch('/jobs/' + jobId)
+                    .then(response => response.json())
+                    .then(data => {
+                        const result = (data.job && data.job.result) || {};
+                        updateProgress(totalSteps);
+                        if (data.job && data.job.status === 'done') {
+                            updateStatus('success', 'Análise Concluída');
+                        } else {
+                            updateStatus('error', 'Análise Falhou');
+                        }
+                        (result.screenshots || []).forEach(path => addImage(path, path.split('/').pop()));
+                    })
+                    .finally(() => { analysisRunning = false; });
+            });
         }
         
-        with open(f"{screenshots_dir}/os_page_analysis.json", "w") as f:
-            json.dump(analysis_data, f, indent=2)
+        // Atualizar imagens periodicamente
+        setInterval(refreshImages, 10000);
         
-        print("🎉 Análise detalhada concluída com sucesso!")
+        // Carregar imagens iniciais
+        refreshImages();
+    </script>
+</body>
+</html>
+        '''
         
-        return {
-            "success": True,
-            "url": current_url,
-            "elements_mapped": len(os_page_elements),
-            "adicionar_button_found": adicionar_os_button > 0
-        }
+        return html_content
         
     except Exception as e:
-        print(f"❌ Erro: {e}")
-        return {"success": False, "error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(detailed_analysis())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', detailed_analysis_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Análise detalhada executada - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar análise detalhada: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_detailed_analysis)
-        thread.daemon = True
-        thread.start()
-        
+        logger.error(f"Erro no endpoint realtime-analysis: {e}")
         return jsonify({
-            'status': 'success',
-            'message': 'Análise detalhada iniciada com mapeamento da página de OS'
-        })
+            'status': 'error',
+            'message': f'Erro no endpoint realtime-analysis: {e}'
+        }), 500
+
+@app.route('/execute-working-analysis', methods=['POST'])
+def execute_working_analysis():
+    """Executa a análise da navegação pelo menu até a página de OS"""
+    try:
+        return submit_automation_job(
+            'working_analysis',
+            {},
+            eace_flows.menu_navigation_test,
+            timeout=300
+        )
         
     except Exception as e:
-        logger.error(f"Erro ao iniciar análise detalhada: {e}")
+        logger.error(f"Erro ao iniciar análise: {e}")
         return jsonify({
             'status': 'error',
-            'message': f'Erro ao iniciar análise detalhada: {e}'
+            'message': f'Erro ao iniciar análise: {e}'
         }), 500
 
-@app.route('/working-code-detailed', methods=['GET'])
-def working_code_detailed():
-    """Endpoint baseado no código que funciona com logs detalhados e visualização"""
+@app.route('/visual-step-by-step', methods=['GET'])
+def visual_step_by_step():
+    """Endpoint com visualização detalhada do passo a passo incluindo análise da página de OS"""
     try:
-        # Retornar página HTML com visualização completa
+        # Retornar página HTML com visualização detalhada
         html_content = '''
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Código Que Funciona - Logs Detalhados</title>
+    <title>Passo a Passo Visual - EACE</title>
     <style>
-        body {
-            font-family: 'Consolas', 'Monaco', monospace;
-            background: #1a1a1a;
-            color: #00ff00;
+        * {
             margin: 0;
-            padding: 20px;
-            line-height: 1.4;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: 'Courier New', monospace;
+            background: #0d1117;
+            color: #c9d1d9;
+            min-height: 100vh;
+            overflow-x: hidden;
         }
         
         .container {
-            max-width: 1800px;
+            max-width: 1600px;
             margin: 0 auto;
+            padding: 20px;
         }
         
         .header {
             text-align: center;
             margin-bottom: 30px;
             padding: 20px;
-            background: #2a2a2a;
-            border: 2px solid #00ff00;
-            border-radius: 10px;
+            background: linear-gradient(135deg, #1f2937, #374151);
+            border-radius: 15px;
+            border: 2px solid #10b981;
+            box-shadow: 0 0 20px rgba(16, 185, 129, 0.3);
         }
         
         .header h1 {
-            color: #00ff00;
-            font-size: 2em;
-            margin: 0 0 10px 0;
+            color: #10b981;
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            text-shadow: 0 0 10px rgba(16, 185, 129, 0.5);
         }
         
         .controls {
@@ -5537,203 +943,358 @@ def working_code_detailed():
             gap: 15px;
             justify-content: center;
             margin-bottom: 30px;
+            flex-wrap: wrap;
         }
         
         .btn {
-            padding: 10px 20px;
-            background: #00ff00;
-            color: #1a1a1a;
+            padding: 12px 24px;
+            background: linear-gradient(135deg, #10b981, #059669);
+            color: white;
             border: none;
-            border-radius: 5px;
+            border-radius: 8px;
             cursor: pointer;
             font-weight: bold;
-            font-family: inherit;
+            transition: all 0.3s ease;
+            min-width: 140px;
         }
         
         .btn:hover {
-            background: #00cc00;
+            transform: translateY(-2px);
+            box-shadow: 0 5px 15px rgba(16, 185, 129, 0.4);
         }
         
         .btn:disabled {
-            background: #666;
+            background: #6b7280;
             cursor: not-allowed;
+            transform: none;
         }
         
-        .main-grid {
+        .status-panel {
+            background: #1f2937;
+            border: 2px solid #10b981;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 30px;
+        }
+        
+        .status-item {
+            display: flex;
+            align-items: center;
+            margin-bottom: 15px;
+            padding: 10px;
+            background: #374151;
+            border-radius: 8px;
+            border-left: 4px solid #10b981;
+        }
+        
+        .status-icon {
+            width: 20px;
+            height: 20px;
+            border-radius: 50%;
+            margin-right: 15px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-weight: bold;
+            color: white;
+        }
+        
+        .status-waiting { background: #6b7280; }
+        .status-running { background: #f59e0b; }
+        .status-success { background: #10b981; }
+        .status-error { background: #ef4444; }
+        
+        .progress-container {
+            margin: 20px 0;
+        }
+        
+        .progress-bar {
+            width: 100%;
+            height: 25px;
+            background: #374151;
+            border-radius: 15px;
+            overflow: hidden;
+            border: 2px solid #10b981;
+        }
+        
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #10b981, #059669);
+            width: 0%;
+            transition: width 0.5s ease;
+            position: relative;
+        }
+        
+        .progress-text {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            color: white;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        
+        .main-content {
             display: grid;
             grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            height: 80vh;
+            gap: 30px;
+            height: 70vh;
         }
         
         .panel {
-            background: #2a2a2a;
-            border: 2px solid #00ff00;
-            border-radius: 10px;
+            background: #1f2937;
+            border: 2px solid #10b981;
+            border-radius: 15px;
             padding: 20px;
             overflow-y: auto;
         }
         
         .panel h2 {
-            color: #00ff00;
-            margin-top: 0;
+            color: #10b981;
+            margin-bottom: 20px;
+            font-size: 1.5em;
             text-align: center;
         }
         
         .log-entry {
-            margin-bottom: 10px;
-            padding: 8px;
-            background: #333;
-            border-left: 4px solid #00ff00;
-            border-radius: 4px;
-            font-size: 12px;
+            margin-bottom: 15px;
+            padding: 12px;
+            background: #374151;
+            border-radius: 8px;
+            border-left: 4px solid #10b981;
+            animation: fadeIn 0.3s ease;
+        }
+        
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
         }
         
         .log-timestamp {
-            color: #ffff00;
+            color: #fbbf24;
             font-weight: bold;
+            font-size: 0.9em;
         }
         
-        .log-phase {
-            color: #00ffff;
+        .log-step {
+            color: #60a5fa;
             font-weight: bold;
+            margin: 0 10px;
         }
         
         .log-message {
-            color: #00ff00;
+            color: #c9d1d9;
         }
         
         .log-success {
-            border-left-color: #00ff00;
-            background: #1a3d1a;
+            border-left-color: #10b981;
+            background: rgba(16, 185, 129, 0.1);
         }
         
         .log-error {
-            border-left-color: #ff0000;
-            background: #3d1a1a;
+            border-left-color: #ef4444;
+            background: rgba(239, 68, 68, 0.1);
         }
         
         .log-warning {
-            border-left-color: #ffff00;
-            background: #3d3d1a;
+            border-left-color: #f59e0b;
+            background: rgba(245, 158, 11, 0.1);
         }
         
-        .log-info {
-            border-left-color: #00ffff;
-            background: #1a3d3d;
+        .screenshot-container {
+            margin-bottom: 25px;
+            text-align: center;
         }
         
-        .screenshot-item {
-            margin-bottom: 20px;
-            text-align: center;
+        .screenshot-container img {
+            max-width: 100%;
+            height: auto;
+            border: 3px solid #10b981;
+            border-radius: 10px;
+            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
+            transition: transform 0.3s ease;
+        }
+        
+        .screenshot-container img:hover {
+            transform: scale(1.05);
+        }
+        
+        .screenshot-caption {
+            margin-top: 10px;
+            color: #fbbf24;
+            font-weight: bold;
+            font-size: 0.9em;
+        }
+        
+        .step-indicator {
+            display: flex;
+            justify-content: center;
+            margin: 20px 0;
+            flex-wrap: wrap;
+            gap: 10px;
         }
         
-        .screenshot-item img {
-            max-width: 100%;
-            border: 2px solid #00ff00;
-            border-radius: 5px;
+        .step-dot {
+            width: 40px;
+            height: 40px;
+            border-radius: 50%;
+            background: #374151;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+            border: 2px solid #6b7280;
         }
         
-        .screenshot-caption {
-            color: #ffff00;
-            font-weight: bold;
-            margin-top: 10px;
+        .step-dot.active {
+            background: #10b981;
+            border-color: #10b981;
+            box-shadow: 0 0 15px rgba(16, 185, 129, 0.5);
         }
         
-        .status-indicator {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            padding: 10px 20px;
-            background: #2a2a2a;
-            border: 2px solid #00ff00;
-            border-radius: 5px;
-            color: #00ff00;
-            font-weight: bold;
+        .step-dot.completed {
+            background: #059669;
+            border-color: #059669;
         }
         
-        .status-running {
-            border-color: #ffff00;
-            color: #ffff00;
+        .analysis-section {
+            margin-top: 30px;
+            padding: 20px;
+            background: #1f2937;
+            border: 2px solid #10b981;
+            border-radius: 15px;
         }
         
-        .status-success {
-            border-color: #00ff00;
-            color: #00ff00;
+        .analysis-title {
+            color: #10b981;
+            font-size: 1.3em;
+            margin-bottom: 15px;
+            text-align: center;
         }
         
-        .status-error {
-            border-color: #ff0000;
-            color: #ff0000;
+        .analysis-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
         }
         
-        .element-details {
-            background: #333;
-            padding: 10px;
-            margin: 10px 0;
-            border-radius: 5px;
-            border-left: 4px solid #00ffff;
+        .analysis-item {
+            background: #374151;
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid #10b981;
         }
         
-        .element-details h4 {
-            color: #00ffff;
-            margin: 0 0 5px 0;
+        .analysis-item h4 {
+            color: #fbbf24;
+            margin-bottom: 10px;
         }
         
-        .element-details pre {
-            color: #cccccc;
-            font-size: 11px;
-            margin: 5px 0;
-            white-space: pre-wrap;
+        .analysis-item p {
+            color: #c9d1d9;
+            font-size: 0.9em;
         }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🔧 Código Que Funciona - Logs Detalhados</h1>
-            <p>Baseado no endpoint /test-expandable-menu com logs completos</p>
+            <h1>🔍 Passo a Passo Visual - EACE</h1>
+            <p>Análise detalhada da automação até a página de Controle de OS</p>
         </div>
         
         <div class="controls">
-            <button class="btn" id="startBtn" onclick="startDetailedTest()">
-                🚀 Executar Teste Detalhado
+            <button class="btn" id="startBtn" onclick="startDetailedAnalysis()">
+                🚀 Iniciar Análise Detalhada
             </button>
             <button class="btn" onclick="clearAll()">
-                🗑️ Limpar Tudo
+                🧹 Limpar Tudo
             </button>
-            <button class="btn" onclick="refreshImages()">
-                🔄 Atualizar Imagens
+            <button class="btn" onclick="refreshData()">
+                🔄 Atualizar Dados
             </button>
         </div>
         
-        <div class="status-indicator" id="statusIndicator">
-            Aguardando...
+        <div class="status-panel">
+            <div class="progress-container">
+                <div class="progress-bar">
+                    <div class="progress-fill" id="progressFill">
+                        <div class="progress-text" id="progressText">0%</div>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="step-indicator" id="stepIndicator">
+                <div class="step-dot">1</div>
+                <div class="step-dot">2</div>
+                <div class="step-dot">3</div>
+                <div class="step-dot">4</div>
+                <div class="step-dot">5</div>
+                <div class="step-dot">6</div>
+                <div class="step-dot">7</div>
+                <div class="step-dot">8</div>
+            </div>
         </div>
         
-        <div class="main-grid">
+        <div class="main-content">
             <div class="panel">
                 <h2>📋 Logs Detalhados</h2>
                 <div id="logsContainer"></div>
             </div>
             
             <div class="panel">
-                <h2>📸 Screenshots</h2>
+                <h2>📸 Screenshots em Tempo Real</h2>
                 <div id="screenshotsContainer"></div>
             </div>
         </div>
+        
+        <div class="analysis-section">
+            <h3 class="analysis-title">🔬 Análise da Página de Controle de OS</h3>
+            <div class="analysis-grid" id="analysisGrid">
+                <!-- Análise será preenchida dinamicamente -->
+            </div>
+        </div>
     </div>
 
     <script>
-        let testRunning = false;
+        let currentStep = 0;
+        let totalSteps = 8;
+        let analysisRunning = false;
         
-        function updateStatus(status, message) {
-            const indicator = document.getElementById('statusIndicator');
-            indicator.textContent = message;
-            indicator.className = 'status-indicator status-' + status;
+        const steps = [
+            { name: "Navegação para Login", desc: "Acessando página de login do EACE" },
+            { name: "Preenchimento de Credenciais", desc: "Inserindo email e senha" },
+            { name: "Autenticação", desc: "Realizando login no sistema" },
+            { name: "Seleção de Perfil", desc: "Escolhendo perfil Fornecedor" },
+            { name: "Dashboard", desc: "Analisando painel principal" },
+            { name: "Expansão do Menu", desc: "Abrindo menu lateral" },
+            { name: "Navegação para OS", desc: "Acessando Controle de OS" },
+            { name: "Análise da Página OS", desc: "Mapeando elementos da página" }
+        ];
+        
+        function updateProgress(step) {
+            const percentage = (step / totalSteps) * 100;
+            const progressFill = document.getElementById('progressFill');
+            const progressText = document.getElementById('progressText');
+            
+            progressFill.style.width = percentage + '%';
+            progressText.textContent = Math.round(percentage) + '%';
+            
+            // Atualizar indicadores de step
+            const stepDots = document.querySelectorAll('.step-dot');
+            stepDots.forEach((dot, index) => {
+                dot.className = 'step-dot';
+                if (index < step) {
+                    dot.classList.add('completed');
+                } else if (index === step) {
+                    dot.classList.add('active');
+                }
+            });
         }
         
-        function addLog(phase, message, type = 'info') {
+        function addLog(step, message, type = 'info') {
             const container = document.getElementById('logsContainer');
             const logEntry = document.createElement('div');
             logEntry.className = `log-entry log-${type}`;
@@ -5741,7 +1302,7 @@ def working_code_detailed():
             const timestamp = new Date().toLocaleTimeString();
             logEntry.innerHTML = `
                 <span class="log-timestamp">[${timestamp}]</span>
-                <span class="log-phase">${phase}:</span>
+                <span class="log-step">STEP ${step}:</span>
                 <span class="log-message">${message}</span>
             `;
             
@@ -5749,27 +1310,13 @@ def working_code_detailed():
             container.scrollTop = container.scrollHeight;
         }
         
-        function addElementDetails(title, element) {
-            const container = document.getElementById('logsContainer');
-            const detailsDiv = document.createElement('div');
-            detailsDiv.className = 'element-details';
-            
-            detailsDiv.innerHTML = `
-                <h4>${title}</h4>
-                <pre>${JSON.stringify(element, null, 2)}</pre>
-            `;
-            
-            container.appendChild(detailsDiv);
-            container.scrollTop = container.scrollHeight;
-        }
-        
         function addScreenshot(filename, caption) {
             const container = document.getElementById('screenshotsContainer');
             const screenshotDiv = document.createElement('div');
-            screenshotDiv.className = 'screenshot-item';
+            screenshotDiv.className = 'screenshot-container';
             
             screenshotDiv.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" loading="lazy">
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" loading="lazy"></a>
                 <div class="screenshot-caption">${caption}</div>
             `;
             
@@ -5777,106 +1324,122 @@ def working_code_detailed():
             container.scrollTop = container.scrollHeight;
         }
         
+        function addAnalysis(title, content) {
+            const analysisGrid = document.getElementById('analysisGrid');
+            const analysisItem = document.createElement('div');
+            analysisItem.className = 'analysis-item';
+            
+            analysisItem.innerHTML = `
+                <h4>${title}</h4>
+                <p>${content}</p>
+            `;
+            
+            analysisGrid.appendChild(analysisItem);
+        }
+        
         function clearAll() {
             document.getElementById('logsContainer').innerHTML = '';
             document.getElementById('screenshotsContainer').innerHTML = '';
-            updateStatus('idle', 'Aguardando...');
+            document.getElementById('analysisGrid').innerHTML = '';
+            updateProgress(0);
+            currentStep = 0;
         }
         
-        function refreshImages() {
+        function refreshData() {
             fetch('/screenshots')
                 .then(response => response.json())
                 .then(data => {
                     const container = document.getElementById('screenshotsContainer');
-                    container.innerHTML = '<h2>📸 Screenshots</h2>';
-                    
-                    // Filtrar screenshots do teste detalhado
-                    const workingScreenshots = data.screenshots.filter(s => 
-                        s.filename.includes('working_detailed_') || 
-                        s.filename.includes('expandable_')
-                    );
+                    container.innerHTML = '';
                     
-                    workingScreenshots.forEach(screenshot => {
+                    data.screenshots.forEach(screenshot => {
                         addScreenshot(screenshot.filename, screenshot.description || screenshot.filename);
                     });
                 })
                 .catch(error => console.error('Erro ao carregar screenshots:', error));
         }
         
-        function startDetailedTest() {
-            if (testRunning) return;
+        function startDetailedAnalysis() {
+            if (analysisRunning) return;
             
-            testRunning = true;
+            analysisRunning = true;
             document.getElementById('startBtn').disabled = true;
-            updateStatus('running', 'Executando teste...');
             clearAll();
             
-            // Iniciar teste no servidor
-            fetch('/execute-working-detailed', {
+            // Iniciar análise no servidor
+            fetch('/execute-detailed-analysis', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 },
                 body: JSON.stringify({
-                    detailed_logs: true,
-                    component_analysis: true
+                    detailed: true,
+                    analyze_os_page: true
                 })
             })
             .then(response => response.json())
             .then(data => {
-                if (data.status === 'success') {
-                    updateStatus('success', 'Teste iniciado com sucesso');
-                    startMonitoring();
+                if (data.success) {
+                    startStepByStepMonitoring(data.job_id);
                 } else {
-                    updateStatus('error', 'Erro ao iniciar teste');
-                    addLog('ERRO', data.message, 'error');
-                    testRunning = false;
+                    addLog(0, 'Erro ao iniciar análise: ' + data.message, 'error');
+                    analysisRunning = false;
                     document.getElementById('startBtn').disabled = false;
                 }
             })
             .catch(error => {
-                updateStatus('error', 'Erro de conexão');
-                addLog('ERRO', error.message, 'error');
-                testRunning = false;
+                addLog(0, 'Erro de conexão: ' + error.message, 'error');
+                analysisRunning = false;
                 document.getElementById('startBtn').disabled = false;
             });
         }
         
-        function startMonitoring() {
-            const phases = [
-                'LOGIN - Navegando para página de login',
-                'LOGIN - Preenchendo credenciais',
-                'LOGIN - Realizando autenticação',
-                'PERFIL - Selecionando perfil Fornecedor',
-                'DASHBOARD - Analisando dashboard inicial',
-                'MENU - Expandindo menu hambúrguer',
-                'NAVEGAÇÃO - Procurando "Gerenciar chamados"',
-                'ANÁLISE - Mapeando elementos do menu',
-                'CONTROLE - Acessando página de OS',
-                'FINAL - Análise da página de controle'
-            ];
-            
-            let currentPhase = 0;
-            
-            const monitoringInterval = setInterval(() => {
-                if (currentPhase < phases.length) {
-                    addLog('FASE ' + (currentPhase + 1), phases[currentPhase], 'info');
-                    currentPhase++;
-                } else {
-                    clearInterval(monitoringInterval);
-                    updateStatus('success', 'Monitoramento concluído');
-                    testRunning = false;
-                    document.getElementById('startBtn').disabled = false;
-                    refreshImages();
-                }
-            }, 3000);
-        }
-        
-        // Atualizar imagens a cada 10 segundos
-        setInterval(refreshImages, 10000);
+        function startStepByStepMonitoring(jobId) {
+            // Logs reais do job via SSE; a análise da página de OS vem do resultado ao final
+            const eventos = new EventSource('/jobs/' + jobId + '/events');
+            eventos.addEventListener('log', event => {
+                const entry = JSON.parse(event.data);
+                currentStep++;
+                addLog(currentStep, entry.message, entry.level === 'error' ? 'error' : 'info');
+                updateProgress(Math.min(currentStep, totalSteps));
+            });
+            eventos.addEventListener('end', () => {
+                eventos.close();
+                fetch('/jobs/' + jobId)
+                    .then(response => response.json())
+                    .then(data => {
+                        const result = (data.job && data.job.result) || {};
+                        updateProgress(totalSteps);
+                        if (data.job && data.job.status === 'done') {
+                            addLog(currentStep, 'Análise concluída com sucesso!', 'success');
+                        } else {
+                            addLog(currentStep, 'Análise falhou: ' + ((data.job && data.job.error) || 'erro desconhecido'), 'error');
+                        }
+                        (result.screenshots || []).forEach(path => addScreenshot(path, path.split('/').pop()));
+                        
+                        if (result.url) {
+                            addAnalysis("🌐 Página analisada", result.url);
+                        }
+                        if (result.elements) {
+                            addAnalysis("📊 Elementos visíveis", result.elements.length + " elementos mapeados");
+                        }
+                        addAnalysis(
+                            "🎯 Botão 'Adicionar nova OS'",
+                            result.adicionar_button_found ? "Encontrado na página de OS." : "Não encontrado."
+                        );
+                    })
+                    .finally(() => {
+                        analysisRunning = false;
+                        document.getElementById('startBtn').disabled = false;
+                    });
+            });
+        }
+        
+        // Atualizar dados periodicamente
+        setInterval(refreshData, 15000);
         
-        // Carregar imagens iniciais
-        refreshImages();
+        // Carregar dados iniciais
+        refreshData();
     </script>
 </body>
 </html>
@@ -5885,431 +1448,54 @@ def working_code_detailed():
         return html_content
         
     except Exception as e:
-        logger.error(f"Erro no endpoint working-code-detailed: {e}")
+        logger.error(f"Erro no endpoint visual-step-by-step: {e}")
         return jsonify({
             'status': 'error',
-            'message': f'Erro no endpoint working-code-detailed: {e}'
+            'message': f'Erro no endpoint visual-step-by-step: {e}'
         }), 500
 
-@app.route('/execute-working-detailed', methods=['POST'])
-def execute_working_detailed():
-    """Executa o código que funciona com logs detalhados"""
-    try:
-        def run_working_detailed():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código baseado EXATAMENTE no test-expandable-menu que funciona
-                working_detailed_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-async def working_detailed_test():
-    """Teste baseado no código que funciona (/test-expandable-menu) com logs detalhados"""
-    
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("working_detailed_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    
+@app.route('/execute-detailed-analysis', methods=['POST'])
+def execute_detailed_analysis():
+    """Executa análise detalhada incluindo mapeamento da página de OS"""
     try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
+        return submit_automation_job(
+            'detailed_analysis',
+            {},
+            lambda context: eace_flows.map_page_elements(context, destination='controle_os'),
+            timeout=300
         )
         
-        page = await browser.new_page()
-        
-        print("🚀 INICIANDO TESTE COM CÓDIGO QUE FUNCIONA...")
-        print("📋 Baseado no endpoint /test-expandable-menu")
-        
-        # FASE 1: LOGIN
-        print("\\n🔐 FASE 1: LOGIN")
-        print("📍 Navegando para página de login...")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_01_login.png")
-        print("✅ Página de login carregada")
-        
-        print("📍 Preenchendo credenciais...")
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_02_credentials.png")
-        print("✅ Credenciais preenchidas")
-        
-        print("📍 Clicando no botão de login...")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_03_logged_in.png")
-        print("✅ Login realizado")
-        
-        # FASE 2: SELEÇÃO DE PERFIL
-        print("\\n👤 FASE 2: SELEÇÃO DE PERFIL")
-        fornecedor_count = await page.locator('//*[contains(text(), "Fornecedor")]').count()
-        print(f"📍 Elementos 'Fornecedor' encontrados: {fornecedor_count}")
-        
-        if fornecedor_count > 0:
-            print("📍 Clicando no perfil Fornecedor...")
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-            await page.screenshot(path=f"{screenshots_dir}/working_detailed_04_profile_selected.png")
-            print("✅ Perfil Fornecedor selecionado")
-        else:
-            print("ℹ️ Perfil Fornecedor não encontrado ou já selecionado")
-        
-        # FASE 3: DASHBOARD
-        print("\\n🏠 FASE 3: ANÁLISE DO DASHBOARD")
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_05_dashboard.png")
-        print("📍 Dashboard carregado")
-        
-        # Contar elementos do dashboard
-        dashboard_elements = await page.evaluate("""
-            () => {
-                const elements = document.querySelectorAll('button, a, input, select');
-                return elements.length;
-            }
-        """)
-        print(f"📊 Total de elementos no dashboard: {dashboard_elements}")
-        
-        # FASE 4: EXPANSÃO DO MENU (CÓDIGO IDÊNTICO AO QUE FUNCIONA)
-        print("\\n🔍 FASE 4: EXPANSÃO DO MENU")
-        print("📍 Procurando e expandindo o menu hambúrguer...")
-        
-        menu_expanded = False
-        
-        # Seletores EXATOS do código que funciona
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for i, selector in enumerate(menu_toggle_selectors):
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                print(f"🔍 Seletor {i+1}: {selector} - Elementos: {elements}")
-                
-                if elements > 0:
-                    print(f"📍 Tentando expandir menu com: {selector}")
-                    
-                    # Clicar no elemento
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    await page.screenshot(path=f"{screenshots_dir}/working_detailed_06_menu_click_{i+1}.png")
-                    
-                    # Verificar se menu foi expandido
-                    visible_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    print(f"🔍 Elementos visíveis após clique: {visible_elements}")
-                    
-                    if visible_elements > 10:
-                        print("✅ Menu expandido com sucesso!")
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao expandir menu com {selector}: {e}")
-                continue
-        
-        if not menu_expanded:
-            print("❌ Não conseguiu expandir o menu")
-            await page.screenshot(path=f"{screenshots_dir}/working_detailed_06_menu_not_expanded.png")
-        
-        # FASE 5: PROCURA POR "GERENCIAR CHAMADOS" (CÓDIGO IDÊNTICO)
-        print("\\n🔍 FASE 5: PROCURA POR 'GERENCIAR CHAMADOS'")
-        
-        os_found = False
-        
-        # Seletores EXATOS do código que funciona
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for i, selector in enumerate(specific_selectors):
-            try:
-                elements = await page.locator(selector).count()
-                print(f"🔍 Seletor {i+1}: {selector} - Elementos: {elements}")
-                
-                if elements > 0:
-                    print(f"📍 Encontrado 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/working_detailed_07_chamados_clicked.png")
-                    
-                    current_url = page.url
-                    print(f"📍 URL após clique: {current_url}")
-                    
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        print(f"✅ SUCESSO! Navegou para: {current_url}")
-                        os_found = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ Erro ao clicar em {selector}: {e}")
-                continue
-        
-        # FASE 6: ANÁLISE ESTRUTURAL (CÓDIGO IDÊNTICO)
-        if not os_found:
-            print("\\n🔍 FASE 6: ANÁLISE ESTRUTURAL DO MENU")
-            
-            # Mapear elementos do menu (CÓDIGO IDÊNTICO)
-            menu_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                                elements.push({
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                });
-                            }
-                        });
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            print(f"📋 Elementos encontrados no menu: {len(menu_elements)}")
-            
-            # Salvar elementos para análise
-            with open(f"{screenshots_dir}/menu_elements_analysis.json", "w") as f:
-                json.dump(menu_elements, f, indent=2)
-            
-            # Tentar segundo elemento (CÓDIGO IDÊNTICO)
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]
-                print(f"🎯 Tentando segundo elemento: {target_element}")
-                
-                try:
-                    if target_element['text']:
-                        await page.click(f"text='{target_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/working_detailed_08_second_element.png")
-                        
-                        current_url = page.url
-                        print(f"📍 URL após segundo elemento: {current_url}")
-                        
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ SUCESSO com segundo elemento! URL: {current_url}")
-                            os_found = True
-                            
-                except Exception as e:
-                    print(f"❌ Erro ao clicar no segundo elemento: {e}")
-        
-        # FASE 7: ANÁLISE DA PÁGINA DE CONTROLE DE OS
-        if os_found:
-            print("\\n🎯 FASE 7: ANÁLISE DA PÁGINA DE CONTROLE DE OS")
-            
-            # Mapear elementos da página de OS
-            os_page_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const allButtons = document.querySelectorAll('button');
-                    const allLinks = document.querySelectorAll('a');
-                    
-                    allButtons.forEach((btn, index) => {
-                        const rect = btn.getBoundingClientRect();
-                        const text = btn.textContent?.trim() || '';
-                        
-                        if (rect.width > 0 && rect.height > 0 && text) {
-                            elements.push({
-                                type: 'button',
-                                text: text,
-                                classes: btn.className,
-                                id: btn.id,
-                                position: {
-                                    x: rect.left,
-                                    y: rect.top,
-                                    width: rect.width,
-                                    height: rect.height
-                                }
-                            });
-                        }
-                    });
-                    
-                    allLinks.forEach((link, index) => {
-                        const rect = link.getBoundingClientRect();
-                        const text = link.textContent?.trim() || '';
-                        
-                        if (rect.width > 0 && rect.height > 0 && text) {
-                            elements.push({
-                                type: 'link',
-                                text: text,
-                                href: link.href,
-                                classes: link.className,
-                                id: link.id,
-                                position: {
-                                    x: rect.left,
-                                    y: rect.top,
-                                    width: rect.width,
-                                    height: rect.height
-                                }
-                            });
-                        }
-                    });
-                    
-                    return elements;
-                }
-            """)
-            
-            print(f"🔍 Elementos mapeados na página de OS: {len(os_page_elements)}")
-            
-            # Salvar análise da página de OS
-            with open(f"{screenshots_dir}/os_page_elements.json", "w") as f:
-                json.dump(os_page_elements, f, indent=2)
-            
-            # Procurar especificamente pelo botão "Adicionar nova OS"
-            adicionar_buttons = [el for el in os_page_elements if 'adicionar' in el['text'].lower() and 'os' in el['text'].lower()]
-            print(f"🎯 Botões 'Adicionar nova OS' encontrados: {len(adicionar_buttons)}")
-            
-            for btn in adicionar_buttons:
-                print(f"📍 Botão encontrado: {btn}")
-        
-        # Screenshot final
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_09_final.png")
-        
-        final_url = page.url
-        print(f"\\n📍 URL FINAL: {final_url}")
-        
-        if os_found:
-            print("✅ TESTE CONCLUÍDO COM SUCESSO!")
-            print("🎉 Navegação para página de Controle de OS realizada")
-        else:
-            print("❌ NÃO CONSEGUIU NAVEGAR PARA PÁGINA DE OS")
-        
-        # Resultado final
-        result = {
-            "success": os_found,
-            "final_url": final_url,
-            "menu_expanded": menu_expanded,
-            "elements_found": len(menu_elements) if 'menu_elements' in locals() else 0,
-            "os_elements": len(os_page_elements) if 'os_page_elements' in locals() else 0
-        }
-        
-        print(f"\\n📊 RESULTADO FINAL:")
-        print(json.dumps(result, indent=2))
-        
-        return result
-        
-    except Exception as e:
-        print(f"❌ ERRO GERAL: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/working_detailed_error.png")
-        return {"success": False, "error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(working_detailed_test())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', working_detailed_code
-                ], env=env, capture_output=True, text=True, timeout=300)
-                
-                logger.info(f"Teste detalhado executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste detalhado: {e}")
-        
-        # Executar em thread separada
-        thread = threading.Thread(target=run_working_detailed)
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste detalhado iniciado baseado no código que funciona'
-        })
-        
     except Exception as e:
-        logger.error(f"Erro ao iniciar teste detalhado: {e}")
+        logger.error(f"Erro ao iniciar análise detalhada: {e}")
         return jsonify({
             'status': 'error',
-            'message': f'Erro ao iniciar teste detalhado: {e}'
+            'message': f'Erro ao iniciar análise detalhada: {e}'
         }), 500
 
-@app.route('/test-expandable-with-logs', methods=['GET'])
-def test_expandable_with_logs():
-    """Versão do test-expandable-menu que funciona + logs reais em tempo real"""
+@app.route('/working-code-detailed', methods=['GET'])
+def working_code_detailed():
+    """Endpoint baseado no código que funciona com logs detalhados e visualização"""
     try:
-        # Página HTML com visualização de logs reais
+        # Retornar página HTML com visualização completa
         html_content = '''
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Expandable Menu - Logs Reais</title>
+    <title>Código Que Funciona - Logs Detalhados</title>
     <style>
         body {
-            font-family: 'Courier New', monospace;
-            background: #0a0a0a;
+            font-family: 'Consolas', 'Monaco', monospace;
+            background: #1a1a1a;
             color: #00ff00;
             margin: 0;
             padding: 20px;
-            line-height: 1.5;
+            line-height: 1.4;
         }
         
         .container {
-            max-width: 1600px;
+            max-width: 1800px;
             margin: 0 auto;
         }
         
@@ -6317,15 +1503,15 @@ def test_expandable_with_logs():
             text-align: center;
             margin-bottom: 30px;
             padding: 20px;
-            background: #1a1a1a;
+            background: #2a2a2a;
             border: 2px solid #00ff00;
             border-radius: 10px;
         }
         
         .header h1 {
             color: #00ff00;
-            font-size: 1.8em;
-            margin: 0;
+            font-size: 2em;
+            margin: 0 0 10px 0;
         }
         
         .controls {
@@ -6338,11 +1524,12 @@ def test_expandable_with_logs():
         .btn {
             padding: 10px 20px;
             background: #00ff00;
-            color: #000;
+            color: #1a1a1a;
             border: none;
             border-radius: 5px;
             cursor: pointer;
             font-weight: bold;
+            font-family: inherit;
         }
         
         .btn:hover {
@@ -6350,19 +1537,19 @@ def test_expandable_with_logs():
         }
         
         .btn:disabled {
-            background: #444;
+            background: #666;
             cursor: not-allowed;
         }
         
-        .main-content {
+        .main-grid {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 20px;
-            height: 75vh;
+            height: 80vh;
         }
         
         .panel {
-            background: #1a1a1a;
+            background: #2a2a2a;
             border: 2px solid #00ff00;
             border-radius: 10px;
             padding: 20px;
@@ -6373,49 +1560,53 @@ def test_expandable_with_logs():
             color: #00ff00;
             margin-top: 0;
             text-align: center;
-            font-size: 1.2em;
         }
         
         .log-entry {
-            margin-bottom: 8px;
-            padding: 6px 10px;
-            background: #2a2a2a;
+            margin-bottom: 10px;
+            padding: 8px;
+            background: #333;
             border-left: 4px solid #00ff00;
-            border-radius: 3px;
-            font-size: 11px;
+            border-radius: 4px;
+            font-size: 12px;
         }
         
-        .log-phase {
+        .log-timestamp {
             color: #ffff00;
             font-weight: bold;
         }
         
-        .log-action {
+        .log-phase {
             color: #00ffff;
             font-weight: bold;
         }
         
-        .log-result {
+        .log-message {
             color: #00ff00;
         }
         
         .log-success {
             border-left-color: #00ff00;
-            background: #0a2a0a;
+            background: #1a3d1a;
         }
         
         .log-error {
             border-left-color: #ff0000;
-            background: #2a0a0a;
+            background: #3d1a1a;
         }
         
         .log-warning {
             border-left-color: #ffff00;
-            background: #2a2a0a;
+            background: #3d3d1a;
+        }
+        
+        .log-info {
+            border-left-color: #00ffff;
+            background: #1a3d3d;
         }
         
         .screenshot-item {
-            margin-bottom: 15px;
+            margin-bottom: 20px;
             text-align: center;
         }
         
@@ -6428,21 +1619,19 @@ def test_expandable_with_logs():
         .screenshot-caption {
             color: #ffff00;
             font-weight: bold;
-            margin-top: 8px;
-            font-size: 12px;
+            margin-top: 10px;
         }
         
-        .status-bar {
+        .status-indicator {
             position: fixed;
-            top: 10px;
+            top: 20px;
             right: 20px;
-            padding: 8px 16px;
-            background: #1a1a1a;
+            padding: 10px 20px;
+            background: #2a2a2a;
             border: 2px solid #00ff00;
             border-radius: 5px;
             color: #00ff00;
             font-weight: bold;
-            font-size: 12px;
         }
         
         .status-running {
@@ -6460,55 +1649,53 @@ def test_expandable_with_logs():
             color: #ff0000;
         }
         
-        .element-info {
-            background: #2a2a2a;
-            padding: 8px;
-            margin: 5px 0;
-            border-radius: 3px;
+        .element-details {
+            background: #333;
+            padding: 10px;
+            margin: 10px 0;
+            border-radius: 5px;
             border-left: 4px solid #00ffff;
-            font-size: 10px;
         }
         
-        .element-info .element-selector {
+        .element-details h4 {
             color: #00ffff;
-            font-weight: bold;
-        }
-        
-        .element-info .element-count {
-            color: #ffff00;
+            margin: 0 0 5px 0;
         }
         
-        .element-info .element-action {
-            color: #00ff00;
+        .element-details pre {
+            color: #cccccc;
+            font-size: 11px;
+            margin: 5px 0;
+            white-space: pre-wrap;
         }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🔧 Test Expandable Menu - Logs Reais</h1>
-            <p>Código que funciona + logs detalhados do que realmente acontece</p>
+            <h1>🔧 Código Que Funciona - Logs Detalhados</h1>
+            <p>Baseado no endpoint /test-expandable-menu com logs completos</p>
         </div>
         
         <div class="controls">
-            <button class="btn" id="startBtn" onclick="startRealTest()">
-                ▶️ Executar Teste Real
+            <button class="btn" id="startBtn" onclick="startDetailedTest()">
+                🚀 Executar Teste Detalhado
             </button>
             <button class="btn" onclick="clearAll()">
-                🗑️ Limpar
+                🗑️ Limpar Tudo
             </button>
             <button class="btn" onclick="refreshImages()">
                 🔄 Atualizar Imagens
             </button>
         </div>
         
-        <div class="status-bar" id="statusBar">
+        <div class="status-indicator" id="statusIndicator">
             Aguardando...
         </div>
         
-        <div class="main-content">
+        <div class="main-grid">
             <div class="panel">
-                <h2>📋 Logs Reais do Código</h2>
+                <h2>📋 Logs Detalhados</h2>
                 <div id="logsContainer"></div>
             </div>
             
@@ -6523,37 +1710,38 @@ def test_expandable_with_logs():
         let testRunning = false;
         
         function updateStatus(status, message) {
-            const statusBar = document.getElementById('statusBar');
-            statusBar.textContent = message;
-            statusBar.className = 'status-bar status-' + status;
+            const indicator = document.getElementById('statusIndicator');
+            indicator.textContent = message;
+            indicator.className = 'status-indicator status-' + status;
         }
         
-        function addRealLog(phase, action, result, type = 'info') {
+        function addLog(phase, message, type = 'info') {
             const container = document.getElementById('logsContainer');
             const logEntry = document.createElement('div');
             logEntry.className = `log-entry log-${type}`;
             
             const timestamp = new Date().toLocaleTimeString();
             logEntry.innerHTML = `
-                [${timestamp}] <span class="log-phase">${phase}</span> - <span class="log-action">${action}</span>: <span class="log-result">${result}</span>
+                <span class="log-timestamp">[${timestamp}]</span>
+                <span class="log-phase">${phase}:</span>
+                <span class="log-message">${message}</span>
             `;
             
             container.appendChild(logEntry);
             container.scrollTop = container.scrollHeight;
         }
         
-        function addElementInfo(selector, count, action) {
-            const container = document.getElementById('logsContainer');
-            const elementDiv = document.createElement('div');
-            elementDiv.className = 'element-info';
+        function addElementDetails(title, element) {
+            const container = document.getElementById('logsContainer');
+            const detailsDiv = document.createElement('div');
+            detailsDiv.className = 'element-details';
             
-            elementDiv.innerHTML = `
-                <div class="element-selector">Seletor: ${selector}</div>
-                <div class="element-count">Elementos encontrados: ${count}</div>
-                <div class="element-action">Ação: ${action}</div>
+            detailsDiv.innerHTML = `
+                <h4>${title}</h4>
+                <pre>${JSON.stringify(element, null, 2)}</pre>
             `;
             
-            container.appendChild(elementDiv);
+            container.appendChild(detailsDiv);
             container.scrollTop = container.scrollHeight;
         }
         
@@ -6563,7 +1751,7 @@ def test_expandable_with_logs():
             screenshotDiv.className = 'screenshot-item';
             
             screenshotDiv.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" onerror="this.style.display='none'">
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" loading="lazy"></a>
                 <div class="screenshot-caption">${caption}</div>
             `;
             
@@ -6584,88 +1772,93 @@ def test_expandable_with_logs():
                     const container = document.getElementById('screenshotsContainer');
                     container.innerHTML = '<h2>📸 Screenshots</h2>';
                     
-                    const expandableScreenshots = data.screenshots.filter(s => 
-                        s.filename.includes('expandable_') || s.filename.includes('realtest_')
+                    // Filtrar screenshots do teste detalhado
+                    const workingScreenshots = data.screenshots.filter(s => 
+                        s.filename.includes('working_detailed_') || 
+                        s.filename.includes('expandable_')
                     );
                     
-                    expandableScreenshots.forEach(screenshot => {
+                    workingScreenshots.forEach(screenshot => {
                         addScreenshot(screenshot.filename, screenshot.description || screenshot.filename);
                     });
                 })
                 .catch(error => console.error('Erro ao carregar screenshots:', error));
         }
         
-        function startRealTest() {
+        function startDetailedTest() {
             if (testRunning) return;
             
             testRunning = true;
             document.getElementById('startBtn').disabled = true;
-            updateStatus('running', 'Executando teste real...');
+            updateStatus('running', 'Executando teste...');
             clearAll();
             
-            fetch('/execute-real-test', {
+            // Iniciar teste no servidor
+            fetch('/execute-working-detailed', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
-                }
+                },
+                body: JSON.stringify({
+                    detailed_logs: true,
+                    component_analysis: true
+                })
             })
             .then(response => response.json())
             .then(data => {
-                if (data.status === 'success') {
-                    updateStatus('success', 'Teste iniciado');
-                    startRealLogMonitoring();
+                if (data.success) {
+                    updateStatus('running', 'Teste iniciado com sucesso');
+                    startMonitoring(data.job_id);
                 } else {
-                    updateStatus('error', 'Erro ao iniciar');
-                    addRealLog('ERRO', 'Inicialização', data.message, 'error');
+                    updateStatus('error', 'Erro ao iniciar teste');
+                    addLog('ERRO', data.message, 'error');
                     testRunning = false;
                     document.getElementById('startBtn').disabled = false;
                 }
             })
             .catch(error => {
                 updateStatus('error', 'Erro de conexão');
-                addRealLog('ERRO', 'Conexão', error.message, 'error');
+                addLog('ERRO', error.message, 'error');
                 testRunning = false;
                 document.getElementById('startBtn').disabled = false;
             });
         }
         
-        function startRealLogMonitoring() {
-            // Simular logs reais baseados no código que funciona
-            const realLogs = [
-                {phase: 'LOGIN', action: 'Navegando para página', result: 'https://eace.org.br/login?login=login', type: 'info'},
-                {phase: 'LOGIN', action: 'Preenchendo campo email', result: 'XPath: //input[@placeholder="seuemail@email.com"]', type: 'info'},
-                {phase: 'LOGIN', action: 'Preenchendo campo senha', result: 'XPath: //input[@type="password"]', type: 'info'},
-                {phase: 'LOGIN', action: 'Clicando botão login', result: 'XPath: //button[contains(text(), "Log In")]', type: 'info'},
-                {phase: 'PERFIL', action: 'Verificando perfil Fornecedor', result: 'XPath: //*[contains(text(), "Fornecedor")]', type: 'info'},
-                {phase: 'PERFIL', action: 'Clicando em Fornecedor', result: 'Perfil selecionado com sucesso', type: 'success'},
-                {phase: 'MENU', action: 'Testando seletor menu', result: 'button[class*="menu"] - 0 elementos', type: 'warning'},
-                {phase: 'MENU', action: 'Testando seletor menu', result: 'button[focusable="true"] - 1 elemento', type: 'info'},
-                {phase: 'MENU', action: 'Clicando botão menu', result: 'button[focusable="true"] - Clicado', type: 'success'},
-                {phase: 'MENU', action: 'Verificando expansão', result: 'Elementos visíveis: 15 → 23', type: 'success'},
-                {phase: 'NAVEGAÇÃO', action: 'Procurando "Gerenciar chamados"', result: 'XPath: //*[contains(text(), "Gerenciar chamados")]', type: 'info'},
-                {phase: 'NAVEGAÇÃO', action: 'Clicando "Gerenciar chamados"', result: 'Elemento encontrado e clicado', type: 'success'},
-                {phase: 'CONTROLE', action: 'Verificando URL', result: 'https://eace.org.br/dashboard_fornecedor/controle_os', type: 'success'},
-                {phase: 'CONTROLE', action: 'Mapeando botão "Adicionar OS"', result: 'Botão identificado no canto superior direito', type: 'success'}
-            ];
-            
-            let logIndex = 0;
-            const logInterval = setInterval(() => {
-                if (logIndex < realLogs.length) {
-                    const log = realLogs[logIndex];
-                    addRealLog(log.phase, log.action, log.result, log.type);
-                    logIndex++;
-                } else {
-                    clearInterval(logInterval);
-                    updateStatus('success', 'Teste concluído');
-                    testRunning = false;
-                    document.getElementById('startBtn').disabled = false;
-                    refreshImages();
-                }
-            }, 2000);
+        function startMonitoring(jobId) {
+            // Logs reais do job via SSE; o resultado final traz os screenshots do job
+            const eventos = new EventSource('/jobs/' + jobId + '/events');
+            eventos.addEventListener('log', event => {
+                const entry = JSON.parse(event.data);
+                addLog(entry.timestamp, entry.message, entry.level === 'error' ? 'error' : 'info');
+            });
+            eventos.addEventListener('end', () => {
+                eventos.close();
+                fetch('/jobs/' + jobId)
+                    .then(response => response.json())
+                    .then(data => {
+                        const result = (data.job && data.job.result) || {};
+                        if (data.job && data.job.status === 'done') {
+                            updateStatus('success', 'Teste concluído');
+                        } else {
+                            updateStatus('error', 'Teste falhou');
+                        }
+                        addElementDetails('Resultado', {
+                            final_url: result.final_url,
+                            menu_expanded: result.menu_expanded,
+                            chamados_clicked: result.chamados_clicked,
+                            error: data.job ? data.job.error : null
+                        });
+                        (result.screenshots || []).forEach(path => addScreenshot(path, path.split('/').pop()));
+                    })
+                    .finally(() => {
+                        testRunning = false;
+                        document.getElementById('startBtn').disabled = false;
+                    });
+            });
         }
         
-        // Atualizar imagens a cada 8 segundos
-        setInterval(refreshImages, 8000);
+        // Atualizar imagens a cada 10 segundos
+        setInterval(refreshImages, 10000);
         
         // Carregar imagens iniciais
         refreshImages();
@@ -6677,1598 +1870,582 @@ def test_expandable_with_logs():
         return html_content
         
     except Exception as e:
-        logger.error(f"Erro no endpoint test-expandable-with-logs: {e}")
+        logger.error(f"Erro no endpoint working-code-detailed: {e}")
         return jsonify({
-            'status': 'error',
-            'message': f'Erro no endpoint test-expandable-with-logs: {e}'
-        }), 500
-
-@app.route('/test-expandable-fixed-logs', methods=['GET'])
-def test_expandable_fixed_logs():
-    """Endpoint corrigido com logs reais e imagens funcionais"""
-    try:
-        # Caminho para arquivo de logs
-        logs_file = "/tmp/current_logs.json"
-        
-        # Verificar se há logs existentes
-        current_logs = []
-        if os.path.exists(logs_file):
-            try:
-                with open(logs_file, 'r') as f:
-                    current_logs = json.load(f)
-            except:
-                current_logs = []
-        
-        # Se não há logs, iniciar o teste
-        if not current_logs:
-            def run_test_with_logs():
-                """Executa o teste e salva logs em arquivo"""
-                try:
-                    # Configurar ambiente
-                    env = os.environ.copy()
-                    env['DISPLAY'] = ':99'
-                    
-                    # Código para executar o teste real
-                    test_code = f'''
-import asyncio
-import json
-import sys
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-def save_log(message, level="info"):
-    """Salva log em arquivo"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    log_entry = {{
-        "timestamp": timestamp,
-        "message": message,
-        "level": level
-    }}
-    
-    logs_file = "/tmp/current_logs.json"
-    
-    # Carregar logs existentes
-    try:
-        if os.path.exists(logs_file):
-            with open(logs_file, 'r') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-    except:
-        logs = []
-    
-    # Adicionar novo log
-    logs.append(log_entry)
-    
-    # Salvar logs
-    with open(logs_file, 'w') as f:
-        json.dump(logs, f, indent=2)
-    
-    print(f"[{timestamp}] [{{level.upper()}}] {message}")
-    sys.stdout.flush()
-
-async def run_real_working_test():
-    """Executa o código EXATO do /test-expandable-menu que funciona"""
-    
-    save_log("🚀 Iniciando teste com código EXATO que funciona 100%", "success")
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    save_log("📁 Diretório de screenshots configurado", "info")
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        save_log("🌐 Iniciando navegador Chromium...", "info")
-        
-        # Configurar browser EXATO
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        save_log("✅ Navegador iniciado com sucesso", "success")
-        
-        # ===================
-        # FAZER LOGIN (CÓDIGO EXATO)
-        # ===================
-        save_log("🔐 Navegando para página de login...", "info")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        save_log("📝 Preenchendo credenciais...", "info")
-        
-        # Preencher email (seletor EXATO)
-        email_selector = '//input[@placeholder="seuemail@email.com"]'
-        await page.fill(email_selector, "raiseupbt@gmail.com")
-        save_log(f"✅ Email preenchido usando: {email_selector}", "success")
-        
-        # Preencher senha (seletor EXATO)
-        password_selector = '//input[@type="password"]'
-        await page.fill(password_selector, "@Uujpgi8u")
-        save_log(f"✅ Senha preenchida usando: {password_selector}", "success")
-        
-        # Clicar no botão de login (seletor EXATO)
-        login_button_selector = '//button[contains(text(), "Log In")]'
-        await page.click(login_button_selector)
-        save_log(f"✅ Botão de login clicado: {login_button_selector}", "success")
-        
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil se necessário (código EXATO)
-        profile_selector = '//*[contains(text(), "Fornecedor")]'
-        profile_count = await page.locator(profile_selector).count()
-        
-        if profile_count > 0:
-            await page.click(profile_selector)
-            save_log(f"✅ Perfil Fornecedor selecionado: {profile_selector}", "success")
-            await page.wait_for_timeout(5000)
-        else:
-            save_log("ℹ️ Seleção de perfil não necessária", "info")
-        
-        # Screenshot do dashboard
-        dashboard_screenshot = f"/tmp/screenshots/fixed_01_dashboard.png"
-        await page.screenshot(path=dashboard_screenshot)
-        save_log(f"📸 Screenshot do dashboard salvo: {dashboard_screenshot}", "success")
-        
-        # ===================
-        # FASE 1: EXPANDIR MENU (CÓDIGO EXATO)
-        # ===================
-        save_log("🔍 FASE 1: Procurando e expandindo o menu hambúrguer...", "info")
-        
-        menu_expanded = False
-        
-        # Seletores EXATOS do código que funciona
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_toggle_selectors:
-            try:
-                save_log(f"🔍 Testando seletor de menu: {selector}", "info")
-                
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                save_log(f"📊 Elementos encontrados com {selector}: {elements}", "info")
-                
-                if elements > 0:
-                    save_log(f"🎯 Clicando no menu com: {selector}", "info")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    
-                    # Screenshot do menu expandido
-                    menu_screenshot = f"/tmp/screenshots/fixed_02_menu_expanded.png"
-                    await page.screenshot(path=menu_screenshot)
-                    save_log(f"📸 Screenshot do menu expandido salvo: {menu_screenshot}", "success")
-                    
-                    # Verificar se menu foi expandido (código EXATO)
-                    visible_elements = await page.evaluate("""
-                        () => {{
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {{
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }}).length;
-                        }}
-                    """)
-                    
-                    save_log(f"📊 Elementos visíveis após expansão: {visible_elements}", "info")
-                    
-                    if visible_elements > 10:  # Threshold EXATO
-                        save_log(f"✅ Menu expandido com sucesso usando: {selector}", "success")
-                        menu_expanded = True
-                        break
-                    else:
-                        save_log(f"❌ Menu não expandiu suficientemente com: {selector}", "error")
-                        
-            except Exception as e:
-                save_log(f"❌ Erro ao expandir menu com {selector}: {e}", "error")
-                continue
-        
-        # ===================
-        # FASE 2: PROCURAR "GERENCIAR CHAMADOS" (CÓDIGO EXATO)
-        # ===================
-        save_log("🔍 FASE 2: Procurando item 'Gerenciar chamados' ou similar...", "info")
-        
-        os_found = False
-        
-        # Seletores EXATOS do código que funciona
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for selector in specific_selectors:
-            try:
-                save_log(f"🔍 Testando seletor para chamados: {selector}", "info")
-                
-                elements = await page.locator(selector).count()
-                save_log(f"📊 Elementos encontrados com {selector}: {elements}", "info")
-                
-                if elements > 0:
-                    save_log(f"✅ Encontrado 'Gerenciar chamados' com: {selector}", "success")
-                    
-                    # Obter o texto do elemento antes de clicar
-                    element_text = await page.locator(selector).first.text_content()
-                    save_log(f"📝 Texto do elemento: '{element_text}'", "info")
-                    
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    
-                    # Screenshot após clicar
-                    chamados_screenshot = f"/tmp/screenshots/fixed_03_chamados_clicked.png"
-                    await page.screenshot(path=chamados_screenshot)
-                    save_log(f"📸 Screenshot após clicar salvo: {chamados_screenshot}", "success")
-                    
-                    # Verificar se navegou para página de OS/chamados (código EXATO)
-                    current_url = page.url
-                    save_log(f"🌐 URL atual após clique: {current_url}", "info")
-                    
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        save_log(f"✅ SUCESSO! Navegou para página de OS: {current_url}", "success")
-                        os_found = True
-                        break
-                    else:
-                        save_log(f"❌ URL não corresponde a página de OS: {current_url}", "error")
-                        
-            except Exception as e:
-                save_log(f"❌ Erro ao clicar em {selector}: {e}", "error")
-                continue
-        
-        # ===================
-        # FASE 3: ANÁLISE ESTRUTURAL (CÓDIGO EXATO)
-        # ===================
-        if not os_found:
-            save_log("🔍 FASE 3: Analisando estrutura do menu expandido...", "info")
-            
-            # Mapear elementos (código EXATO)
-            menu_elements = await page.evaluate("""
-                () => {{
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {{
-                        document.querySelectorAll(selector).forEach((el, index) => {{
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            // Focar no menu lateral esquerdo (código EXATO)
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {{
-                                elements.push({{
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                }});
-                            }}
-                        }});
-                    }});
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }}
-            """)
-            
-            save_log(f"📊 Elementos encontrados no menu lateral: {{len(menu_elements)}}", "info")
-            
-            # Log detalhado dos elementos encontrados
-            for i, element in enumerate(menu_elements[:5]):  # Primeiros 5 elementos
-                save_log(f"📋 Elemento {{i+1}}: '{{element['text']}}' ({{element['tagName']}}) - classes: {{element['classes']}}", "info")
-            
-            # Procurar pelo segundo elemento (código EXATO)
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]  # Segundo elemento (índice 1)
-                save_log(f"🎯 Tentando segundo elemento: '{{target_element['text']}}' ({{target_element['tagName']}})", "info")
-                
-                try:
-                    # Tentar clicar no elemento por texto (código EXATO)
-                    if target_element['text']:
-                        await page.click(f"text='{{target_element['text']}}'")
-                        await page.wait_for_timeout(3000)
-                        
-                        # Screenshot do segundo elemento
-                        second_screenshot = f"/tmp/screenshots/fixed_04_second_element.png"
-                        await page.screenshot(path=second_screenshot)
-                        save_log(f"📸 Screenshot do segundo elemento salvo: {second_screenshot}", "success")
-                        
-                        current_url = page.url
-                        save_log(f"🌐 URL após clicar no segundo elemento: {current_url}", "info")
-                        
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            save_log(f"✅ SUCESSO com segundo elemento! URL: {current_url}", "success")
-                            os_found = True
-                        else:
-                            save_log(f"❌ Segundo elemento não levou à página de OS: {current_url}", "error")
-                            
-                except Exception as e:
-                    save_log(f"❌ Erro ao clicar no segundo elemento: {e}", "error")
-            else:
-                save_log("❌ Menos de 2 elementos encontrados no menu", "error")
-        
-        # Screenshot final
-        final_screenshot = f"/tmp/screenshots/fixed_05_final.png"
-        await page.screenshot(path=final_screenshot)
-        save_log(f"📸 Screenshot final salvo: {final_screenshot}", "success")
-        
-        final_url = page.url
-        save_log(f"🌐 URL final: {final_url}", "info")
-        
-        if os_found:
-            save_log("🎉 TESTE CONCLUÍDO COM SUCESSO! Navegação para Controle de OS realizada!", "success")
-        else:
-            save_log("❌ TESTE FALHOU: Não conseguiu navegar para página de OS/chamados", "error")
-        
-        return {{
-            "success": os_found,
-            "final_url": final_url,
-            "menu_expanded": menu_expanded,
-            "elements_found": len(menu_elements) if 'menu_elements' in locals() else 0
-        }}
-        
-    except Exception as e:
-        save_log(f"❌ ERRO CRÍTICO no teste: {e}", "error")
-        error_screenshot = f"/tmp/screenshots/fixed_error.png"
-        await page.screenshot(path=error_screenshot)
-        save_log(f"📸 Screenshot do erro salvo: {error_screenshot}", "error")
-        return {{"error": str(e)}}
-    
-    finally:
-        save_log("🔄 Fechando navegador...", "info")
-        await browser.close()
-        await playwright.stop()
-        save_log("✅ Navegador fechado com sucesso", "success")
-
-if __name__ == "__main__":
-    result = asyncio.run(run_real_working_test())
-    print(json.dumps(result, indent=2))
-'''
-                    
-                    # Executar código Python
-                    result = subprocess.run([
-                        'python3', '-c', test_code
-                    ], env=env, capture_output=True, text=True, timeout=300)
-                    
-                    # Log do resultado
-                    if result.returncode == 0:
-                        logger.info("✅ Teste executado com sucesso")
-                    else:
-                        logger.error(f"❌ Teste falhou: {result.stderr}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Erro ao executar teste: {e}")
-            
-            # Executar em thread separada
-            thread = threading.Thread(target=run_test_with_logs)
-            thread.daemon = True
-            thread.start()
-            
-            # Aguardar um pouco para os logs iniciais
-            time.sleep(1)
-            
-            # Recarregar logs
-            if os.path.exists(logs_file):
-                try:
-                    with open(logs_file, 'r') as f:
-                        current_logs = json.load(f)
-                except:
-                    current_logs = []
-        
-        # Listar screenshots disponíveis
-        screenshots = []
-        screenshots_dir = "/tmp/screenshots"
-        if os.path.exists(screenshots_dir):
-            for file in os.listdir(screenshots_dir):
-                if file.startswith("fixed_") and file.endswith(".png"):
-                    screenshots.append(file)
-        
-        # Gerar HTML
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Test Expandable - Logs e Imagens Corrigidos</title>
-            <meta charset="UTF-8">
-            <meta http-equiv="refresh" content="2">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f0f0f0; }}
-                .container {{ max-width: 1400px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ text-align: center; margin-bottom: 30px; }}
-                .status {{ padding: 15px; margin: 10px 0; border-radius: 5px; font-weight: bold; }}
-                .status-success {{ background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
-                .terminal {{ background: #000; color: #00ff00; padding: 20px; border-radius: 5px; font-family: 'Courier New', monospace; height: 400px; overflow-y: auto; border: 2px solid #333; }}
-                .log-entry {{ margin: 3px 0; padding: 2px; white-space: pre-wrap; }}
-                .log-success {{ color: #00ff00; }}
-                .log-error {{ color: #ff0000; }}
-                .log-info {{ color: #ffff00; }}
-                .screenshots {{ margin: 30px 0; }}
-                .screenshot {{ margin: 15px; display: inline-block; vertical-align: top; }}
-                .screenshot img {{ max-width: 280px; border: 2px solid #ddd; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }}
-                .screenshot h4 {{ text-align: center; margin: 10px 0; color: #333; }}
-                .refresh-btn {{ background: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; margin: 10px 0; }}
-                .refresh-btn:hover {{ background: #0056b3; }}
-                .clear-btn {{ background: #dc3545; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; margin: 10px 0; }}
-                .clear-btn:hover {{ background: #c82333; }}
-            </style>
-            <script>
-                function clearLogs() {{
-                    fetch('/clear-logs', {{method: 'POST'}})
-                        .then(() => location.reload());
-                }}
-            </script>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔧 Test Expandable - Logs e Imagens Corrigidos</h1>
-                    <p>Código exato do /test-expandable-menu + logs reais na página + imagens funcionais</p>
-                    <button class="refresh-btn" onclick="location.reload()">🔄 Atualizar</button>
-                    <button class="clear-btn" onclick="clearLogs()">🗑️ Limpar Logs</button>
-                </div>
-                
-                <div class="status status-success">
-                    ✅ Logs salvos em arquivo e exibidos na página<br>
-                    📸 Screenshots com paths corretos<br>
-                    🔄 Página atualiza automaticamente a cada 2 segundos
-                </div>
-                
-                <div class="terminal" id="terminal">
-                    <div class="log-entry log-success">[SISTEMA] Logs em tempo real do teste:</div>
-        """
-        
-        # Adicionar logs na página
-        for log_entry in current_logs:
-            level_class = f"log-{log_entry['level']}"
-            html_content += f'<div class="log-entry {level_class}">[{log_entry["timestamp"]}] {log_entry["message"]}</div>\n'
-        
-        html_content += """
-                </div>
-                
-                <div class="screenshots">
-                    <h2>📸 Screenshots Disponíveis:</h2>
-        """
-        
-        # Adicionar screenshots
-        screenshot_names = {
-            "fixed_01_dashboard.png": "Dashboard",
-            "fixed_02_menu_expanded.png": "Menu Expandido", 
-            "fixed_03_chamados_clicked.png": "Chamados Clicado",
-            "fixed_04_second_element.png": "Segundo Elemento",
-            "fixed_05_final.png": "Final"
-        }
-        
-        for filename, title in screenshot_names.items():
-            html_content += f"""
-                    <div class="screenshot">
-                        <h4>{title}</h4>
-                        <img src="/screenshot/{filename}" alt="{title}" onerror="this.style.display='none'">
-                    </div>
-            """
-        
-        html_content += f"""
-                </div>
-                
-                <div class="status status-success">
-                    🌐 <strong>Total de logs:</strong> {len(current_logs)}<br>
-                    📋 <strong>Screenshots encontrados:</strong> {len(screenshots)}<br>
-                    🔗 <strong>Galeria completa:</strong> <a href="/screenshots/gallery" target="_blank">Ver todos</a>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html_content
-        
-    except Exception as e:
-        logger.error(f"Erro no endpoint test-expandable-fixed-logs: {e}")
-        return f"<h1>Erro: {e}</h1><p>Verifique os logs do servidor para mais detalhes.</p>"
+            'status': 'error',
+            'message': f'Erro no endpoint working-code-detailed: {e}'
+        }), 500
 
-@app.route('/clear-logs', methods=['POST'])
-def clear_logs():
-    """Limpa os logs do teste"""
+@app.route('/execute-working-detailed', methods=['POST'])
+def execute_working_detailed():
+    """Executa a navegação pelo menu até a página de OS com logs detalhados"""
     try:
-        logs_file = "/tmp/current_logs.json"
-        if os.path.exists(logs_file):
-            os.remove(logs_file)
-        return jsonify({"status": "success", "message": "Logs limpos"})
+        return submit_automation_job(
+            'working_detailed',
+            {},
+            eace_flows.menu_navigation_test,
+            timeout=300
+        )
+        
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)})
-
-@app.route('/test-expandable-real-working', methods=['GET'])
-def test_expandable_real_working():
-    """Endpoint baseado EXATAMENTE no código que funciona + logs reais"""
-    import threading
-    import time
-    import json
-    from datetime import datetime
-    
-    # Sistema de logs em tempo real - usar arquivo para comunicação
-    logs_file = "/tmp/real_logs.json"
-    
-    def load_logs():
-        """Carrega logs do arquivo"""
-        try:
-            if os.path.exists(logs_file):
-                with open(logs_file, 'r') as f:
-                    return json.load(f)
-            return []
-        except:
-            return []
-    
-    def run_exact_working_code():
-        """Executa o código EXATO do /test-expandable-menu que funciona"""
-        try:
-            # Inicializar arquivo de logs
-            initial_logs = [{
-                "timestamp": datetime.now().strftime("%H:%M:%S"),
-                "message": "🚀 Iniciando teste com código EXATO que funciona 100%",
-                "level": "success"
-            }]
-            
-            with open(logs_file, 'w') as f:
-                json.dump(initial_logs, f)
-            
-            # Configurar ambiente
-            env = os.environ.copy()
-            env['DISPLAY'] = ':99'
-            
-            # Código Python EXATO do endpoint que funciona + sistema de logs
-            working_code = '''
-import asyncio
-import json
-import sys
-from playwright.async_api import async_playwright
-import os
-from datetime import datetime
-
-def log_real_action(message, level="info"):
-    """Log com timestamp real"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] [{level.upper()}] {message}")
-    sys.stdout.flush()
+        logger.error(f"Erro ao iniciar teste detalhado: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro ao iniciar teste detalhado: {e}'
+        }), 500
 
-async def run_exact_working_test():
-    """Código EXATO do /test-expandable-menu que funciona"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    log_real_action("📁 Diretório de screenshots configurado", "info")
-    
-    playwright = await async_playwright().start()
-    
+@app.route('/test-expandable-with-logs', methods=['GET'])
+def test_expandable_with_logs():
+    """Versão do test-expandable-menu que funciona + logs reais em tempo real"""
     try:
-        log_real_action("🌐 Iniciando navegador Chromium...", "info")
+        # Página HTML com visualização de logs reais
+        html_content = '''
+<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Expandable Menu - Logs Reais</title>
+    <style>
+        body {
+            font-family: 'Courier New', monospace;
+            background: #0a0a0a;
+            color: #00ff00;
+            margin: 0;
+            padding: 20px;
+            line-height: 1.5;
+        }
         
-        # Configurar browser EXATO
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
+        .container {
+            max-width: 1600px;
+            margin: 0 auto;
+        }
         
-        page = await browser.new_page()
-        log_real_action("✅ Navegador iniciado com sucesso", "success")
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            padding: 20px;
+            background: #1a1a1a;
+            border: 2px solid #00ff00;
+            border-radius: 10px;
+        }
         
-        # ===================
-        # FAZER LOGIN (CÓDIGO EXATO)
-        # ===================
-        log_real_action("🔐 Navegando para página de login...", "info")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
+        .header h1 {
+            color: #00ff00;
+            font-size: 1.8em;
+            margin: 0;
+        }
         
-        log_real_action("📝 Preenchendo credenciais...", "info")
+        .controls {
+            display: flex;
+            gap: 15px;
+            justify-content: center;
+            margin-bottom: 30px;
+        }
         
-        # Preencher email (seletor EXATO)
-        email_selector = '//input[@placeholder="seuemail@email.com"]'
-        await page.fill(email_selector, "raiseupbt@gmail.com")
-        log_real_action(f"✅ Email preenchido usando: {email_selector}", "success")
+        .btn {
+            padding: 10px 20px;
+            background: #00ff00;
+            color: #000;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-weight: bold;
+        }
         
-        # Preencher senha (seletor EXATO)
-        password_selector = '//input[@type="password"]'
-        await page.fill(password_selector, "@Uujpgi8u")
-        log_real_action(f"✅ Senha preenchida usando: {password_selector}", "success")
+        .btn:hover {
+            background: #00cc00;
+        }
         
-        # Clicar no botão de login (seletor EXATO)
-        login_button_selector = '//button[contains(text(), "Log In")]'
-        await page.click(login_button_selector)
-        log_real_action(f"✅ Botão de login clicado: {login_button_selector}", "success")
+        .btn:disabled {
+            background: #444;
+            cursor: not-allowed;
+        }
         
-        await page.wait_for_timeout(5000)
+        .main-content {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            height: 75vh;
+        }
         
-        # Selecionar perfil se necessário (código EXATO)
-        profile_selector = '//*[contains(text(), "Fornecedor")]'
-        profile_count = await page.locator(profile_selector).count()
+        .panel {
+            background: #1a1a1a;
+            border: 2px solid #00ff00;
+            border-radius: 10px;
+            padding: 20px;
+            overflow-y: auto;
+        }
         
-        if profile_count > 0:
-            await page.click(profile_selector)
-            log_real_action(f"✅ Perfil Fornecedor selecionado: {profile_selector}", "success")
-            await page.wait_for_timeout(5000)
-        else:
-            log_real_action("ℹ️ Seleção de perfil não necessária", "info")
-        
-        # Screenshot do dashboard (nome EXATO)
-        dashboard_screenshot = f"{screenshots_dir}/working_01_dashboard.png"
-        await page.screenshot(path=dashboard_screenshot)
-        log_real_action(f"📸 Screenshot do dashboard: {dashboard_screenshot}", "success")
-        
-        # ===================
-        # FASE 1: EXPANDIR MENU (CÓDIGO EXATO)
-        # ===================
-        log_real_action("🔍 FASE 1: Procurando e expandindo o menu hambúrguer...", "info")
-        
-        menu_expanded = False
-        
-        # Seletores EXATOS do código que funciona
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_toggle_selectors:
-            try:
-                log_real_action(f"🔍 Testando seletor de menu: {selector}", "info")
-                
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                log_real_action(f"📊 Elementos encontrados com {selector}: {elements}", "info")
-                
-                if elements > 0:
-                    log_real_action(f"🎯 Clicando no menu com: {selector}", "info")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    
-                    # Screenshot do menu expandido
-                    menu_screenshot = f"{screenshots_dir}/working_02_menu_expanded.png"
-                    await page.screenshot(path=menu_screenshot)
-                    log_real_action(f"📸 Screenshot do menu expandido: {menu_screenshot}", "success")
-                    
-                    # Verificar se menu foi expandido (código EXATO)
-                    visible_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    log_real_action(f"📊 Elementos visíveis após expansão: {visible_elements}", "info")
-                    
-                    if visible_elements > 10:  # Threshold EXATO
-                        log_real_action(f"✅ Menu expandido com sucesso usando: {selector}", "success")
-                        menu_expanded = True
-                        break
-                    else:
-                        log_real_action(f"❌ Menu não expandiu suficientemente com: {selector}", "error")
-                        
-            except Exception as e:
-                log_real_action(f"❌ Erro ao expandir menu com {selector}: {e}", "error")
-                continue
+        .panel h2 {
+            color: #00ff00;
+            margin-top: 0;
+            text-align: center;
+            font-size: 1.2em;
+        }
         
-        # ===================
-        # FASE 2: PROCURAR "GERENCIAR CHAMADOS" (CÓDIGO EXATO)
-        # ===================
-        log_real_action("🔍 FASE 2: Procurando item 'Gerenciar chamados' ou similar...", "info")
-        
-        os_found = False
-        
-        # Seletores EXATOS do código que funciona
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for selector in specific_selectors:
-            try:
-                log_real_action(f"🔍 Testando seletor para chamados: {selector}", "info")
-                
-                elements = await page.locator(selector).count()
-                log_real_action(f"📊 Elementos encontrados com {selector}: {elements}", "info")
-                
-                if elements > 0:
-                    log_real_action(f"✅ Encontrado 'Gerenciar chamados' com: {selector}", "success")
-                    
-                    # Obter o texto do elemento antes de clicar
-                    element_text = await page.locator(selector).first.text_content()
-                    log_real_action(f"📝 Texto do elemento: '{element_text}'", "info")
-                    
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    
-                    # Screenshot após clicar
-                    chamados_screenshot = f"{screenshots_dir}/working_03_chamados_clicked.png"
-                    await page.screenshot(path=chamados_screenshot)
-                    log_real_action(f"📸 Screenshot após clicar: {chamados_screenshot}", "success")
-                    
-                    # Verificar se navegou para página de OS/chamados (código EXATO)
-                    current_url = page.url
-                    log_real_action(f"🌐 URL atual após clique: {current_url}", "info")
-                    
-                    if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                        log_real_action(f"✅ SUCESSO! Navegou para página de OS: {current_url}", "success")
-                        os_found = True
-                        break
-                    else:
-                        log_real_action(f"❌ URL não corresponde a página de OS: {current_url}", "error")
-                        
-            except Exception as e:
-                log_real_action(f"❌ Erro ao clicar em {selector}: {e}", "error")
-                continue
+        .log-entry {
+            margin-bottom: 8px;
+            padding: 6px 10px;
+            background: #2a2a2a;
+            border-left: 4px solid #00ff00;
+            border-radius: 3px;
+            font-size: 11px;
+        }
         
-        # ===================
-        # FASE 3: ANÁLISE ESTRUTURAL (CÓDIGO EXATO)
-        # ===================
-        if not os_found:
-            log_real_action("🔍 FASE 3: Analisando estrutura do menu expandido...", "info")
-            
-            # Mapear elementos (código EXATO)
-            menu_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            // Focar no menu lateral esquerdo (código EXATO)
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                                elements.push({
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                });
-                            }
-                        });
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
-            
-            log_real_action(f"📊 Elementos encontrados no menu lateral: {len(menu_elements)}", "info")
-            
-            # Log detalhado dos elementos encontrados
-            for i, element in enumerate(menu_elements[:5]):  # Primeiros 5 elementos
-                log_real_action(f"📋 Elemento {i+1}: '{element['text']}' ({element['tagName']}) - classes: {element['classes']}", "info")
-            
-            # Procurar pelo segundo elemento (código EXATO)
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]  # Segundo elemento (índice 1)
-                log_real_action(f"🎯 Tentando segundo elemento: '{target_element['text']}' ({target_element['tagName']})", "info")
-                
-                try:
-                    # Tentar clicar no elemento por texto (código EXATO)
-                    if target_element['text']:
-                        await page.click(f"text='{target_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        
-                        # Screenshot do segundo elemento
-                        second_screenshot = f"{screenshots_dir}/working_04_second_element.png"
-                        await page.screenshot(path=second_screenshot)
-                        log_real_action(f"📸 Screenshot do segundo elemento: {second_screenshot}", "success")
-                        
-                        current_url = page.url
-                        log_real_action(f"🌐 URL após clicar no segundo elemento: {current_url}", "info")
-                        
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            log_real_action(f"✅ SUCESSO com segundo elemento! URL: {current_url}", "success")
-                            os_found = True
-                        else:
-                            log_real_action(f"❌ Segundo elemento não levou à página de OS: {current_url}", "error")
-                            
-                except Exception as e:
-                    log_real_action(f"❌ Erro ao clicar no segundo elemento: {e}", "error")
-            else:
-                log_real_action("❌ Menos de 2 elementos encontrados no menu", "error")
+        .log-phase {
+            color: #ffff00;
+            font-weight: bold;
+        }
         
-        # Screenshot final
-        final_screenshot = f"{screenshots_dir}/working_05_final.png"
-        await page.screenshot(path=final_screenshot)
-        log_real_action(f"📸 Screenshot final: {final_screenshot}", "success")
+        .log-action {
+            color: #00ffff;
+            font-weight: bold;
+        }
         
-        final_url = page.url
-        log_real_action(f"🌐 URL final: {final_url}", "info")
+        .log-result {
+            color: #00ff00;
+        }
         
-        if os_found:
-            log_real_action("🎉 TESTE CONCLUÍDO COM SUCESSO! Navegação para Controle de OS realizada!", "success")
-        else:
-            log_real_action("❌ TESTE FALHOU: Não conseguiu navegar para página de OS/chamados", "error")
+        .log-success {
+            border-left-color: #00ff00;
+            background: #0a2a0a;
+        }
         
-        return {
-            "success": os_found,
-            "final_url": final_url,
-            "menu_expanded": menu_expanded,
-            "elements_found": len(menu_elements) if 'menu_elements' in locals() else 0
+        .log-error {
+            border-left-color: #ff0000;
+            background: #2a0a0a;
         }
         
-    except Exception as e:
-        log_real_action(f"❌ ERRO CRÍTICO no teste: {e}", "error")
-        error_screenshot = f"{screenshots_dir}/working_error.png"
-        await page.screenshot(path=error_screenshot)
-        log_real_action(f"📸 Screenshot do erro: {error_screenshot}", "error")
-        return {"error": str(e)}
-    
-    finally:
-        log_real_action("🔄 Fechando navegador...", "info")
-        await browser.close()
-        await playwright.stop()
-        log_real_action("✅ Navegador fechado com sucesso", "success")
-
-if __name__ == "__main__":
-    result = asyncio.run(run_exact_working_test())
-    print(json.dumps(result, indent=2))
-'''
-            
-            add_real_log("🔧 Executando código Python com Playwright...", "info")
-            
-            # Executar código Python
-            result = subprocess.run([
-                'python3', '-c', working_code
-            ], env=env, capture_output=True, text=True, timeout=300)
-            
-            # Processar saída do código
-            if result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        add_real_log(f"📝 {line}", "info")
-            
-            if result.stderr:
-                for line in result.stderr.strip().split('\n'):
-                    if line.strip():
-                        add_real_log(f"❌ {line}", "error")
-            
-            if result.returncode == 0:
-                add_real_log("✅ Teste executado com sucesso!", "success")
-            else:
-                add_real_log(f"❌ Teste falhou com código: {result.returncode}", "error")
-            
-        except Exception as e:
-            add_real_log(f"❌ Erro durante execução: {e}", "error")
-    
-    # Executar teste em thread separada
-    thread = threading.Thread(target=run_exact_working_code)
-    thread.daemon = True
-    thread.start()
-    
-    # Aguardar um pouco para os logs iniciais
-    time.sleep(2)
-    
-    # Gerar HTML com logs reais
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Test Expandable Menu - Código Exato Que Funciona</title>
-        <meta charset="UTF-8">
-        <meta http-equiv="refresh" content="3">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; background: #f0f0f0; }}
-            .container {{ max-width: 1400px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .header {{ text-align: center; margin-bottom: 30px; }}
-            .status {{ padding: 15px; margin: 10px 0; border-radius: 5px; font-weight: bold; }}
-            .status-success {{ background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
-            .terminal {{ background: #000; color: #00ff00; padding: 20px; border-radius: 5px; font-family: 'Courier New', monospace; height: 500px; overflow-y: auto; border: 2px solid #333; }}
-            .log-entry {{ margin: 3px 0; padding: 2px; }}
-            .log-success {{ color: #00ff00; }}
-            .log-error {{ color: #ff0000; }}
-            .log-info {{ color: #ffff00; }}
-            .screenshots {{ margin: 30px 0; }}
-            .screenshot {{ margin: 15px; display: inline-block; vertical-align: top; }}
-            .screenshot img {{ max-width: 280px; border: 2px solid #ddd; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }}
-            .screenshot h4 {{ text-align: center; margin: 10px 0; color: #333; }}
-            .refresh-btn {{ background: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; margin: 10px 0; }}
-            .refresh-btn:hover {{ background: #0056b3; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🔧 Test Expandable Menu - Código Exato Que Funciona</h1>
-                <p>Baseado no código EXATO do /test-expandable-menu que funciona 100%</p>
-                <button class="refresh-btn" onclick="location.reload()">🔄 Atualizar Logs</button>
-            </div>
-            
-            <div class="status status-success">
-                ✅ Usando o código EXATO do endpoint que funciona<br>
-                🎯 Navegação: Login → Perfil → Menu Hambúrguer → Gerenciar Chamados → Controle de OS<br>
-                🔄 Página atualiza automaticamente a cada 3 segundos
-            </div>
-            
-            <div class="terminal" id="terminal">
-                <div class="log-entry log-success">[LOG SYSTEM] Logs reais do código EXATO em execução:</div>
-    """
-    
-    # Adicionar logs reais
-    for log_entry in global_logs:
-        level_class = f"log-{log_entry['level']}"
-        html_content += f'<div class="log-entry {level_class}">[{log_entry["timestamp"]}] {log_entry["message"]}</div>\n'
-    
-    html_content += f"""
-            </div>
-            
-            <div class="screenshots">
-                <h2>📸 Screenshots em Tempo Real:</h2>
-                <div class="screenshot">
-                    <h4>Dashboard</h4>
-                    <img src="/screenshot/working_01_dashboard.png" alt="Dashboard">
-                </div>
-                <div class="screenshot">
-                    <h4>Menu Expandido</h4>
-                    <img src="/screenshot/working_02_menu_expanded.png" alt="Menu Expandido">
-                </div>
-                <div class="screenshot">
-                    <h4>Chamados Clicado</h4>
-                    <img src="/screenshot/working_03_chamados_clicked.png" alt="Chamados">
-                </div>
-                <div class="screenshot">
-                    <h4>Segundo Elemento</h4>
-                    <img src="/screenshot/working_04_second_element.png" alt="Segundo Elemento">
-                </div>
-                <div class="screenshot">
-                    <h4>Controle de OS (Final)</h4>
-                    <img src="/screenshot/working_05_final.png" alt="Final">
-                </div>
-            </div>
-            
-            <div class="status status-success">
-                🌐 <strong>Galeria completa:</strong> <a href="/screenshots/gallery" target="_blank">Ver todos os screenshots</a><br>
-                📋 <strong>Lista JSON:</strong> <a href="/screenshots" target="_blank">Ver JSON</a>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    return html_content
-
-@app.route('/execute-real-test', methods=['POST'])
-def execute_real_test():
-    """Executa o código EXATO do test-expandable-menu com logs reais"""
-    try:
-        def run_real_test():
-            try:
-                # Configurar ambiente
-                env = os.environ.copy()
-                env['DISPLAY'] = ':99'
-                
-                # Código EXATO do test-expandable-menu + logs reais
-                real_test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-
-async def test_expandable_menu_with_real_logs():
-    """Código EXATO do test-expandable-menu que funciona + logs reais"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "/tmp/screenshots"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("realtest_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        # Configurar browser
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
+        .log-warning {
+            border-left-color: #ffff00;
+            background: #2a2a0a;
+        }
+        
+        .screenshot-item {
+            margin-bottom: 15px;
+            text-align: center;
+        }
+        
+        .screenshot-item img {
+            max-width: 100%;
+            border: 2px solid #00ff00;
+            border-radius: 5px;
+        }
+        
+        .screenshot-caption {
+            color: #ffff00;
+            font-weight: bold;
+            margin-top: 8px;
+            font-size: 12px;
+        }
+        
+        .status-bar {
+            position: fixed;
+            top: 10px;
+            right: 20px;
+            padding: 8px 16px;
+            background: #1a1a1a;
+            border: 2px solid #00ff00;
+            border-radius: 5px;
+            color: #00ff00;
+            font-weight: bold;
+            font-size: 12px;
+        }
         
-        page = await browser.new_page()
+        .status-running {
+            border-color: #ffff00;
+            color: #ffff00;
+        }
         
-        print("🚀 INICIANDO TESTE COM CÓDIGO EXATO DO test-expandable-menu")
+        .status-success {
+            border-color: #00ff00;
+            color: #00ff00;
+        }
         
-        # Fazer login
-        print("🔐 LOGIN - Navegando para página de login")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        print("✅ LOGIN - Página carregada")
+        .status-error {
+            border-color: #ff0000;
+            color: #ff0000;
+        }
         
-        print("🔐 LOGIN - Preenchendo email: raiseupbt@gmail.com")
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        print("✅ LOGIN - Email preenchido")
+        .element-info {
+            background: #2a2a2a;
+            padding: 8px;
+            margin: 5px 0;
+            border-radius: 3px;
+            border-left: 4px solid #00ffff;
+            font-size: 10px;
+        }
         
-        print("🔐 LOGIN - Preenchendo senha")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        print("✅ LOGIN - Senha preenchida")
+        .element-info .element-selector {
+            color: #00ffff;
+            font-weight: bold;
+        }
         
-        print("🔐 LOGIN - Clicando botão Log In")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        print("✅ LOGIN - Botão clicado, aguardando resposta")
+        .element-info .element-count {
+            color: #ffff00;
+        }
         
-        try:
-            await page.screenshot(path=f"{screenshots_dir}/realtest_01_login.png")
-            print("📸 SCREENSHOT - realtest_01_login.png gerado")
-        except Exception as e:
-            print(f"❌ SCREENSHOT - Erro ao gerar realtest_01_login.png: {e}")
-        
-        # Selecionar perfil se necessário
-        print("👤 PERFIL - Verificando se precisa selecionar perfil")
-        fornecedor_count = await page.locator('//*[contains(text(), "Fornecedor")]').count()
-        print(f"👤 PERFIL - Elementos 'Fornecedor' encontrados: {fornecedor_count}")
-        
-        if fornecedor_count > 0:
-            print("👤 PERFIL - Clicando em Fornecedor")
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-            print("✅ PERFIL - Perfil Fornecedor selecionado")
-        else:
-            print("ℹ️ PERFIL - Fornecedor não encontrado ou já selecionado")
+        .element-info .element-action {
+            color: #00ff00;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔧 Test Expandable Menu - Logs Reais</h1>
+            <p>Código que funciona + logs detalhados do que realmente acontece</p>
+        </div>
         
-        try:
-            await page.screenshot(path=f"{screenshots_dir}/realtest_02_dashboard.png")
-            print("📸 SCREENSHOT - realtest_02_dashboard.png gerado")
-        except Exception as e:
-            print(f"❌ SCREENSHOT - Erro ao gerar realtest_02_dashboard.png: {e}")
-        
-        # FASE 1: Expandir o menu (hambúrguer) - CÓDIGO EXATO
-        print("\\n🔍 MENU - FASE 1: Procurando e expandindo o menu...")
-        
-        menu_expanded = False
-        
-        # Seletores EXATOS do código que funciona
-        menu_toggle_selectors = [
-            "button[class*='menu']",
-            "button[class*='hamburger']", 
-            "button[class*='toggle']",
-            "button[aria-label*='menu']",
-            "button[focusable='true']",
-            "//button[contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[contains(@aria-label, 'menu')]",
-            "//button[1]",
-            "//div[contains(@class, 'generic')]//button[1]"
-        ]
-        
-        for selector in menu_toggle_selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = await page.locator(selector).count()
-                else:
-                    elements = await page.locator(selector).count()
-                
-                print(f"🔍 MENU - Testando seletor: {selector}")
-                print(f"🔍 MENU - Elementos encontrados: {elements}")
-                
-                if elements > 0:
-                    print(f"📍 MENU - Tentando expandir menu com: {selector}")
-                    
-                    if selector.startswith("//"):
-                        await page.locator(selector).click()
-                    else:
-                        await page.locator(selector).click()
-                    
-                    await page.wait_for_timeout(2000)
-                    try:
-                        await page.screenshot(path=f"{screenshots_dir}/realtest_03_menu_expanded.png")
-                        print("📸 SCREENSHOT - realtest_03_menu_expanded.png gerado")
-                    except Exception as e:
-                        print(f"❌ SCREENSHOT - Erro ao gerar realtest_03_menu_expanded.png: {e}")
-                    
-                    # Verificar se menu foi expandido (procurar por mais elementos visíveis)
-                    visible_elements = await page.evaluate("""
-                        () => {
-                            const elements = document.querySelectorAll('a, button, [role="button"]');
-                            return Array.from(elements).filter(el => {
-                                const rect = el.getBoundingClientRect();
-                                return rect.width > 0 && rect.height > 0;
-                            }).length;
-                        }
-                    """)
-                    
-                    print(f"🔍 MENU - Elementos visíveis após clique: {visible_elements}")
-                    
-                    # Assumir que menu foi expandido se há mais elementos visíveis
-                    if visible_elements > 10:  # Threshold do código original
-                        print("✅ MENU - Menu expandido com sucesso!")
-                        menu_expanded = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ MENU - Erro ao expandir menu com {selector}: {e}")
-                continue
+        <div class="controls">
+            <button class="btn" id="startBtn" onclick="startRealTest()">
+                ▶️ Executar Teste Real
+            </button>
+            <button class="btn" onclick="clearAll()">
+                🗑️ Limpar
+            </button>
+            <button class="btn" onclick="refreshImages()">
+                🔄 Atualizar Imagens
+            </button>
+        </div>
         
-        if not menu_expanded:
-            print("❌ MENU - Não conseguiu expandir o menu")
-            try:
-                await page.screenshot(path=f"{screenshots_dir}/realtest_03_menu_not_expanded.png")
-                print("📸 SCREENSHOT - realtest_03_menu_not_expanded.png gerado")
-            except Exception as e:
-                print(f"❌ SCREENSHOT - Erro ao gerar realtest_03_menu_not_expanded.png: {e}")
-        
-        # FASE 2: Procurar e clicar no item do menu relacionado a OS - CÓDIGO EXATO
-        print("\\n🔍 NAVEGAÇÃO - FASE 2: Procurando item 'Gerenciar chamados' ou similar...")
-        
-        os_found = False
-        
-        # Primeiro, procurar especificamente por "Gerenciar chamados" (código original)
-        specific_selectors = [
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//div[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'chamados')]",
-            "//a[contains(text(), 'chamados')]",
-            "//*[contains(text(), 'chamados')]"
-        ]
-        
-        for selector in specific_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                print(f"🔍 NAVEGAÇÃO - Testando seletor: {selector}")
-                print(f"🔍 NAVEGAÇÃO - Elementos encontrados: {elements}")
-                
-                if elements > 0:
-                    print(f"📍 NAVEGAÇÃO - Encontrado 'Gerenciar chamados': {selector}")
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    await page.screenshot(path=f"{screenshots_dir}/realtest_04_chamados_clicked.png")
-                    print("📸 SCREENSHOT - realtest_04_chamados_clicked.png gerado")
-                    
-                    # Verificar se navegou para página de OS/chamados (Bubble não muda URL)
-                    current_url = page.url
-                    print(f"📍 NAVEGAÇÃO - URL atual: {current_url}")
-                    
-                    # Aguardar página carregar
-                    await page.wait_for_timeout(2000)
-                    
-                    # Verificar se apareceram elementos específicos da página de OS
-                    os_indicators = await page.evaluate("""
-                        () => {
-                            const indicators = [];
-                            const texts = Array.from(document.querySelectorAll('*')).map(el => el.textContent?.trim()).filter(text => text);
-                            
-                            // Procurar por textos indicadores da página de OS
-                            if (texts.some(text => 
-                                text.includes('Controle de OS') || 
-                                text.includes('Adicionar nova OS') || 
-                                text.includes('Relatório de OS') ||
-                                text.includes('Total de OS') ||
-                                text.includes('OS por estado') ||
-                                text.includes('Gerenciar chamados')
-                            )) {
-                                indicators.push('os_page_found');
-                            }
-                            
-                            return indicators;
-                        }
-                    """)
-                    
-                    print(f"📍 NAVEGAÇÃO - Indicadores de página OS: {os_indicators}")
-                    
-                    if len(os_indicators) > 0:
-                        print(f"✅ NAVEGAÇÃO - SUCESSO! Detectada página de OS pelos elementos")
-                        os_found = True
-                        break
-                        
-            except Exception as e:
-                print(f"❌ NAVEGAÇÃO - Erro ao clicar em {selector}: {e}")
-                continue
+        <div class="status-bar" id="statusBar">
+            Aguardando...
+        </div>
         
-        # Se não encontrou "Gerenciar chamados", procurar por outros termos - CÓDIGO EXATO
-        if not os_found:
-            print("🔍 NAVEGAÇÃO - Procurando por termos alternativos...")
+        <div class="main-content">
+            <div class="panel">
+                <h2>📋 Logs Reais do Código</h2>
+                <div id="logsContainer"></div>
+            </div>
             
-            alternative_selectors = [
-                "//*[contains(text(), 'OS')]",
-                "//*[contains(text(), 'Operação')]",
-                "//*[contains(text(), 'Controle')]",
-                "//*[contains(text(), 'Tickets')]",
-                "//*[contains(text(), 'Atendimento')]",
-                "//button[contains(@class, 'generic')]",
-                "//a[contains(@href, 'os')]",
-                "//a[contains(@href, 'chamados')]",
-                "//a[contains(@href, 'controle')]"
-            ]
+            <div class="panel">
+                <h2>📸 Screenshots</h2>
+                <div id="screenshotsContainer"></div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        let testRunning = false;
+        
+        function updateStatus(status, message) {
+            const statusBar = document.getElementById('statusBar');
+            statusBar.textContent = message;
+            statusBar.className = 'status-bar status-' + status;
+        }
+        
+        function addRealLog(phase, action, result, type = 'info') {
+            const container = document.getElementById('logsContainer');
+            const logEntry = document.createElement('div');
+            logEntry.className = `log-entry log-${type}`;
             
-            for selector in alternative_selectors:
-                try:
-                    elements = await page.locator(selector).count()
-                    print(f"🔍 NAVEGAÇÃO - Testando alternativa: {selector}")
-                    print(f"🔍 NAVEGAÇÃO - Elementos encontrados: {elements}")
-                    
-                    if elements > 0:
-                        print(f"📍 NAVEGAÇÃO - Tentando alternativa: {selector}")
-                        await page.locator(selector).click()
-                        await page.wait_for_timeout(3000)
-                        await page.screenshot(path=f"{screenshots_dir}/realtest_05_alternative_clicked.png")
-                        
-                        current_url = page.url
-                        print(f"📍 NAVEGAÇÃO - URL após alternativa: {current_url}")
-                        
-                        if 'os' in current_url.lower() or 'chamados' in current_url.lower() or 'controle' in current_url.lower():
-                            print(f"✅ NAVEGAÇÃO - SUCESSO com alternativa! URL: {current_url}")
-                            os_found = True
-                            break
-                            
-                except Exception as e:
-                    print(f"❌ NAVEGAÇÃO - Erro com alternativa {selector}: {e}")
-                    continue
-        
-        # FASE 3: Análise estrutural do menu expandido - CÓDIGO EXATO
-        if not os_found:
-            print("\\n🔍 ANÁLISE - FASE 3: Analisando estrutura do menu expandido...")
+            const timestamp = new Date().toLocaleTimeString();
+            logEntry.innerHTML = `
+                [${timestamp}] <span class="log-phase">${phase}</span> - <span class="log-action">${action}</span>: <span class="log-result">${result}</span>
+            `;
             
-            # Mapear todos os elementos do menu expandido
-            menu_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const selectors = ['button', 'a', '[role="button"]', 'div[onclick]'];
-                    
-                    selectors.forEach(selector => {
-                        document.querySelectorAll(selector).forEach((el, index) => {
-                            const rect = el.getBoundingClientRect();
-                            const text = el.textContent?.trim() || '';
-                            
-                            // Focar no menu lateral esquerdo
-                            if (rect.left < 200 && rect.width > 10 && rect.height > 10 && text.length > 0) {
-                                elements.push({
-                                    tagName: el.tagName.toLowerCase(),
-                                    text: text,
-                                    classes: el.className,
-                                    href: el.href || '',
-                                    left: rect.left,
-                                    top: rect.top,
-                                    index: index
-                                });
-                            }
-                        });
-                    });
-                    
-                    return elements.sort((a, b) => a.top - b.top);
-                }
-            """)
+            container.appendChild(logEntry);
+            container.scrollTop = container.scrollHeight;
+        }
+        
+        function addElementInfo(selector, count, action) {
+            const container = document.getElementById('logsContainer');
+            const elementDiv = document.createElement('div');
+            elementDiv.className = 'element-info';
+            
+            elementDiv.innerHTML = `
+                <div class="element-selector">Seletor: ${selector}</div>
+                <div class="element-count">Elementos encontrados: ${count}</div>
+                <div class="element-action">Ação: ${action}</div>
+            `;
             
-            print(f"📋 ANÁLISE - Elementos encontrados no menu: {len(menu_elements)}")
+            container.appendChild(elementDiv);
+            container.scrollTop = container.scrollHeight;
+        }
+        
+        function addScreenshot(filename, caption) {
+            const container = document.getElementById('screenshotsContainer');
+            const screenshotDiv = document.createElement('div');
+            screenshotDiv.className = 'screenshot-item';
             
-            # Salvar elementos para análise
-            with open(f"{screenshots_dir}/realtest_menu_elements.json", "w") as f:
-                json.dump(menu_elements, f, indent=2)
+            screenshotDiv.innerHTML = `
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" onerror="this.style.display='none'"></a>
+                <div class="screenshot-caption">${caption}</div>
+            `;
             
-            # Procurar pelo segundo elemento (baseado no feedback do usuário)
-            if len(menu_elements) >= 2:
-                target_element = menu_elements[1]  # Segundo elemento (índice 1)
-                print(f"🎯 ANÁLISE - Tentando segundo elemento: {target_element}")
-                
-                try:
-                    # Tentar clicar no elemento por texto
-                    if target_element['text']:
-                        print(f"📍 ANÁLISE - Clicando no texto: {target_element['text']}")
-                        await page.click(f"text='{target_element['text']}'")
-                        await page.wait_for_timeout(3000)
-                        try:
-                            await page.screenshot(path=f"{screenshots_dir}/realtest_06_second_element.png")
-                            print("📸 SCREENSHOT - realtest_06_second_element.png gerado")
-                        except Exception as e:
-                            print(f"❌ SCREENSHOT - Erro ao gerar realtest_06_second_element.png: {e}")
-                        
-                        current_url = page.url
-                        print(f"📍 ANÁLISE - URL após segundo elemento: {current_url}")
-                        
-                        # Aguardar página carregar
-                        await page.wait_for_timeout(2000)
-                        
-                        # Verificar se apareceram elementos específicos da página de OS
-                        os_indicators = await page.evaluate("""
-                            () => {
-                                const indicators = [];
-                                const texts = Array.from(document.querySelectorAll('*')).map(el => el.textContent?.trim()).filter(text => text);
-                                
-                                // Log dos textos encontrados para debug
-                                const osTexts = texts.filter(text => 
-                                    text.includes('OS') || 
-                                    text.includes('Relatório') || 
-                                    text.includes('Total') ||
-                                    text.includes('Controle') ||
-                                    text.includes('Adicionar')
-                                );
-                                
-                                console.log('Textos relacionados a OS encontrados:', osTexts);
-                                
-                                // Procurar por textos indicadores da página de OS (baseado nos logs)
-                                if (texts.some(text => 
-                                    text === 'Total de OS' ||
-                                    text === 'OS por estado' ||
-                                    text === 'Relatório de OS' ||
-                                    text.includes('Controle de OS') || 
-                                    text.includes('Adicionar nova OS') || 
-                                    text.includes('Gerenciar chamados')
-                                )) {
-                                    indicators.push('os_page_found');
-                                }
-                                
-                                return {
-                                    indicators: indicators,
-                                    osTexts: osTexts
-                                };
-                            }
-                        """)
-                        
-                        print(f"📍 ANÁLISE - Indicadores de página OS: {os_indicators.get('indicators', [])}")
-                        print(f"📍 ANÁLISE - Textos de OS encontrados: {os_indicators.get('osTexts', [])}")
-                        
-                        if len(os_indicators.get('indicators', [])) > 0:
-                            print(f"✅ ANÁLISE - SUCESSO com segundo elemento! Detectada página de OS pelos elementos")
-                            os_found = True
-                            
-                except Exception as e:
-                    print(f"❌ ANÁLISE - Erro ao clicar no segundo elemento: {e}")
-        
-        # Screenshot final SEMPRE (mesmo com erros)
-        try:
-            await page.screenshot(path=f"{screenshots_dir}/realtest_07_final.png")
-            print("📸 SCREENSHOT - realtest_07_final.png gerado")
-        except Exception as e:
-            print(f"❌ SCREENSHOT - Erro ao gerar realtest_07_final.png: {e}")
+            container.appendChild(screenshotDiv);
+            container.scrollTop = container.scrollHeight;
+        }
         
-        final_url = page.url
-        print(f"\\n📍 RESULTADO - URL final: {final_url}")
+        function clearAll() {
+            document.getElementById('logsContainer').innerHTML = '';
+            document.getElementById('screenshotsContainer').innerHTML = '';
+            updateStatus('idle', 'Aguardando...');
+        }
         
-        # Verificar se chegou na página correta baseado em elementos (Bubble não muda URL)
-        if not os_found:
-            print("🔍 RESULTADO - Verificação final: procurando indicadores da página de OS...")
-            
-            # Verificação final baseada em elementos
-            final_os_indicators = await page.evaluate("""
-                () => {
-                    const indicators = [];
-                    const texts = Array.from(document.querySelectorAll('*')).map(el => el.textContent?.trim()).filter(text => text);
-                    
-                    // Procurar por textos indicadores da página de OS (baseado nos logs)
-                    if (texts.some(text => 
-                        text === 'Total de OS' ||
-                        text === 'OS por estado' ||
-                        text === 'Relatório de OS' ||
-                        text.includes('Controle de OS') || 
-                        text.includes('Adicionar nova OS') || 
-                        text.includes('Gerenciar chamados')
-                    )) {
-                        indicators.push('os_page_found');
-                    }
+        function refreshImages() {
+            fetch('/screenshots')
+                .then(response => response.json())
+                .then(data => {
+                    const container = document.getElementById('screenshotsContainer');
+                    container.innerHTML = '<h2>📸 Screenshots</h2>';
                     
-                    return indicators;
-                }
-            """)
-            
-            print(f"📍 RESULTADO - Indicadores finais de página OS: {final_os_indicators}")
-            
-            if len(final_os_indicators) > 0:
-                print("✅ RESULTADO - Teste CONCLUÍDO COM SUCESSO!")
-                print("🎉 RESULTADO - Navegação para página de OS/chamados realizada")
-                print(f"📍 RESULTADO - Página de OS detectada pelos elementos da página")
-                os_found = True
-        
-        if os_found:
-            print("✅ RESULTADO - Teste CONCLUÍDO COM SUCESSO!")
-            print("🎉 RESULTADO - Navegação para página de OS/chamados realizada")
-            print("🔍 RESULTADO - Executando bloco de sucesso - mapeamento e busca por botão...")
-            
-            # Mapear elementos da página de OS
-            print("🔍 CONTROLE - Mapeando elementos da página de OS")
-            os_elements = await page.evaluate("""
-                () => {
-                    const elements = [];
-                    const buttons = document.querySelectorAll('button');
+                    const expandableScreenshots = data.screenshots.filter(s => 
+                        s.filename.includes('expandable_') || s.filename.includes('realtest_')
+                    );
                     
-                    buttons.forEach((btn, index) => {
-                        const rect = btn.getBoundingClientRect();
-                        const text = btn.textContent?.trim() || '';
-                        
-                        if (rect.width > 0 && rect.height > 0 && text) {
-                            elements.push({
-                                text: text,
-                                position: {
-                                    x: rect.left,
-                                    y: rect.top,
-                                    width: rect.width,
-                                    height: rect.height
-                                }
-                            });
-                        }
+                    expandableScreenshots.forEach(screenshot => {
+                        addScreenshot(screenshot.filename, screenshot.description || screenshot.filename);
                     });
-                    
-                    return elements;
-                }
-            """)
-            
-            print(f"🔍 CONTROLE - Elementos mapeados: {len(os_elements)}")
-            
-            # Procurar botão "Adicionar"
-            adicionar_buttons = [el for el in os_elements if 'adicionar' in el['text'].lower()]
-            print(f"🎯 CONTROLE - Botões 'Adicionar' encontrados: {len(adicionar_buttons)}")
-            
-            for btn in adicionar_buttons:
-                print(f"📍 CONTROLE - Botão: {btn['text']} - Posição: {btn['position']}")
-            
-            # Tentar clicar no botão "Adicionar OS"
-            print("\\n🎯 ADICIONAR OS - Procurando e clicando no botão...")
-            print("🔍 ADICIONAR OS - Iniciando busca por botão 'Adicionar nova OS'...")
-            
-            adicionar_os_selectors = [
-                "//button[contains(text(), 'Adicionar nova OS')]",
-                "//button[contains(text(), 'Adicionar OS')]",
-                "//button[contains(text(), 'Adicionar')]",
-                "//button[contains(text(), 'Nova OS')]",
-                "//button[contains(text(), 'Novo')]",
-                "//a[contains(text(), 'Adicionar nova OS')]",
-                "//a[contains(text(), 'Adicionar OS')]",
-                "//a[contains(text(), 'Adicionar')]",
-                "//*[contains(text(), 'Adicionar nova OS')]",
-                "//*[contains(text(), 'Adicionar OS')]",
-                "//*[contains(text(), 'Adicionar')]"
-            ]
+                })
+                .catch(error => console.error('Erro ao carregar screenshots:', error));
+        }
+        
+        function startRealTest() {
+            if (testRunning) return;
             
-            botao_clicado = False
+            testRunning = true;
+            document.getElementById('startBtn').disabled = true;
+            updateStatus('running', 'Executando teste real...');
+            clearAll();
             
-            for selector in adicionar_os_selectors:
-                try:
-                    elements = await page.locator(selector).count()
-                    print(f"🔍 ADICIONAR OS - Testando seletor: {selector}")
-                    print(f"🔍 ADICIONAR OS - Elementos encontrados: {elements}")
-                    
-                    if elements > 0:
-                        print(f"📍 ADICIONAR OS - Clicando no botão: {selector}")
-                        await page.locator(selector).click()
-                        await page.wait_for_timeout(3000)
-                        
-                        # Screenshot após clicar no botão
-                        await page.screenshot(path=f"{screenshots_dir}/realtest_08_adicionar_os.png")
-                        print("📸 SCREENSHOT - realtest_08_adicionar_os.png gerado")
-                        
-                        # Verificar se abriu nova página/modal (Bubble não muda URL)
-                        current_url = page.url
-                        print(f"📍 ADICIONAR OS - URL após clicar: {current_url}")
-                        
-                        # Aguardar possível modal ou nova página carregar
-                        await page.wait_for_timeout(3000)
-                        
-                        # Verificar se apareceram elementos de formulário de nova OS
-                        form_indicators = await page.evaluate("""
-                            () => {
-                                const indicators = [];
-                                const texts = Array.from(document.querySelectorAll('*')).map(el => el.textContent?.trim()).filter(text => text);
-                                
-                                // Procurar por indicadores de formulário de nova OS
-                                if (texts.some(text => text.includes('Nova OS') || text.includes('Criar OS') || text.includes('Adicionar OS'))) {
-                                    indicators.push('form_opened');
-                                }
-                                
-                                // Procurar por campos de formulário típicos
-                                const inputs = document.querySelectorAll('input, select, textarea');
-                                if (inputs.length > 3) {
-                                    indicators.push('form_fields_found');
-                                }
-                                
-                                return indicators;
-                            }
-                        """)
-                        
-                        print(f"📍 ADICIONAR OS - Indicadores de formulário: {form_indicators}")
-                        
-                        # Screenshot final da nova página/modal
-                        await page.screenshot(path=f"{screenshots_dir}/realtest_09_nova_pagina.png")
-                        print("📸 SCREENSHOT - realtest_09_nova_pagina.png gerado")
-                        
-                        print("✅ ADICIONAR OS - Botão clicado com sucesso!")
-                        botao_clicado = True
-                        break
-                        
-                except Exception as e:
-                    print(f"❌ ADICIONAR OS - Erro ao clicar em {selector}: {e}")
-                    continue
+            fetch('/execute-real-test', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                }
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    updateStatus('success', 'Teste iniciado');
+                    startRealLogMonitoring();
+                } else {
+                    updateStatus('error', 'Erro ao iniciar');
+                    addRealLog('ERRO', 'Inicialização', data.message, 'error');
+                    testRunning = false;
+                    document.getElementById('startBtn').disabled = false;
+                }
+            })
+            .catch(error => {
+                updateStatus('error', 'Erro de conexão');
+                addRealLog('ERRO', 'Conexão', error.message, 'error');
+                testRunning = false;
+                document.getElementById('startBtn').disabled = false;
+            });
+        }
+        
+        function startRealLogMonitoring() {
+            // Simular logs reais baseados no código que funciona
+            const realLogs = [
+                {phase: 'LOGIN', action: 'Navegando para página', result: 'https://eace.org.br/login?login=login', type: 'info'},
+                {phase: 'LOGIN', action: 'Preenchendo campo email', result: 'XPath: //input[@placeholder="seuemail@email.com"]', type: 'info'},
+                {phase: 'LOGIN', action: 'Preenchendo campo senha', result: 'XPath: //input[@type="password"]', type: 'info'},
+                {phase: 'LOGIN', action: 'Clicando botão login', result: 'XPath: //button[contains(text(), "Log In")]', type: 'info'},
+                {phase: 'PERFIL', action: 'Verificando perfil Fornecedor', result: 'XPath: //*[contains(text(), "Fornecedor")]', type: 'info'},
+                {phase: 'PERFIL', action: 'Clicando em Fornecedor', result: 'Perfil selecionado com sucesso', type: 'success'},
+                {phase: 'MENU', action: 'Testando seletor menu', result: 'button[class*="menu"] - 0 elementos', type: 'warning'},
+                {phase: 'MENU', action: 'Testando seletor menu', result: 'button[focusable="true"] - 1 elemento', type: 'info'},
+                {phase: 'MENU', action: 'Clicando botão menu', result: 'button[focusable="true"] - Clicado', type: 'success'},
+                {phase: 'MENU', action: 'Verificando expansão', result: 'Elementos visíveis: 15 → 23', type: 'success'},
+                {phase: 'NAVEGAÇÃO', action: 'Procurando "Gerenciar chamados"', result: 'XPath: //*[contains(text(), "Gerenciar chamados")]', type: 'info'},
+                {phase: 'NAVEGAÇÃO', action: 'Clicando "Gerenciar chamados"', result: 'Elemento encontrado e clicado', type: 'success'},
+                {phase: 'CONTROLE', action: 'Verificando URL', result: 'https://eace.org.br/dashboard_fornecedor/controle_os', type: 'success'},
+                {phase: 'CONTROLE', action: 'Mapeando botão "Adicionar OS"', result: 'Botão identificado no canto superior direito', type: 'success'}
+            ];
             
-            if not botao_clicado:
-                print("❌ ADICIONAR OS - Não conseguiu encontrar/clicar no botão")
-                
-        else:
-            print("❌ RESULTADO - Não conseguiu navegar para página de OS/chamados")
-        
-        return {
-            "success": os_found,
-            "final_url": final_url,
-            "menu_expanded": menu_expanded,
-            "elements_found": len(menu_elements) if 'menu_elements' in locals() else 0
+            let logIndex = 0;
+            const logInterval = setInterval(() => {
+                if (logIndex < realLogs.length) {
+                    const log = realLogs[logIndex];
+                    addRealLog(log.phase, log.action, log.result, log.type);
+                    logIndex++;
+                } else {
+                    clearInterval(logInterval);
+                    updateStatus('success', 'Teste concluído');
+                    testRunning = false;
+                    document.getElementById('startBtn').disabled = false;
+                    refreshImages();
+                }
+            }, 2000);
         }
         
+        // Atualizar imagens a cada 8 segundos
+        setInterval(refreshImages, 8000);
+        
+        // Carregar imagens iniciais
+        refreshImages();
+    </script>
+</body>
+</html>
+        '''
+        
+        return html_content
+        
     except Exception as e:
-        print(f"❌ ERRO GERAL: {e}")
-        await page.screenshot(path=f"{screenshots_dir}/realtest_error.png")
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
+        logger.error(f"Erro no endpoint test-expandable-with-logs: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro no endpoint test-expandable-with-logs: {e}'
+        }), 500
 
-if __name__ == "__main__":
-    result = asyncio.run(test_expandable_menu_with_real_logs())
-    print(json.dumps(result, indent=2))
-'''
+# Execução corrente do teste com logs (stream SSE em /jobs/<id>/events)
+fixed_logs_job_id = None
+fixed_logs_lock = threading.Lock()
+
+@app.route('/test-expandable-fixed-logs', methods=['GET'])
+def test_expandable_fixed_logs():
+    """Teste da navegação pelo menu lateral com logs em tempo real (SSE) e screenshots"""
+    global fixed_logs_job_id
+    try:
+        store = get_job_store()
+        
+        # Se não há execução registrada, iniciar o teste no motor (pool de navegadores)
+        with fixed_logs_lock:
+            if fixed_logs_job_id is None:
+                record = store.create('test_expandable_fixed_logs', {})
+                fixed_logs_job_id = record['id']
+                schedule_automation_job(record, eace_flows.menu_navigation_test, timeout=300)
+            job_id = fixed_logs_job_id
+        
+        # Gerar HTML
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Test Expandable - Logs e Imagens Corrigidos</title>
+            <meta charset="UTF-8">
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f0f0f0; }}
+                .container {{ max-width: 1400px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+                .header {{ text-align: center; margin-bottom: 30px; }}
+                .status {{ padding: 15px; margin: 10px 0; border-radius: 5px; font-weight: bold; }}
+                .status-success {{ background: #d4edda; color: #155724; border: 1px solid #c3e6cb; }}
+                .terminal {{ background: #000; color: #00ff00; padding: 20px; border-radius: 5px; font-family: 'Courier New', monospace; height: 400px; overflow-y: auto; border: 2px solid #333; }}
+                .log-entry {{ margin: 3px 0; padding: 2px; white-space: pre-wrap; }}
+                .log-success {{ color: #00ff00; }}
+                .log-error {{ color: #ff0000; }}
+                .log-info {{ color: #ffff00; }}
+                .screenshots {{ margin: 30px 0; }}
+                .screenshot {{ margin: 15px; display: inline-block; vertical-align: top; }}
+                .screenshot img {{ max-width: 280px; border: 2px solid #ddd; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1); }}
+                .screenshot h4 {{ text-align: center; margin: 10px 0; color: #333; }}
+                .refresh-btn {{ background: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; margin: 10px 0; }}
+                .refresh-btn:hover {{ background: #0056b3; }}
+                .clear-btn {{ background: #dc3545; color: white; padding: 10px 20px; border: none; border-radius: 5px; cursor: pointer; margin: 10px 0; }}
+                .clear-btn:hover {{ background: #c82333; }}
+            </style>
+            <script>
+                function clearLogs() {{
+                    fetch('/clear-logs', {{method: 'POST'}})
+                        .then(() => location.reload());
+                }}
+                
+                // Logs chegam em tempo real via SSE (replay desde o início ao abrir a página)
+                const eventos = new EventSource('/jobs/{job_id}/events');
+                eventos.addEventListener('log', event => {{
+                    const entry = JSON.parse(event.data);
+                    const terminal = document.getElementById('terminal');
+                    const div = document.createElement('div');
+                    div.className = 'log-entry log-' + entry.level;
+                    div.textContent = '[' + entry.timestamp + '] ' + entry.message;
+                    terminal.appendChild(div);
+                    terminal.scrollTop = terminal.scrollHeight;
+                    document.getElementById('logCount').textContent = entry.seq;
+                }});
+                eventos.addEventListener('end', () => {{
+                    eventos.close();
+                    fetch('/jobs/{job_id}')
+                        .then(response => response.json())
+                        .then(data => {{
+                            const result = (data.job && data.job.result) || {{}};
+                            const container = document.getElementById('screenshots');
+                            (result.screenshots || []).forEach(path => {{
+                                const div = document.createElement('div');
+                                div.className = 'screenshot';
+                                div.innerHTML = '<h4></h4><a target="_blank"><img></a>';
+                                div.querySelector('h4').textContent = path.split('/').pop();
+                                div.querySelector('a').href = '/screenshot/' + path;
+                                div.querySelector('img').src = '/thumbnail/' + path;
+                                container.appendChild(div);
+                            }});
+                        }});
+                }});
+            </script>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🔧 Test Expandable - Logs e Imagens Corrigidos</h1>
+                    <p>Login, menu lateral e "Gerenciar chamados" até a página de OS, com logs reais na página</p>
+                    <button class="refresh-btn" onclick="location.reload()">🔄 Atualizar</button>
+                    <button class="clear-btn" onclick="clearLogs()">🗑️ Limpar Logs</button>
+                </div>
                 
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', real_test_code
-                ], env=env, capture_output=True, text=True, timeout=300)
+                <div class="status status-success">
+                    ✅ Teste executado no pool de navegadores do servidor<br>
+                    📸 Screenshots do job exibidos ao final<br>
+                    🔄 Logs transmitidos em tempo real (Server-Sent Events)
+                </div>
                 
-                logger.info(f"Teste real executado - Return code: {result.returncode}")
-                logger.info(f"Stdout: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"Stderr: {result.stderr}")
-                    
-            except Exception as e:
-                logger.error(f"Erro ao executar teste real: {e}")
+                <div class="terminal" id="terminal">
+                    <div class="log-entry log-success">[SISTEMA] Logs em tempo real do teste:</div>
+        """
         
-        # Executar em thread separada
-        thread = threading.Thread(target=run_real_test)
-        thread.daemon = True
-        thread.start()
+        html_content += f"""
+                </div>
+                
+                <div class="screenshots" id="screenshots">
+                    <h2>📸 Screenshots do teste:</h2>
+                </div>
+                
+                <div class="status status-success">
+                    🌐 <strong>Total de logs:</strong> <span id="logCount">0</span><br>
+                    🔗 <strong>Resultado:</strong> <a href="/jobs/{job_id}" target="_blank">/jobs/{job_id}</a><br>
+                    🔗 <strong>Galeria completa:</strong> <a href="/screenshots/gallery" target="_blank">Ver todos</a>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
         
-        return jsonify({
-            'status': 'success',
-            'message': 'Teste real iniciado com código exato do test-expandable-menu'
-        })
+        return html_content
+        
+    except Exception as e:
+        logger.error(f"Erro no endpoint test-expandable-fixed-logs: {e}")
+        return f"<h1>Erro: {e}</h1><p>Verifique os logs do servidor para mais detalhes.</p>"
+
+@app.route('/clear-logs', methods=['POST'])
+def clear_logs():
+    """Limpa os logs do teste (a próxima visita inicia uma nova execução)"""
+    global fixed_logs_job_id
+    try:
+        with fixed_logs_lock:
+            job_id, fixed_logs_job_id = fixed_logs_job_id, None
+        
+        if job_id:
+            hub = get_log_hub()
+            stream = hub.get(job_id)
+            if stream is None or stream.closed:
+                logs_file = hub.path(job_id)
+                if os.path.exists(logs_file):
+                    os.remove(logs_file)
+        return jsonify({"status": "success", "message": "Logs limpos"})
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)})
+
+@app.route('/execute-real-test', methods=['POST'])
+def execute_real_test():
+    """Executa o teste de navegação até o modal "Adicionar nova OS" """
+    try:
+        return submit_automation_job(
+            'real_test',
+            {},
+            lambda context: eace_flows.navigation_test(context, open_modal=True),
+            timeout=300
+        )
         
     except Exception as e:
         logger.error(f"Erro ao iniciar teste real: {e}")
@@ -8276,6 +2453,8 @@ if __name__ == "__main__":
             'status': 'error',
             'message': f'Erro ao iniciar teste real: {e}'
         }), 500
+
+
 @app.route('/test-os-detection', methods=['GET'])
 def test_os_detection():
     """Endpoint para testar apenas a detecção de página OS"""
@@ -8398,128 +2577,10 @@ def test_os_detection():
 def execute_os_detection_test():
     """Executa apenas a parte de detecção de página OS"""
     try:
-        def run_os_detection():
-            try:
-                # Código Python para testar detecção
-                test_code = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-
-async def test_os_detection():
-    """Teste apenas a detecção de página OS"""
-    
-    playwright = await async_playwright().start()
-    
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        page = await browser.new_page()
-        
-        # Fazer login rápido
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        
-        # Selecionar perfil
-        fornecedor_count = await page.locator('//*[contains(text(), "Fornecedor")]').count()
-        if fornecedor_count > 0:
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-        
-        # Clicar no botão "portable_wifi_off" (ação que sabemos que funciona)
-        await page.click('text="portable_wifi_off"')
-        await page.wait_for_timeout(3000)
-        
-        # Testar detecção
-        os_indicators = await page.evaluate("""
-            () => {
-                const indicators = [];
-                const texts = Array.from(document.querySelectorAll('*')).map(el => el.textContent?.trim()).filter(text => text);
-                
-                const osTexts = texts.filter(text => 
-                    text.includes('OS') || 
-                    text.includes('Relatório') || 
-                    text.includes('Total') ||
-                    text.includes('Controle') ||
-                    text.includes('Adicionar')
-                );
-                
-                console.log('Textos relacionados a OS encontrados:', osTexts);
-                
-                if (texts.some(text => 
-                    text === 'Total de OS' ||
-                    text === 'OS por estado' ||
-                    text === 'Relatório de OS' ||
-                    text.includes('Controle de OS') || 
-                    text.includes('Adicionar nova OS') || 
-                    text.includes('Gerenciar chamados')
-                )) {
-                    indicators.push('os_page_found');
-                }
-                
-                return {
-                    indicators: indicators,
-                    osTexts: osTexts,
-                    allTexts: texts.slice(0, 50)  // Primeiros 50 textos para debug
-                };
-            }
-        """)
-        
-        return {
-            "success": len(os_indicators.get('indicators', [])) > 0,
-            "indicators": os_indicators.get('indicators', []),
-            "osTexts": os_indicators.get('osTexts', []),
-            "allTexts": os_indicators.get('allTexts', [])
-        }
-        
-    except Exception as e:
-        return {"error": str(e)}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(test_os_detection())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', test_code
-                ], capture_output=True, text=True, timeout=120)
-                
-                if result.returncode == 0:
-                    import json
-                    output = json.loads(result.stdout)
-                    return output
-                else:
-                    return {"error": result.stderr}
-                    
-            except Exception as e:
-                return {"error": str(e)}
-        
-        # Executar em thread separada
-        import threading
-        result = {"status": "running"}
-        
-        def run_test():
-            nonlocal result
-            result = run_os_detection()
-        
-        thread = threading.Thread(target=run_test)
-        thread.start()
-        thread.join(timeout=120)
-        
-        if thread.is_alive():
+        try:
+            # Executar no motor de automação (pool de navegadores aquecidos)
+            result = get_engine().run_with_context(eace_flows.detect_os_page, timeout=120)
+        except concurrent.futures.TimeoutError:
             return jsonify({
                 'success': False,
                 'message': 'Timeout na execução do teste'
@@ -8724,6 +2785,38 @@ def create_os_with_inep():
             logs.scrollTop = logs.scrollHeight;
         }
         
+        function aguardarJob(jobId, onLog) {
+            return new Promise((resolve, reject) => {
+                const consultar = () => fetch('/jobs/' + jobId)
+                    .then(response => response.json())
+                    .then(data => {
+                        if (!data.success) {
+                            reject(new Error(data.message));
+                        } else if (data.job.status === 'done' || data.job.status === 'failed') {
+                            resolve(data.job);
+                        } else {
+                            setTimeout(consultar, 2000);
+                        }
+                    })
+                    .catch(reject);
+                
+                // Logs chegam em tempo real via SSE; a consulta só roda no fim (ou se o stream cair)
+                const eventos = new EventSource('/jobs/' + jobId + '/events');
+                eventos.addEventListener('log', event => {
+                    const entry = JSON.parse(event.data);
+                    if (onLog) onLog(entry.message, entry.level);
+                });
+                eventos.addEventListener('end', () => {
+                    eventos.close();
+                    consultar();
+                });
+                eventos.onerror = () => {
+                    eventos.close();
+                    consultar();
+                };
+            });
+        }
+        
         function executarCriacaoOS() {
             if (executando) return;
             
@@ -8755,6 +2848,11 @@ def create_os_with_inep():
                 })
             })
             .then(response => response.json())
+            .then(job => {
+                adicionarLog(`⏳ Job ${job.job_id} em execução...`, 'info');
+                return aguardarJob(job.job_id, adicionarLog);
+            })
+            .then(job => job.result || { error: job.error })
             .then(data => {
                 if (data.success) {
                     adicionarLog('✅ OS criada com sucesso!', 'success');
@@ -8770,368 +2868,45 @@ def create_os_with_inep():
                     
                     // Carregar screenshots
                     if (data.screenshots && data.screenshots.length > 0) {
-                        data.screenshots.forEach(screenshot => {
-                            const div = document.createElement('div');
-                            div.className = 'screenshot';
-                            div.innerHTML = `<img src="/screenshot/${screenshot}" alt="${screenshot}">`;
-                            screenshots.appendChild(div);
-                        });
-                    }
-                } else {
-                    adicionarLog(`❌ Erro: ${data.error}`, 'error');
-                }
-            })
-            .catch(error => {
-                adicionarLog(`❌ Erro na requisição: ${error}`, 'error');
-            })
-            .finally(() => {
-                executando = false;
-                btn.disabled = false;
-                btn.textContent = '🚀 Criar OS com INEP';
-            });
-        }
-    </script>
-</body>
-</html>
-'''
-                return html_content
-        
-        # Obter dados da requisição
-        data = request.json if request.method == 'POST' else {}
-        inep_value = data.get('inep', request.args.get('inep', '33099553'))
-        
-        logger.info(f"Criando OS com INEP: {inep_value}")
-        
-        def run_os_creation():
-            try:
-                # Código Python para criar OS e identificar número
-                # Preparar variáveis para substituir na template
-                screenshots_dir = "/tmp/screenshots"
-                
-                # Usar template string regular em vez de f-string para evitar conflitos
-                create_os_template = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-import re
-
-async def create_os_with_inep(inep_value="{INEP_VALUE}"):
-    """Criar OS com INEP e identificar número da OS criada"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "{SCREENSHOTS_DIR}"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("create_os_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    screenshots = []
-    
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        page = await browser.new_page()
-        
-        # ETAPA 1: Login
-        print("🔐 LOGIN - Acessando página de login...")
-        await page.goto("https://eace.org.br/login?login=login", timeout=30000)
-        await page.wait_for_timeout(2000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_01_login.png")
-        screenshots.append("create_os_01_login.png")
-        print("📸 Screenshot: create_os_01_login.png")
-        
-        # Preencher credenciais
-        await page.fill("//input[@placeholder='seuemail@email.com']", "raiseupbt@gmail.com")
-        await page.fill("//input[@type='password']", "@Uujpgi8u")
-        await page.click("//button[contains(text(), 'Log In')]")
-        await page.wait_for_timeout(3000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_02_after_login.png")
-        screenshots.append("create_os_02_after_login.png")
-        print("📸 Screenshot: create_os_02_after_login.png")
-        
-        # ETAPA 2: Selecionar perfil Fornecedor
-        print("👤 PERFIL - Selecionando perfil Fornecedor...")
-        await page.click("//*[contains(text(), 'Fornecedor')]")
-        await page.wait_for_timeout(3000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_03_dashboard.png")
-        screenshots.append("create_os_03_dashboard.png")
-        print("📸 Screenshot: create_os_03_dashboard.png")
-        
-        # ETAPA 3: Navegar para página de OS (usando código que funciona)
-        print("🧭 NAVEGAÇÃO - Expandindo menu lateral...")
-        
-        # Expandir menu lateral
-        menu_selectors = [
-            "//button[contains(@class, 'sidebar') or contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[not(@disabled)]"
-        ]
-        
-        for selector in menu_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).first.click()
-                    await page.wait_for_timeout(2000)
-                    break
-            except:
-                continue
-        
-        # Clicar em "Gerenciar chamados"
-        chamados_selectors = [
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]"
-        ]
-        
-        for selector in chamados_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    break
-            except:
-                continue
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_04_os_page.png")
-        screenshots.append("create_os_04_os_page.png")
-        print("📸 Screenshot: create_os_04_os_page.png")
-        
-        # ETAPA 4: Clicar em "Adicionar nova OS"
-        print("➕ ADICIONAR OS - Clicando em 'Adicionar nova OS'...")
-        
-        adicionar_selectors = [
-            "text='Adicionar nova OS'",
-            "button:has-text('Adicionar nova OS')",
-            "//button[contains(text(), 'Adicionar nova OS')]",
-            "//*[contains(text(), 'Adicionar nova OS')]"
-        ]
-        
-        os_created = False
-        for selector in adicionar_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    
-                    await page.screenshot(path=screenshots_dir + "/create_os_05_modal_opened.png")
-                    screenshots.append("create_os_05_modal_opened.png")
-                    print("📸 Screenshot: create_os_05_modal_opened.png")
-                    
-                    # ETAPA 5: Preencher campo INEP
-                    print("⌨️ INEP - Preenchendo campo com: " + inep_value)
-                    
-                    # Tentar encontrar campo específico do INEP
-                    inep_selectors = [
-                        "input[placeholder*='INEP']",
-                        "input[placeholder*='código']",
-                        "input[placeholder*='escola']",
-                        "input[type='text']"
-                    ]
-                    
-                    inep_filled = False
-                    for inep_selector in inep_selectors:
-                        try:
-                            field_count = await page.locator(inep_selector).count()
-                            if field_count > 0:
-                                await page.locator(inep_selector).first.click()
-                                await page.wait_for_timeout(500)
-                                await page.locator(inep_selector).first.fill(inep_value)
-                                await page.wait_for_timeout(2000)
-                                
-                                # Aguardar sugestão e clicar
-                                await page.keyboard.press('ArrowDown')
-                                await page.keyboard.press('Enter')
-                                await page.wait_for_timeout(2000)
-                                
-                                inep_filled = True
-                                break
-                        except:
-                            continue
-                    
-                    if not inep_filled:
-                        # Fallback com Tab + Type
-                        await page.keyboard.press('Tab')
-                        await page.wait_for_timeout(1000)
-                        await page.keyboard.type(inep_value, delay=200)
-                        await page.wait_for_timeout(3000)
-                        await page.keyboard.press('ArrowDown')
-                        await page.keyboard.press('Enter')
-                        await page.wait_for_timeout(2000)
-                    
-                    await page.screenshot(path=screenshots_dir + "/create_os_06_inep_filled.png")
-                    screenshots.append("create_os_06_inep_filled.png")
-                    print("📸 Screenshot: create_os_06_inep_filled.png")
-                    
-                    # ETAPA 6: Clicar em "Incluir"
-                    print("✅ INCLUIR - Clicando no botão 'Incluir'...")
-                    
-                    incluir_selectors = [
-                        "button:has-text('Incluir')",
-                        "//button[contains(text(), 'Incluir')]",
-                        "//*[contains(text(), 'Incluir')]"
-                    ]
-                    
-                    for incluir_selector in incluir_selectors:
-                        try:
-                            incluir_count = await page.locator(incluir_selector).count()
-                            if incluir_count > 0:
-                                await page.locator(incluir_selector).click()
-                                await page.wait_for_timeout(5000)
-                                os_created = True
-                                break
-                        except:
-                            continue
-                    
-                    break
-            except:
-                continue
-        
-        if not os_created:
-            print("❌ ERRO - Não foi possível criar a OS")
-            return {{"error": "Não foi possível criar a OS"}}
-        
-        # ETAPA 7: Identificar número da OS criada
-        print("🔍 IDENTIFICAÇÃO - Procurando número da OS criada...")
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_07_final_page.png")
-        screenshots.append("create_os_07_final_page.png")
-        print("📸 Screenshot: create_os_07_final_page.png")
-        
-        # Procurar pela OS mais recente na lista
-        os_numbers = await page.evaluate("""
-            () => {{
-                const osElements = document.querySelectorAll('*');
-                const osNumbers = [];
-                
-                osElements.forEach(el => {{
-                    const text = el.textContent || '';
-                    // Procurar por padrão OS: #XXXXXXXXXX
-                    const osMatch = text.match(/OS[:\\s]*#?(\\d{{10,}})/i);
-                    if (osMatch) {{
-                        osNumbers.push(osMatch[1]);
-                    }}
-                }});
-                
-                // Remover duplicatas e ordenar
-                const uniqueNumbers = [...new Set(osNumbers)];
-                return uniqueNumbers.sort((a, b) => b.localeCompare(a));
-            }}
-        """)
-        
-        # A OS mais recente deve ser a primeira da lista
-        os_number = None
-        if os_numbers and len(os_numbers) > 0:
-            os_number = os_numbers[0]
-            print("🎉 SUCESSO - OS criada com número: " + os_number)
-        else:
-            print("⚠️ AVISO - Não foi possível identificar o número da OS")
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_08_final_result.png")
-        screenshots.append("create_os_08_final_result.png")
-        print("📸 Screenshot: create_os_08_final_result.png")
+                        data.screenshots.forEach(screenshot => {
+                            const div = document.createElement('div');
+                            div.className = 'screenshot';
+                            div.innerHTML = `<a href="/screenshot/${screenshot}" target="_blank"><img src="/thumbnail/${screenshot}" alt="${screenshot}"></a>`;
+                            screenshots.appendChild(div);
+                        });
+                    }
+                } else {
+                    adicionarLog(`❌ Erro: ${data.error}`, 'error');
+                }
+            })
+            .catch(error => {
+                adicionarLog(`❌ Erro na requisição: ${error}`, 'error');
+            })
+            .finally(() => {
+                executando = false;
+                btn.disabled = false;
+                btn.textContent = '🚀 Criar OS com INEP';
+            });
+        }
+    </script>
+</body>
+</html>
+'''
+                return html_content
         
-        # Resultado final
-        result = {{
-            "success": True,
-            "inep_used": inep_value,
-            "os_number": os_number,
-            "os_created": os_created,
-            "screenshots": screenshots,
-            "message": "OS criada com sucesso!" if os_number else "OS criada, mas número não identificado"
-        }}
+        # Obter dados da requisição
+        data = request.json if request.method == 'POST' else {}
+        inep_value = data.get('inep', request.args.get('inep', '33099553'))
         
-        return result
+        logger.info(f"Criando OS com INEP: {inep_value}")
         
-    except Exception as e:
-        print("❌ ERRO: " + str(e))
-        return {{"error": str(e)}}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(create_os_with_inep())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Aplicar substituições na template
-                create_os_code = create_os_template.format(
-                    INEP_VALUE=inep_value,
-                    SCREENSHOTS_DIR=screenshots_dir
-                )
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', create_os_code
-                ], capture_output=True, text=True, timeout=600)  # 10 minutos
-                
-                if result.returncode == 0:
-                    try:
-                        # Separar prints do JSON
-                        output_lines = result.stdout.strip().split('\n')
-                        
-                        # Log dos prints para debug
-                        for line in output_lines:
-                            logger.info(f"Python output: {line}")
-                        
-                        # Procurar pela linha JSON
-                        json_line = None
-                        for line in reversed(output_lines):
-                            line = line.strip()
-                            if line.startswith('{') and line.endswith('}'):
-                                json_line = line
-                                break
-                        
-                        if json_line:
-                            output = json.loads(json_line)
-                            return output
-                        else:
-                            logger.error("Nenhuma linha JSON encontrada no stdout")
-                            return {"error": "Nenhuma linha JSON encontrada", "stdout": result.stdout}
-                            
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Erro JSON decode: {e}")
-                        return {"error": f"Erro ao decodificar JSON: {e}", "stdout": result.stdout}
-                else:
-                    logger.error(f"Subprocess falhou com código {result.returncode}")
-                    return {"error": f"Subprocess falhou: {result.stderr}", "stdout": result.stdout}
-                    
-            except subprocess.TimeoutExpired:
-                logger.error("Timeout na execução do código Python")
-                return {"error": "Timeout na execução (10 minutos)", "timeout": True}
-            except Exception as e:
-                logger.error(f"Erro na execução: {e}")
-                return {"error": str(e)}
-        
-        # Executar em thread separada para não bloquear
-        thread = threading.Thread(target=run_os_creation)
-        thread.start()
-        thread.join(timeout=620)  # 10 minutos + buffer
-        
-        if thread.is_alive():
-            logger.error("Thread ainda executando após timeout")
-            return jsonify({"error": "Operação ainda executando, tente novamente"})
-        
-        # Tentar obter resultado
-        try:
-            result = run_os_creation()
-            return jsonify(result)
-        except Exception as e:
-            logger.error(f"Erro ao obter resultado: {e}")
-            return jsonify({"error": str(e)})
+        return submit_automation_job(
+            'create_os_with_inep',
+            {'inep': inep_value},
+            lambda context, page: eace_flows.create_os_with_inep(context, inep_value, page=page),
+            timeout=600,  # 10 minutos
+            standby=True
+        )
             
     except Exception as e:
         logger.error(f"Erro no endpoint create-os-with-inep: {e}")
@@ -9367,7 +3142,7 @@ def test_direct_os_access():
             screenshotDiv.className = 'screenshot-item';
             
             screenshotDiv.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" onerror="this.style.display='none'">
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" onerror="this.style.display='none'"></a>
                 <div class="screenshot-caption">${caption}</div>
             `;
             
@@ -9414,7 +3189,7 @@ def test_direct_os_access():
                                 📸 Passo ${stepNumber}: ${stepName}
                             </div>
                             <div style="text-align: center;">
-                                <img src="/screenshot/${screenshot.filename}" 
+                                <img src="/thumbnail/${screenshot.filename}" 
                                      alt="${stepName}" 
                                      style="max-width: 100%; height: auto; border: 2px solid #00ff00; border-radius: 5px; cursor: pointer;"
                                      onclick="openImageModal('${screenshot.filename}', '${stepName}')"
@@ -9475,6 +3250,38 @@ def test_direct_os_access():
             document.body.appendChild(modal);
         }
         
+        function aguardarJob(jobId, onLog) {
+            return new Promise((resolve, reject) => {
+                const consultar = () => fetch('/jobs/' + jobId)
+                    .then(response => response.json())
+                    .then(data => {
+                        if (!data.success) {
+                            reject(new Error(data.message));
+                        } else if (data.job.status === 'done' || data.job.status === 'failed') {
+                            resolve(data.job);
+                        } else {
+                            setTimeout(consultar, 2000);
+                        }
+                    })
+                    .catch(reject);
+                
+                // Logs chegam em tempo real via SSE; a consulta só roda no fim (ou se o stream cair)
+                const eventos = new EventSource('/jobs/' + jobId + '/events');
+                eventos.addEventListener('log', event => {
+                    const entry = JSON.parse(event.data);
+                    if (onLog) onLog(entry.message, entry.level);
+                });
+                eventos.addEventListener('end', () => {
+                    eventos.close();
+                    consultar();
+                });
+                eventos.onerror = () => {
+                    eventos.close();
+                    consultar();
+                };
+            });
+        }
+        
         function startDirectTest() {
             if (testRunning) return;
             
@@ -9508,6 +3315,17 @@ def test_direct_os_access():
                 })
             })
             .then(response => response.json())
+            .then(job => {
+                if (!job.success) {
+                    return job;
+                }
+                addLog(`⏳ Job ${job.job_id} em execução...`, 'info');
+                return aguardarJob(job.job_id, addLog).then(job => ({
+                    success: job.status === 'done' || !!job.result,
+                    result: job.result,
+                    message: job.error
+                }));
+            })
             .then(data => {
                 clearInterval(logMonitor);
                 
@@ -9588,578 +3406,13 @@ def execute_direct_os_access():
         
         logger.info(f"Executando acesso direto com INEP: {inep_value}")
         
-        def run_direct_access():
-            try:
-                # Código Python simplificado
-                # Preparar variáveis para substituir na template
-                screenshots_dir = "/tmp/screenshots"
-                
-                # Usar template string regular em vez de f-string para evitar conflitos
-                direct_code_template = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-
-async def direct_os_access(inep_value="{INEP_VALUE}"):
-    """Acesso direto simplificado à página OS"""
-    
-    # Configurar diretório de screenshots
-    screenshots_dir = "{SCREENSHOTS_DIR}"
-    os.makedirs(screenshots_dir, exist_ok=True)
-    
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("direct_"):
-            os.remove(os.path.join(screenshots_dir, file))
-    
-    playwright = await async_playwright().start()
-    screenshots = []
-    
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
+        return submit_automation_job(
+            'direct_os_access',
+            {'inep': inep_value},
+            lambda context: eace_flows.direct_os_access(context, inep_value),
+            timeout=480
         )
         
-        page = await browser.new_page()
-        
-        print("🚀 ACESSO DIRETO - Iniciando automação simplificada")
-        print("🔧 CONFIGURAÇÃO - Ambiente configurado: headless=True, screenshots em /tmp/screenshots")
-        
-        # PASSO 1: Login
-        print("🔐 LOGIN - Navegando para página: https://eace.org.br/login?login=login")
-        await page.goto("https://eace.org.br/login?login=login")
-        await page.wait_for_timeout(3000)
-        print("✅ LOGIN - Página carregada com sucesso")
-        
-        print("🔐 LOGIN - Preenchendo campo email: raiseupbt@gmail.com")
-        await page.fill('//input[@placeholder="seuemail@email.com"]', "raiseupbt@gmail.com")
-        print("✅ LOGIN - Email preenchido")
-        
-        print("🔐 LOGIN - Preenchendo campo senha: ****** (oculta)")
-        await page.fill('//input[@type="password"]', "@Uujpgi8u")
-        print("✅ LOGIN - Senha preenchida")
-        
-        print("🔐 LOGIN - Clicando botão 'Log In'")
-        await page.click('//button[contains(text(), "Log In")]')
-        await page.wait_for_timeout(5000)
-        print("✅ LOGIN - Botão clicado, aguardando resposta do servidor")
-        
-        await page.screenshot(path=screenshots_dir + "/direct_01_login.png")
-        screenshots.append("direct_01_login.png")
-        print("📸 Screenshot: direct_01_login.png")
-        
-        # PASSO 2: Selecionar perfil
-        print("👤 PERFIL - Verificando se precisa selecionar perfil")
-        fornecedor_count = await page.locator('//*[contains(text(), "Fornecedor")]').count()
-        print("👤 PERFIL - Elementos 'Fornecedor' encontrados: " + str(fornecedor_count))
-        
-        if fornecedor_count > 0:
-            print("👤 PERFIL - Clicando em 'Fornecedor'")
-            await page.click('//*[contains(text(), "Fornecedor")]')
-            await page.wait_for_timeout(5000)
-            print("✅ PERFIL - Perfil 'Fornecedor' selecionado com sucesso")
-        else:
-            print("ℹ️ PERFIL - Elemento 'Fornecedor' não encontrado ou já selecionado")
-        
-        print("📱 DASHBOARD - Redirecionando para dashboard do fornecedor")
-        await page.screenshot(path=screenshots_dir + "/direct_02_dashboard.png")
-        screenshots.append("direct_02_dashboard.png")
-        print("📸 Screenshot: direct_02_dashboard.png gerado")
-        
-        # PASSO 3: Ação que funciona - clicar em "portable_wifi_off"
-        print("🎯 ACESSO OS - Executando ação que sabemos que funciona")
-        print("🎯 ACESSO OS - Clicando em elemento com texto 'portable_wifi_off'")
-        await page.click('text="portable_wifi_off"')
-        await page.wait_for_timeout(3000)
-        print("✅ ACESSO OS - Elemento clicado com sucesso")
-        print("📱 PÁGINA OS - Navegando para página de controle de OS")
-        
-        await page.screenshot(path=screenshots_dir + "/direct_03_os_page.png")
-        screenshots.append("direct_03_os_page.png")
-        print("📸 Screenshot: direct_03_os_page.png gerado")
-        
-        # PASSO 4: Aguardar página carregar completamente
-        print("⏳ AGUARDO - Aguardando página de OS carregar completamente")
-        await page.wait_for_timeout(8000)  # Aumentado para 8 segundos
-        print("✅ AGUARDO - Aguardo concluído, página deve estar carregada")
-        
-        # PASSO 5: Procurar e clicar em "Adicionar nova OS"
-        print("🔍 ADICIONAR OS - Procurando botão 'Adicionar nova OS'")
-        
-        # Aguardar mais tempo para página carregar completamente
-        print("⏳ AGUARDO - Aguardando página carregar completamente (25 segundos)")
-        await page.wait_for_timeout(25000)  # Aumentado para 25 segundos
-        
-        # Screenshot antes da busca por botão
-        await page.screenshot(path=screenshots_dir + "/direct_04_before_button_search.png")
-        screenshots.append("direct_04_before_button_search.png")
-        print("📸 Screenshot: direct_04_before_button_search.png")
-        
-        # Mapear todos os elementos visíveis para debug
-        all_elements = await page.evaluate("""
-            () => {{
-                const elements = [];
-                const allElements = document.querySelectorAll('button, a, div, span');
-                
-                allElements.forEach((el, index) => {{
-                    const rect = el.getBoundingClientRect();
-                    const text = el.textContent?.trim() || '';
-                    const style = window.getComputedStyle(el);
-                    
-                    if (rect.width > 0 && rect.height > 0 && text.length > 0 && 
-                        style.display !== 'none' && style.visibility !== 'hidden') {{
-                        elements.push({{
-                            tagName: el.tagName,
-                            text: text,
-                            classes: el.className,
-                            id: el.id,
-                            index: index,
-                            visible: true,
-                            clickable: !el.disabled
-                        }});
-                    }}
-                }});
-                
-                return elements;
-            }}
-        """)
-        
-        print("🔍 ADICIONAR OS - Total de elementos visíveis: " + str(len(all_elements)))
-        
-        # Procurar elementos que contenham "Adicionar" ou "Nova"
-        adicionar_elements = [el for el in all_elements if 
-                            'adicionar' in el['text'].lower() or 
-                            'nova' in el['text'].lower() or 
-                            'novo' in el['text'].lower() or
-                            'add' in el['text'].lower() or
-                            'create' in el['text'].lower() or
-                            'criar' in el['text'].lower()]
-        
-        # Procurar também por elementos com ícones ou palavras-chave relacionadas
-        os_elements = [el for el in all_elements if 
-                      'os' in el['text'].lower() or 
-                      'order' in el['text'].lower() or
-                      'chamado' in el['text'].lower()]
-        
-        print("🔍 ADICIONAR OS - Elementos com 'Adicionar/Nova/Novo/Add/Create': " + str(len(adicionar_elements)))
-        for el in adicionar_elements:
-            print("🔍 ADICIONAR OS - Encontrado: " + el['tagName'] + " - '" + el['text'] + "' - Classes: " + el['classes'] + " - Clickable: " + str(el['clickable']))
-            
-        print("🔍 OS ELEMENTS - Elementos com 'OS/Order/Chamado': " + str(len(os_elements)))
-        for el in os_elements:
-            print("🔍 OS ELEMENTS - Encontrado: " + el['tagName'] + " - '" + el['text'] + "' - Classes: " + el['classes'] + " - Clickable: " + str(el['clickable']))
-            
-        # Salvar análise completa para debug
-        debug_data = {{
-            'total_elements': len(all_elements),
-            'adicionar_elements': len(adicionar_elements),
-            'os_elements': len(os_elements),
-            'all_elements_sample': all_elements[:20],  # Primeiros 20 elementos
-            'adicionar_elements_full': adicionar_elements,
-            'os_elements_full': os_elements
-        }}
-        
-        with open(screenshots_dir + "/debug_elements.json", "w") as f:
-            json.dump(debug_data, f, indent=2)
-        print("📄 DEBUG - Análise completa salva em debug_elements.json")
-        
-        adicionar_clicked = False
-        
-        # Seletores simplificados baseados no teste manual que funcionou
-        adicionar_selectors = [
-            # Seletores mais prováveis baseados no teste manual
-            "text='Adicionar nova OS'",
-            "button:has-text('Adicionar nova OS')",
-            "//button[contains(text(), 'Adicionar nova OS')]",
-            "//*[contains(text(), 'Adicionar nova OS')]",
-            
-            # Seletores alternativos simples
-            "text='Adicionar OS'",
-            "button:has-text('Adicionar OS')",
-            "//button[contains(text(), 'Adicionar')]"
-        ]
-        
-        # Primeira tentativa: seletores específicos
-        for i, selector in enumerate(adicionar_selectors):
-            try:
-                print("🔍 ADICIONAR OS - Testando seletor " + str(i+1) + "/" + str(len(adicionar_selectors)) + ": " + selector)
-                elements = await page.locator(selector).count()
-                print("📊 ADICIONAR OS - Elementos encontrados: " + str(elements))
-                
-                if elements > 0:
-                    print("✅ ADICIONAR OS - Seletor funcionou! Elementos encontrados: " + str(elements))
-                    print("📍 ADICIONAR OS - Clicando: " + selector)
-                    
-                    # Aguardar elemento estar visível e clicável
-                    await page.wait_for_selector(selector, timeout=5000)
-                    
-                    # Capturar URL antes do clique
-                    url_before = page.url
-                    print("📍 ADICIONAR OS - URL antes do clique: " + url_before)
-                    
-                    await page.locator(selector).click()
-                    print("🎯 ADICIONAR OS - Clique executado! Aguardando resposta...")
-                    await page.wait_for_timeout(2000)
-                    
-                    # Screenshot imediatamente após o clique
-                    await page.screenshot(path=screenshots_dir + "/direct_04_immediate_after_click.png")
-                    screenshots.append("direct_04_immediate_after_click.png")
-                    print("📸 Screenshot: direct_04_immediate_after_click.png")
-                    
-                    await page.wait_for_timeout(2000)
-                    
-                    # Capturar URL após o clique
-                    url_after = page.url
-                    print("📍 ADICIONAR OS - URL após o clique: " + url_after)
-                    
-                    await page.screenshot(path=screenshots_dir + "/direct_05_after_wait.png")
-                    screenshots.append("direct_05_after_wait.png")
-                    print("📸 Screenshot: direct_05_after_wait.png")
-                    
-                    # Verificar se modal ou nova página foi aberta
-                    modal_opened = await page.evaluate("""
-                        () => {{
-                            // Verificar se há modal aberto
-                            const modals = document.querySelectorAll('[role="dialog"], .modal, .popup, .overlay');
-                            
-                            // Verificar especificamente campo INEP
-                            const inepInputs = [];
-                            const allInputs = document.querySelectorAll('input[type="text"], input[type="search"], textarea');
-                            
-                            allInputs.forEach(input => {{
-                                const label = input.closest('label') || input.previousElementSibling || input.nextElementSibling;
-                                const placeholder = input.placeholder || '';
-                                const labelText = label ? label.textContent : '';
-                                
-                                // Procurar especificamente por INEP
-                                if (labelText.toLowerCase().includes('inep') ||
-                                    placeholder.toLowerCase().includes('inep') ||
-                                    labelText.toLowerCase().includes('escola') || 
-                                    placeholder.toLowerCase().includes('escola') ||
-                                    placeholder.toLowerCase().includes('código')) {{
-                                    inepInputs.push({{
-                                        placeholder: placeholder,
-                                        label: labelText,
-                                        id: input.id,
-                                        classes: input.className,
-                                        value: input.value
-                                    }});
-                                }}
-                            }});
-                            
-                            // Verificar elementos de formulário geral
-                            const forms = document.querySelectorAll('form');
-                            const inputs = document.querySelectorAll('input[type="text"], textarea, select');
-                            
-                            return {{ 
-                                type: modals.length > 0 ? 'modal' : 'form_elements',
-                                modals: modals.length,
-                                forms: forms.length, 
-                                inputs: inputs.length,
-                                inepFields: inepInputs.length,
-                                inepDetails: inepInputs
-                            }};
-                        }}
-                    """)
-                    
-                    print("📍 ADICIONAR OS - Verificação de modal/formulário: " + str(modal_opened))
-                    
-                    # Aguardar modal/página carregar (pode demorar mais tempo)
-                    print("⏳ AGUARDO - Aguardando modal carregar (até 30 segundos)...")
-                    await page.wait_for_timeout(30000)  # Aumentado para 30 segundos
-                    
-                    # Screenshot final
-                    await page.screenshot(path=screenshots_dir + "/direct_06_final.png")
-                    screenshots.append("direct_06_final.png")
-                    print("📸 Screenshot: direct_06_final.png")
-                    
-                    # PASSO 7: Preencher campo INEP no modal (IMPLEMENTAÇÃO SIMPLIFICADA)
-                    print("📝 MODAL - Preenchendo campo INEP no modal...")
-                    print("📝 MODAL - Usando INEP: " + inep_value)
-                    
-                    # Aguardar o modal carregar completamente
-                    await page.wait_for_timeout(5000)  # Aumentado para 5 segundos
-                    
-                    # MÉTODO SIMPLES baseado no teste manual que funcionou
-                    modal_filled = False
-                    button_active = False
-                    
-                    print("🎯 MODAL - Método simplificado baseado no teste manual que funcionou")
-                    try:
-                        # Screenshot antes de começar
-                        await page.screenshot(path=screenshots_dir + "/direct_07_before_fill.png")
-                        screenshots.append("direct_07_before_fill.png")
-                        print("📸 Screenshot: direct_07_before_fill.png")
-                        
-                        # Múltiplas tentativas para focar no campo INEP
-                        print("🎯 MODAL - Tentando focar no campo INEP...")
-                        
-                        # Método 1: Procurar campo por placeholder
-                        inep_field_found = False
-                        try:
-                            # Tentar encontrar campo específico do INEP
-                            inep_selectors = [
-                                "input[placeholder*='INEP']",
-                                "input[placeholder*='código']",
-                                "input[placeholder*='escola']",
-                                "input[type='text']"
-                            ]
-                            
-                            for selector in inep_selectors:
-                                try:
-                                    field_count = await page.locator(selector).count()
-                                    print("🔍 MODAL - Testando campo: " + selector + " - " + str(field_count) + " campos")
-                                    
-                                    if field_count > 0:
-                                        print("✅ MODAL - Campo encontrado: " + selector)
-                                        await page.locator(selector).first.click()
-                                        await page.wait_for_timeout(500)
-                                        await page.locator(selector).first.fill(inep_value)
-                                        print("⌨️ MODAL - INEP digitado no campo: " + inep_value)
-                                        inep_field_found = True
-                                        break
-                                except Exception as e:
-                                    print("❌ MODAL - Erro com campo " + selector + ": " + str(e))
-                                    continue
-                                    
-                        except Exception as e:
-                            print("❌ MODAL - Erro ao procurar campo INEP: " + str(e))
-                        
-                        # Método 2: Fallback com Tab + Type (método original)
-                        if not inep_field_found:
-                            print("🎯 MODAL - Fallback: Usando Tab + Type...")
-                            await page.keyboard.press('Tab')
-                            await page.wait_for_timeout(1000)
-                            await page.keyboard.type(inep_value, delay=200)
-                            print("⌨️ MODAL - INEP digitado com Tab+Type: " + inep_value)
-                            inep_field_found = True
-                            
-                        await page.wait_for_timeout(1000)
-                        
-                        # Aguardar sugestões aparecerem (3 segundos como no teste manual)
-                        print("⏳ MODAL - Aguardando sugestões do autocomplete...")
-                        await page.wait_for_timeout(3000)
-                        
-                        # Screenshot após digitar
-                        await page.screenshot(path=screenshots_dir + "/direct_08_typed.png")
-                        screenshots.append("direct_08_typed.png")
-                        print("📸 Screenshot: direct_08_typed.png")
-                        
-                        # Usar ArrowDown + Enter para selecionar sugestão (método que funcionou)
-                        print("🔽 MODAL - Selecionando sugestão com ArrowDown + Enter...")
-                        await page.keyboard.press('ArrowDown')
-                        await page.wait_for_timeout(500)
-                        await page.keyboard.press('Enter')
-                        await page.wait_for_timeout(2000)
-                        
-                        modal_filled = True
-                        print("🎉 MODAL - Sugestão selecionada com sucesso!")
-                        
-                        # Verificar se botão "Incluir" foi ativado
-                        print("🔍 MODAL - Verificando se botão 'Incluir' foi ativado...")
-                        
-                        button_check = await page.evaluate("""
-                            () => {{
-                                const buttons = document.querySelectorAll('button');
-                                for (let btn of buttons) {{
-                                    const text = btn.textContent?.toLowerCase().trim();
-                                    if (text && text.includes('incluir')) {{
-                                        const disabled = btn.disabled;
-                                        const style = window.getComputedStyle(btn);
-                                        const backgroundColor = style.backgroundColor;
-                                        const cursor = style.cursor;
-                                        const opacity = style.opacity;
-                                        
-                                        // Verificar se o botão está ativado
-                                        const isActive = !disabled && cursor === 'pointer' && opacity !== '0.5';
-                                        
-                                        return {{
-                                            found: true,
-                                            disabled: disabled,
-                                            text: btn.textContent.trim(),
-                                            backgroundColor: backgroundColor,
-                                            cursor: cursor,
-                                            opacity: opacity,
-                                            isActive: isActive
-                                        }};
-                                    }}
-                                }}
-                                return {{ found: false }};
-                            }}
-                        """)
-                        
-                        if button_check['found']:
-                            button_active = button_check['isActive']
-                            if button_active:
-                                print("🎉 MODAL - Botão 'Incluir' ATIVADO! ✅")
-                                print("   - Texto: " + button_check['text'])
-                                print("   - Disabled: " + str(button_check['disabled']))
-                                print("   - Cursor: " + button_check['cursor'])
-                            else:
-                                print("⚠️ MODAL - Botão 'Incluir' ainda está desativado")
-                                print("   - Disabled: " + str(button_check['disabled']))
-                                print("   - Cursor: " + button_check['cursor'])
-                        else:
-                            print("❌ MODAL - Botão 'Incluir' não encontrado")
-                            
-                    except Exception as e:
-                        print("❌ MODAL - Erro no preenchimento: " + str(e))
-                        modal_filled = False
-                    
-                    # Screenshot final mostrando o resultado
-                    await page.screenshot(path=screenshots_dir + "/direct_09_final_result.png")
-                    screenshots.append("direct_09_final_result.png")
-                    print("📸 Screenshot: direct_09_final_result.png - Estado final do modal")
-                    
-                    # RESULTADO FINAL
-                    if modal_filled and button_active:
-                        print("🎉 SUCESSO COMPLETO! ✅")
-                        print("   ✅ Campo INEP preenchido")
-                        print("   ✅ Sugestão selecionada") 
-                        print("   ✅ Botão 'Incluir' ativado")
-                        print("🚫 NÃO clicando em 'Incluir' conforme solicitado")
-                    elif modal_filled:
-                        print("⚠️ PARCIAL: Campo preenchido mas botão não ativado")
-                    else:
-                        print("❌ FALHA: Não foi possível preencher o campo INEP")
-                        
-                    adicionar_clicked = True
-                    print("✅ ADICIONAR OS - Modal aberto e processamento concluído!")
-                    
-                    break
-                    
-            except Exception as e:
-                print("❌ ADICIONAR OS - Erro com " + selector + ": " + str(e))
-                continue
-        else:
-            # Se nenhum seletor funcionou, definir valores padrão
-            print("⚠️ ADICIONAR OS - Nenhum seletor funcionou, definindo valores padrão")
-            modal_filled = False
-            button_active = False
-            adicionar_clicked = False
-            
-            # Garantir que as variáveis estão definidas para o resultado
-            if 'all_elements' not in locals():
-                all_elements = []
-            if 'adicionar_elements' not in locals():
-                adicionar_elements = []
-            
-        # Resultado final da operação
-        print("📋 RESUMO FINAL:")
-        print("   ✅ Login realizado com sucesso")
-        print("   ✅ Perfil Fornecedor selecionado")
-        print("   ✅ Navegação para página de OS")
-        print("   ✅ Modal 'Adicionar nova OS' aberto")
-        if modal_filled and button_active:
-            print("   ✅ Campo INEP preenchido: " + inep_value)
-            print("   ✅ Sugestão selecionada automaticamente")
-            print("   ✅ Botão 'Incluir' ativado e pronto")
-            print("   🚫 Botão 'Incluir' NÃO foi clicado (conforme solicitado)")
-        else:
-            print("   ⚠️ Preenchimento do INEP: " + ('Sim' if modal_filled else 'Não'))
-            print("   ⚠️ Botão 'Incluir' ativo: " + ('Sim' if button_active else 'Não'))
-        
-        # Preparar resultado final
-        result = {{
-            "success": True,
-            "screenshots": screenshots,
-            "adicionar_clicked": adicionar_clicked,
-            "modal_filled": modal_filled,
-            "button_active": button_active,
-            "inep_used": inep_value,
-            "total_elements": len(all_elements),
-            "adicionar_elements": len(adicionar_elements),
-            "message": "Automação concluída com sucesso - Modal aberto e INEP preenchido"
-        }}
-        
-        return result
-        
-    except Exception as e:
-        print("❌ ERRO: " + str(e))
-        return {{"error": str(e)}}
-    
-    finally:
-        await browser.close()
-        await playwright.stop()
-
-if __name__ == "__main__":
-    result = asyncio.run(direct_os_access())
-    print(json.dumps(result, indent=2))
-'''
-                
-                # Aplicar substituições na template
-                direct_code = direct_code_template.format(
-                    INEP_VALUE=inep_value,
-                    SCREENSHOTS_DIR=screenshots_dir
-                )
-                
-                # Executar código Python
-                result = subprocess.run([
-                    'python3', '-c', direct_code
-                ], capture_output=True, text=True, timeout=480)
-                
-                if result.returncode == 0:
-                    try:
-                        # Separar prints do JSON - o JSON sempre vem na última linha
-                        output_lines = result.stdout.strip().split('\n')
-                        
-                        # Log dos prints para debug
-                        for line in output_lines:
-                            logger.info(f"Python output: {line}")
-                        
-                        # Procurar pela linha JSON (começa com { e termina com })
-                        json_line = None
-                        for line in reversed(output_lines):
-                            line = line.strip()
-                            if line.startswith('{') and line.endswith('}'):
-                                json_line = line
-                                break
-                        
-                        if json_line:
-                            output = json.loads(json_line)
-                            return output
-                        else:
-                            logger.error("Nenhuma linha JSON encontrada no stdout")
-                            return {"error": "Nenhuma linha JSON encontrada", "stdout": result.stdout}
-                            
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Erro JSON decode: {e}")
-                        logger.error(f"Stdout completo: {result.stdout}")
-                        logger.error(f"Stderr: {result.stderr}")
-                        return {"error": f"Erro ao decodificar JSON: {e}", "stdout": result.stdout, "stderr": result.stderr}
-                else:
-                    logger.error(f"Subprocess falhou com código {result.returncode}")
-                    logger.error(f"Stderr: {result.stderr}")
-                    return {"error": result.stderr, "returncode": result.returncode}
-                    
-            except Exception as e:
-                return {"error": str(e)}
-        
-        # Executar em thread separada
-        import threading
-        result = {"status": "running"}
-        
-        def run_test():
-            nonlocal result
-            result = run_direct_access()
-        
-        thread = threading.Thread(target=run_test)
-        thread.start()
-        thread.join(timeout=120)
-        
-        if thread.is_alive():
-            return jsonify({
-                'success': False,
-                'message': 'Timeout na execução do teste'
-            })
-        
-        return jsonify({
-            'success': True,
-            'result': result
-        })
-        
     except Exception as e:
         logger.error(f"Erro no acesso direto OS: {e}")
         return jsonify({
@@ -10414,7 +3667,7 @@ def test_expandable_detailed_logs():
             screenshotDiv.className = 'screenshot-item';
             
             screenshotDiv.innerHTML = `
-                <img src="/screenshots/${filename}" alt="${caption}" onerror="this.style.display='none'">
+                <a href="/screenshot/${filename}" target="_blank"><img src="/thumbnail/${filename}" alt="${caption}" onerror="this.style.display='none'"></a>
                 <div class="screenshot-caption">${caption}</div>
             `;
             
@@ -10561,316 +3814,195 @@ def execute_create_os_with_inep():
         
         logger.info(f"Executando criação de OS com INEP: {inep_value}")
         
-        # Preparar variáveis para substituir na template
-        screenshots_dir = "/tmp/screenshots"
-        
-        # Usar template string regular em vez de f-string para evitar conflitos
-        create_os_template = '''
-import asyncio
-import json
-from playwright.async_api import async_playwright
-import os
-import re
+        # Executar no motor de automação; o resultado é consultado em /jobs/<id>
+        return submit_automation_job(
+            'create_os_with_inep',
+            {'inep': inep_value},
+            lambda context, page: eace_flows.create_os_with_inep(context, inep_value, page=page),
+            timeout=600,  # 10 minutos
+            standby=True
+        )
+            
+    except Exception as e:
+        logger.error(f"Erro na execução de create-os-with-inep: {e}")
+        return jsonify({"error": str(e)})
 
-async def create_os_with_inep(inep_value="{INEP_VALUE}"):
-    """Criar OS com INEP e identificar número da OS criada"""
+
+@app.route('/execute-create-os-batch', methods=['POST'])
+def execute_create_os_batch():
+    """Criar várias OS com um único login; resultados em NDJSON, uma linha por item"""
+    data = request.json or {}
+    ineps = [str(inep) for inep in data.get('ineps', [])]
+    ticket_ids = data.get('ticket_ids') or []
+    missing = []
+    
+    if ticket_ids:
+        try:
+            resolved, missing = resolve_ticket_ineps(ticket_ids)
+            ineps.extend(resolved)
+        except Exception as e:
+            logger.error(f"Erro ao resolver INEPs dos tickets: {e}")
+            return jsonify({'success': False, 'message': f'Erro ao resolver tickets: {e}'}), 500
     
-    # Configurar diretório de screenshots
-    screenshots_dir = "{SCREENSHOTS_DIR}"
-    os.makedirs(screenshots_dir, exist_ok=True)
+    invalid = [inep for inep in ineps if not is_valid_inep(inep)]
+    if invalid or not ineps:
+        return jsonify({
+            'success': False,
+            'message': 'Informe INEPs com exatamente 8 dígitos numéricos',
+            'invalid': invalid,
+            'missing': missing
+        }), 400
     
-    # Limpar screenshots anteriores
-    for file in os.listdir(screenshots_dir):
-        if file.startswith("create_os_"):
-            os.remove(os.path.join(screenshots_dir, file))
+    logger.info(f"Executando criação de OS em lote: {len(ineps)} INEPs")
     
-    playwright = await async_playwright().start()
-    screenshots = []
+    # Resultados chegam do loop do pool por uma fila thread-safe
+    results = queue.Queue()
+    future = get_engine().submit_with_standby(
+        lambda context, page: eace_flows.create_os_batch(context, ineps, on_result=results.put, page=page)
+    )
     
-    try:
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        page = await browser.new_page()
-        
-        # ETAPA 1: Login
-        print("🔐 LOGIN - Acessando página de login...")
-        await page.goto("https://eace.org.br/login?login=login", timeout=30000)
-        await page.wait_for_timeout(2000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_01_login.png")
-        screenshots.append("create_os_01_login.png")
-        print("📸 Screenshot: create_os_01_login.png")
-        
-        # Preencher credenciais
-        await page.fill("//input[@placeholder='seuemail@email.com']", "raiseupbt@gmail.com")
-        await page.fill("//input[@type='password']", "@Uujpgi8u")
-        await page.click("//button[contains(text(), 'Log In')]")
-        await page.wait_for_timeout(3000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_02_after_login.png")
-        screenshots.append("create_os_02_after_login.png")
-        print("📸 Screenshot: create_os_02_after_login.png")
-        
-        # ETAPA 2: Selecionar perfil Fornecedor
-        print("👤 PERFIL - Selecionando perfil Fornecedor...")
-        await page.click("//*[contains(text(), 'Fornecedor')]")
-        await page.wait_for_timeout(3000)
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_03_dashboard.png")
-        screenshots.append("create_os_03_dashboard.png")
-        print("📸 Screenshot: create_os_03_dashboard.png")
-        
-        # ETAPA 3: Navegar para página de OS (usando código que funciona)
-        print("🧭 NAVEGAÇÃO - Expandindo menu lateral...")
-        
-        # Expandir menu lateral
-        menu_selectors = [
-            "//button[contains(@class, 'sidebar') or contains(@class, 'menu')]",
-            "//button[@focusable='true']",
-            "//button[not(@disabled)]"
-        ]
-        
-        for selector in menu_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).first.click()
-                    await page.wait_for_timeout(2000)
-                    break
-            except:
-                continue
-        
-        # Clicar em "Gerenciar chamados"
-        chamados_selectors = [
-            "//a[contains(text(), 'Gerenciar chamados')]",
-            "//button[contains(text(), 'Gerenciar chamados')]",
-            "//*[contains(text(), 'Gerenciar chamados')]"
-        ]
-        
-        for selector in chamados_selectors:
-            try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    break
-            except:
-                continue
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_04_os_page.png")
-        screenshots.append("create_os_04_os_page.png")
-        print("📸 Screenshot: create_os_04_os_page.png")
-        
-        # ETAPA 4: Clicar em "Adicionar nova OS"
-        print("➕ ADICIONAR OS - Clicando em 'Adicionar nova OS'...")
-        
-        adicionar_selectors = [
-            "text='Adicionar nova OS'",
-            "button:has-text('Adicionar nova OS')",
-            "//button[contains(text(), 'Adicionar nova OS')]",
-            "//*[contains(text(), 'Adicionar nova OS')]"
-        ]
+    def generate():
+        for ticket in missing:
+            yield json.dumps({'success': False, 'error': 'INEP não encontrado', **ticket}, ensure_ascii=False) + '\n'
         
-        os_created = False
-        for selector in adicionar_selectors:
+        received = 0
+        while received < len(ineps):
             try:
-                elements = await page.locator(selector).count()
-                if elements > 0:
-                    await page.locator(selector).click()
-                    await page.wait_for_timeout(3000)
-                    
-                    await page.screenshot(path=screenshots_dir + "/create_os_05_modal_opened.png")
-                    screenshots.append("create_os_05_modal_opened.png")
-                    print("📸 Screenshot: create_os_05_modal_opened.png")
-                    
-                    # ETAPA 5: Preencher campo INEP
-                    print("⌨️ INEP - Preenchendo campo com: " + inep_value)
-                    
-                    # Tentar encontrar campo específico do INEP
-                    inep_selectors = [
-                        "input[placeholder*='INEP']",
-                        "input[placeholder*='código']",
-                        "input[placeholder*='escola']",
-                        "input[type='text']"
-                    ]
-                    
-                    inep_filled = False
-                    for inep_selector in inep_selectors:
-                        try:
-                            field_count = await page.locator(inep_selector).count()
-                            if field_count > 0:
-                                await page.locator(inep_selector).first.click()
-                                await page.wait_for_timeout(500)
-                                await page.locator(inep_selector).first.fill(inep_value)
-                                await page.wait_for_timeout(2000)
-                                
-                                # Aguardar sugestão e clicar
-                                await page.keyboard.press('ArrowDown')
-                                await page.keyboard.press('Enter')
-                                await page.wait_for_timeout(2000)
-                                
-                                inep_filled = True
-                                break
-                        except:
-                            continue
-                    
-                    if not inep_filled:
-                        # Fallback com Tab + Type
-                        await page.keyboard.press('Tab')
-                        await page.wait_for_timeout(1000)
-                        await page.keyboard.type(inep_value, delay=200)
-                        await page.wait_for_timeout(3000)
-                        await page.keyboard.press('ArrowDown')
-                        await page.keyboard.press('Enter')
-                        await page.wait_for_timeout(2000)
-                    
-                    await page.screenshot(path=screenshots_dir + "/create_os_06_inep_filled.png")
-                    screenshots.append("create_os_06_inep_filled.png")
-                    print("📸 Screenshot: create_os_06_inep_filled.png")
-                    
-                    # ETAPA 6: Clicar em "Incluir"
-                    print("✅ INCLUIR - Clicando no botão 'Incluir'...")
-                    
-                    incluir_selectors = [
-                        "button:has-text('Incluir')",
-                        "//button[contains(text(), 'Incluir')]",
-                        "//*[contains(text(), 'Incluir')]"
-                    ]
-                    
-                    for incluir_selector in incluir_selectors:
-                        try:
-                            incluir_count = await page.locator(incluir_selector).count()
-                            if incluir_count > 0:
-                                await page.locator(incluir_selector).click()
-                                await page.wait_for_timeout(5000)
-                                os_created = True
-                                break
-                        except:
-                            continue
-                    
+                item = results.get(timeout=1)
+            except queue.Empty:
+                if future.done() and results.empty():
                     break
-            except:
                 continue
+            received += 1
+            yield json.dumps(item, ensure_ascii=False) + '\n'
         
-        if not os_created:
-            print("❌ ERRO - Não foi possível criar a OS")
-            return {{"error": "Não foi possível criar a OS"}}
-        
-        # ETAPA 7: Identificar número da OS criada
-        print("🔍 IDENTIFICAÇÃO - Procurando número da OS criada...")
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_07_final_page.png")
-        screenshots.append("create_os_07_final_page.png")
-        print("📸 Screenshot: create_os_07_final_page.png")
-        
-        # Procurar pela OS mais recente na lista
-        os_numbers = await page.evaluate("""
-            () => {{
-                const osElements = document.querySelectorAll('*');
-                const osNumbers = [];
-                
-                osElements.forEach(el => {{
-                    const text = el.textContent || '';
-                    // Procurar por padrão OS: #XXXXXXXXXX
-                    const osMatch = text.match(/OS[:\\s]*#?(\\d{{10,}})/i);
-                    if (osMatch) {{
-                        osNumbers.push(osMatch[1]);
-                    }}
-                }});
-                
-                // Remover duplicatas e ordenar
-                const uniqueNumbers = [...new Set(osNumbers)];
-                return uniqueNumbers.sort((a, b) => b.localeCompare(a));
-            }}
-        """)
-        
-        # A OS mais recente deve ser a primeira da lista
-        os_number = None
-        if os_numbers and len(os_numbers) > 0:
-            os_number = os_numbers[0]
-            print("🎉 SUCESSO - OS criada com número: " + os_number)
-        else:
-            print("⚠️ AVISO - Não foi possível identificar o número da OS")
-        
-        await page.screenshot(path=screenshots_dir + "/create_os_08_final_result.png")
-        screenshots.append("create_os_08_final_result.png")
-        print("📸 Screenshot: create_os_08_final_result.png")
-        
-        # Resultado final
-        result = {{
-            "success": True,
-            "inep_used": inep_value,
-            "os_number": os_number,
-            "os_created": os_created,
-            "screenshots": screenshots,
-            "message": "OS criada com sucesso!" if os_number else "OS criada, mas número não identificado"
-        }}
-        
-        return result
+        try:
+            summary = future.result(timeout=60)
+            yield json.dumps({'summary': {k: v for k, v in summary.items() if k != 'results'}}, ensure_ascii=False) + '\n'
+        except Exception as e:
+            logger.error(f"Erro na criação de OS em lote: {e}")
+            yield json.dumps({'summary': {'success': False, 'error': str(e)}}, ensure_ascii=False) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    """Lista os jobs de automação mais recentes"""
+    try:
+        status_filter = request.args.get('status')
+        limit = min(int(request.args.get('limit', 50)), 500)
+        store = get_job_store()
         
+        return jsonify({
+            'success': True,
+            'counts': store.stats(),
+            'jobs': store.list(status=status_filter, limit=limit)
+        })
     except Exception as e:
-        print("❌ ERRO: " + str(e))
-        return {{"error": str(e)}}
+        logger.error(f"Erro ao listar jobs: {e}")
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Estado e resultado de um job de automação"""
+    job = get_job_store().get(job_id)
+    
+    if not job:
+        return jsonify({
+            'success': False,
+            'message': f'Job {job_id} não encontrado'
+        }), 404
     
-    finally:
-        await browser.close()
-        await playwright.stop()
+    return jsonify({'success': True, 'job': job})
 
-if __name__ == "__main__":
-    result = asyncio.run(create_os_with_inep())
-    print(json.dumps(result, indent=2))
-'''
-        
-        # Aplicar substituições na template
-        create_os_code = create_os_template.format(
-            INEP_VALUE=inep_value,
-            SCREENSHOTS_DIR=screenshots_dir
-        )
-        
-        # Executar código Python
-        result = subprocess.run([
-            'python3', '-c', create_os_code
-        ], capture_output=True, text=True, timeout=600)  # 10 minutos
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Logs do job em tempo real (Server-Sent Events), encerrando com o evento 'end'"""
+    store = get_job_store()
+    hub = get_log_hub()
+    
+    if store.get(job_id) is None and hub.get(job_id) is None:
+        return jsonify({
+            'success': False,
+            'message': f'Job {job_id} não encontrado'
+        }), 404
+    
+    try:
+        after = int(request.headers.get('Last-Event-ID') or request.args.get('after', 0))
+    except ValueError:
+        after = 0
+    
+    def generate():
+        yield 'retry: 3000\n\n'
+        for entry in hub.follow(job_id, after=after):
+            if entry is None:
+                yield ': keep-alive\n\n'
+            else:
+                yield f"id: {entry['seq']}\nevent: log\ndata: {json.dumps(entry, ensure_ascii=False)}\n\n"
         
-        if result.returncode == 0:
-            try:
-                # Separar prints do JSON
-                output_lines = result.stdout.strip().split('\n')
-                
-                # Log dos prints para debug
-                for line in output_lines:
-                    logger.info(f"Python output: {line}")
-                
-                # Procurar pela linha JSON
-                json_line = None
-                for line in reversed(output_lines):
-                    line = line.strip()
-                    if line.startswith('{') and line.endswith('}'):
-                        json_line = line
-                        break
-                
-                if json_line:
-                    output = json.loads(json_line)
-                    return jsonify(output)
-                else:
-                    logger.error("Nenhuma linha JSON encontrada no stdout")
-                    return jsonify({"error": "Nenhuma linha JSON encontrada", "stdout": result.stdout})
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"Erro JSON decode: {e}")
-                return jsonify({"error": f"Erro ao decodificar JSON: {e}", "stdout": result.stdout})
-        else:
-            logger.error(f"Subprocess falhou com código {result.returncode}")
-            return jsonify({"error": f"Subprocess falhou: {result.stderr}", "stdout": result.stdout})
-            
-    except subprocess.TimeoutExpired:
-        logger.error("Timeout na execução do código Python")
-        return jsonify({"error": "Timeout na execução (10 minutos)", "timeout": True})
+        job = store.get(job_id) or {}
+        yield f"event: end\ndata: {json.dumps({'status': job.get('status'), 'error': job.get('error')})}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/pool/status', methods=['GET'])
+def pool_status():
+    """Estatísticas do motor de automação e do pool de navegadores"""
+    try:
+        return jsonify({
+            'status': 'success',
+            'engine': get_engine().stats(),
+            'navigation': get_nav_cache().stats(),
+            'selectors': get_selector_registry().stats(),
+            'supabase': get_supabase_gateway().stats(),
+            'write_behind': get_write_behind().stats(),
+            'screenshots': {
+                **screenshot_stats(),
+                'index': get_screenshot_index().stats(),
+                'thumbnails': get_thumbnail_cache().stats()
+            },
+            'retention': get_retention_manager().stats(),
+            'timestamp': datetime.now().isoformat()
+        })
     except Exception as e:
-        logger.error(f"Erro na execução de create-os-with-inep: {e}")
-        return jsonify({"error": str(e)})
+        logger.error(f"Erro ao obter status do pool: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+def _pool_gauge(field):
+    """Valor do pool de navegadores, se o motor já foi iniciado (a coleta não o inicia)"""
+    def read():
+        engine = running_engine()
+        if engine is None:
+            return None
+        stats = engine.pool.stats()
+        if field == 'utilization':
+            return stats['busy'] / stats['size'] if stats['size'] else 0
+        return stats[field]
+    return read
+
+gauge_callback('eace_job_queue_depth', 'Jobs aguardando ou em execução', lambda: {
+    (status,): count for status, count in get_job_store().stats().items() if status in ('queued', 'running')
+}, ('status',))
+gauge_callback('eace_browser_pool_size', 'Navegadores no pool', _pool_gauge('size'))
+gauge_callback('eace_browser_pool_busy', 'Navegadores com um job em andamento', _pool_gauge('busy'))
+gauge_callback('eace_browser_pool_utilization', 'Fração dos navegadores ocupados', _pool_gauge('utilization'))
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Métricas no formato do Prometheus (fases, fila, pool, Supabase, resultados)"""
+    return Response(render_metrics(), content_type=METRICS_CONTENT_TYPE)
 
 
 if __name__ == '__main__':
@@ -10880,6 +4012,17 @@ if __name__ == '__main__':
     logger.info(f"   - Status: http://0.0.0.0:{port}/status")
     logger.info(f"   - Screenshots: http://0.0.0.0:{port}/screenshots")
     logger.info(f"   - Galeria: http://0.0.0.0:{port}/screenshots/gallery")
+    logger.info(f"   - Métricas: http://0.0.0.0:{port}/metrics")
+    
+    # Aquecer o motor já na inicialização para o standby estar pronto antes do primeiro webhook
+    if os.getenv('STANDBY_CONTEXTS', '1') != '0':
+        try:
+            get_engine()
+        except Exception as e:
+            logger.error(f"Erro ao aquecer o motor de automação: {e}")
+    
+    # Limpeza periódica de screenshots e logs (artefatos de jobs com falha ficam mais tempo)
+    get_retention_manager(job_status=lambda job_id: (get_job_store().get(job_id) or {}).get('status'))
     
     try:
         app.run(host='0.0.0.0', port=port, debug=False)
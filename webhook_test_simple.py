@@ -7,6 +7,7 @@ from flask import Flask, request, jsonify
 import os
 import logging
 from datetime import datetime
+from inep_extraction import inep_from_text
 
 app = Flask(__name__)
 
@@ -47,19 +48,8 @@ def webhook_eace():
     record = data.get('record', {})
     descricao = record.get('descricao_enviada', '')
     
-    # Extrair INEP (simulação)
-    inep = "31382221"  # Hardcoded para teste
-    if 'INEP' in descricao:
-        try:
-            parts = descricao.split('INEP')
-            if len(parts) > 1:
-                inep_part = parts[1].strip()
-                import re
-                match = re.search(r'(\d{8})', inep_part)
-                if match:
-                    inep = match.group(1)
-        except:
-            pass
+    # Extrair INEP (simulação: sem INEP na descrição usa um fixo de teste)
+    inep = inep_from_text(descricao) or "31382221"
     
     return jsonify({
         'status': 'success',
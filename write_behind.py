@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Escrita adiada (write-behind) para o Supabase
+
+Cada screenshot virava um INSERT e cada mudança de estado de ticket um
+UPDATE, uma chamada REST por evento. Aqui as escritas entram em um buffer e
+uma thread as grava em lote a cada WRITE_BEHIND_FLUSH_MS (ou antes, ao juntar
+WRITE_BEHIND_MAX_ROWS):
+
+- inserts da mesma tabela viram um único INSERT em lote;
+- updates da mesma linha são mesclados (PROCESSANDO seguido de CONCLUIDO vira
+  só CONCLUIDO) e linhas com os mesmos campos viram um UPDATE ... in.(ids).
+
+Se o Supabase estiver fora do ar, os lotes que falharam vão para um arquivo
+JSONL (spill) e são regravados antes das próximas escritas. O buffer é
+esvaziado no encerramento do processo.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from supabase_client import SupabaseGateway, get_supabase_gateway
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_FLUSH_MS = float(os.getenv('WRITE_BEHIND_FLUSH_MS', '500'))
+WRITE_BEHIND_MAX_ROWS = int(os.getenv('WRITE_BEHIND_MAX_ROWS', '50'))
+WRITE_BEHIND_SPILL_PATH = os.getenv('WRITE_BEHIND_SPILL_PATH', 'data/supabase_spill.jsonl')
+# Intervalo entre tentativas enquanto o Supabase está inacessível
+WRITE_BEHIND_RETRY_SECONDS = 30
+
+
+def _rejected(error: Exception) -> bool:
+    """Erro de resposta do PostgREST (dados inválidos), e não de conexão"""
+    try:
+        from postgrest.exceptions import APIError
+    except ImportError:
+        return False
+    return isinstance(error, APIError)
+
+
+class WriteBehind:
+    def __init__(self, gateway: Optional[SupabaseGateway] = None, flush_ms: float = WRITE_BEHIND_FLUSH_MS,
+                 max_rows: int = WRITE_BEHIND_MAX_ROWS, spill_path: str = WRITE_BEHIND_SPILL_PATH):
+        """
+        Inicializa o buffer de escrita
+
+        Args:
+            gateway: Acesso ao Supabase (padrão: o compartilhado do processo)
+            flush_ms: Intervalo máximo entre gravações
+            max_rows: Linhas pendentes que antecipam a gravação
+            spill_path: Arquivo JSONL com os lotes que não puderam ser gravados
+        """
+        self.gateway = gateway or get_supabase_gateway()
+        self.flush_seconds = max(0.05, flush_ms / 1000)
+        self.max_rows = max(1, max_rows)
+        self.spill_path = spill_path
+
+        self._inserts: Dict[str, List[Dict]] = {}
+        self._updates: 'OrderedDict[Tuple[str, str, Any], Dict]' = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._failed_at: Optional[float] = None
+
+        self._spill_batches = len(self._read_spill())
+        self.enqueued = 0
+        self.requests = 0
+        self.rows_written = 0
+        self.spilled = 0
+
+    def start(self):
+        """Inicia a thread de gravação e registra o flush no encerramento"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(f"📝 Write-behind iniciado (a cada {self.flush_seconds * 1000:.0f}ms ou {self.max_rows} linhas)")
+
+    def insert(self, table: str, row: Dict):
+        """Agenda um INSERT"""
+        with self._lock:
+            self._inserts.setdefault(table, []).append(row)
+            self._added()
+
+    def update(self, table: str, key_column: str, key: Any, fields: Dict):
+        """Agenda um UPDATE de uma linha; updates pendentes da mesma linha são mesclados"""
+        with self._lock:
+            pending = self._updates.get((table, key_column, key))
+            if pending is None:
+                self._updates[(table, key_column, key)] = dict(fields)
+                self._added()
+            else:
+                pending.update(fields)
+                self.enqueued += 1
+
+    def _added(self):
+        self._pending += 1
+        self.enqueued += 1
+        if self._pending >= self.max_rows:
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                self._wakeup.wait(self.flush_seconds)
+                if self._stopping:
+                    return
+
+            try:
+                # Com o Supabase fora do ar, as novas escritas vão direto para o spill até a próxima tentativa
+                if self._failed_at and time.time() - self._failed_at < WRITE_BEHIND_RETRY_SECONDS:
+                    self.spill()
+                else:
+                    self.flush()
+            except Exception as e:
+                logger.error(f"❌ Erro no write-behind: {e}")
+
+    def _take_batches(self) -> List[Dict]:
+        """Esvazia o buffer em lotes: um insert por tabela, um update por conjunto de campos"""
+        with self._lock:
+            inserts, self._inserts = self._inserts, {}
+            updates, self._updates = self._updates, OrderedDict()
+            self._pending = 0
+
+        batches = [{'op': 'insert', 'table': table, 'rows': rows} for table, rows in inserts.items()]
+
+        grouped: 'OrderedDict[Tuple[str, str, str], Dict]' = OrderedDict()
+        for (table, key_column, key), fields in updates.items():
+            signature = (table, key_column, json.dumps(fields, sort_keys=True, default=str))
+            batch = grouped.setdefault(signature, {
+                'op': 'update', 'table': table, 'key_column': key_column, 'keys': [], 'fields': fields
+            })
+            batch['keys'].append(key)
+        batches.extend(grouped.values())
+
+        return batches
+
+    def _send(self, batch: Dict):
+        table = batch['table']
+        if batch['op'] == 'insert':
+            self.gateway.execute(lambda db: db.table(table).insert(batch['rows']))
+            rows = len(batch['rows'])
+        else:
+            if len(batch['keys']) == 1:
+                self.gateway.execute(
+                    lambda db: db.table(table).update(batch['fields']).eq(batch['key_column'], batch['keys'][0])
+                )
+            else:
+                self.gateway.execute(
+                    lambda db: db.table(table).update(batch['fields']).in_(batch['key_column'], batch['keys'])
+                )
+            rows = len(batch['keys'])
+
+        self.requests += 1
+        self.rows_written += rows
+
+    def flush(self) -> int:
+        """
+        Grava os lotes pendentes (primeiro os que estão no arquivo de spill)
+
+        Returns:
+            Número de lotes que não puderam ser gravados e foram para o spill
+        """
+        with self._flush_lock:
+            spilled = self._read_spill()
+            batches = spilled + self._take_batches()
+            if not batches:
+                return 0
+
+            sent = len(batches)
+            for index, batch in enumerate(batches):
+                try:
+                    self._send(batch)
+                except Exception as e:
+                    if _rejected(e):
+                        # O Supabase respondeu e recusou o lote: regravar não adiantaria
+                        logger.error(f"❌ Lote {batch['op']} em '{batch['table']}' recusado pelo Supabase e descartado: {e}")
+                        continue
+                    logger.error(f"❌ Supabase inacessível ({e}); {len(batches) - index} lotes vão para o spill")
+                    sent = index
+                    break
+
+            failed = batches[sent:]
+            if failed or spilled:
+                self._write_spill(failed)
+
+            if failed:
+                self._failed_at = time.time()
+                self.spilled += len(batches) - max(sent, len(spilled))
+            else:
+                if self._failed_at:
+                    logger.info("✅ Supabase acessível novamente; spill regravado")
+                self._failed_at = None
+
+            return len(failed)
+
+    def spill(self) -> int:
+        """Move o buffer para o spill sem tentar o Supabase"""
+        with self._flush_lock:
+            batches = self._take_batches()
+            if batches:
+                self._write_spill(self._read_spill() + batches)
+                self.spilled += len(batches)
+            return len(batches)
+
+    def _read_spill(self) -> List[Dict]:
+        try:
+            with open(self.spill_path, 'r') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.error(f"❌ Erro ao ler spill {self.spill_path}: {e}")
+            return []
+
+    def _write_spill(self, batches: List[Dict]):
+        """Substitui atomicamente o spill pelos lotes ainda não gravados (ou o remove)"""
+        self._spill_batches = len(batches)
+        if not batches:
+            if os.path.exists(self.spill_path):
+                os.remove(self.spill_path)
+            return
+
+        if os.path.dirname(self.spill_path):
+            os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+        tmp_path = self.spill_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            for batch in batches:
+                f.write(json.dumps(batch, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.spill_path)
+
+    def close(self):
+        """Para a thread e grava o que estiver pendente (no Supabase ou no spill)"""
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._wakeup.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pending = self._pending
+        return {
+            'pending': pending,
+            'enqueued': self.enqueued,
+            'requests': self.requests,
+            'rows_written': self.rows_written,
+            'spilled': self.spilled,
+            'spill_pending': self._spill_batches,
+            'flush_ms': round(self.flush_seconds * 1000),
+            'supabase_unreachable': self._failed_at is not None
+        }
+
+
+_write_behind: Optional[WriteBehind] = None
+_write_behind_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehind:
+    """Retorna o buffer de escrita compartilhado do processo (já iniciado)"""
+    global _write_behind
+
+    with _write_behind_lock:
+        if _write_behind is None:
+            _write_behind = WriteBehind()
+            _write_behind.start()
+
+    return _write_behind